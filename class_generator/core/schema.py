@@ -4,6 +4,7 @@ import dataclasses
 import json
 import re
 import shlex
+from collections.abc import Mapping
 from pathlib import Path
 from typing import Any
 
@@ -16,6 +17,7 @@ from class_generator.exceptions import ResourceNotFoundError
 from class_generator.utils import execute_parallel_tasks, execute_parallel_with_mapping
 from ocp_resources.utils.archive_utils import save_json_archive
 from ocp_resources.utils.schema_validator import SchemaValidator
+from ocp_resources.utils.tracing import traced
 
 LOGGER = get_logger(name=__name__)
 
@@ -39,8 +41,11 @@ def get_client_binary() -> str:
     raise RuntimeError("Neither 'oc' nor 'kubectl' binary found in PATH")
 
 
-def read_resources_mapping_file(skip_cache: bool = False) -> dict[Any, Any]:
-    """Read resources mapping using SchemaValidator for consistency"""
+def read_resources_mapping_file(skip_cache: bool = False) -> Mapping[Any, Any]:
+    """Read resources mapping using SchemaValidator for consistency
+
+    The returned mapping is read-only and loads kinds on access, copy it with `dict()` before updating it.
+    """
     # Use SchemaValidator to load and get mappings data
     if SchemaValidator.load_mappings_data(skip_cache=skip_cache):
         mappings = SchemaValidator.get_mappings_data(skip_cache=skip_cache)
@@ -258,6 +263,7 @@ def identify_missing_resources(client: str, existing_resources_mapping: dict[Any
     return missing_resources
 
 
+@traced(name="class_generator.build_dynamic_resource_to_api_mapping")
 def build_dynamic_resource_to_api_mapping(client: str) -> dict[str, list[str]]:
     """
     Build resource-to-API mapping dynamically from 'kubectl api-resources -o wide' output.
@@ -433,6 +439,7 @@ def find_api_paths_for_missing_resources(client: str, paths: dict[str, Any], mis
     return relevant_paths
 
 
+@traced(name="class_generator.fetch_all_api_schemas")
 def fetch_all_api_schemas(
     client: str, paths: dict[str, Any], filter_paths: set[str] | None = None
 ) -> dict[str, dict[str, Any]]:
@@ -1511,6 +1518,7 @@ class UpdateStrategy:
     need_v3_index: bool
 
 
+@traced(name="class_generator.determine_update_strategy")
 def _determine_update_strategy(client: str, resources_mapping: dict[Any, Any]) -> UpdateStrategy:
     """Determine the update strategy based on cluster version.
 
@@ -1546,6 +1554,7 @@ def _determine_update_strategy(client: str, resources_mapping: dict[Any, Any]) -
     return UpdateStrategy(should_update=should_update, missing_resources=missing_resources, need_v3_index=need_v3_index)
 
 
+@traced(name="class_generator.fetch_openapi_v3_index")
 def _fetch_openapi_v3_index(client: str) -> dict[str, Any]:
     """Fetch OpenAPI v3 index from the cluster.
 
@@ -1590,6 +1599,7 @@ def _fetch_api_index_if_needed(client: str, need_v3_index: bool) -> dict[str, An
     return _fetch_openapi_v3_index(client)
 
 
+@traced(name="class_generator.fetch_schemas_based_on_strategy")
 def _fetch_schemas_based_on_strategy(client: str, strategy: UpdateStrategy, paths: dict[str, Any]) -> dict[str, Any]:
     """Fetch schemas based on the determined update strategy.
 
@@ -1634,6 +1644,7 @@ def _handle_no_schemas_case() -> None:
         LOGGER.debug("Could not load existing definitions file. No existing definitions to preserve.")
 
 
+@traced(name="class_generator.process_and_write_schemas")
 def _process_and_write_schemas(
     client: str,
     strategy: UpdateStrategy,
@@ -1681,6 +1692,7 @@ def _process_and_write_schemas(
     LOGGER.info("Schema processing completed successfully")
 
 
+@traced(name="class_generator.update_kind_schema")
 def update_kind_schema(client: str | None = None) -> None:
     """Update schema files using OpenAPI v3 endpoints
 
@@ -1690,8 +1702,8 @@ def update_kind_schema(client: str | None = None) -> None:
     if client is None:
         client = get_client_binary()
 
-    # Load existing resources mapping
-    resources_mapping = read_resources_mapping_file()
+    # Load existing resources mapping (updated in place)
+    resources_mapping = dict(read_resources_mapping_file())
 
     # Determine update strategy based on cluster version
     strategy = _determine_update_strategy(client=client, resources_mapping=resources_mapping)
@@ -1717,6 +1729,7 @@ def update_kind_schema(client: str | None = None) -> None:
         )
 
 
+@traced(name="class_generator.update_single_resource_schema")
 def update_single_resource_schema(kind: str, client: str | None = None) -> None:
     """Update schema for a single resource kind without affecting other resources.
 
@@ -1789,7 +1802,7 @@ def update_single_resource_schema(kind: str, client: str | None = None) -> None:
     LOGGER.info(f"Resource {kind} is namespaced: {namespacing_dict[kind]}")
 
     # Load existing resources mapping
-    resources_mapping = read_resources_mapping_file(skip_cache=True)
+    resources_mapping = dict(read_resources_mapping_file(skip_cache=True))
     existing_count = len(resources_mapping)
     LOGGER.info(f"Loaded {existing_count} existing resources from mapping")
 
@@ -1,29 +1,43 @@
 """Fake Kubernetes client for testing"""
 
+from fake_kubernetes_client.clock import FakeClock
 from fake_kubernetes_client.configuration import FakeConfiguration
+from fake_kubernetes_client.controllers import FakeController, FakeControllerManager
 from fake_kubernetes_client.dynamic_client import FakeDynamicClient
+from fake_kubernetes_client.event_bus import FakeEventBus
 from fake_kubernetes_client.exceptions import (
     ApiException,
     ConflictError,
     NotFoundError,
+    RemoteOperationNotSupportedError,
 )
 from fake_kubernetes_client.kubernetes_client import FakeKubernetesClient
+from fake_kubernetes_client.locks import LockStats
 from fake_kubernetes_client.resource_field import FakeResourceField
 from fake_kubernetes_client.resource_instance import FakeResourceInstance
 from fake_kubernetes_client.resource_manager import FakeResourceManager
 from fake_kubernetes_client.resource_registry import FakeResourceRegistry
 from fake_kubernetes_client.resource_storage import FakeResourceStorage
+from fake_kubernetes_client.server import FakeClusterServer, FakeRemoteStorage
 
 __all__ = [
+    "FakeClock",
+    "FakeClusterServer",
     "FakeConfiguration",
+    "FakeController",
+    "FakeControllerManager",
     "FakeDynamicClient",
+    "FakeEventBus",
     "FakeKubernetesClient",
     "FakeResourceField",
     "FakeResourceInstance",
     "FakeResourceRegistry",
+    "FakeRemoteStorage",
     "FakeResourceStorage",
     "FakeResourceManager",
     "ApiException",
     "NotFoundError",
     "ConflictError",
+    "RemoteOperationNotSupportedError",
+    "LockStats",
 ]
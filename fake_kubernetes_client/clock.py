@@ -0,0 +1,222 @@
+"""FakeClock implementation for fake Kubernetes client"""
+
+import contextlib
+import datetime
+import heapq
+import itertools
+import logging
+import sys
+import threading
+import time
+from collections.abc import Callable, Generator
+from types import ModuleType
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Packages whose `time` and `datetime` module globals follow the virtual clock
+VIRTUAL_TIME_PACKAGES: tuple[str, ...] = ("ocp_resources", "fake_kubernetes_client", "timeout_sampler")
+
+_ACTIVE_CLOCK: "FakeClock | None" = None
+_ACTIVE_CLOCK_LOCK = threading.Lock()
+
+
+class _VirtualTimeModule:
+    """Stand-in of the `time` module in the patched modules"""
+
+    def __init__(self, clock: "FakeClock") -> None:
+        self._clock = clock
+
+    def time(self) -> float:
+        return self._clock.time()
+
+    def monotonic(self) -> float:
+        return self._clock.monotonic()
+
+    def perf_counter(self) -> float:
+        return self._clock.monotonic()
+
+    def sleep(self, seconds: float) -> None:
+        self._clock.sleep(seconds)
+
+    def __getattr__(self, name: str) -> Any:
+        return getattr(time, name)
+
+
+def _virtual_datetime(clock: "FakeClock") -> type[datetime.datetime]:
+    """Stand-in of the `datetime.datetime` class in the patched modules"""
+
+    class VirtualDatetime(datetime.datetime):
+        @classmethod
+        def now(cls, tz: datetime.tzinfo | None = None) -> datetime.datetime:  # type: ignore[override]
+            return datetime.datetime.fromtimestamp(clock.time(), tz=tz)
+
+        @classmethod
+        def utcnow(cls) -> datetime.datetime:  # type: ignore[override]
+            return datetime.datetime.fromtimestamp(clock.time(), tz=datetime.timezone.utc).replace(tzinfo=None)
+
+    return VirtualDatetime
+
+
+class FakeClock:
+    """Clock of the fake cluster
+
+    The clock follows the real time until `virtual_time()` is entered. In virtual time, sleeping advances the clock
+    instantly, running the callbacks scheduled with `call_later` at their virtual time, so a wait that times out after
+    four minutes returns in milliseconds. The waits of the wrapper (`TimeoutSampler`, `TimeoutWatch`, the wait engine)
+    and the fake client timestamps, status transitions and watches all follow the virtual clock.
+
+    Virtual time is process wide: the sleeps of all threads advance the same clock, and only one clock can be virtual
+    at a time.
+    """
+
+    def __init__(self) -> None:
+        self.virtual = False
+        self._lock = threading.RLock()
+        self._time = 0.0
+        self._monotonic = 0.0
+        # (monotonic due time, sequence, callback)
+        self._timers: list[tuple[float, int, Callable[[], Any]]] = []
+        self._timers_changed = threading.Condition(self._lock)
+        self._timer_thread: threading.Thread | None = None
+        self._sequence = itertools.count()
+        self._patches: list[tuple[ModuleType, str, Any]] = []
+
+    def time(self) -> float:
+        """Seconds since the epoch"""
+        return self._time if self.virtual else time.time()
+
+    def monotonic(self) -> float:
+        """Monotonic seconds"""
+        return self._monotonic if self.virtual else time.monotonic()
+
+    def now(self, tz: datetime.tzinfo | None = datetime.timezone.utc) -> datetime.datetime:
+        """Current date and time, UTC by default"""
+        return datetime.datetime.fromtimestamp(self.time(), tz=tz)
+
+    def sleep(self, seconds: float) -> None:
+        """Sleep, instantly in virtual time"""
+        if self.virtual:
+            self.advance(seconds=seconds)
+        else:
+            time.sleep(seconds)
+
+    def advance(self, seconds: float) -> None:
+        """Advance the virtual clock, running the callbacks that become due in order"""
+        with self._lock:
+            target = self._monotonic + max(seconds, 0)
+
+        while True:
+            # Callbacks run without the lock, they may write to the fake cluster or schedule callbacks
+            with self._lock:
+                if not self._timers or self._timers[0][0] > target:
+                    self._move_to(monotonic=max(target, self._monotonic))
+                    return
+
+                due, _, callback = heapq.heappop(self._timers)
+                self._move_to(monotonic=max(due, self._monotonic))
+
+            callback()
+
+    def _move_to(self, monotonic: float) -> None:
+        self._time += monotonic - self._monotonic
+        self._monotonic = monotonic
+
+    def call_later(self, delay: float, callback: Callable[[], Any]) -> None:
+        """Run `callback` after `delay` seconds, at that virtual time in virtual time or from the timer thread"""
+        with self._lock:
+            heapq.heappush(self._timers, (self.monotonic() + max(delay, 0), next(self._sequence), callback))
+            if self.virtual:
+                return
+
+            self._timers_changed.notify_all()
+            if self._timer_thread is None:
+                self._timer_thread = threading.Thread(target=self._run_timers, name="fake-clock-timers", daemon=True)
+                self._timer_thread.start()
+
+    def _run_timers(self) -> None:
+        """Run the due callbacks in real time, a single thread serves all the timers of the clock"""
+        while True:
+            with self._lock:
+                if self.virtual or not self._timers:
+                    self._timers_changed.wait()
+                    continue
+
+                delay = self._timers[0][0] - time.monotonic()
+                if delay > 0:
+                    self._timers_changed.wait(timeout=delay)
+                    continue
+
+                _, _, callback = heapq.heappop(self._timers)
+
+            try:
+                callback()
+            except Exception:
+                logger.exception("FakeClock callback failed")
+
+    def wait(self, condition: threading.Condition, timeout: float | None) -> None:
+        """Wait for a notification of `condition` (held by the caller) for up to `timeout` seconds
+
+        In virtual time, only the scheduled callbacks can change the fake cluster, so the clock advances to the next
+        callback or by `timeout`, whichever comes first.
+        """
+        if self.virtual:
+            with self._lock:
+                waits = [timeout] if timeout is not None else []
+                if self._timers:
+                    waits.append(self._timers[0][0] - self._monotonic)
+            if waits:
+                self.advance(seconds=max(min(waits), 0))
+                return
+
+        condition.wait(timeout=timeout)
+
+    @contextlib.contextmanager
+    def virtual_time(self) -> Generator["FakeClock", None, None]:
+        """Run the context in virtual time, starting at the current real time
+
+        Modules of `VIRTUAL_TIME_PACKAGES` imported before entering the context use the virtual clock.
+        """
+        global _ACTIVE_CLOCK
+
+        with _ACTIVE_CLOCK_LOCK:
+            nested = _ACTIVE_CLOCK is self
+            if _ACTIVE_CLOCK is not None and not nested:
+                raise RuntimeError("Another FakeClock is already in virtual time")
+            _ACTIVE_CLOCK = self
+
+        if nested:
+            yield self
+            return
+
+        with self._lock:
+            # Pending real time timers keep their due time, the virtual clock starts at the real monotonic time
+            self._time, self._monotonic = time.time(), time.monotonic()
+            self.virtual = True
+        self._patch_modules()
+        try:
+            yield self
+        finally:
+            self._unpatch_modules()
+            with self._lock:
+                self.virtual = False
+                self._timers.clear()
+                self._timers_changed.notify_all()
+            with _ACTIVE_CLOCK_LOCK:
+                _ACTIVE_CLOCK = None
+
+    def _patch_modules(self) -> None:
+        replacements = ((time, _VirtualTimeModule(clock=self)), (datetime.datetime, _virtual_datetime(clock=self)))
+        for name, module in list(sys.modules.items()):
+            if module is None or name == __name__ or name.split(".")[0] not in VIRTUAL_TIME_PACKAGES:
+                continue
+            for attribute, value in list(vars(module).items()):
+                for real, virtual in replacements:
+                    if value is real:
+                        self._patches.append((module, attribute, value))
+                        setattr(module, attribute, virtual)
+
+    def _unpatch_modules(self) -> None:
+        while self._patches:
+            module, attribute, value = self._patches.pop()
+            setattr(module, attribute, value)
@@ -0,0 +1,854 @@
+"""Simulated controllers for fake Kubernetes client"""
+
+import hashlib
+import json
+import math
+import random
+import threading
+from collections import defaultdict
+from collections.abc import Callable
+from typing import TYPE_CHECKING, Any, ClassVar
+
+from fake_kubernetes_client.event_bus import FakeWatchEvent
+from fake_kubernetes_client.exceptions import ConflictError, NotFoundError
+from fake_kubernetes_client.status_templates import get_pod_status_template
+
+if TYPE_CHECKING:
+    from fake_kubernetes_client.dynamic_client import FakeDynamicClient
+
+# Seconds a reconcile step takes: fixed, uniform between (min, max), or drawn from the random generator
+Latency = float | tuple[float, float] | Callable[[random.Random], float]
+
+# Characters of the generated name suffixes, like the Kubernetes name generator
+NAME_SUFFIX_CHARACTERS: str = "bcdfghjklmnpqrstvwxz2456789"
+FAKE_NODE_NAME: str = "fake-node-1"
+VM_RUNNING_STRATEGIES: tuple[str, ...] = ("Always", "RerunOnFailure", "Once")
+
+
+def log_normal(median: float, sigma: float = 0.5) -> Callable[[random.Random], float]:
+    """Long-tailed latency around `median` seconds, like boot and image pull times"""
+    return lambda rng: rng.lognormvariate(math.log(median), sigma)
+
+
+def _owner_reference(resource: dict[str, Any]) -> dict[str, Any]:
+    return {
+        "apiVersion": resource["apiVersion"],
+        "kind": resource["kind"],
+        "name": resource["metadata"]["name"],
+        "uid": resource["metadata"]["uid"],
+        "controller": True,
+        "blockOwnerDeletion": True,
+    }
+
+
+def _controller_owner(resource: dict[str, Any], kind: str) -> dict[str, Any] | None:
+    for owner in resource.get("metadata", {}).get("ownerReferences") or []:
+        if owner.get("kind") == kind and owner.get("controller"):
+            return owner
+    return None
+
+
+def _is_owned_by(resource: dict[str, Any], owner: dict[str, Any]) -> bool:
+    return any(
+        reference.get("uid") == owner["metadata"]["uid"]
+        for reference in resource.get("metadata", {}).get("ownerReferences") or []
+    )
+
+
+def _label_selector(match_labels: dict[str, str]) -> str | None:
+    return ",".join(f"{key}={value}" for key, value in sorted(match_labels.items())) or None
+
+
+class FakeController:
+    """Base class of the simulated controllers
+
+    A controller manages one kind: it sets the status of the created resources (`initial_status`) and reconciles them
+    from the events of the kinds it `watches`, like a Kubernetes controller would. Reconcile steps are scheduled with
+    `after`, each takes `latency` seconds of the fake clock and fails with probability `failure_rate`.
+    """
+
+    api_version: str = ""
+    kind: str = ""
+    # (api_version, kind) of the events passed to `reconcile`, besides the managed kind
+    watches: tuple[tuple[str, str], ...] = ()
+    # Status of the created resources
+    initial_status: ClassVar[dict[str, Any]] = {}
+    # Set by `FakeControllerManager.add`
+    manager: "FakeControllerManager"
+
+    def __init__(self, latency: Latency = 0.0, failure_rate: float = 0.0) -> None:
+        self.latency = latency
+        self.failure_rate = failure_rate
+        self._pending: set[tuple[Any, ...]] = set()
+        self._pending_lock = threading.Lock()
+
+    def set_initial_status(self, resource: dict[str, Any]) -> None:
+        """Set the status of a resource being created"""
+        resource["status"] = json.loads(json.dumps(self.initial_status))
+
+    def reconcile(self, event: FakeWatchEvent) -> None:
+        """Handle an event, called while the event is published: schedule the work with `after`
+
+        Only `manager.get` may be used here, writing or listing the fake cluster while an event is published can
+        deadlock.
+        """
+
+    def delay(self) -> float:
+        """Draw the duration of a reconcile step"""
+        if callable(self.latency):
+            return max(self.latency(self.manager.random), 0.0)
+        if isinstance(self.latency, tuple):
+            return self.manager.random.uniform(*self.latency)
+        return self.latency
+
+    def fails(self) -> bool:
+        """Draw whether a reconcile step fails"""
+        return self.failure_rate > 0 and self.manager.random.random() < self.failure_rate
+
+    def after(
+        self,
+        resource: dict[str, Any],
+        step: Callable[[dict[str, Any]], None],
+        delay: float | None = None,
+    ) -> None:
+        """Run `step` with the current version of `resource` after `delay` seconds (default: a drawn `delay()`)
+
+        A step that is already scheduled for the resource is not scheduled again, and steps of deleted or recreated
+        resources are dropped.
+        """
+        metadata = resource["metadata"]
+        key = (step.__name__, metadata["uid"])
+        with self._pending_lock:
+            if key in self._pending:
+                return
+            self._pending.add(key)
+
+        def _run() -> None:
+            with self._pending_lock:
+                self._pending.discard(key)
+            current = self.manager.get(
+                api_version=resource["apiVersion"],
+                kind=resource["kind"],
+                name=metadata["name"],
+                namespace=metadata.get("namespace"),
+            )
+            if current is not None and current["metadata"]["uid"] == metadata["uid"]:
+                step(current)
+
+        self.manager.schedule(delay=self.delay() if delay is None else delay, callback=_run)
+
+    def condition(
+        self, resource: dict[str, Any], condition_type: str, status: bool, reason: str, message: str = ""
+    ) -> dict[str, Any]:
+        """Build a status condition, keeping the transition time of an unchanged condition"""
+        status_value = "True" if status else "False"
+        for previous in resource.get("status", {}).get("conditions") or []:
+            if previous.get("type") == condition_type and previous.get("status") == status_value:
+                transition_time = previous.get("lastTransitionTime")
+                break
+        else:
+            transition_time = self.manager.client.clock.now().isoformat()
+
+        return {
+            "type": condition_type,
+            "status": status_value,
+            "reason": reason,
+            "message": message,
+            "lastTransitionTime": transition_time,
+        }
+
+
+class FakeControllerManager:
+    """Simulated controllers of the fake cluster
+
+    Controllers are off by default, resources get a final status when created. Once started, the controllers drive
+    the status of the kinds they manage through the event bus of the storage and the fake clock, so the resources go
+    through realistic transitions (a Deployment creates a ReplicaSet, which creates Pods that become Running) with
+    configurable latencies and failures. In virtual time, booting a thousand VMs takes seconds.
+
+    Example:
+        client.controllers.start(seed=42)
+        client.controllers.configure(kind="VirtualMachineInstance", latency=log_normal(median=30), failure_rate=0.01)
+    """
+
+    def __init__(self, client: "FakeDynamicClient", seed: int | None = None) -> None:
+        self.client = client
+        self.random = random.Random(seed)
+        # kind -> controller managing it
+        self.controllers: dict[str, FakeController] = {}
+        self.running = False
+        self._routes: defaultdict[tuple[str, str], list[FakeController]] = defaultdict(list)
+
+    def add(self, controller: FakeController) -> None:
+        """Add a controller, replacing the controller of the same kind"""
+        controller.manager = self
+        self.controllers[controller.kind] = controller
+        self._routes.clear()
+        for kind_controller in self.controllers.values():
+            for key in ((kind_controller.api_version, kind_controller.kind), *kind_controller.watches):
+                self._routes[key].append(kind_controller)
+
+    def configure(self, kind: str, latency: Latency | None = None, failure_rate: float | None = None) -> None:
+        """Set the latency and failure rate of the controller of a kind"""
+        controller = self.controllers[kind]
+        if latency is not None:
+            controller.latency = latency
+        if failure_rate is not None:
+            controller.failure_rate = failure_rate
+
+    def start(self, seed: int | None = None, default_controllers: bool = True) -> "FakeControllerManager":
+        """Start reconciling, adding the default controllers for the kinds without one"""
+        if seed is not None:
+            self.random.seed(seed)
+        if default_controllers:
+            for controller in DEFAULT_CONTROLLERS:
+                if controller.kind not in self.controllers:
+                    self.add(controller=controller())
+        if not self.running:
+            self.client.storage.event_bus.subscribe(callback=self._dispatch)
+            self.running = True
+        return self
+
+    def stop(self) -> None:
+        """Stop reconciling, the steps already scheduled still run"""
+        self.client.storage.event_bus.unsubscribe(callback=self._dispatch)
+        self.running = False
+
+    def get_controller(self, api_version: str, kind: str) -> FakeController | None:
+        """Running controller of a kind"""
+        controller = self.controllers.get(kind) if self.running else None
+        return controller if controller and controller.api_version == api_version else None
+
+    def _dispatch(self, event: FakeWatchEvent) -> None:
+        for controller in self._routes.get((event.api_version, event.kind), ()):
+            controller.reconcile(event=event)
+
+    def schedule(self, delay: float, callback: Callable[[], Any]) -> None:
+        """Run `callback` after `delay` seconds of the fake clock"""
+        self.client.clock.call_later(delay=delay, callback=callback)
+
+    def get(self, api_version: str, kind: str, name: str, namespace: str | None) -> dict[str, Any] | None:
+        """Get a stored resource (read-only)"""
+        return self.client.storage.get_resource(kind=kind, api_version=api_version, name=name, namespace=namespace)
+
+    def list(
+        self, api_version: str, kind: str, namespace: str | None, label_selector: str | None = None
+    ) -> list[dict[str, Any]]:
+        """List stored resources (read-only)"""
+        return self.client.storage.list_resources(
+            kind=kind, api_version=api_version, namespace=namespace, label_selector=label_selector
+        )
+
+    def create(self, api_version: str, kind: str, namespace: str | None, body: dict[str, Any]) -> None:
+        """Create a resource through the fake API, ignoring conflicts"""
+        try:
+            self.client.resources.get(api_version=api_version, kind=kind).create(body=body, namespace=namespace)
+        except ConflictError:
+            pass
+
+    def delete(self, api_version: str, kind: str, name: str, namespace: str | None) -> None:
+        """Delete a resource through the fake API, ignoring missing resources"""
+        try:
+            self.client.resources.get(api_version=api_version, kind=kind).delete(name=name, namespace=namespace)
+        except NotFoundError:
+            pass
+
+    def update(
+        self, resource: dict[str, Any], status: dict[str, Any] | None = None, spec: dict[str, Any] | None = None
+    ) -> None:
+        """Merge `status` and `spec` keys into the current version of a resource, None values remove keys
+
+        Like the status subresource, status updates keep the generation; spec updates increment it. Updates that
+        change nothing are not written.
+        """
+        metadata = resource["metadata"]
+        storage = self.client.storage
+        with storage.lock(kind=resource["kind"], api_version=resource["apiVersion"]):
+            current = self.get(
+                api_version=resource["apiVersion"],
+                kind=resource["kind"],
+                name=metadata["name"],
+                namespace=metadata.get("namespace"),
+            )
+            if current is None or current["metadata"]["uid"] != metadata["uid"]:
+                return
+
+            updated = dict(current)
+            updated_metadata = dict(current["metadata"])
+            for field, changes in (("status", status), ("spec", spec)):
+                if changes is None:
+                    continue
+                merged = {**(current.get(field) or {}), **changes}
+                merged = {key: value for key, value in merged.items() if value is not None}
+                if merged == (current.get(field) or {}):
+                    continue
+                updated[field] = merged
+                if field == "spec":
+                    updated_metadata["generation"] = updated_metadata.get("generation", 1) + 1
+
+            if updated.keys() == current.keys() and all(updated[key] is current[key] for key in updated):
+                return
+
+            updated["metadata"] = updated_metadata
+            storage.store_resource(
+                kind=current["kind"],
+                api_version=current["apiVersion"],
+                name=metadata["name"],
+                namespace=metadata.get("namespace"),
+                resource=updated,
+            )
+
+    def generate_name(self, prefix: str) -> str:
+        """Name with a random suffix, like `metadata.generateName`"""
+        return f"{prefix}-{''.join(self.random.choices(NAME_SUFFIX_CHARACTERS, k=5))}"
+
+
+class FakePodController(FakeController):
+    """Pods are Pending, then Running after a step, or Failed"""
+
+    api_version = "v1"
+    kind = "Pod"
+
+    def set_initial_status(self, resource: dict[str, Any]) -> None:
+        resource["status"] = {
+            "phase": "Pending",
+            "conditions": [self.condition(resource=resource, condition_type="PodScheduled", status=True, reason="")],
+        }
+
+    def reconcile(self, event: FakeWatchEvent) -> None:
+        if event.type == "ADDED" and event.object.get("status", {}).get("phase") == "Pending":
+            self.after(resource=event.object, step=self.start_containers)
+
+    def start_containers(self, pod: dict[str, Any]) -> None:
+        if self.fails():
+            self.manager.update(
+                resource=pod,
+                status={
+                    "phase": "Failed",
+                    "conditions": [
+                        self.condition(resource=pod, condition_type="Ready", status=False, reason="Error"),
+                    ],
+                },
+            )
+            return
+
+        self.manager.update(resource=pod, status=get_pod_status_template(body=pod))
+
+
+class FakeReplicaSetController(FakeController):
+    """ReplicaSets create and delete their Pods after a step, and count the ready Pods"""
+
+    api_version = "apps/v1"
+    kind = "ReplicaSet"
+    watches = (("v1", "Pod"),)
+
+    initial_status = {"replicas": 0}
+
+    def reconcile(self, event: FakeWatchEvent) -> None:
+        if event.kind == "Pod":
+            owner = _controller_owner(resource=event.object, kind=self.kind)
+            replica_set = owner and self.manager.get(
+                api_version=self.api_version, kind=self.kind, name=owner["name"], namespace=event.namespace
+            )
+            if replica_set:
+                self.after(resource=replica_set, step=self.sync, delay=0)
+        elif event.type == "DELETED":
+            self.manager.schedule(delay=0, callback=lambda: self.delete_pods(replica_set=event.object))
+        elif event.object.get("metadata", {}).get("generation") != event.object.get("status", {}).get(
+            "observedGeneration"
+        ):
+            self.after(resource=event.object, step=self.sync)
+
+    def _pods(self, replica_set: dict[str, Any]) -> list[dict[str, Any]]:
+        match_labels = replica_set.get("spec", {}).get("selector", {}).get("matchLabels") or {}
+        return [
+            pod
+            for pod in self.manager.list(
+                api_version="v1",
+                kind="Pod",
+                namespace=replica_set["metadata"].get("namespace"),
+                label_selector=_label_selector(match_labels=match_labels),
+            )
+            if _is_owned_by(resource=pod, owner=replica_set)
+        ]
+
+    def delete_pods(self, replica_set: dict[str, Any]) -> None:
+        for pod in self._pods(replica_set=replica_set):
+            self.manager.delete(
+                api_version="v1", kind="Pod", name=pod["metadata"]["name"], namespace=pod["metadata"].get("namespace")
+            )
+
+    def sync(self, replica_set: dict[str, Any]) -> None:
+        namespace = replica_set["metadata"].get("namespace")
+        replicas = replica_set.get("spec", {}).get("replicas", 1)
+        template = replica_set.get("spec", {}).get("template", {})
+        pods = self._pods(replica_set=replica_set)
+
+        for _ in range(replicas - len(pods)):
+            self.manager.create(
+                api_version="v1",
+                kind="Pod",
+                namespace=namespace,
+                body={
+                    "metadata": {
+                        "name": self.manager.generate_name(prefix=replica_set["metadata"]["name"]),
+                        "labels": dict(template.get("metadata", {}).get("labels") or {}),
+                        "annotations": dict(template.get("metadata", {}).get("annotations") or {}),
+                        "ownerReferences": [_owner_reference(resource=replica_set)],
+                    },
+                    "spec": json.loads(json.dumps(template.get("spec") or {})),
+                },
+            )
+        for pod in pods[replicas:]:
+            self.manager.delete(api_version="v1", kind="Pod", name=pod["metadata"]["name"], namespace=namespace)
+
+        pods = self._pods(replica_set=replica_set)
+        ready = sum(
+            any(
+                condition.get("type") == "Ready" and condition.get("status") == "True"
+                for condition in pod.get("status", {}).get("conditions") or []
+            )
+            for pod in pods
+        )
+        self.manager.update(
+            resource=replica_set,
+            status={
+                "replicas": len(pods),
+                "fullyLabeledReplicas": len(pods),
+                "readyReplicas": ready,
+                "availableReplicas": ready,
+                "observedGeneration": replica_set["metadata"].get("generation"),
+            },
+        )
+
+
+class FakeDeploymentController(FakeController):
+    """Deployments own a ReplicaSet per pod template, created after a step, and sum up its replicas"""
+
+    api_version = "apps/v1"
+    kind = "Deployment"
+    watches = (("apps/v1", "ReplicaSet"),)
+
+    initial_status = {"replicas": 0, "updatedReplicas": 0, "readyReplicas": 0, "availableReplicas": 0}
+
+    def reconcile(self, event: FakeWatchEvent) -> None:
+        if event.kind == "ReplicaSet":
+            owner = _controller_owner(resource=event.object, kind=self.kind)
+            deployment = owner and self.manager.get(
+                api_version=self.api_version, kind=self.kind, name=owner["name"], namespace=event.namespace
+            )
+            if deployment:
+                self.after(resource=deployment, step=self.roll_up, delay=0)
+        elif event.type == "DELETED":
+            self.manager.schedule(delay=0, callback=lambda: self.delete_replica_sets(deployment=event.object))
+        elif event.object.get("metadata", {}).get("generation") != event.object.get("status", {}).get(
+            "observedGeneration"
+        ):
+            self.after(resource=event.object, step=self.sync)
+
+    def _replica_sets(self, deployment: dict[str, Any]) -> list[dict[str, Any]]:
+        return [
+            replica_set
+            for replica_set in self.manager.list(
+                api_version="apps/v1", kind="ReplicaSet", namespace=deployment["metadata"].get("namespace")
+            )
+            if _is_owned_by(resource=replica_set, owner=deployment)
+        ]
+
+    def delete_replica_sets(self, deployment: dict[str, Any]) -> None:
+        for replica_set in self._replica_sets(deployment=deployment):
+            self.manager.delete(
+                api_version="apps/v1",
+                kind="ReplicaSet",
+                name=replica_set["metadata"]["name"],
+                namespace=replica_set["metadata"].get("namespace"),
+            )
+
+    def _template_hash(self, deployment: dict[str, Any]) -> str:
+        template = deployment.get("spec", {}).get("template", {})
+        return hashlib.sha256(json.dumps(template, sort_keys=True).encode()).hexdigest()[:10]
+
+    def sync(self, deployment: dict[str, Any]) -> None:
+        namespace = deployment["metadata"].get("namespace")
+        spec = deployment.get("spec", {})
+        template_hash = self._template_hash(deployment=deployment)
+        name = f"{deployment['metadata']['name']}-{template_hash}"
+
+        for replica_set in self._replica_sets(deployment=deployment):
+            if replica_set["metadata"]["name"] == name:
+                self.manager.update(resource=replica_set, spec={"replicas": spec.get("replicas", 1)})
+            else:
+                self.manager.delete(
+                    api_version="apps/v1", kind="ReplicaSet", name=replica_set["metadata"]["name"], namespace=namespace
+                )
+
+        template = json.loads(json.dumps(spec.get("template", {})))
+        template.setdefault("metadata", {}).setdefault("labels", {})["pod-template-hash"] = template_hash
+        match_labels = {**(spec.get("selector", {}).get("matchLabels") or {}), "pod-template-hash": template_hash}
+        self.manager.create(
+            api_version="apps/v1",
+            kind="ReplicaSet",
+            namespace=namespace,
+            body={
+                "metadata": {
+                    "name": name,
+                    "labels": template["metadata"]["labels"],
+                    "ownerReferences": [_owner_reference(resource=deployment)],
+                },
+                "spec": {
+                    "replicas": spec.get("replicas", 1),
+                    "selector": {"matchLabels": match_labels},
+                    "template": template,
+                },
+            },
+        )
+        self.roll_up(deployment=deployment)
+
+    def roll_up(self, deployment: dict[str, Any]) -> None:
+        replicas = deployment.get("spec", {}).get("replicas", 1)
+        name = f"{deployment['metadata']['name']}-{self._template_hash(deployment=deployment)}"
+        replica_sets = self._replica_sets(deployment=deployment)
+        updated = [replica_set for replica_set in replica_sets if replica_set["metadata"]["name"] == name]
+        if not updated:
+            return
+
+        def _total(field: str) -> int:
+            return sum(replica_set.get("status", {}).get(field) or 0 for replica_set in replica_sets)
+
+        available = _total(field="availableReplicas")
+        complete = available == replicas == _total(field="replicas")
+        self.manager.update(
+            resource=deployment,
+            status={
+                "observedGeneration": deployment["metadata"].get("generation"),
+                "replicas": _total(field="replicas"),
+                "updatedReplicas": updated[0].get("status", {}).get("replicas") or 0,
+                "readyReplicas": _total(field="readyReplicas"),
+                "availableReplicas": available,
+                "unavailableReplicas": max(replicas - available, 0) or None,
+                "conditions": [
+                    self.condition(
+                        resource=deployment,
+                        condition_type="Available",
+                        status=available >= replicas,
+                        reason="MinimumReplicasAvailable" if available >= replicas else "MinimumReplicasUnavailable",
+                    ),
+                    self.condition(
+                        resource=deployment,
+                        condition_type="Progressing",
+                        status=True,
+                        reason="NewReplicaSetAvailable" if complete else "ReplicaSetUpdated",
+                        message=f'ReplicaSet "{name}" {"has successfully progressed" if complete else "is progressing"}.',
+                    ),
+                ],
+            },
+        )
+
+
+class FakeVirtualMachineInstanceController(FakeController):
+    """VMIs go through the Scheduling, Scheduled and Running phases, a step each, or fail"""
+
+    api_version = "kubevirt.io/v1"
+    kind = "VirtualMachineInstance"
+    next_phases: dict[str, str] = {"Pending": "Scheduling", "Scheduling": "Scheduled", "Scheduled": "Running"}
+
+    initial_status = {"phase": "Pending"}
+
+    def reconcile(self, event: FakeWatchEvent) -> None:
+        if event.type != "DELETED" and event.object.get("status", {}).get("phase") in self.next_phases:
+            self.after(resource=event.object, step=self.advance)
+
+    def advance(self, vmi: dict[str, Any]) -> None:
+        phase = self.next_phases.get(vmi.get("status", {}).get("phase"))
+        if phase is None:
+            return
+
+        if self.fails():
+            self.manager.update(
+                resource=vmi,
+                status={
+                    "phase": "Failed",
+                    "conditions": [self.condition(resource=vmi, condition_type="Ready", status=False, reason="Error")],
+                },
+            )
+            return
+
+        status: dict[str, Any] = {"phase": phase}
+        if phase == "Scheduled":
+            status["nodeName"] = FAKE_NODE_NAME
+        elif phase == "Running":
+            status["conditions"] = [self.condition(resource=vmi, condition_type="Ready", status=True, reason="")]
+        self.manager.update(resource=vmi, status=status)
+
+
+class FakeVirtualMachineController(FakeController):
+    """VMs to run create their VMI after a step, stopped VMs delete it, and follow its phase"""
+
+    api_version = "kubevirt.io/v1"
+    kind = "VirtualMachine"
+    watches = (("kubevirt.io/v1", "VirtualMachineInstance"),)
+    printable_statuses: dict[str, str] = {
+        "Pending": "Starting",
+        "Scheduling": "Starting",
+        "Scheduled": "Starting",
+        "Running": "Running",
+        "Failed": "CrashLoopBackOff",
+        "Succeeded": "Stopped",
+    }
+
+    initial_status = {"printableStatus": "Stopped", "created": False}
+
+    def _should_run(self, vm: dict[str, Any]) -> bool:
+        spec = vm.get("spec", {})
+        return bool(spec.get("running")) or spec.get("runStrategy") in VM_RUNNING_STRATEGIES
+
+    def reconcile(self, event: FakeWatchEvent) -> None:
+        if event.kind == "VirtualMachineInstance":
+            owner = _controller_owner(resource=event.object, kind=self.kind)
+            vm = owner and self.manager.get(
+                api_version=self.api_version, kind=self.kind, name=owner["name"], namespace=event.namespace
+            )
+            if vm:
+                self.after(resource=vm, step=self.follow_vmi, delay=0)
+        elif event.type == "DELETED":
+            self.manager.schedule(
+                delay=0,
+                callback=lambda: self.manager.delete(
+                    api_version=self.api_version,
+                    kind="VirtualMachineInstance",
+                    name=event.object["metadata"]["name"],
+                    namespace=event.namespace,
+                ),
+            )
+        elif event.object.get("metadata", {}).get("generation") != event.object.get("status", {}).get(
+            "observedGeneration"
+        ):
+            self.after(resource=event.object, step=self.sync)
+
+    def _vmi(self, vm: dict[str, Any]) -> dict[str, Any] | None:
+        vmi = self.manager.get(
+            api_version=self.api_version,
+            kind="VirtualMachineInstance",
+            name=vm["metadata"]["name"],
+            namespace=vm["metadata"].get("namespace"),
+        )
+        return vmi if vmi and _is_owned_by(resource=vmi, owner=vm) else None
+
+    def sync(self, vm: dict[str, Any]) -> None:
+        namespace = vm["metadata"].get("namespace")
+        vmi = self._vmi(vm=vm)
+        if self._should_run(vm=vm) and vmi is None:
+            template = json.loads(json.dumps(vm.get("spec", {}).get("template", {})))
+            self.manager.create(
+                api_version=self.api_version,
+                kind="VirtualMachineInstance",
+                namespace=namespace,
+                body={
+                    "metadata": {
+                        "name": vm["metadata"]["name"],
+                        "labels": template.get("metadata", {}).get("labels") or {},
+                        "annotations": template.get("metadata", {}).get("annotations") or {},
+                        "ownerReferences": [_owner_reference(resource=vm)],
+                    },
+                    "spec": template.get("spec") or {},
+                },
+            )
+        elif not self._should_run(vm=vm) and vmi is not None:
+            self.manager.update(resource=vm, status={"printableStatus": "Stopping"})
+            self.manager.delete(
+                api_version=self.api_version,
+                kind="VirtualMachineInstance",
+                name=vm["metadata"]["name"],
+                namespace=namespace,
+            )
+
+        self.manager.update(resource=vm, status={"observedGeneration": vm["metadata"].get("generation")})
+        self.follow_vmi(vm=vm)
+
+    def follow_vmi(self, vm: dict[str, Any]) -> None:
+        vmi = self._vmi(vm=vm)
+        if vmi is None:
+            if self._should_run(vm=vm) and vm.get("status", {}).get("created"):
+                # The VMI of a VM to run was deleted, start it again
+                self.after(resource=vm, step=self.sync)
+            self.manager.update(
+                resource=vm,
+                status={"printableStatus": "Stopped", "created": False, "ready": None, "conditions": None},
+            )
+            return
+
+        phase = vmi.get("status", {}).get("phase", "Pending")
+        running = phase == "Running"
+        self.manager.update(
+            resource=vm,
+            status={
+                "printableStatus": self.printable_statuses.get(phase, "Starting"),
+                "created": True,
+                "ready": True if running else None,
+                "conditions": [
+                    self.condition(
+                        resource=vm,
+                        condition_type="Ready",
+                        status=running,
+                        reason="" if running else "VMINotReady",
+                    )
+                ],
+            },
+        )
+
+
+class FakePersistentVolumeClaimController(FakeController):
+    """PVCs are bound after a step, or stay Pending on failure"""
+
+    api_version = "v1"
+    kind = "PersistentVolumeClaim"
+
+    initial_status = {"phase": "Pending"}
+
+    def reconcile(self, event: FakeWatchEvent) -> None:
+        if event.type == "ADDED" and event.object.get("status", {}).get("phase") == "Pending":
+            self.after(resource=event.object, step=self.bind)
+
+    def bind(self, pvc: dict[str, Any]) -> None:
+        if self.fails():
+            return
+
+        spec = pvc.get("spec", {})
+        self.manager.update(
+            resource=pvc,
+            status={
+                "phase": "Bound",
+                "accessModes": spec.get("accessModes", ["ReadWriteOnce"]),
+                "capacity": dict(spec.get("resources", {}).get("requests") or {}),
+            },
+        )
+
+
+class FakeDataVolumeController(FakeController):
+    """DataVolumes create their PVC after a step, then import in a step per phase once it is bound, or fail"""
+
+    api_version = "cdi.kubevirt.io/v1beta1"
+    kind = "DataVolume"
+    watches = (("v1", "PersistentVolumeClaim"),)
+    next_phases: dict[str, str] = {
+        "PVCBound": "ImportScheduled",
+        "ImportScheduled": "ImportInProgress",
+        "ImportInProgress": "Succeeded",
+    }
+
+    def set_initial_status(self, resource: dict[str, Any]) -> None:
+        resource["status"] = {
+            "phase": "Pending",
+            "progress": "N/A",
+            "conditions": [
+                self.condition(resource=resource, condition_type=condition_type, status=False, reason="")
+                for condition_type in ("Bound", "Ready", "Running")
+            ],
+        }
+
+    def reconcile(self, event: FakeWatchEvent) -> None:
+        if event.kind == "PersistentVolumeClaim":
+            owner = _controller_owner(resource=event.object, kind=self.kind)
+            data_volume = owner and self.manager.get(
+                api_version=self.api_version, kind=self.kind, name=owner["name"], namespace=event.namespace
+            )
+            if data_volume and event.object.get("status", {}).get("phase") == "Bound":
+                self.after(resource=data_volume, step=self.claim_bound, delay=0)
+        elif event.type == "DELETED":
+            self.manager.schedule(
+                delay=0,
+                callback=lambda: self.manager.delete(
+                    api_version="v1",
+                    kind="PersistentVolumeClaim",
+                    name=event.object["metadata"]["name"],
+                    namespace=event.namespace,
+                ),
+            )
+        elif event.type == "ADDED":
+            self.after(resource=event.object, step=self.create_claim)
+        elif event.object.get("status", {}).get("phase") in self.next_phases:
+            self.after(resource=event.object, step=self.advance)
+
+    def create_claim(self, data_volume: dict[str, Any]) -> None:
+        spec = data_volume.get("spec", {})
+        claim_spec = json.loads(json.dumps(spec.get("pvc") or spec.get("storage") or {}))
+        claim_spec.setdefault("accessModes", ["ReadWriteOnce"])
+        self.manager.create(
+            api_version="v1",
+            kind="PersistentVolumeClaim",
+            namespace=data_volume["metadata"].get("namespace"),
+            body={
+                "metadata": {
+                    "name": data_volume["metadata"]["name"],
+                    "labels": {"app": "containerized-data-importer"},
+                    "ownerReferences": [_owner_reference(resource=data_volume)],
+                },
+                "spec": claim_spec,
+            },
+        )
+
+    def claim_bound(self, data_volume: dict[str, Any]) -> None:
+        if data_volume.get("status", {}).get("phase") != "Pending":
+            return
+
+        self.manager.update(
+            resource=data_volume,
+            status={
+                "phase": "PVCBound",
+                "claimName": data_volume["metadata"]["name"],
+                "conditions": [
+                    self.condition(resource=data_volume, condition_type="Bound", status=True, reason="Bound"),
+                    self.condition(resource=data_volume, condition_type="Ready", status=False, reason=""),
+                    self.condition(resource=data_volume, condition_type="Running", status=False, reason=""),
+                ],
+            },
+        )
+
+    def advance(self, data_volume: dict[str, Any]) -> None:
+        phase = self.next_phases.get(data_volume.get("status", {}).get("phase"))
+        if phase is None:
+            return
+
+        if self.fails():
+            self.manager.update(
+                resource=data_volume,
+                status={
+                    "phase": "Failed",
+                    "conditions": [
+                        self.condition(resource=data_volume, condition_type="Bound", status=True, reason="Bound"),
+                        self.condition(resource=data_volume, condition_type="Ready", status=False, reason="Error"),
+                        self.condition(resource=data_volume, condition_type="Running", status=False, reason="Error"),
+                    ],
+                },
+            )
+            return
+
+        succeeded = phase == "Succeeded"
+        self.manager.update(
+            resource=data_volume,
+            status={
+                "phase": phase,
+                "progress": "100.0%" if succeeded else "0.00%",
+                "conditions": [
+                    self.condition(resource=data_volume, condition_type="Bound", status=True, reason="Bound"),
+                    self.condition(resource=data_volume, condition_type="Ready", status=succeeded, reason=""),
+                    self.condition(
+                        resource=data_volume,
+                        condition_type="Running",
+                        status=phase == "ImportInProgress",
+                        reason="Completed" if succeeded else "",
+                    ),
+                ],
+            },
+        )
+
+
+DEFAULT_CONTROLLERS: tuple[type[FakeController], ...] = (
+    FakeDeploymentController,
+    FakeReplicaSetController,
+    FakePodController,
+    FakeVirtualMachineController,
+    FakeVirtualMachineInstanceController,
+    FakeDataVolumeController,
+    FakePersistentVolumeClaimController,
+)
@@ -2,6 +2,8 @@
 
 from typing import Any
 
+from fake_kubernetes_client.clock import FakeClock
+from fake_kubernetes_client.controllers import FakeControllerManager
 from fake_kubernetes_client.exceptions import NotFoundError
 from fake_kubernetes_client.kubernetes_client import FakeKubernetesClient
 from fake_kubernetes_client.resource_field import FakeResourceField
@@ -14,7 +16,7 @@ from fake_kubernetes_client.resource_storage import FakeResourceStorage
 class FakeDynamicClient:
     """Fake implementation of kubernetes.dynamic.DynamicClient"""
 
-    def __init__(self, client: FakeKubernetesClient | None = None) -> None:
+    def __init__(self, client: FakeKubernetesClient | None = None, storage: FakeResourceStorage | None = None) -> None:
         # Distinguish between creating a new client vs using an existing one
         if client is None:
             # Create a new client with circular reference
@@ -25,7 +27,12 @@ class FakeDynamicClient:
             self.client = client
 
         self.configuration = self.client.configuration
-        self.storage = FakeResourceStorage()
+        # Virtual time: `with client.clock.virtual_time(): ...`
+        self.clock = storage.clock if storage else FakeClock()
+        # A FakeRemoteStorage shares the fake cluster of a FakeClusterServer
+        self.storage = storage or FakeResourceStorage(clock=self.clock)
+        # Simulated controllers, off until `client.controllers.start()`
+        self.controllers = FakeControllerManager(client=self)
         self.registry = FakeResourceRegistry()
         self._resources_manager = FakeResourceManager(client=self)
 
@@ -136,9 +143,11 @@ class FakeDynamicClient:
 
     def get(self, resource: Any, *args: Any, **kwargs: Any) -> Any:
         """Get resources based on resource definition"""
-        # Extract resource definition from FakeResourceField if needed
-        if hasattr(resource, "data"):
-            resource_def = resource.data
+        # Extract resource definition from FakeResourceField / FakeResourceInstance if needed
+        if isinstance(resource, FakeResourceInstance):
+            resource_def = resource.resource_def
+        elif isinstance(resource, FakeResourceField):
+            resource_def = resource.to_dict()
         else:
             resource_def = resource
 
@@ -0,0 +1,222 @@
+"""FakeEventBus implementation for fake Kubernetes client"""
+
+import threading
+from collections import deque
+from collections.abc import Callable, Iterator
+from dataclasses import dataclass
+from typing import Any, cast
+
+from fake_kubernetes_client.clock import FakeClock
+from fake_kubernetes_client.locks import MeteredLock
+
+# Watch events kept for resuming watches, older resource versions get 410 Gone
+DEFAULT_HISTORY_SIZE: int = 10000
+# Seconds between BOOKMARK events of watches that allow them
+DEFAULT_BOOKMARK_INTERVAL: float = 60.0
+
+
+@dataclass(frozen=True)
+class FakeWatchEvent:
+    """A change of a stored resource"""
+
+    resource_version: int
+    type: str
+    api_version: str
+    kind: str
+    namespace: str | None
+    object: dict[str, Any]
+
+
+class FakeEventBus:
+    """Watch events of the fake cluster
+
+    Every write gets the next resource version of a single counter (like etcd revisions) and is published to the
+    watchers as an ADDED, MODIFIED or DELETED event. The last `history_size` events are kept, so watches can resume
+    from a resource version; watches from an older resource version get an ERROR event with code 410 (Gone).
+
+    Subscribers are called with every event, in order, by the writing thread while it holds `condition`: they must not
+    block, write or list the fake cluster (that can deadlock on the storage locks), but schedule their work (see
+    `FakeClock.call_later`).
+    """
+
+    def __init__(
+        self,
+        history_size: int = DEFAULT_HISTORY_SIZE,
+        bookmark_interval: float = DEFAULT_BOOKMARK_INTERVAL,
+        clock: FakeClock | None = None,
+    ) -> None:
+        self.clock = clock or FakeClock()
+        # Held by the storage to commit a write: assign its resource version, make it visible and publish it
+        self.commit_lock = MeteredLock()
+        # MeteredLock has the private methods Condition waits with, like an RLock
+        self.condition = threading.Condition(cast(threading.RLock, self.commit_lock))
+        self.history: deque[FakeWatchEvent] = deque(maxlen=history_size)
+        self.bookmark_interval = bookmark_interval
+        self.subscribers: list[Callable[[FakeWatchEvent], None]] = []
+        self._resource_version = 0
+        # Events up to this resource version are no longer in the history
+        self._compacted_resource_version = 0
+
+    @property
+    def resource_version(self) -> str:
+        """Current resource version"""
+        return str(self._resource_version)
+
+    def next_resource_version(self) -> str:
+        """Allocate the resource version of a write"""
+        with self.condition:
+            self._resource_version += 1
+            return str(self._resource_version)
+
+    def publish(
+        self, event_type: str, api_version: str, kind: str, namespace: str | None, resource: dict[str, Any]
+    ) -> None:
+        """Publish a watch event, at the resource version of the resource"""
+        with self.condition:
+            try:
+                resource_version = int(resource["metadata"]["resourceVersion"])
+            except (KeyError, TypeError, ValueError):
+                resource_version = int(self.next_resource_version())
+
+            self._resource_version = max(self._resource_version, resource_version)
+            if self.history.maxlen is not None and len(self.history) == self.history.maxlen:
+                self._compacted_resource_version = self.history[0].resource_version
+
+            event = FakeWatchEvent(
+                resource_version=resource_version,
+                type=event_type,
+                api_version=api_version,
+                kind=kind,
+                namespace=namespace,
+                object=resource,
+            )
+            self.history.append(event)
+            for subscriber in list(self.subscribers):
+                subscriber(event)
+            self.condition.notify_all()
+
+    def subscribe(self, callback: Callable[[FakeWatchEvent], None]) -> None:
+        """Call `callback` with every published event"""
+        with self.condition:
+            self.subscribers.append(callback)
+
+    def unsubscribe(self, callback: Callable[[FakeWatchEvent], None]) -> None:
+        """Stop calling `callback`"""
+        with self.condition:
+            if callback in self.subscribers:
+                self.subscribers.remove(callback)
+
+    def compact(self, resource_version: str | None = None) -> None:
+        """Drop the history up to a resource version (default: all of it), like an etcd compaction"""
+        with self.condition:
+            compact_to = int(resource_version) if resource_version else self._resource_version
+            while self.history and self.history[0].resource_version <= compact_to:
+                self.history.popleft()
+            self._compacted_resource_version = max(self._compacted_resource_version, compact_to)
+
+    def _events_after(self, resource_version: int) -> list[FakeWatchEvent]:
+        events: list[FakeWatchEvent] = []
+        for event in reversed(self.history):
+            if event.resource_version <= resource_version:
+                break
+            events.append(event)
+        events.reverse()
+        return events
+
+    def wait_for_events(self, position: int, timeout: float | None) -> tuple[list[FakeWatchEvent] | None, int]:
+        """Get the events after a resource version, waiting up to `timeout` seconds (None: forever) for one
+
+        Returns:
+            tuple: The events (None if the history no longer has them) and the current resource version.
+        """
+        with self.condition:
+            events = None if position < self._compacted_resource_version else self._events_after(position)
+            if events == [] and (timeout is None or timeout > 0):
+                self.clock.wait(condition=self.condition, timeout=timeout)
+                events = None if position < self._compacted_resource_version else self._events_after(position)
+            return events, self._resource_version
+
+    def watch(
+        self,
+        api_version: str,
+        kind: str,
+        namespace: str | None = None,
+        resource_version: str | None = None,
+        timeout: float | None = None,
+        allow_bookmarks: bool = False,
+        matches: Callable[[dict[str, Any]], bool] | None = None,
+        initial: Callable[[], list[dict[str, Any]]] | None = None,
+    ) -> Iterator[tuple[str, dict[str, Any]]]:
+        """Watch the resources of a kind, blocking until `timeout` expires
+
+        Without a resource version (or with "0"), the resources returned by `initial` are sent as ADDED events first.
+
+        Args:
+            api_version (str): Storage API version of the kind.
+            kind (str): Resource kind.
+            namespace (str | None): Namespace to watch, None for all namespaces.
+            resource_version (str | None): Send the events after this resource version.
+            timeout (float | None): Seconds to watch for, None to watch until the generator is closed.
+            allow_bookmarks (bool): Send BOOKMARK events every `bookmark_interval` seconds.
+            matches (Callable | None): Send only the events of the resources it returns True for.
+            initial (Callable | None): Get the current resources, for watches without a resource version.
+
+        Yields:
+            tuple[str, dict]: Event type and object.
+        """
+        deadline = None if timeout is None else self.clock.monotonic() + timeout
+        next_bookmark = self.clock.monotonic() + self.bookmark_interval
+        if resource_version in (None, "", "0"):
+            # Writes are visible before they are published, listing after reading the position may repeat some of
+            # them but never misses one
+            position = int(self.resource_version)
+            for resource in initial() if initial else []:
+                yield "ADDED", resource
+        else:
+            position = int(resource_version)
+
+        while True:
+            wait_times = [next_bookmark - self.clock.monotonic()] if allow_bookmarks else []
+            if deadline is not None:
+                wait_times.append(deadline - self.clock.monotonic())
+            events, current_resource_version = self.wait_for_events(
+                position=position, timeout=max(min(wait_times), 0) if wait_times else None
+            )
+
+            if events is None:
+                yield "ERROR", _gone_status(resource_version=position, current=current_resource_version)
+                return
+
+            for event in events:
+                position = event.resource_version
+                if (
+                    event.api_version == api_version
+                    and event.kind == kind
+                    and (namespace is None or event.namespace == namespace)
+                    and (matches is None or matches(event.object))
+                ):
+                    yield event.type, event.object
+
+            now = self.clock.monotonic()
+            if allow_bookmarks and now >= next_bookmark:
+                position = max(position, current_resource_version)
+                next_bookmark = now + self.bookmark_interval
+                yield (
+                    "BOOKMARK",
+                    {"apiVersion": api_version, "kind": kind, "metadata": {"resourceVersion": str(position)}},
+                )
+
+            if deadline is not None and now >= deadline:
+                return
+
+
+def _gone_status(resource_version: int, current: int) -> dict[str, Any]:
+    return {
+        "kind": "Status",
+        "apiVersion": "v1",
+        "metadata": {},
+        "status": "Failure",
+        "message": f"too old resource version: {resource_version} ({current})",
+        "reason": "Expired",
+        "code": 410,
+    }
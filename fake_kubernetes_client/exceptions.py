@@ -52,3 +52,7 @@ except ImportError:
     MethodNotAllowedError = FakeClientMethodNotAllowedError
     ResourceNotFoundError = FakeClientResourceNotFoundError
     ServerTimeoutError = FakeClientServerTimeoutError
+
+
+class RemoteOperationNotSupportedError(Exception):
+    """Operation of a fake cluster that only runs in the process of its FakeClusterServer"""
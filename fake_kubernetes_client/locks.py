@@ -0,0 +1,64 @@
+"""Contention metered locks for fake Kubernetes client"""
+
+import threading
+from dataclasses import dataclass
+from time import perf_counter  # Bound here so lock waits are measured in real time, even in virtual time
+from typing import Any
+
+
+@dataclass
+class LockStats:
+    """Contention of a lock"""
+
+    acquisitions: int = 0
+    # Acquisitions that had to wait for another thread
+    contended: int = 0
+    wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+
+class MeteredLock:
+    """Re-entrant lock counting its acquisitions and the time spent waiting for it, usable with threading.Condition"""
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        # Only updated while holding the lock
+        self.stats = LockStats()
+
+    def acquire(self, blocking: bool = True, timeout: float = -1) -> bool:
+        if self._lock.acquire(blocking=False):
+            self.stats.acquisitions += 1
+            return True
+
+        if not blocking:
+            return False
+
+        start = perf_counter()
+        if not self._lock.acquire(timeout=timeout):
+            return False
+
+        waited = perf_counter() - start
+        self.stats.acquisitions += 1
+        self.stats.contended += 1
+        self.stats.wait_seconds += waited
+        self.stats.max_wait_seconds = max(self.stats.max_wait_seconds, waited)
+        return True
+
+    def release(self) -> None:
+        self._lock.release()
+
+    def __enter__(self) -> bool:
+        return self.acquire()
+
+    def __exit__(self, *_args: Any) -> None:
+        self.release()
+
+    # threading.Condition uses these to wait on a re-entrant lock
+    def _is_owned(self) -> bool:
+        return self._lock._is_owned()  # type: ignore[attr-defined]
+
+    def _release_save(self) -> Any:
+        return self._lock._release_save()  # type: ignore[attr-defined]
+
+    def _acquire_restore(self, state: Any) -> None:
+        self._lock._acquire_restore(state)  # type: ignore[attr-defined]
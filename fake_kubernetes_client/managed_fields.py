@@ -0,0 +1,116 @@
+"""Field ownership helpers for the fake server-side apply
+
+Fields are tracked as leaf paths (tuples of keys, lists are atomic) and stored in `metadata.managedFields` in the
+Kubernetes `FieldsV1` format, e.g. {"f:metadata": {"f:labels": {"f:app": {}}}}.
+"""
+
+import copy
+from typing import Any
+
+# Manager owning the fields a resource had before it was first applied, as named by Kubernetes
+BEFORE_FIRST_APPLY_MANAGER = "before-first-apply"
+# Keys identifying the object, never owned by a manager
+IDENTITY_PATHS = {("apiVersion",), ("kind",), ("metadata", "name"), ("metadata", "namespace")}
+MISSING = object()
+
+FieldPath = tuple[str, ...]
+
+
+def leaf_paths(data: dict[str, Any], prefix: FieldPath = ()) -> dict[FieldPath, Any]:
+    """Get all the leaf paths of a configuration with their values"""
+    paths: dict[FieldPath, Any] = {}
+    for key, value in data.items():
+        path = (*prefix, key)
+        if isinstance(value, dict) and value:
+            paths.update(leaf_paths(data=value, prefix=path))
+        elif path not in IDENTITY_PATHS:
+            paths[path] = value
+
+    return paths
+
+
+def get_path(data: dict[str, Any], path: FieldPath) -> Any:
+    """Get the value at a path or MISSING"""
+    value: Any = data
+    for key in path:
+        if not isinstance(value, dict) or key not in value:
+            return MISSING
+
+        value = value[key]
+
+    return value
+
+
+def set_path(data: dict[str, Any], path: FieldPath, value: Any) -> None:
+    """Set the value at a path, creating the parent dicts"""
+    for key in path[:-1]:
+        if not isinstance(data.get(key), dict):
+            data[key] = {}
+
+        data = data[key]
+
+    data[path[-1]] = copy.deepcopy(value)
+
+
+def delete_path(data: dict[str, Any], path: FieldPath) -> None:
+    """Delete the value at a path and the parent dicts it leaves empty (below the top level)"""
+    parents = [data]
+    for key in path[:-1]:
+        child = parents[-1].get(key)
+        if not isinstance(child, dict):
+            return
+
+        parents.append(child)
+
+    parents[-1].pop(path[-1], None)
+    for depth in range(len(path) - 1, 1, -1):
+        if parents[depth]:
+            break
+
+        parents[depth - 1].pop(path[depth - 1], None)
+
+
+def to_fields_v1(paths: set[FieldPath]) -> dict[str, Any]:
+    """Convert leaf paths to the FieldsV1 format"""
+    fields: dict[str, Any] = {}
+    for path in sorted(paths):
+        node = fields
+        for key in path:
+            node = node.setdefault(f"f:{key}", {})
+
+    return fields
+
+
+def from_fields_v1(fields: dict[str, Any], prefix: FieldPath = ()) -> set[FieldPath]:
+    """Convert the FieldsV1 format to leaf paths"""
+    paths: set[FieldPath] = set()
+    for key, value in fields.items():
+        path = (*prefix, key.removeprefix("f:"))
+        if value:
+            paths.update(from_fields_v1(fields=value, prefix=path))
+        else:
+            paths.add(path)
+
+    return paths
+
+
+def get_managed_paths(resource: dict[str, Any]) -> dict[str, set[FieldPath]]:
+    """Get the leaf paths owned by each manager of a resource"""
+    return {
+        entry["manager"]: from_fields_v1(fields=entry.get("fieldsV1") or {})
+        for entry in resource.get("metadata", {}).get("managedFields") or []
+    }
+
+
+def set_managed_paths(resource: dict[str, Any], managed_paths: dict[str, set[FieldPath]], appliers: set[str]) -> None:
+    """Store the leaf paths owned by each manager of a resource, dropping managers owning nothing"""
+    resource["metadata"]["managedFields"] = [
+        {
+            "manager": manager,
+            "operation": "Apply" if manager in appliers else "Update",
+            "fieldsType": "FieldsV1",
+            "fieldsV1": to_fields_v1(paths=paths),
+        }
+        for manager, paths in managed_paths.items()
+        if paths
+    ]
@@ -24,7 +24,7 @@ class FakeResourceField:
                 if "items" in data:
                     value = data["items"]
                     if isinstance(value, list):
-                        return [FakeResourceField(item) if isinstance(item, dict) else item for item in value]
+                        return _field_list(value=value)
                     return value
             except AttributeError:
                 pass
@@ -56,7 +56,7 @@ class FakeResourceField:
         elif isinstance(value, dict):
             return FakeResourceField(data=value)
         elif isinstance(value, list):
-            return [FakeResourceField(data=item) if isinstance(item, dict) else item for item in value]
+            return _field_list(value=value)
         else:
             return value
 
@@ -67,7 +67,7 @@ class FakeResourceField:
         elif isinstance(value, dict):
             return FakeResourceField(data=value)
         elif isinstance(value, list):
-            return [FakeResourceField(data=item) if isinstance(item, dict) else item for item in value]
+            return _field_list(value=value)
         else:
             return value
 
@@ -87,6 +87,9 @@ class FakeResourceField:
         value = self._data.get(key, default)
         if isinstance(value, dict) and value != default:
             return FakeResourceField(data=value)
+        if isinstance(value, list) and value is not default:
+            # Stored resources are shared snapshots, don't let callers mutate them
+            return copy.deepcopy(value)
         return value
 
     def to_dict(self) -> dict[str, Any]:
@@ -107,7 +110,7 @@ class FakeResourceField:
         if "items" in self._data:
             value = self._data["items"]
             if isinstance(value, list):
-                return [FakeResourceField(data=item) if isinstance(item, dict) else item for item in value]
+                return _field_list(value=value)
             return value
         # Otherwise return dict.items()
         return self._data.items()
@@ -119,3 +122,8 @@ class FakeResourceField:
     def __len__(self) -> int:
         """Get length like a dictionary"""
         return len(self._data)
+
+
+def _field_list(value: list[Any]) -> list[Any]:
+    """Copy of a stored list, with its dicts as fields"""
+    return [FakeResourceField(data=item) if isinstance(item, dict) else copy.deepcopy(item) for item in value]
@@ -1,6 +1,7 @@
 """FakeResourceInstance implementation for fake Kubernetes client"""
 
 import copy
+import json
 import time
 import uuid
 from collections.abc import Iterator
@@ -8,6 +9,16 @@ from datetime import datetime, timezone
 from typing import TYPE_CHECKING, Any, Union
 
 from fake_kubernetes_client.exceptions import ConflictError, MethodNotAllowedError, NotFoundError
+from fake_kubernetes_client.managed_fields import (
+    BEFORE_FIRST_APPLY_MANAGER,
+    MISSING,
+    delete_path,
+    get_managed_paths,
+    get_path,
+    leaf_paths,
+    set_managed_paths,
+    set_path,
+)
 from fake_kubernetes_client.resource_field import FakeResourceField
 from fake_kubernetes_client.status_templates import add_realistic_status
 
@@ -60,10 +71,6 @@ class FakeResourceInstance:
             # Use our fake ConflictError which has status attribute
             raise ConflictError(f"{self.resource_def['kind']} '{name}' already exists") from None
 
-    def _generate_resource_version(self) -> str:
-        """Generate unique resource version"""
-        return str(int(time.time() * 1000))
-
     def _generate_timestamp(self) -> str:
         """Generate current UTC timestamp in ISO format"""
         return datetime.now(timezone.utc).isoformat()
@@ -108,7 +115,6 @@ class FakeResourceInstance:
         # Add generated metadata
         body["metadata"].update({
             "uid": str(uuid.uuid4()),
-            "resourceVersion": self._generate_resource_version(),
             "creationTimestamp": self._generate_timestamp(),
             "generation": 1,
             "labels": body["metadata"].get("labels", {}),
@@ -119,13 +125,23 @@ class FakeResourceInstance:
         body["apiVersion"] = storage_api_version  # Use the same full API version for body
         body["kind"] = self.resource_def["kind"]
 
-        # Add realistic status for resources that need it
-        # Pass resource mappings from registry if available
-        resource_mappings = None
-        if self.client and hasattr(self.client, "registry"):
-            resource_mappings = self.client.registry._get_resource_mappings()
+        # Kinds managed by a running simulated controller start from its initial status
+        controller = None
+        if self.client and hasattr(self.client, "controllers"):
+            controller = self.client.controllers.get_controller(
+                api_version=storage_api_version, kind=self.resource_def["kind"]
+            )
+
+        if controller:
+            controller.set_initial_status(resource=body)
+        else:
+            # Add realistic status for resources that need it
+            # Pass resource mappings from registry if available
+            resource_mappings = None
+            if self.client and hasattr(self.client, "registry"):
+                resource_mappings = self.client.registry._get_resource_mappings()
 
-        add_realistic_status(body=body, resource_mappings=resource_mappings)
+            add_realistic_status(body=body, resource_mappings=resource_mappings)
 
         # Special case: ProjectRequest is ephemeral - only creates Project (matches real cluster behavior)
         if self.resource_def["kind"] == "ProjectRequest":
@@ -136,14 +152,21 @@ class FakeResourceInstance:
             # Return Project data, not ProjectRequest (ProjectRequest is ephemeral)
             return FakeResourceField(data=project_body)
 
-        # Store resource with initial metadata and status
-        self.storage.store_resource(
-            api_version=storage_api_version,  # Use consistent API version for storage
-            kind=self.resource_def["kind"],
-            name=name,
-            namespace=self._normalize_namespace(namespace),  # Normalize namespace (empty string -> None)
-            resource=body,
-        )
+        # Store resource with initial metadata and status, checking again under the lock of the kind so concurrent
+        # creates of the same name conflict
+        with self.storage.lock(kind=self.resource_def["kind"], api_version=storage_api_version):
+            if self.storage.get_resource(
+                kind=self.resource_def["kind"], api_version=storage_api_version, name=name, namespace=resource_namespace
+            ):
+                self._create_conflict_error(name)
+
+            self.storage.store_resource(
+                api_version=storage_api_version,  # Use consistent API version for storage
+                kind=self.resource_def["kind"],
+                name=name,
+                namespace=self._normalize_namespace(resource_namespace),  # Normalize namespace (empty string -> None)
+                resource=body,
+            )
 
         # Generate automatic events for resource creation
         self._generate_resource_events(body, "Created", "created")
@@ -161,7 +184,6 @@ class FakeResourceInstance:
             "metadata": {
                 "name": project_name,
                 "uid": str(uuid.uuid4()),
-                "resourceVersion": self._generate_resource_version(),
                 "creationTimestamp": self._generate_timestamp(),
                 "generation": 1,
                 "labels": project_request_body["metadata"].get("labels", {}),
@@ -207,7 +229,6 @@ class FakeResourceInstance:
                 "name": event_name,
                 "namespace": resource_namespace or "default",
                 "uid": str(uuid.uuid4()),
-                "resourceVersion": str(int(time.time() * 1000)),
                 "creationTimestamp": datetime.now(timezone.utc).isoformat(),
                 "generation": 1,
             },
@@ -240,9 +261,11 @@ class FakeResourceInstance:
         namespace: str | None = None,
         label_selector: str | None = None,
         field_selector: str | None = None,
+        limit: int | None = None,
+        _continue: str | None = None,
         **_kwargs: Any,
     ) -> FakeResourceField:
-        """Get resource(s)"""
+        """Get resource(s), lists are paginated when `limit` is set"""
         if name:
             # Get specific resource
             namespace = self._normalize_namespace(namespace)
@@ -258,6 +281,8 @@ class FakeResourceInstance:
 
         # List resources using consistent API version
         storage_api_version = self._get_storage_api_version()
+        # Read before listing, watching from it may repeat writes made meanwhile but never misses one
+        list_resource_version = self.storage.event_bus.resource_version
         resources = self.storage.list_resources(
             kind=self.resource_def["kind"],
             api_version=storage_api_version,
@@ -271,11 +296,19 @@ class FakeResourceInstance:
             "apiVersion": self.resource_def["api_version"],
             "kind": f"{self.resource_def['kind']}List",
             "metadata": {
-                "resourceVersion": self._generate_resource_version(),
+                "resourceVersion": list_resource_version,
             },
             "items": resources,
         }
 
+        # Paginate, the continue token is the offset of the next page
+        if limit:
+            offset = int(_continue or 0)
+            response["items"] = resources[offset : offset + limit]
+            if offset + limit < len(resources):
+                response["metadata"]["continue"] = str(offset + limit)
+                response["metadata"]["remainingItemCount"] = len(resources) - offset - limit
+
         return FakeResourceField(data=response)
 
     def delete(
@@ -325,31 +358,32 @@ class FakeResourceInstance:
         namespace = self._normalize_namespace(namespace)
 
         storage_api_version = self._get_storage_api_version()
-        existing = self.storage.get_resource(
-            kind=self.resource_def["kind"], api_version=storage_api_version, name=name, namespace=namespace
-        )
-        if not existing:
-            self._create_not_found_error(name)
-            # This line is unreachable but satisfies type checker
-            return FakeResourceField(data={})
-
-        # Simple merge patch implementation
-        patched = copy.deepcopy(existing)
-        self._merge_patch(patched, body)
-
-        # Update metadata
-        patched["metadata"]["resourceVersion"] = self._generate_resource_version()
-        if "generation" in patched["metadata"]:
-            patched["metadata"]["generation"] += 1
-
-        # Store updated resource
-        self.storage.store_resource(
-            kind=self.resource_def["kind"],
-            api_version=storage_api_version,
-            name=name,
-            namespace=namespace,
-            resource=patched,
-        )
+        # Held until stored, so concurrent writes are not lost
+        with self.storage.lock(kind=self.resource_def["kind"], api_version=storage_api_version):
+            existing = self.storage.get_resource(
+                kind=self.resource_def["kind"], api_version=storage_api_version, name=name, namespace=namespace
+            )
+            if not existing:
+                self._create_not_found_error(name)
+                # This line is unreachable but satisfies type checker
+                return FakeResourceField(data={})
+
+            # Simple merge patch implementation
+            patched = copy.deepcopy(existing)
+            self._merge_patch(patched, body)
+
+            # Update metadata, the storage sets the resource version
+            if "generation" in patched["metadata"]:
+                patched["metadata"]["generation"] += 1
+
+            # Store updated resource
+            self.storage.store_resource(
+                kind=self.resource_def["kind"],
+                api_version=storage_api_version,
+                name=name,
+                namespace=namespace,
+                resource=patched,
+            )
 
         # Generate automatic events for resource patch
         self._generate_resource_events(patched, "Updated", "updated")
@@ -372,51 +406,52 @@ class FakeResourceInstance:
         namespace = self._normalize_namespace(namespace)
 
         storage_api_version = self._get_storage_api_version()
-        existing = self.storage.get_resource(
-            kind=self.resource_def["kind"], api_version=storage_api_version, name=name, namespace=namespace
-        )
-        if not existing:
-            self._create_not_found_error(name)
-            # This line is unreachable but satisfies type checker
-            return FakeResourceField(data={})
-
-        # Check for resourceVersion conflict - this is what Kubernetes does
-        if "metadata" in body and "resourceVersion" in body["metadata"]:
-            if body["metadata"]["resourceVersion"] != existing["metadata"]["resourceVersion"]:
-                # Create conflict error with proper message
-                try:
-                    api_exception = K8sApiException(status=409, reason="Conflict")
-                    api_exception.body = f'{{"kind":"Status","apiVersion":"v1","metadata":{{}},"status":"Failure","message":"Operation cannot be fulfilled on {self.resource_def["kind"].lower()}s.{self.resource_def.get("group", "")} \\"{name}\\": the object has been modified; please apply your changes to the latest version and try again","reason":"Conflict","code":409}}'
-                    raise ConflictError(api_exception) from None
-                except (NameError, TypeError):
-                    # Use our fake ConflictError which has status attribute
-                    raise ConflictError(
-                        f"Operation cannot be fulfilled on {self.resource_def['kind']} '{name}': the object has been modified"
-                    ) from None
-
-        # Ensure metadata is preserved
-        if "metadata" not in body:
-            body["metadata"] = {}
-
-        body["metadata"].update({
-            "uid": existing["metadata"]["uid"],
-            "resourceVersion": self._generate_resource_version(),
-            "creationTimestamp": existing["metadata"]["creationTimestamp"],
-            "generation": existing["metadata"].get("generation", 1) + 1,
-        })
-
-        # Set API version and kind
-        body["apiVersion"] = self.resource_def["api_version"]
-        body["kind"] = self.resource_def["kind"]
-
-        # Store replaced resource
-        self.storage.store_resource(
-            kind=self.resource_def["kind"],
-            api_version=storage_api_version,
-            name=name,
-            namespace=namespace,
-            resource=body,
-        )
+        # Held until stored, so the resource version check and the write are atomic
+        with self.storage.lock(kind=self.resource_def["kind"], api_version=storage_api_version):
+            existing = self.storage.get_resource(
+                kind=self.resource_def["kind"], api_version=storage_api_version, name=name, namespace=namespace
+            )
+            if not existing:
+                self._create_not_found_error(name)
+                # This line is unreachable but satisfies type checker
+                return FakeResourceField(data={})
+
+            # Check for resourceVersion conflict - this is what Kubernetes does
+            if "metadata" in body and "resourceVersion" in body["metadata"]:
+                if body["metadata"]["resourceVersion"] != existing["metadata"]["resourceVersion"]:
+                    # Create conflict error with proper message
+                    try:
+                        api_exception = K8sApiException(status=409, reason="Conflict")
+                        api_exception.body = f'{{"kind":"Status","apiVersion":"v1","metadata":{{}},"status":"Failure","message":"Operation cannot be fulfilled on {self.resource_def["kind"].lower()}s.{self.resource_def.get("group", "")} \\"{name}\\": the object has been modified; please apply your changes to the latest version and try again","reason":"Conflict","code":409}}'
+                        raise ConflictError(api_exception) from None
+                    except (NameError, TypeError):
+                        # Use our fake ConflictError which has status attribute
+                        raise ConflictError(
+                            f"Operation cannot be fulfilled on {self.resource_def['kind']} '{name}': the object has been modified"
+                        ) from None
+
+            # Ensure metadata is preserved
+            if "metadata" not in body:
+                body["metadata"] = {}
+
+            body["metadata"].update({
+                "uid": existing["metadata"]["uid"],
+                "creationTimestamp": existing["metadata"]["creationTimestamp"],
+                "generation": existing["metadata"].get("generation", 1) + 1,
+            })
+
+            # Set API version and kind
+            body["apiVersion"] = self.resource_def["api_version"]
+            body["kind"] = self.resource_def["kind"]
+
+            # Store replaced resource
+            self.storage.store_resource(
+                kind=self.resource_def["kind"],
+                api_version=storage_api_version,
+                name=name,
+                namespace=namespace,
+                resource=body,
+            )
 
         # Generate automatic events for resource replacement
         self._generate_resource_events(body, "Updated", "replaced")
@@ -438,27 +473,156 @@ class FakeResourceInstance:
         """Update a resource (alias for replace)"""
         return self.replace(name=name, body=body, namespace=namespace, **kwargs)
 
+    def server_side_apply(
+        self,
+        body: dict[str, Any] | None = None,
+        name: str | None = None,
+        namespace: str | None = None,
+        force_conflicts: bool | None = None,
+        field_manager: str | None = None,
+        **_kwargs: Any,
+    ) -> FakeResourceField:
+        """Server-side apply a configuration to an existing resource
+
+        Simplified apply semantics: fields are leaf paths (lists are atomic) owned by managers in
+        `metadata.managedFields`. Setting a field to a different value than the one on the resource conflicts unless
+        the manager owns it or `force_conflicts` is set. Fields the manager applied before and no longer applies are
+        removed unless another manager owns them.
+        """
+        if not body:
+            raise ValueError("body is required for server side apply")
+        if not field_manager:
+            raise ValueError("field_manager is required for server side apply")
+
+        name = name or body.get("metadata", {}).get("name")
+        if not name:
+            raise ValueError("name is required for server side apply")
+
+        namespace = self._normalize_namespace(namespace or body.get("metadata", {}).get("namespace"))
+        storage_api_version = self._get_storage_api_version()
+        # Held until stored, so the conflict detection and the write are atomic
+        with self.storage.lock(kind=self.resource_def["kind"], api_version=storage_api_version):
+            existing = self.storage.get_resource(
+                kind=self.resource_def["kind"], api_version=storage_api_version, name=name, namespace=namespace
+            )
+            if not existing:
+                self._create_not_found_error(name)
+                # This line is unreachable but satisfies type checker
+                return FakeResourceField(data={})
+
+            applied = leaf_paths(data=body)
+            managed_paths = get_managed_paths(resource=existing)
+            appliers = {
+                entry["manager"]
+                for entry in existing["metadata"].get("managedFields") or []
+                if entry.get("operation") == "Apply"
+            } | {field_manager}
+            owned = managed_paths.pop(field_manager, set())
+            conflicts = sorted(
+                path
+                for path, value in applied.items()
+                if path not in owned and get_path(data=existing, path=path) not in (MISSING, value)
+            )
+            if conflicts and not force_conflicts:
+                message = f"Apply failed with {len(conflicts)} conflict(s): " + ", ".join(
+                    f".{'.'.join(path)}" for path in conflicts
+                )
+                try:
+                    api_exception = K8sApiException(status=409, reason="Conflict")
+                    api_exception.body = json.dumps({
+                        "kind": "Status",
+                        "apiVersion": "v1",
+                        "metadata": {},
+                        "status": "Failure",
+                        "message": message,
+                        "reason": "Conflict",
+                        "code": 409,
+                    })
+                    raise ConflictError(api_exception) from None
+                except (NameError, TypeError):
+                    # Use our fake ConflictError which has status attribute
+                    raise ConflictError(message) from None
+
+            # Fields set before any apply keep an owner, so the applier releasing them does not remove them
+            all_owned = set(owned).union(*managed_paths.values())
+            unowned = {
+                path for path in applied if path not in all_owned and get_path(data=existing, path=path) is not MISSING
+            }
+            if unowned:
+                managed_paths.setdefault(BEFORE_FIRST_APPLY_MANAGER, set()).update(unowned)
+
+            if force_conflicts:
+                for paths in managed_paths.values():
+                    paths.difference_update(applied)
+
+            patched = copy.deepcopy(existing)
+            others_owned = set().union(*managed_paths.values())
+            for path in owned - set(applied) - others_owned:
+                delete_path(data=patched, path=path)
+
+            for path, value in applied.items():
+                set_path(data=patched, path=path, value=value)
+
+            managed_paths[field_manager] = set(applied)
+            set_managed_paths(resource=patched, managed_paths=managed_paths, appliers=appliers)
+            if "generation" in patched["metadata"]:
+                patched["metadata"]["generation"] += 1
+
+            self.storage.store_resource(
+                kind=self.resource_def["kind"],
+                api_version=storage_api_version,
+                name=name,
+                namespace=namespace,
+                resource=patched,
+            )
+        self._generate_resource_events(patched, "Updated", "applied")
+
+        return FakeResourceField(data=patched)
+
     def watch(
-        self, namespace: str | None = None, _timeout: int | None = None, **kwargs: Any
+        self,
+        namespace: str | None = None,
+        name: str | None = None,
+        label_selector: str | None = None,
+        field_selector: str | None = None,
+        resource_version: str | None = None,
+        timeout: int | None = None,
+        allow_watch_bookmarks: bool = False,
+        **_kwargs: Any,
     ) -> Iterator[dict[str, Any]]:
-        """Watch for resource changes"""
-        # Simple implementation - yields existing resources as ADDED events
-        storage_api_version = self.resource_def.get("group_version", self.resource_def["api_version"])
+        """Watch for resource changes
 
-        # Extract label and field selectors from kwargs
-        label_selector = kwargs.get("label_selector")
-        field_selector = kwargs.get("field_selector")
+        Without `resource_version`, existing resources are sent as ADDED events first. The watch then blocks and
+        sends ADDED/MODIFIED/DELETED events until `timeout` expires, see `FakeEventBus.watch`.
+        """
+        storage_api_version = self._get_storage_api_version()
+        namespace = self._normalize_namespace(namespace)
+        if name:
+            field_selector = ",".join(filter(None, [field_selector, f"metadata.name=={name}"]))
 
-        resources = self.storage.list_resources(
-            kind=self.resource_def["kind"],
-            api_version=storage_api_version,
-            namespace=self._normalize_namespace(namespace),  # Normalize namespace here too
-            label_selector=label_selector,
-            field_selector=field_selector,
-        )
+        def _matches(resource: dict[str, Any]) -> bool:
+            labels = resource.get("metadata", {}).get("labels") or {}
+            if label_selector and not self.storage._matches_label_selector(labels, label_selector):
+                return False
+            return not field_selector or self.storage._matches_field_selector(resource, field_selector)
 
-        for resource in resources:
-            yield {"type": "ADDED", "object": FakeResourceField(data=resource), "raw_object": resource}
+        for event_type, resource in self.storage.event_bus.watch(
+            api_version=storage_api_version,
+            kind=self.resource_def["kind"],
+            namespace=namespace,
+            resource_version=resource_version,
+            timeout=timeout,
+            allow_bookmarks=allow_watch_bookmarks,
+            matches=_matches,
+            initial=lambda: self.storage.list_resources(
+                kind=self.resource_def["kind"],
+                api_version=storage_api_version,
+                namespace=namespace,
+                label_selector=label_selector,
+                field_selector=field_selector,
+            ),
+        ):
+            yield {"type": event_type, "object": FakeResourceField(data=resource), "raw_object": resource}
 
     def _merge_patch(self, target: dict[str, Any], patch: dict[str, Any]) -> None:
         """Simple merge patch implementation"""
@@ -2,6 +2,7 @@
 
 import logging
 from collections import defaultdict
+from collections.abc import Mapping
 from typing import Any
 
 from fake_kubernetes_client.resource_field import FakeResourceField
@@ -16,7 +17,7 @@ class FakeResourceRegistry:
     def __init__(self) -> None:
         # Store by kind to allow searching across API groups
         self.resources: defaultdict[str, list[dict[str, Any]]] = defaultdict(list)
-        self._resource_mappings_cache: dict[str, Any] | None = None
+        self._resource_mappings_cache: Mapping[str, Any] | None = None
         self._builtin_resources: dict[tuple[str, str], dict[str, Any]] = {}
         self._additional_resources: dict[str, list[dict[str, Any]]] = {}
         self._load_resource_definitions()
@@ -34,12 +35,13 @@ class FakeResourceRegistry:
         else:
             return kind_lower + "s"
 
-    def _get_resource_mappings(self) -> dict[str, Any]:
+    def _get_resource_mappings(self) -> Mapping[str, Any]:
         """Load and cache the resource mappings file using SchemaValidator"""
         if self._resource_mappings_cache is None:
             # Use SchemaValidator to load the mappings - single source of truth
+            # Only group/version/kind and namespaced are needed, skip loading the full schemas
             if SchemaValidator.load_mappings_data():
-                self._resource_mappings_cache = SchemaValidator.get_mappings_data() or {}
+                self._resource_mappings_cache = SchemaValidator.get_mappings_summary() or {}
                 logger.debug(f"Loaded {len(self._resource_mappings_cache)} resource mappings from SchemaValidator")
             else:
                 logger.error("Failed to load resource mappings from SchemaValidator")
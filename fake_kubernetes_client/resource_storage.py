@@ -1,27 +1,186 @@
 """FakeResourceStorage implementation for fake Kubernetes client"""
 
 import copy
+import dataclasses
+import threading
 from collections import defaultdict
 from typing import Any
 
+from fake_kubernetes_client.clock import FakeClock
+from fake_kubernetes_client.event_bus import FakeEventBus
+from fake_kubernetes_client.locks import LockStats, MeteredLock
 
-class FakeResourceStorage:
-    """In-memory storage for Kubernetes resources"""
+# Field paths indexed for field selectors, other paths are matched by scanning
+INDEXED_FIELD_PATHS: tuple[str, ...] = ("metadata.name", "metadata.namespace", "spec.nodeName", "status.phase")
+
+# (namespace, name)
+ResourceKey = tuple[str | None, str]
+
+
+def _snapshot(value: Any) -> Any:
+    """Copy a JSON like value, faster than copy.deepcopy for dicts and lists of plain values"""
+    if isinstance(value, dict):
+        return {key: _snapshot(item) for key, item in value.items()}
+    if isinstance(value, list):
+        return [_snapshot(item) for item in value]
+    if value is None or isinstance(value, (str, int, float, bool)):
+        return value
+    return copy.deepcopy(value)
+
+
+class KindIndex:
+    """Secondary indexes of the resources of a kind, on labels and `INDEXED_FIELD_PATHS`
+
+    Index buckets are dicts used as insertion ordered sets of resource keys.
+    """
 
     def __init__(self) -> None:
+        # (label key, label value) -> resource keys
+        self.labels: defaultdict[tuple[str, str], dict[ResourceKey, None]] = defaultdict(dict)
+        # (field path, string value) -> resource keys
+        self.fields: defaultdict[tuple[str, str], dict[ResourceKey, None]] = defaultdict(dict)
+        # field path -> keys of resources with a non string value, compared by type by the field selector
+        self.unindexed_fields: defaultdict[str, dict[ResourceKey, None]] = defaultdict(dict)
+
+    def _buckets(self, resource: dict[str, Any]) -> list[tuple[defaultdict[Any, dict[ResourceKey, None]], Any]]:
+        buckets: list[tuple[defaultdict[Any, dict[ResourceKey, None]], Any]] = []
+        for label_key, label_value in ((resource.get("metadata") or {}).get("labels") or {}).items():
+            if isinstance(label_value, str):
+                buckets.append((self.labels, (label_key, label_value)))
+
+        for path in INDEXED_FIELD_PATHS:
+            value = get_field_value(obj=resource, path=path)
+            if value is NotImplemented:
+                continue
+            if isinstance(value, str):
+                buckets.append((self.fields, (path, value)))
+            else:
+                buckets.append((self.unindexed_fields, path))
+
+        return buckets
+
+    def add(self, key: ResourceKey, resource: dict[str, Any]) -> None:
+        for index, bucket_key in self._buckets(resource=resource):
+            index[bucket_key][key] = None
+
+    def remove(self, key: ResourceKey, resource: dict[str, Any]) -> None:
+        for index, bucket_key in self._buckets(resource=resource):
+            bucket = index.get(bucket_key)
+            if bucket is None:
+                continue
+            bucket.pop(key, None)
+            if not bucket:
+                del index[bucket_key]
+
+    def candidates(self, label_selector: str | None, field_selector: str | None) -> list[ResourceKey] | None:
+        """Get the keys of the resources that can match the selectors
+
+        Only equality requirements are looked up (with the same parsing as the selector filters), the candidates
+        still have to be filtered by the selectors.
+
+        Returns:
+            list[ResourceKey] | None: Candidate keys, None if no requirement is indexed.
+        """
+        key_sets: list[dict[ResourceKey, None]] = []
+        for part in (label_selector or "").split(","):
+            if "=" in part:
+                label_key, label_value = part.split("=", 1)
+                key_sets.append(self.labels.get((label_key.strip(), label_value.strip()), {}))
+
+        for part in (field_selector or "").split(","):
+            separator = "==" if "==" in part else "="
+            if separator not in part:
+                continue
+            path, value = (item.strip() for item in part.split(separator, 1))
+            if path in INDEXED_FIELD_PATHS:
+                unindexed = self.unindexed_fields.get(path)
+                matching = self.fields.get((path, value), {})
+                key_sets.append({**matching, **unindexed} if unindexed else matching)
+
+        if not key_sets:
+            return None
+
+        smallest, *others = sorted(key_sets, key=len)
+        return [key for key in smallest if all(key in other for other in others)]
+
+
+class FakeResourceStorage:
+    """In-memory storage for Kubernetes resources
+
+    Resources are stored as snapshots that are never modified in place: `store_resource` copies the resource and
+    replaces the previous snapshot. Read methods return the snapshots without copying them, callers must copy a
+    resource before modifying it.
+
+    Writes are published to `event_bus` as watch events.
+
+    The storage is thread safe. Each kind has its own lock (`lock()`), held to write or list the kind and by callers
+    that read, modify and write a resource; getting a resource takes no lock. Writes of all kinds are committed under
+    the short `event_bus.commit_lock`, which assigns their resource version. `lock_stats()` reports the contention.
+    """
+
+    def __init__(self, clock: FakeClock | None = None) -> None:
         # Storage structure: {api_version: {kind: {namespace: {name: resource}}}}
         self.resources: defaultdict[str, defaultdict[str, defaultdict[str | None, dict[str, Any]]]] = defaultdict(
             lambda: defaultdict(lambda: defaultdict(dict))
         )
+        # (api_version, kind) -> secondary indexes
+        self.indexes: defaultdict[tuple[str, str], KindIndex] = defaultdict(KindIndex)
+        self.clock = clock or FakeClock()
+        self.event_bus = FakeEventBus(clock=self.clock)
+        # (api_version, kind) -> lock of the kind
+        self.kind_locks: dict[tuple[str, str], MeteredLock] = {}
+        self._kind_locks_lock = threading.Lock()
+
+    def lock(self, kind: str, api_version: str) -> MeteredLock:
+        """Get the (re-entrant) lock of a kind"""
+        lock = self.kind_locks.get((api_version, kind))
+        if lock is None:
+            with self._kind_locks_lock:
+                if (api_version, kind) not in self.kind_locks:
+                    # Create the nested structures of the kind once, they are then only changed under its lock
+                    self.resources[api_version][kind]
+                    self.indexes[api_version, kind]
+                    self.kind_locks[api_version, kind] = MeteredLock()
+                lock = self.kind_locks[api_version, kind]
+        return lock
+
+    def lock_stats(self) -> dict[str, LockStats]:
+        """Get the contention of the commit lock ("commit") and of the lock of each kind ("<api_version>/<kind>")"""
+        stats = {"commit": dataclasses.replace(self.event_bus.commit_lock.stats)}
+        for (api_version, kind), lock in list(self.kind_locks.items()):
+            stats[f"{api_version}/{kind}"] = dataclasses.replace(lock.stats)
+        return stats
 
     def store_resource(
         self, kind: str, api_version: str, name: str, namespace: str | None, resource: dict[str, Any]
     ) -> None:
-        """Store a resource"""
-        self.resources[api_version][kind][namespace][name] = copy.deepcopy(resource)
+        """Store a resource, setting its resource version"""
+        snapshot = _snapshot(resource)
+        snapshot.setdefault("metadata", {})
+        with self.lock(kind=kind, api_version=api_version):
+            namespace_resources = self.resources[api_version][kind][namespace]
+            previous = namespace_resources.get(name)
+            with self.event_bus.condition:
+                # Assigned at commit, so resource versions are published in order
+                snapshot["metadata"]["resourceVersion"] = self.event_bus.next_resource_version()
+                namespace_resources[name] = snapshot
+                self.event_bus.publish(
+                    event_type="ADDED" if previous is None else "MODIFIED",
+                    api_version=api_version,
+                    kind=kind,
+                    namespace=namespace,
+                    resource=snapshot,
+                )
+
+            index = self.indexes[api_version, kind]
+            if previous is not None:
+                index.remove(key=(namespace, name), resource=previous)
+            index.add(key=(namespace, name), resource=snapshot)
+
+        resource.setdefault("metadata", {})["resourceVersion"] = snapshot["metadata"]["resourceVersion"]
 
     def get_resource(self, kind: str, api_version: str, name: str, namespace: str | None) -> dict[str, Any] | None:
-        """Get a specific resource"""
+        """Get a specific resource (a read-only snapshot)"""
         api_resources = self.resources.get(api_version)
         if not api_resources:
             return None
@@ -31,8 +190,7 @@ class FakeResourceStorage:
         namespace_resources = kind_resources.get(namespace)
         if not namespace_resources:
             return None
-        resource = namespace_resources.get(name)
-        return copy.deepcopy(resource) if resource else None
+        return namespace_resources.get(name) or None
 
     def list_resources(
         self,
@@ -42,25 +200,32 @@ class FakeResourceStorage:
         label_selector: str | None = None,
         field_selector: str | None = None,
     ) -> list[dict[str, Any]]:
-        """List resources with optional filtering"""
+        """List resources with optional filtering (read-only snapshots)"""
         resources: list[dict[str, Any]] = []
 
         api_resources = self.resources.get(api_version)
-        if not api_resources:
+        if not api_resources or not api_resources.get(kind):
             return resources
 
-        kind_resources = api_resources.get(kind)
-        if not kind_resources:
-            return resources
-
-        if namespace is not None:
-            # List resources in specific namespace
-            namespace_resources = kind_resources.get(namespace, {})
-            resources = list(namespace_resources.values())
-        else:
-            # List resources across all namespaces
-            for ns_resources in kind_resources.values():
-                resources.extend(ns_resources.values())
+        with self.lock(kind=kind, api_version=api_version):
+            kind_resources = api_resources[kind]
+            candidates = self.indexes[api_version, kind].candidates(
+                label_selector=label_selector, field_selector=field_selector
+            )
+            if candidates is not None:
+                resources = [
+                    kind_resources[resource_namespace][name]
+                    for resource_namespace, name in candidates
+                    if namespace is None or resource_namespace == namespace
+                ]
+            elif namespace is not None:
+                # List resources in specific namespace
+                namespace_resources = kind_resources.get(namespace, {})
+                resources = list(namespace_resources.values())
+            else:
+                # List resources across all namespaces
+                for ns_resources in kind_resources.values():
+                    resources.extend(ns_resources.values())
 
         # Apply label selector filter
         if label_selector:
@@ -70,20 +235,34 @@ class FakeResourceStorage:
         if field_selector:
             resources = self._filter_by_fields(resources, field_selector)
 
-        return [copy.deepcopy(r) for r in resources]
+        return resources
 
     def delete_resource(self, kind: str, api_version: str, name: str, namespace: str | None) -> dict[str, Any] | None:
         """Delete a resource"""
-        resource = self.get_resource(kind, api_version, name, namespace)
-        if resource:
-            del self.resources[api_version][kind][namespace][name]
-            # Clean up empty structures
-            if not self.resources[api_version][kind][namespace]:
-                del self.resources[api_version][kind][namespace]
-            if not self.resources[api_version][kind]:
-                del self.resources[api_version][kind]
-            if not self.resources[api_version]:
-                del self.resources[api_version]
+        with self.lock(kind=kind, api_version=api_version):
+            resource = self.get_resource(kind, api_version, name, namespace)
+            if resource:
+                with self.event_bus.condition:
+                    del self.resources[api_version][kind][namespace][name]
+                    # The DELETED event carries the resource version of the deletion
+                    self.event_bus.publish(
+                        event_type="DELETED",
+                        api_version=api_version,
+                        kind=kind,
+                        namespace=namespace,
+                        resource={
+                            **resource,
+                            "metadata": {
+                                **resource.get("metadata", {}),
+                                "resourceVersion": self.event_bus.next_resource_version(),
+                            },
+                        },
+                    )
+
+                self.indexes[api_version, kind].remove(key=(namespace, name), resource=resource)
+                # Clean up empty structures, the structures of the kind are kept for lock-free reads
+                if not self.resources[api_version][kind][namespace]:
+                    del self.resources[api_version][kind][namespace]
         return resource
 
     def _filter_by_labels(self, resources: list[dict[str, Any]], label_selector: str) -> list[dict[str, Any]]:
@@ -181,16 +360,19 @@ class FakeResourceStorage:
 
     def _get_field_value(self, obj: dict[str, Any], path: str) -> Any:
         """Get value from nested dictionary using dot notation"""
-        current = obj
-        parts = path.split(".")
-
-        for _i, part in enumerate(parts):
-            if isinstance(current, dict):
-                if part not in current:
-                    # Return a sentinel value to indicate the field doesn't exist
-                    return NotImplemented
-                current = current[part]
-            else:
+        return get_field_value(obj=obj, path=path)
+
+
+def get_field_value(obj: dict[str, Any], path: str) -> Any:
+    """Get value from nested dictionary using dot notation, NotImplemented if the field doesn't exist"""
+    current = obj
+    for part in path.split("."):
+        if isinstance(current, dict):
+            if part not in current:
+                # Return a sentinel value to indicate the field doesn't exist
                 return NotImplemented
+            current = current[part]
+        else:
+            return NotImplemented
 
-        return current
+    return current
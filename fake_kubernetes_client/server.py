@@ -0,0 +1,271 @@
+"""Fake cluster shared between processes for fake Kubernetes client"""
+
+import contextlib
+import os
+import shutil
+import tempfile
+import threading
+from collections.abc import Callable
+from multiprocessing.connection import Client, Connection, Listener
+from typing import Any
+
+from fake_kubernetes_client.clock import FakeClock
+from fake_kubernetes_client.event_bus import FakeEventBus, FakeWatchEvent
+from fake_kubernetes_client.exceptions import RemoteOperationNotSupportedError
+from fake_kubernetes_client.locks import LockStats
+from fake_kubernetes_client.resource_storage import FakeResourceStorage
+
+# Address of a `FakeClusterServer`, `get_client(fake=True)` clients then share its fake cluster
+FAKE_CLUSTER_ADDRESS_ENV: str = "OPENSHIFT_PYTHON_WRAPPER_FAKE_CLUSTER_ADDRESS"
+# Hex encoded authentication key of the `FakeClusterServer` at `FAKE_CLUSTER_ADDRESS_ENV`
+FAKE_CLUSTER_AUTHKEY_ENV: str = "OPENSHIFT_PYTHON_WRAPPER_FAKE_CLUSTER_AUTHKEY"
+# Longest wait for watch events in a single request, so watches notice a stopped server
+MAX_REMOTE_WAIT: float = 5.0
+
+
+class FakeClusterServer:
+    """Serve the storage of a fake cluster to other processes over a unix socket
+
+    Clients (`FakeRemoteStorage`) share the resources, resource versions and watch events of the served storage, so
+    the pytest-xdist workers of a session can run against one fake cluster. Each client thread has its own connection,
+    served by its own thread: the server is as concurrent as the storage, and the locks a client holds are released if
+    it disconnects.
+
+    Clients send pickles, which the server loads: only clients with the authentication key are served and the socket
+    is only accessible to its owner. Pass the key to the clients of other processes with `environment()`.
+
+    Example:
+        with FakeClusterServer() as server:
+            os.environ.update(server.environment())  # get_client(fake=True) now connects to it
+    """
+
+    def __init__(
+        self, storage: FakeResourceStorage | None = None, address: str | None = None, authkey: bytes | None = None
+    ) -> None:
+        self.storage = storage or FakeResourceStorage()
+        self._socket_dir = None if address else tempfile.mkdtemp(prefix="fake-cluster-")
+        self.address = address or os.path.join(self._socket_dir, "cluster.sock")  # type: ignore[arg-type]
+        # Random key by default, a key is always required
+        self.authkey = authkey or os.urandom(32)
+        self._listener: Listener | None = None
+        self._connections: set[Connection] = set()
+        self._connections_lock = threading.Lock()
+        event_bus = self.storage.event_bus
+        self._methods: dict[str, Callable[..., Any]] = {
+            "get_resource": self.storage.get_resource,
+            "list_resources": self.storage.list_resources,
+            "delete_resource": self.storage.delete_resource,
+            "lock_stats": self.storage.lock_stats,
+            "next_resource_version": event_bus.next_resource_version,
+            "resource_version": lambda: event_bus.resource_version,
+            "wait_for_events": event_bus.wait_for_events,
+            "compact": event_bus.compact,
+        }
+
+    def start(self) -> "FakeClusterServer":
+        """Listen for clients, from a background thread"""
+        self._listener = Listener(address=self.address, family="AF_UNIX", authkey=self.authkey)
+        os.chmod(self.address, 0o600)
+        threading.Thread(target=self._accept, name="fake-cluster-server", daemon=True).start()
+        return self
+
+    def environment(self) -> dict[str, str]:
+        """Environment variables connecting `get_client(fake=True)` to this server"""
+        return {FAKE_CLUSTER_ADDRESS_ENV: self.address, FAKE_CLUSTER_AUTHKEY_ENV: self.authkey.hex()}
+
+    def stop(self) -> None:
+        """Stop listening and disconnect the clients"""
+        if self._listener is not None:
+            self._listener.close()
+            self._listener = None
+        with self._connections_lock:
+            for connection in self._connections:
+                connection.close()
+            self._connections.clear()
+        if self._socket_dir:
+            shutil.rmtree(self._socket_dir, ignore_errors=True)
+
+    def __enter__(self) -> "FakeClusterServer":
+        return self.start()
+
+    def __exit__(self, *_args: Any) -> None:
+        self.stop()
+
+    def _accept(self) -> None:
+        listener = self._listener
+        while listener is not None:
+            try:
+                connection = listener.accept()
+            except OSError:
+                # Closed by stop()
+                return
+            except Exception:
+                # Failed handshake (wrong authkey), keep serving the other clients
+                continue
+
+            with self._connections_lock:
+                self._connections.add(connection)
+            threading.Thread(target=self._serve, args=(connection,), name="fake-cluster-client", daemon=True).start()
+
+    def _serve(self, connection: Connection) -> None:
+        held_locks: list[Any] = []
+        try:
+            while True:
+                try:
+                    method, kwargs = connection.recv()
+                except (EOFError, OSError):
+                    return
+
+                try:
+                    response = ("ok", self._call(method=method, kwargs=kwargs, held_locks=held_locks))
+                except Exception as exc:
+                    response = ("error", exc)
+
+                try:
+                    connection.send(response)
+                except OSError:
+                    return
+        finally:
+            while held_locks:
+                held_locks.pop().release()
+            with self._connections_lock:
+                self._connections.discard(connection)
+            connection.close()
+
+    def _call(self, method: str, kwargs: dict[str, Any], held_locks: list[Any]) -> Any:
+        if method == "acquire":
+            lock = self.storage.lock(**kwargs)
+            lock.acquire()
+            held_locks.append(lock)
+            return None
+
+        if method == "release":
+            held_locks.pop().release()
+            return None
+
+        if method == "store_resource":
+            self.storage.store_resource(**kwargs)
+            return kwargs["resource"]["metadata"]["resourceVersion"]
+
+        if method not in self._methods:
+            raise ValueError(f"Unknown fake cluster method: {method}")
+
+        return self._methods[method](**kwargs)
+
+
+class _RemoteLock:
+    """Lock of a kind held on the server, re-entrant for the calling thread"""
+
+    def __init__(self, storage: "FakeRemoteStorage", kind: str, api_version: str) -> None:
+        self._storage = storage
+        self._kwargs = {"kind": kind, "api_version": api_version}
+
+    def __enter__(self) -> bool:
+        self._storage.call("acquire", **self._kwargs)
+        return True
+
+    def __exit__(self, *_args: Any) -> None:
+        self._storage.call("release")
+
+
+class FakeRemoteEventBus(FakeEventBus):
+    """Event bus of a `FakeRemoteStorage`, events are published by the server"""
+
+    def __init__(self, storage: "FakeRemoteStorage", clock: FakeClock | None = None) -> None:
+        super().__init__(clock=clock)
+        self.storage = storage
+
+    @property
+    def resource_version(self) -> str:
+        return self.storage.call("resource_version")
+
+    def next_resource_version(self) -> str:
+        return self.storage.call("next_resource_version")
+
+    def wait_for_events(self, position: int, timeout: float | None) -> tuple[list[FakeWatchEvent] | None, int]:
+        wait = MAX_REMOTE_WAIT if timeout is None else min(timeout, MAX_REMOTE_WAIT)
+        return self.storage.call("wait_for_events", position=position, timeout=wait)
+
+    def compact(self, resource_version: str | None = None) -> None:
+        self.storage.call("compact", resource_version=resource_version)
+
+    def publish(self, *_args: Any, **_kwargs: Any) -> None:
+        raise RemoteOperationNotSupportedError("Events of a remote fake cluster are published by its FakeClusterServer")
+
+    def subscribe(self, *_args: Any, **_kwargs: Any) -> None:
+        raise RemoteOperationNotSupportedError(
+            "Subscribers (and simulated controllers) of a remote fake cluster run in the FakeClusterServer process"
+        )
+
+
+class FakeRemoteStorage(FakeResourceStorage):
+    """Storage of a fake cluster served by a `FakeClusterServer`, usually in another process
+
+    Use it as the storage of a client: `FakeDynamicClient(storage=FakeRemoteStorage(address=..., authkey=...))`. Each
+    thread connects to the server once. Virtual time is not shared: the server waits for watch events in its own time.
+    """
+
+    def __init__(self, address: str, authkey: bytes, clock: FakeClock | None = None) -> None:
+        super().__init__(clock=clock)
+        self.address = address
+        self.authkey = authkey
+        self.event_bus = FakeRemoteEventBus(storage=self, clock=self.clock)
+        self._local = threading.local()
+
+    def call(self, method: str, **kwargs: Any) -> Any:
+        """Call a storage method on the server, from the connection of the calling thread"""
+        connection = getattr(self._local, "connection", None)
+        if connection is None:
+            connection = Client(address=self.address, family="AF_UNIX", authkey=self.authkey)
+            self._local.connection = connection
+
+        connection.send((method, kwargs))
+        status, result = connection.recv()
+        if status == "error":
+            raise result
+        return result
+
+    def close(self) -> None:
+        """Close the connection of the calling thread, releasing the locks it holds"""
+        connection = getattr(self._local, "connection", None)
+        if connection is not None:
+            with contextlib.suppress(OSError):
+                connection.close()
+            self._local.connection = None
+
+    def lock(self, kind: str, api_version: str) -> _RemoteLock:  # type: ignore[override]
+        return _RemoteLock(storage=self, kind=kind, api_version=api_version)
+
+    def lock_stats(self) -> dict[str, LockStats]:
+        return self.call("lock_stats")
+
+    def store_resource(
+        self, kind: str, api_version: str, name: str, namespace: str | None, resource: dict[str, Any]
+    ) -> None:
+        resource_version = self.call(
+            "store_resource", kind=kind, api_version=api_version, name=name, namespace=namespace, resource=resource
+        )
+        resource.setdefault("metadata", {})["resourceVersion"] = resource_version
+
+    def get_resource(self, kind: str, api_version: str, name: str, namespace: str | None) -> dict[str, Any] | None:
+        return self.call("get_resource", kind=kind, api_version=api_version, name=name, namespace=namespace)
+
+    def list_resources(
+        self,
+        kind: str,
+        api_version: str,
+        namespace: str | None = None,
+        label_selector: str | None = None,
+        field_selector: str | None = None,
+    ) -> list[dict[str, Any]]:
+        return self.call(
+            "list_resources",
+            kind=kind,
+            api_version=api_version,
+            namespace=namespace,
+            label_selector=label_selector,
+            field_selector=field_selector,
+        )
+
+    def delete_resource(self, kind: str, api_version: str, name: str, namespace: str | None) -> dict[str, Any] | None:
+        return self.call("delete_resource", kind=kind, api_version=api_version, name=name, namespace=namespace)
@@ -3,6 +3,7 @@
 import json
 import os
 import random
+from collections.abc import Mapping
 from datetime import datetime, timezone
 from typing import Any
 
@@ -10,7 +11,7 @@ from typing import Any
 class StatusSchemaParser:
     """Parser for generating status from resource schemas"""
 
-    def __init__(self, resource_mappings: dict[str, Any]) -> None:
+    def __init__(self, resource_mappings: Mapping[str, Any]) -> None:
         self.resource_mappings = resource_mappings
         self._definitions_cache: dict[str, Any] = {}
         self._definitions: dict[str, Any] = {}
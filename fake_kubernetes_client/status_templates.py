@@ -1,5 +1,6 @@
 """Status template methods for fake Kubernetes resources"""
 
+from collections.abc import Mapping
 from datetime import datetime, timezone
 from typing import Any
 
@@ -42,7 +43,7 @@ def _get_ready_status_config(body: dict[str, Any]) -> tuple[str, str, str]:
     return status, reason, message
 
 
-def add_realistic_status(body: dict[str, Any], resource_mappings: dict[str, Any] | None = None) -> None:
+def add_realistic_status(body: dict[str, Any], resource_mappings: Mapping[str, Any] | None = None) -> None:
     """Add realistic status to resources that need it"""
     kind = body.get("kind", "")
 
@@ -67,7 +68,7 @@ def add_realistic_status(body: dict[str, Any], resource_mappings: dict[str, Any]
         body["status"] = status
 
 
-def generate_dynamic_status(body: dict[str, Any], resource_mappings: dict[str, Any]) -> dict[str, Any]:
+def generate_dynamic_status(body: dict[str, Any], resource_mappings: Mapping[str, Any]) -> dict[str, Any]:
     """Generate status dynamically based on resource schema"""
     kind = body.get("kind", "")
     api_version = body.get("apiVersion", "v1")
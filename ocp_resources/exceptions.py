@@ -94,3 +94,41 @@ class ConditionError(Exception):
     """Raised when a resource condition reaches an unexpected state."""
 
     pass
+
+
+class WatchNotPermittedError(Exception):
+    """Raised when the client is not allowed to list or watch a resource."""
+
+    def __init__(self, reason: str) -> None:
+        self.reason = reason
+        super().__init__(reason)
+
+    def __str__(self) -> str:
+        return f"Watch is not permitted: {self.reason}"
+
+
+class ListExpiredError(Exception):
+    """Raised when the continue token of a paginated LIST expired before its next page was fetched."""
+
+    def __init__(self, reason: str) -> None:
+        self.reason = reason
+        super().__init__(reason)
+
+    def __str__(self) -> str:
+        return (
+            f"Paginated list expired before it was fully read, list again or read it faster "
+            f"(page_size=0 lists everything at once): {self.reason}"
+        )
+
+
+class BulkResourceError(Exception):
+    """Raised when an operation on a list of resources failed for one or more of them."""
+
+    def __init__(self, operation: str, errors: list[tuple[Any, Exception]]) -> None:
+        self.operation = operation
+        self.errors = errors
+        super().__init__(operation)
+
+    def __str__(self) -> str:
+        failures = "\n".join(f"  {resource.kind} {resource.name}: {exp!r}" for resource, exp in self.errors)
+        return f"{self.operation} failed for {len(self.errors)} resource(s):\n{failures}"
@@ -1,15 +1,32 @@
 # Generated using https://github.com/RedHatQE/openshift-python-wrapper/blob/main/class_generator/README.md
 
 import json
+import re
+from collections.abc import Generator
+from datetime import datetime
 from typing import Any
 
 import kubernetes
+from kubernetes.dynamic import DynamicClient
 from timeout_sampler import TimeoutWatch
 
 from ocp_resources.exceptions import ExecOnPodError, MissingRequiredArgumentError
 from ocp_resources.node import Node
 from ocp_resources.resource import NamespacedResource
-from ocp_resources.utils.constants import TIMEOUT_5SEC
+from ocp_resources.utils.constants import TIMEOUT_4MINUTES, TIMEOUT_5SEC
+from ocp_resources.utils.instrumentation import api_caller, observe_api_call
+from ocp_resources.utils.pod_exec import (
+    DEFAULT_EXEC_SHELL,
+    DEFAULT_FAN_OUT_WORKERS,
+    ExecResult,
+    PodExecOutput,
+    PodExecSession,
+    close_exec_sessions,
+    execute_on_pods,
+    get_exec_session,
+)
+from ocp_resources.utils.pod_log import DEFAULT_LOG_BUFFER_SIZE, LogLine, PodLogFollower
+from ocp_resources.utils.tracing import traced
 
 
 class Pod(NamespacedResource):
@@ -657,6 +674,8 @@ class Pod(NamespacedResource):
 
     # End of generated code
 
+    @traced()
+    @api_caller(name="execute")
     def execute(self, command: list[str], timeout: int = 60, container: str = "", ignore_rc: bool = False) -> str:
         """
         Run command on Pod
@@ -675,31 +694,33 @@ class Pod(NamespacedResource):
         """
         error_channel: dict[Any, Any] = {}
         stream_closed_error: str = "stream resp is closed"
-        self.logger.info(f"Execute {command} on {self.name} ({self.node.name})")
-        resp = kubernetes.stream.stream(
-            api_method=self._kube_v1_api.connect_get_namespaced_pod_exec,
-            name=self.name,
-            namespace=self.namespace,
-            command=command,
-            container=container or self.instance.spec.containers[0].name,
-            stderr=True,
-            stdin=False,
-            stdout=True,
-            tty=False,
-            _preload_content=False,
-        )
-
-        timeout_watch = TimeoutWatch(timeout=timeout)
-        while resp.is_open():
-            resp.run_forever(timeout=2)
-            try:
-                error_channel = json.loads(resp.read_channel(kubernetes.stream.ws_client.ERROR_CHANNEL))
-                break
-            except json.decoder.JSONDecodeError:
-                # Check remaining time, in order to throw exception
-                # if remaining time reached zero
-                if timeout_watch.remaining_time() <= 0:
-                    raise ExecOnPodError(command=command, rc=-1, out="", err=stream_closed_error) from None
+        self.logger.info(f"Execute {command} on {self.name} ({self.known_instance.spec.nodeName})")
+        with observe_api_call(verb="create", resource="pods/exec", namespace=self.namespace):
+            resp = kubernetes.stream.stream(
+                api_method=self._kube_v1_api.connect_get_namespaced_pod_exec,
+                name=self.name,
+                namespace=self.namespace,
+                command=command,
+                container=container or self.known_instance.spec.containers[0].name,
+                stderr=True,
+                stdin=False,
+                stdout=True,
+                tty=False,
+                _preload_content=False,
+            )
+
+            timeout_watch = TimeoutWatch(timeout=timeout)
+            while resp.is_open():
+                # Returns on the next frame, the error channel is the last frame of a finished command
+                resp.update(timeout=max(min(timeout_watch.remaining_time(), 2), 0))
+                try:
+                    error_channel = json.loads(resp.read_channel(kubernetes.stream.ws_client.ERROR_CHANNEL))
+                    break
+                except json.decoder.JSONDecodeError:
+                    # Check remaining time, in order to throw exception
+                    # if remaining time reached zero
+                    if timeout_watch.remaining_time() <= 0:
+                        raise ExecOnPodError(command=command, rc=-1, out="", err=stream_closed_error) from None
 
         rcstring = error_channel.get("status")
         if rcstring is None:
@@ -720,6 +741,98 @@ class Pod(NamespacedResource):
 
         raise ExecOnPodError(command=command, rc=returncode, out=stdout, err=stderr)
 
+    def exec_session(self, container: str = "", shell: str = DEFAULT_EXEC_SHELL) -> PodExecSession:
+        """
+        Get the persistent exec session of a container, opening it if needed.
+
+        Sessions are kept per container (and shared with other `Pod` objects of this pod) until
+        `close_exec_sessions` is called.
+
+        Args:
+            container (str): Container name, defaults to the first container.
+            shell (str): Shell binary in the container.
+
+        Returns:
+            PodExecSession: Open exec session.
+        """
+        return get_exec_session(pod=self, container=container, shell=shell)
+
+    def execute_many(
+        self, commands: list[list[str]], timeout: int = 60, container: str = "", shell: str = DEFAULT_EXEC_SHELL
+    ) -> list[ExecResult]:
+        """
+        Run commands over the persistent exec session of a container, sent all at once.
+
+        Args:
+            commands (list): Commands to run, in order.
+            timeout (int): Time to wait for all the commands.
+            container (str): Container name where to exec the commands.
+            shell (str): Shell binary in the container.
+
+        Returns:
+            list[ExecResult]: rc, stdout and stderr of each command.
+
+        Raises:
+            ExecOnPodError: If the exec stream closed or the commands did not finish in time.
+        """
+        return self.exec_session(container=container, shell=shell).execute_many(commands=commands, timeout=timeout)
+
+    @classmethod
+    def execute_on_pods(
+        cls,
+        command: list[str],
+        pods: list["Pod"] | None = None,
+        client: DynamicClient | None = None,
+        namespace: str | None = None,
+        label_selector: str | None = None,
+        timeout: int = 60,
+        container: str = "",
+        ignore_rc: bool = False,
+        max_workers: int = DEFAULT_FAN_OUT_WORKERS,
+    ) -> Generator[PodExecOutput, None, None]:
+        """
+        Run a command on many pods in parallel, yielding results as they finish.
+
+        Pass either pods, or client and label_selector to run on the matching pods.
+
+        Args:
+            command (list): Command to run.
+            pods (list, optional): Pods to run the command on.
+            client (DynamicClient, optional): Client to get the pods with.
+            namespace (str, optional): Namespace of the pods, all namespaces if not set.
+            label_selector (str, optional): Label selector of the pods.
+            timeout (int): Time to wait for the command on each pod.
+            container (str): Container name where to exec the command.
+            ignore_rc (bool): If True ignore error rc from the shell and return out.
+            max_workers (int): Number of pods to run the command on at a time.
+
+        Returns:
+            Generator: PodExecOutput (pod, stdout, error) of each pod, in completion order.
+
+        Raises:
+            MissingRequiredArgumentError: If neither pods nor client and label_selector are passed.
+        """
+        if pods is None:
+            if not (client and label_selector):
+                raise MissingRequiredArgumentError(argument="pods or client and label_selector")
+
+            pods = list(cls.get(client=client, namespace=namespace, label_selector=label_selector))
+
+        return execute_on_pods(
+            pods=pods,
+            command=command,
+            timeout=timeout,
+            container=container,
+            ignore_rc=ignore_rc,
+            max_workers=max_workers,
+        )
+
+    def close_exec_sessions(self) -> None:
+        """
+        Close the persistent exec sessions of the Pod.
+        """
+        close_exec_sessions(pod=self)
+
     def log(self, **kwargs: Any) -> str:
         """
         Get Pod logs
@@ -729,6 +842,65 @@ class Pod(NamespacedResource):
         """
         return self._kube_v1_api.read_namespaced_pod_log(name=self.name, namespace=self.namespace, **kwargs)
 
+    def log_follower(
+        self,
+        container: str = "",
+        follow: bool = True,
+        since_seconds: int | None = None,
+        since_time: datetime | None = None,
+        tail_lines: int | None = None,
+        buffer_size: int = DEFAULT_LOG_BUFFER_SIZE,
+    ) -> PodLogFollower:
+        """
+        Get a log streamer of a container, see `PodLogFollower`.
+
+        Args:
+            container (str): Container name, defaults to the first container.
+            follow (bool): Keep streaming new lines, else stop at the end of the current log.
+            since_seconds (int, optional): Start with lines newer than this many seconds.
+            since_time (datetime, optional): Start with lines newer than this time.
+            tail_lines (int, optional): Start with the last lines of the log.
+            buffer_size (int): Number of last lines kept in the follower buffer.
+
+        Returns:
+            PodLogFollower: Log streamer, iterate `lines()` to read the log.
+        """
+        return PodLogFollower(
+            pod=self,
+            container=container,
+            follow=follow,
+            since_seconds=since_seconds,
+            since_time=since_time,
+            tail_lines=tail_lines,
+            buffer_size=buffer_size,
+        )
+
+    def wait_for_log_line(
+        self,
+        regex: str | re.Pattern[str],
+        timeout: int = TIMEOUT_4MINUTES,
+        container: str = "",
+        since_seconds: int | None = None,
+    ) -> LogLine:
+        """
+        Wait for a log line matching a regex, reading the log as a stream (instead of re-reading the whole log).
+
+        Args:
+            regex (str | re.Pattern): Regex searched in each line.
+            timeout (int): Time to wait for the line.
+            container (str): Container name, defaults to the first container.
+            since_seconds (int, optional): Only match lines newer than this many seconds, else the whole log.
+
+        Returns:
+            LogLine: First matching line.
+
+        Raises:
+            TimeoutExpiredError: If no line matched in time.
+        """
+        return self.log_follower(container=container, since_seconds=since_seconds).wait_for_log_line(
+            regex=regex, timeout=timeout
+        )
+
     @property
     def node(self) -> Node:
         """
@@ -737,7 +909,8 @@ class Pod(NamespacedResource):
         Returns:
             Node: Node
         """
-        node_name = self.instance.spec.nodeName
+        # nodeName does not change once the Pod is scheduled
+        node_name = self.known_instance.spec.nodeName or self.instance.spec.nodeName
         assert node_name, f"Node not found for pod {self.name}"
         return Node(
             client=self.client,
@@ -1,14 +1,17 @@
 import base64
 import contextlib
 import copy
+import functools
 import json
 import os
 import re
 import sys
 import threading
+import time
 import warnings
 from abc import ABC, abstractmethod
-from collections.abc import Callable, Generator
+from collections.abc import AsyncGenerator, Callable, Generator
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from io import StringIO
 from signal import SIGINT, signal
 from types import TracebackType
@@ -24,6 +27,7 @@ from kubernetes.dynamic import DynamicClient, ResourceInstance
 from kubernetes.dynamic.exceptions import (
     ConflictError,
     ForbiddenError,
+    GoneError,
     MethodNotAllowedError,
     NotFoundError,
     ResourceNotFoundError,
@@ -39,20 +43,28 @@ from timeout_sampler import (
 from urllib3.exceptions import MaxRetryError
 
 from fake_kubernetes_client.dynamic_client import FakeDynamicClient
+from fake_kubernetes_client.server import FAKE_CLUSTER_ADDRESS_ENV, FAKE_CLUSTER_AUTHKEY_ENV, FakeRemoteStorage
 from ocp_resources.event import Event
 from ocp_resources.exceptions import (
+    BulkResourceError,
     ClientWithBasicAuthError,
     ConditionError,
+    ListExpiredError,
     MissingRequiredArgumentError,
     MissingResourceResError,
     ResourceTeardownError,
     ValidationError,
+    WatchNotPermittedError,
 )
+from ocp_resources.utils.async_utils import iterate_sync, run_sync
 from ocp_resources.utils.client_config import DynamicClientWithKubeconfig, resolve_bearer_token, save_kubeconfig
+from ocp_resources.utils.connection_pool import ConnectionPoolSettings, install_connection_pool
 from ocp_resources.utils.constants import (
     DEFAULT_CLUSTER_RETRY_EXCEPTIONS,
+    DEFAULT_LIST_PAGE_SIZE,
     NOT_FOUND_ERROR_EXCEPTION_DICT,
     PROTOCOL_ERROR_EXCEPTION_DICT,
+    RESOURCE_LIST_DEPENDENCY_ORDER,
     TIMEOUT_1MINUTE,
     TIMEOUT_1SEC,
     TIMEOUT_4MINUTES,
@@ -60,9 +72,23 @@ from ocp_resources.utils.constants import (
     TIMEOUT_10SEC,
     TIMEOUT_30SEC,
 )
+from ocp_resources.utils.discovery_cache import PersistentDiscoverer, discovery_cache_ttl
+from ocp_resources.utils.informer import (
+    Indexer,
+    Informer,
+    get_cached_object,
+    informers_running,
+    list_cached_objects,
+    start_informer,
+)
+from ocp_resources.utils.instrumentation import api_call_context, api_caller, install_instrumentation
+from ocp_resources.utils.rate_limiter import ClientRateLimiter, TokenBucketRateLimiter, client_rate_limits
 from ocp_resources.utils.resource_constants import ResourceConstants
+from ocp_resources.utils.retry_policy import RetryPolicy
 from ocp_resources.utils.schema_validator import SchemaValidator
+from ocp_resources.utils.tracing import install_tracing, traced
 from ocp_resources.utils.utils import skip_existing_resource_creation_teardown
+from ocp_resources.utils.wait_engine import ResourceWaiter, WaitStats, wait_for_resources
 
 LOGGER = get_logger(name=__name__)
 MAX_SUPPORTED_API_VERSION = "v2"
@@ -93,6 +119,47 @@ def _get_api_version(client: DynamicClient, api_group: str, kind: str) -> str:
     raise NotImplementedError(log)
 
 
+def _paginate(
+    get_page: Callable[..., Any],
+    page_size: int,
+    exceptions_dict: dict[type[Exception], list[str]] = DEFAULT_CLUSTER_RETRY_EXCEPTIONS,
+    retry_policy: RetryPolicy | None = None,
+) -> Generator[Any, None, None]:
+    """
+    Yield the items of a LIST request, fetching one page at a time.
+
+    Args:
+        get_page (Callable): Issues the LIST request, called with `limit` and `_continue`.
+        page_size (int): Maximum number of items per page; 0 lists everything in a single request.
+        exceptions_dict (dict): Exceptions dict for TimeoutSampler, used when fetching a page.
+        retry_policy (RetryPolicy, optional): Retry policy used when fetching a page.
+
+    Yields:
+        ResourceField: Listed items.
+
+    Raises:
+        ListExpiredError: If the continue token expired (410 Gone) before the next page was fetched, the items
+            already yielded cannot be continued consistently.
+    """
+    _continue = None
+    while True:
+        with api_call_context(caller="get"):
+            try:
+                response = Resource.retry_cluster_exceptions(
+                    func=functools.partial(get_page, limit=page_size or None, _continue=_continue),
+                    exceptions_dict=exceptions_dict,
+                    retry_policy=retry_policy,
+                )
+            except GoneError as exp:
+                if not _continue:
+                    raise
+                raise ListExpiredError(reason=str(exp.summary())) from exp
+        yield from response.items
+        _continue = response.metadata.get("continue")
+        if not page_size or not _continue:
+            return
+
+
 def client_configuration_with_basic_auth(
     username: str,
     password: str,
@@ -208,6 +275,10 @@ def get_client(
     token: str | None = None,
     fake: bool = False,
     generate_kubeconfig: bool = False,
+    qps: float | None = None,
+    burst: int | None = None,
+    connection_pool: ConnectionPoolSettings | None = None,
+    share_connection_pool: bool = True,
 ) -> DynamicClient | FakeDynamicClient:
     """
     Get a kubernetes client.
@@ -233,12 +304,33 @@ def get_client(
         verify_ssl (bool): whether to verify ssl
         token (str): Use token to login
         generate_kubeconfig (bool): if True, save the kubeconfig to a temporary file and add path to client kubeconfig attribute.
+        qps (float): API requests per second of each of the read, write and watch lanes, 0 for no limit.
+            Defaults to `OPENSHIFT_PYTHON_WRAPPER_CLIENT_QPS` (0). 429/503 answers with `Retry-After` are always retried.
+        burst (int): API requests of each lane sent at once before spreading them to `qps`.
+            Defaults to `OPENSHIFT_PYTHON_WRAPPER_CLIENT_BURST` (10).
+        connection_pool (ConnectionPoolSettings): HTTP connection pool size and TCP keep-alive settings.
+            Defaults to `ConnectionPoolSettings.from_env()`.
+        share_connection_pool (bool): Share the connection pool with the other clients of the same cluster,
+            credentials and pool settings.
+        fake (bool): Return a fake client. It uses the fake cluster served at
+            `OPENSHIFT_PYTHON_WRAPPER_FAKE_CLUSTER_ADDRESS` if set, authenticated with the hex encoded
+            `OPENSHIFT_PYTHON_WRAPPER_FAKE_CLUSTER_AUTHKEY` (see `fake_kubernetes_client.FakeClusterServer`).
 
     Returns:
         DynamicClient: a kubernetes client.
     """
     if fake:
-        return FakeDynamicClient()
+        fake_cluster_address = os.environ.get(FAKE_CLUSTER_ADDRESS_ENV)
+        if not fake_cluster_address:
+            return FakeDynamicClient()
+
+        fake_cluster_authkey = os.environ.get(FAKE_CLUSTER_AUTHKEY_ENV)
+        if not fake_cluster_authkey:
+            raise ValueError(f"{FAKE_CLUSTER_ADDRESS_ENV} is set without {FAKE_CLUSTER_AUTHKEY_ENV}")
+
+        return FakeDynamicClient(
+            storage=FakeRemoteStorage(address=fake_cluster_address, authkey=bytes.fromhex(fake_cluster_authkey))
+        )
 
     proxy = os.environ.get("HTTPS_PROXY") or os.environ.get("HTTP_PROXY")
 
@@ -288,8 +380,19 @@ def get_client(
 
     kubernetes.client.Configuration.set_default(default=client_configuration)
 
+    connection_pool = connection_pool or ConnectionPoolSettings.from_env()
+    install_connection_pool(api_client=_client, settings=connection_pool, shared=share_connection_pool)
+    env_qps, env_burst = client_rate_limits()
+    rate_limiter = ClientRateLimiter(qps=env_qps if qps is None else qps, burst=env_burst if burst is None else burst)
+    install_instrumentation(api_client=_client)
+    install_tracing(api_client=_client)
+    rate_limiter.install(api_client=_client)
+
+    # Persistent discovery cache, disabled with OPENSHIFT_PYTHON_WRAPPER_DISCOVERY_CACHE_TTL=0
+    discoverer = PersistentDiscoverer if discovery_cache_ttl() > 0 else None
+
     try:
-        _dynamic_client = kubernetes.dynamic.DynamicClient(client=_client)
+        _dynamic_client = kubernetes.dynamic.DynamicClient(client=_client, discoverer=discoverer)
     except MaxRetryError:
         # Ref: https://github.com/kubernetes-client/python/blob/v26.1.0/kubernetes/base/config/incluster_config.py
         LOGGER.info("Trying to get client via incluster_config")
@@ -297,12 +400,21 @@ def get_client(
             client=kubernetes.config.incluster_config.load_incluster_config(
                 client_configuration=client_configuration, try_refresh_token=try_refresh_token
             ),
+            discoverer=discoverer,
         )
+        install_connection_pool(
+            api_client=_dynamic_client.client, settings=connection_pool, shared=share_connection_pool
+        )
+        install_instrumentation(api_client=_dynamic_client.client)
+        install_tracing(api_client=_dynamic_client.client)
+        rate_limiter.install(api_client=_dynamic_client.client)
 
     if generate_kubeconfig:
         if config_file:
             LOGGER.info(f"`generate_kubeconfig` ignored, kubeconfig already available at {config_file}")
-            _dynamic_client = DynamicClientWithKubeconfig(client=_dynamic_client.client, kubeconfig=config_file)
+            _dynamic_client = DynamicClientWithKubeconfig(
+                client=_dynamic_client.client, kubeconfig=config_file, discoverer=discoverer
+            )
         else:
             _resolved_token = resolve_bearer_token(token=token, client_configuration=client_configuration)
             kubeconfig_path = save_kubeconfig(
@@ -311,7 +423,9 @@ def get_client(
                 config_dict=config_dict,
                 verify_ssl=verify_ssl,
             )
-            _dynamic_client = DynamicClientWithKubeconfig(client=_dynamic_client.client, kubeconfig=kubeconfig_path)
+            _dynamic_client = DynamicClientWithKubeconfig(
+                client=_dynamic_client.client, kubeconfig=kubeconfig_path, discoverer=discoverer
+            )
 
     return _dynamic_client
 
@@ -634,6 +748,9 @@ class Resource(ResourceConstants):
         kind_dict: dict[Any, Any] | None = None,
         wait_for_resource: bool = False,
         schema_validation_enabled: bool = False,
+        freshness: str = ResourceConstants.Freshness.ALWAYS,
+        max_age: float = 0,
+        retry_policy: RetryPolicy | None = None,
     ):
         """
         Create an API resource
@@ -661,6 +778,12 @@ class Resource(ResourceConstants):
             wait_for_resource (bool): Waits for the resource to be created
             schema_validation_enabled (bool): Enable automatic schema validation for this instance.
                 Defaults to False. Set to True to validate on create/update operations.
+            freshness (str): How `instance` uses the last known body of the resource (Resource.Freshness):
+                ALWAYS fetches on every access, MAX_AGE reuses the last known body for `max_age` seconds,
+                WATCH serves the resource from the shared informer of its kind, refreshed on watch events.
+            max_age (float): Seconds to reuse the last known body for, with Freshness.MAX_AGE.
+            retry_policy (RetryPolicy): Back off policy for the API calls and waits of the resource, instead of
+                retrying every `sleep` seconds.
         """
         if yaml_file and kind_dict:
             raise ValueError("yaml_file and resource_dict are mutually exclusive")
@@ -702,6 +825,14 @@ class Resource(ResourceConstants):
         self.initial_resource_version: str = ""
         self.logger = self._set_logger()
         self.wait_for_resource = wait_for_resource
+        self.last_wait_stats: WaitStats | None = None
+        self.freshness = freshness
+        self.max_age = max_age
+        self.retry_policy = retry_policy
+        self._last_instance: ResourceInstance | None = None
+        self._last_body: Any = None
+        self._last_body_time: float = 0.0
+        self._last_body_unread: bool = False
 
         if ensure_exists:
             self._ensure_exists()
@@ -886,6 +1017,28 @@ class Resource(ResourceConstants):
             **get_kwargs,
         ).get(*args, **kwargs, timeout_seconds=cls.timeout_seconds)
 
+    @classmethod
+    def _list_resources(
+        cls,
+        client: DynamicClient,
+        singular_name: str,
+        page_size: int,
+        exceptions_dict: dict[type[Exception], list[str]] = DEFAULT_CLUSTER_RETRY_EXCEPTIONS,
+        retry_policy: RetryPolicy | None = None,
+        **kwargs: Any,
+    ) -> Generator[ResourceField, None, None]:
+        if not cls.api_version:
+            cls.api_version = _get_api_version(client=client, api_group=cls.api_group, kind=cls.kind)
+
+        get_kwargs = {"singular_name": singular_name} if singular_name else {}
+        api = client.resources.get(kind=cls.kind, api_version=cls.api_version, **get_kwargs)
+        yield from _paginate(
+            get_page=functools.partial(api.get, **kwargs, timeout_seconds=cls.timeout_seconds),
+            page_size=page_size,
+            exceptions_dict=exceptions_dict,
+            retry_policy=retry_policy,
+        )
+
     def _prepare_singular_name_kwargs(self, **kwargs: Any) -> dict[str, Any]:
         kwargs = kwargs if kwargs else {}
         if self.singular_name:
@@ -926,53 +1079,59 @@ class Resource(ResourceConstants):
     def api(self) -> ResourceInstance:
         return self.full_api()
 
-    def wait(self, timeout: int = TIMEOUT_4MINUTES, sleep: int = 1) -> None:
+    @traced()
+    @api_caller(name="wait")
+    def wait(self, timeout: int = TIMEOUT_4MINUTES, sleep: int = 1, use_watch: bool | None = None) -> None:
         """
         Wait for resource
 
         Args:
             timeout (int): Time to wait for the resource.
             sleep (int): Time to wait between retries
+            use_watch (bool | None): Wait using a watch instead of polling.
+                If None, `OPENSHIFT_PYTHON_WRAPPER_WAIT_WITH_WATCH` environment variable is used.
 
         Raises:
             TimeoutExpiredError: If resource not exists.
         """
         self.logger.info(f"Wait until {self.kind} {self.name} is created")
-        samples = TimeoutSampler(
-            wait_timeout=timeout,
+        ResourceWaiter(
+            resource=self,
+            timeout=timeout,
             sleep=sleep,
             exceptions_dict={
                 **PROTOCOL_ERROR_EXCEPTION_DICT,
                 **NOT_FOUND_ERROR_EXCEPTION_DICT,
                 **DEFAULT_CLUSTER_RETRY_EXCEPTIONS,
             },
-            func=lambda: self.exists,
-        )
-        for sample in samples:
-            if sample:
-                return
+            use_watch=use_watch,
+            retry_policy=self.retry_policy,
+        ).wait(predicate=lambda resource_dict: resource_dict is not None)
 
-    def wait_deleted(self, timeout: int = TIMEOUT_4MINUTES) -> bool:
+    @traced()
+    @api_caller(name="wait_deleted")
+    def wait_deleted(self, timeout: int = TIMEOUT_4MINUTES, use_watch: bool | None = None) -> bool:
         """
         Wait until resource is deleted
 
         Args:
             timeout (int): Time to wait for the resource.
+            use_watch (bool | None): Wait using a watch instead of polling.
+                If None, `OPENSHIFT_PYTHON_WRAPPER_WAIT_WITH_WATCH` environment variable is used.
 
         Raises:
             TimeoutExpiredError: If resource still exists.
         """
         self.logger.info(f"Wait until {self.kind} {self.name} is deleted")
         try:
-            for sample in TimeoutSampler(wait_timeout=timeout, sleep=1, func=lambda: self.exists):
-                if not sample:
-                    return True
+            ResourceWaiter(resource=self, timeout=timeout, use_watch=use_watch, retry_policy=self.retry_policy).wait(
+                predicate=lambda resource_dict: resource_dict is None
+            )
+            return True
         except TimeoutExpiredError:
             self.logger.warning(f"Timeout expired while waiting for {self.kind} {self.name} to be deleted")
             return False
 
-        return False
-
     @property
     def exists(self) -> ResourceInstance | None:
         """
@@ -987,6 +1146,8 @@ class Resource(ResourceConstants):
     def _kube_v1_api(self) -> kubernetes.client.CoreV1Api:
         return kubernetes.client.CoreV1Api(api_client=self.client.client)
 
+    @traced()
+    @api_caller(name="wait_for_status")
     def wait_for_status(
         self,
         status: str,
@@ -995,6 +1156,8 @@ class Resource(ResourceConstants):
         sleep: int = 1,
         exceptions_dict: dict[type[Exception], list[str]] = PROTOCOL_ERROR_EXCEPTION_DICT
         | DEFAULT_CLUSTER_RETRY_EXCEPTIONS,
+        use_watch: bool | None = None,
+        retry_policy: RetryPolicy | None = None,
     ) -> None:
         """
         Wait for resource to be in status
@@ -1004,46 +1167,61 @@ class Resource(ResourceConstants):
             timeout (int): Time to wait for the resource.
             stop_status (str): Status which should stop the wait and failed.
             exceptions_dict (dict[type[Exception], list[str]]): Dictionary of exceptions to retry on.
+            use_watch (bool | None): Wait using a watch instead of polling.
+                If None, `OPENSHIFT_PYTHON_WRAPPER_WAIT_WITH_WATCH` environment variable is used.
+            retry_policy (RetryPolicy): Poll with the policy intervals instead of `sleep`, defaults to the resource
+                retry policy.
 
         Raises:
             TimeoutExpiredError: If resource in not in desire status.
         """
         stop_status = stop_status if stop_status else self.Status.FAILED
         self.logger.info(f"Wait for {self.kind} {self.name} status to be {status}")
-        samples = TimeoutSampler(
-            wait_timeout=timeout,
-            sleep=sleep,
-            exceptions_dict=exceptions_dict,
-            func=lambda: self.exists,
-        )
         current_status = None
         last_logged_status = None
-        try:
-            for sample in samples:
-                if sample:
-                    instance_dict = sample.to_dict()
-                    current_status = instance_dict.get("status", {}).get("phase")
 
-                    if current_status != last_logged_status:
-                        last_logged_status = current_status
-                        self.logger.info(f"Status of {self.kind} {self.name} is {current_status}")
+        def _status_reached(resource_dict: dict[str, Any] | None) -> bool:
+            nonlocal current_status, last_logged_status
+            if not resource_dict:
+                return False
+
+            current_status = (resource_dict.get("status") or {}).get("phase")
 
-                    if current_status == status:
-                        return
+            if current_status != last_logged_status:
+                last_logged_status = current_status
+                self.logger.info(f"Status of {self.kind} {self.name} is {current_status}")
 
-                    if current_status == stop_status:
-                        raise TimeoutExpiredError(f"Status of {self.kind} {self.name} is {current_status}")
+            if current_status == status:
+                return True
+
+            if current_status == stop_status:
+                raise TimeoutExpiredError(f"Status of {self.kind} {self.name} is {current_status}")
+
+            return False
+
+        try:
+            ResourceWaiter(
+                resource=self,
+                timeout=timeout,
+                sleep=sleep,
+                exceptions_dict=exceptions_dict,
+                use_watch=use_watch,
+                retry_policy=retry_policy or self.retry_policy,
+            ).wait(predicate=_status_reached)
 
         except TimeoutExpiredError:
             if current_status:
                 self.logger.error(f"Status of {self.kind} {self.name} is {current_status}")
             raise
 
+    @traced()
+    @api_caller(name="create")
     def create(
         self,
         wait: bool = False,
         exceptions_dict: dict[type[Exception], list[str]] = DEFAULT_CLUSTER_RETRY_EXCEPTIONS
         | PROTOCOL_ERROR_EXCEPTION_DICT,
+        retry_policy: RetryPolicy | None = None,
     ) -> ResourceInstance | None:
         """
         Create resource.
@@ -1051,6 +1229,7 @@ class Resource(ResourceConstants):
         Args:
             wait (bool) : True to wait for resource status.
             exceptions_dict (dict[type[Exception], list[str]]): Dictionary of exceptions to retry on.
+            retry_policy (RetryPolicy): Retry policy, defaults to the resource retry policy.
 
         Returns:
             ResourceInstance | None: Created resource instance or None if create failed.
@@ -1069,8 +1248,13 @@ class Resource(ResourceConstants):
         if self.dry_run:
             resource_kwargs["dry_run"] = "All"
 
+        self._forget_instance()
         resource_ = Resource.retry_cluster_exceptions(
-            func=self.api.create, exceptions_dict=exceptions_dict, **resource_kwargs
+            func=self.api.create,
+            exceptions_dict=exceptions_dict,
+            retry_policy=retry_policy or self.retry_policy,
+            operation=f"create {self.kind} {self.name}",
+            **resource_kwargs,
         )
         with contextlib.suppress(ForbiddenError, AttributeError, NotFoundError):
             # some resources do not support get() (no instance) or the client do not have permissions
@@ -1080,11 +1264,34 @@ class Resource(ResourceConstants):
             self.wait()
         return resource_
 
-    def delete(self, wait: bool = False, timeout: int = TIMEOUT_4MINUTES, body: dict[str, Any] | None = None) -> bool:
+    @traced()
+    @api_caller(name="delete")
+    def delete(
+        self,
+        wait: bool = False,
+        timeout: int = TIMEOUT_4MINUTES,
+        body: dict[str, Any] | None = None,
+        retry_policy: RetryPolicy | None = None,
+    ) -> bool:
+        """
+        Delete resource.
+
+        Args:
+            wait (bool): True to wait for the resource to be deleted.
+            timeout (int): Time to wait for the resource to be deleted.
+            body (dict, optional): Delete options.
+            retry_policy (RetryPolicy): Retry cluster errors of the delete request with this policy, defaults to
+                the resource retry policy. Without a policy the request is not retried.
+
+        Returns:
+            bool: False if the resource was not deleted within `timeout`, True otherwise.
+        """
         self.logger.info(f"Delete {self.kind} {self.name}")
+        retry_policy = retry_policy or self.retry_policy
 
-        if self.exists:
-            _instance_dict = self.instance.to_dict()
+        _instance = self.exists
+        if _instance:
+            _instance_dict = _instance.to_dict()
             if isinstance(_instance_dict, dict):
                 hashed_data = self.hash_resource_dict(resource_dict=_instance_dict)
                 self.logger.info(f"Deleting {hashed_data}")
@@ -1093,7 +1300,19 @@ class Resource(ResourceConstants):
             else:
                 self.logger.warning(f"{self.kind}: {self.name} instance.to_dict() return was not a dict")
 
-            self.api.delete(name=self.name, namespace=self.namespace, body=body)
+            if retry_policy:
+                Resource.retry_cluster_exceptions(
+                    func=self.api.delete,
+                    retry_policy=retry_policy,
+                    operation=f"delete {self.kind} {self.name}",
+                    name=self.name,
+                    namespace=self.namespace,
+                    body=body,
+                )
+            else:
+                self.api.delete(name=self.name, namespace=self.namespace, body=body)
+
+            self._forget_instance()
 
             if wait:
                 return self.wait_deleted(timeout=timeout)
@@ -1116,6 +1335,8 @@ class Resource(ResourceConstants):
         self.logger.info(f"Get {self.kind} {self.name} status")
         return self.instance.status.phase
 
+    @traced()
+    @api_caller(name="update")
     def update(self, resource_dict: dict[str, Any]) -> None:
         """
         Update resource with resource dict
@@ -1130,12 +1351,16 @@ class Resource(ResourceConstants):
         hashed_resource_dict = self.hash_resource_dict(resource_dict=resource_dict)
         self.logger.info(f"Update {self.kind} {self.name}:\n{hashed_resource_dict}")
         self.logger.debug(f"\n{yaml.dump(hashed_resource_dict)}")
-        self.api.patch(
-            body=resource_dict,
-            namespace=self.namespace,
-            content_type="application/merge-patch+json",
+        self._remember_instance(
+            instance=self.api.patch(
+                body=resource_dict,
+                namespace=self.namespace,
+                content_type="application/merge-patch+json",
+            )
         )
 
+    @traced()
+    @api_caller(name="update_replace")
     def update_replace(self, resource_dict: dict[str, Any]) -> None:
         """
         Replace resource metadata.
@@ -1150,7 +1375,43 @@ class Resource(ResourceConstants):
         hashed_resource_dict = self.hash_resource_dict(resource_dict=resource_dict)
         self.logger.info(f"Replace {self.kind} {self.name}: \n{hashed_resource_dict}")
         self.logger.debug(f"\n{yaml.dump(hashed_resource_dict)}")
-        self.api.replace(body=resource_dict, name=self.name, namespace=self.namespace)
+        self._remember_instance(instance=self.api.replace(body=resource_dict, name=self.name, namespace=self.namespace))
+
+    @traced()
+    @api_caller(name="apply")
+    def apply(self, resource_dict: dict[str, Any], field_manager: str, force_conflicts: bool = False) -> None:
+        """
+        Server-side apply a partial configuration owned by a field manager.
+
+        The fields in `resource_dict` become owned by `field_manager`; fields it applied before and are missing from
+        `resource_dict` are removed (unless another manager owns them), so applying an empty configuration releases
+        all its fields.
+
+        Args:
+            resource_dict (dict): Partial resource dict, `apiVersion`, `kind` and `metadata.name` are added.
+            field_manager (str): Field manager name.
+            force_conflicts (bool): Take over fields owned by other managers instead of failing on conflicts.
+
+        Raises:
+            ConflictError: If a field is owned by another manager with a different value and not forced.
+        """
+        body = {**resource_dict, "apiVersion": self.api_version, "kind": self.kind}
+        body["metadata"] = {**(resource_dict.get("metadata") or {}), "name": self.name}
+        if self.namespace:
+            body["metadata"]["namespace"] = self.namespace
+
+        hashed_resource_dict = self.hash_resource_dict(resource_dict=body)
+        self.logger.info(f"Apply {self.kind} {self.name} as {field_manager}:\n{hashed_resource_dict}")
+        self.logger.debug(f"\n{yaml.dump(hashed_resource_dict)}")
+        self._remember_instance(
+            instance=self.api.server_side_apply(
+                body=body,
+                name=self.name,
+                namespace=self.namespace,
+                field_manager=field_manager,
+                force_conflicts=force_conflicts,
+            )
+        )
 
     @staticmethod
     def retry_cluster_exceptions(
@@ -1158,9 +1419,33 @@ class Resource(ResourceConstants):
         exceptions_dict: dict[type[Exception], list[str]] = DEFAULT_CLUSTER_RETRY_EXCEPTIONS,
         timeout: int = TIMEOUT_10SEC,
         sleep_time: int = 1,
+        retry_policy: RetryPolicy | None = None,
+        operation: str = "",
         **kwargs: Any,
     ) -> Any:
+        """
+        Call a function, retrying the exceptions of `exceptions_dict` every `sleep_time` seconds until `timeout`.
+
+        Args:
+            func (Callable): Function to call, with `kwargs`.
+            exceptions_dict (dict): Exceptions to retry on.
+            timeout (int): Time to keep retrying.
+            sleep_time (int): Time between retries, ignored with `retry_policy`.
+            retry_policy (RetryPolicy, optional): Retry with the policy back off, budget and history.
+            operation (str): Operation name in the retry policy history.
+
+        Returns:
+            Any: Function result.
+
+        Raises:
+            Exception: The last retried exception if `timeout` expired.
+        """
         try:
+            if retry_policy:
+                return retry_policy.call(
+                    func=func, timeout=timeout, exceptions_dict=exceptions_dict, operation=operation, **kwargs
+                )
+
             sampler = TimeoutSampler(
                 wait_timeout=timeout,
                 sleep=sleep_time,
@@ -1188,12 +1473,17 @@ class Resource(ResourceConstants):
         exceptions_dict: dict[type[Exception], list[str]] = DEFAULT_CLUSTER_RETRY_EXCEPTIONS,
         raw: bool = False,
         context: str | None = None,
+        page_size: int = DEFAULT_LIST_PAGE_SIZE,
+        retry_policy: RetryPolicy | None = None,
         *args: Any,
         **kwargs: Any,
     ) -> Generator[Any, None, None]:
         """
         Get resources
 
+        Resources are listed lazily, `page_size` at a time. Yielded resources carry the listed body, so the first
+        access to `instance` does not issue another GET.
+
         Args:
             client (DynamicClient): k8s client
             dyn_client (DynamicClient): Open connection to remote cluster.
@@ -1202,6 +1492,8 @@ class Resource(ResourceConstants):
             singular_name (str): Resource kind (in lowercase), in use where we have multiple matches for resource.
             raw (bool): If True return raw object.
             exceptions_dict (dict): Exceptions dict for TimeoutSampler
+            page_size (int): Number of resources to list per request; 0 lists all resources in a single request.
+            retry_policy (RetryPolicy): Retry policy used when listing.
 
         Returns:
             generator: Generator of Resources of cls.kind.
@@ -1218,7 +1510,31 @@ class Resource(ResourceConstants):
             _client = get_client(config_file=config_file, context=context)
 
         def _get() -> Generator["Resource|ResourceInstance", None, None]:
-            _resources = cls._prepare_resources(*args, client=_client, singular_name=singular_name, **kwargs)  # type: ignore[misc]
+            cached_resources = None if raw else cls._get_cached_resources(_client, *args, **kwargs)
+            if cached_resources is not None:
+                for cached_resource in cached_resources:
+                    yield cls(client=_client, name=cached_resource["metadata"]["name"])
+
+                return
+
+            if not (args or kwargs.get("name")):
+                for resource_field in cls._list_resources(
+                    client=_client,
+                    singular_name=singular_name,
+                    page_size=page_size,
+                    exceptions_dict=exceptions_dict,
+                    retry_policy=retry_policy,
+                    **kwargs,
+                ):
+                    if raw:
+                        yield resource_field
+                    else:
+                        yield cls.from_instance(client=_client, instance=resource_field)
+
+                return
+
+            with api_call_context(caller="get"):
+                _resources = cls._prepare_resources(*args, client=_client, singular_name=singular_name, **kwargs)  # type: ignore[misc]
             try:
                 for resource_field in _resources.items:
                     if raw:
@@ -1232,9 +1548,10 @@ class Resource(ResourceConstants):
                 else:
                     yield cls(client=_client, name=_resources.metadata.name)
 
-        return Resource.retry_cluster_exceptions(func=_get, exceptions_dict=exceptions_dict)
+        return Resource.retry_cluster_exceptions(func=_get, exceptions_dict=exceptions_dict, retry_policy=retry_policy)
 
     @property
+    @api_caller(name="instance")
     def instance(self) -> ResourceInstance:
         """
         Get resource instance
@@ -1243,10 +1560,205 @@ class Resource(ResourceConstants):
             openshift.dynamic.client.ResourceInstance
         """
 
+        cached_instance = self._cached_instance()
+        if cached_instance is not None:
+            return cached_instance
+
         def _instance() -> ResourceInstance | None:
             return self.api.get(name=self.name)
 
-        return self.retry_cluster_exceptions(func=_instance)
+        return self._remember_instance(
+            instance=self.retry_cluster_exceptions(
+                func=_instance, retry_policy=self.retry_policy, operation=f"get {self.kind} {self.name}"
+            )
+        )
+
+    @property
+    def known_instance(self) -> ResourceInstance:
+        """
+        Get the last known resource instance, fetch it only if no body is known yet.
+
+        Use it for fields which do not change during the resource lifetime (e.g. uid or Pod containers).
+
+        Returns:
+            openshift.dynamic.client.ResourceInstance
+        """
+        return self._get_last_instance() or self.instance
+
+    @property
+    def resource_version(self) -> str | None:
+        """
+        metadata.resourceVersion of the last known body of the resource.
+
+        Returns:
+            str | None: Resource version, None if no body is known.
+        """
+        if self._last_body is not None:
+            metadata = self._last_body.get("metadata") or {}
+            return metadata.get("resourceVersion")
+
+        if self._last_instance is not None:
+            return self._last_instance.metadata.resourceVersion
+
+        return None
+
+    @classmethod
+    def from_dict(cls, client: DynamicClient, resource_dict: Any, **kwargs: Any) -> Self:
+        """
+        Build a resource object from an existing resource body, e.g. a listed or watched object.
+
+        The body is kept as the last known body of the resource; the first `instance` access is served from it.
+
+        Args:
+            client (DynamicClient): k8s client
+            resource_dict (dict | ResourceField): Resource body.
+            **kwargs (Any): Additional arguments to be passed to the resource class constructor.
+
+        Returns:
+            Resource: Resource object.
+        """
+        metadata = resource_dict["metadata"]
+        if issubclass(cls, NamespacedResource):
+            kwargs.setdefault("namespace", metadata.get("namespace"))
+
+        resource = cls(client=client, name=metadata["name"], **kwargs)
+        resource._last_body = resource_dict
+        resource._last_body_time = time.monotonic()
+        resource._last_body_unread = True
+        return resource
+
+    @classmethod
+    def from_instance(cls, client: DynamicClient, instance: ResourceInstance | ResourceField, **kwargs: Any) -> Self:
+        """
+        Build a resource object from an existing resource instance.
+
+        Args:
+            client (DynamicClient): k8s client
+            instance (ResourceInstance | ResourceField): Resource instance, e.g. returned by the dynamic client.
+            **kwargs (Any): Additional arguments to be passed to the resource class constructor.
+
+        Returns:
+            Resource: Resource object.
+        """
+        return cls.from_dict(client=client, resource_dict=instance, **kwargs)
+
+    def _remember_instance(self, instance: Any) -> Any:
+        self._last_instance = instance
+        self._last_body = None
+        self._last_body_time = time.monotonic()
+        self._last_body_unread = False
+        return instance
+
+    def _forget_instance(self) -> None:
+        self._last_instance = None
+        self._last_body = None
+        self._last_body_unread = False
+
+    def _get_last_instance(self) -> ResourceInstance | None:
+        if self._last_body is not None:
+            body = self._last_body if isinstance(self._last_body, dict) else self._last_body.to_dict()
+            self._last_instance = ResourceInstance(client=self.client, instance=body)
+            self._last_body = None
+
+        return self._last_instance
+
+    def _cached_instance(self) -> ResourceInstance | None:
+        last_instance = self._get_last_instance()
+        if last_instance is not None:
+            # A body given by the caller (from_dict / get) is served once, following reads follow the freshness policy
+            if self._last_body_unread:
+                self._last_body_unread = False
+                return last_instance
+
+            if self.freshness == self.Freshness.MAX_AGE and time.monotonic() - self._last_body_time <= self.max_age:
+                return last_instance
+
+        if self.freshness == self.Freshness.WATCH:
+            try:
+                self.informer(client=self.client, namespace=self.namespace)
+            except WatchNotPermittedError as exp:
+                self.logger.warning(f"Cannot watch {self.kind} {self.name}, fetching it on every access: {exp}")
+                self.freshness = self.Freshness.ALWAYS
+                return None
+
+        elif not informers_running():
+            return None
+
+        if not self.name:
+            return None
+
+        self._set_api_version()
+        cached_resource = get_cached_object(
+            client=self.client,
+            api_version=self.api_version,
+            kind=self.kind,
+            name=self.name,
+            namespace=self.namespace,
+        )
+        if cached_resource is None:
+            return None
+
+        return self._remember_instance(instance=ResourceInstance(client=self.client, instance=cached_resource))
+
+    @classmethod
+    def _get_cached_resources(cls, client: DynamicClient, *args: Any, **kwargs: Any) -> list[dict[str, Any]] | None:
+        if args or not informers_running() or set(kwargs) - {"namespace", "label_selector"}:
+            return None
+
+        if not cls.api_version:
+            cls.api_version = _get_api_version(client=client, api_group=cls.api_group, kind=cls.kind)
+
+        return list_cached_objects(
+            client=client,
+            api_version=cls.api_version,
+            kind=cls.kind,
+            namespace=kwargs.get("namespace"),
+            label_selector=kwargs.get("label_selector"),
+        )
+
+    @classmethod
+    def informer(
+        cls,
+        client: DynamicClient,
+        namespace: str | None = None,
+        label_selector: str | None = None,
+        field_selector: str | None = None,
+        indexers: dict[str, Indexer] | None = None,
+        singular_name: str = "",
+        **kwargs: Any,
+    ) -> Informer:
+        """
+        Get the shared informer of this kind, starting it if needed.
+
+        While the informer is running and fresh, `instance` and `get` of this kind are served from its cache.
+
+        Args:
+            client (DynamicClient): k8s client.
+            namespace (str | None): Namespace to watch; None for all namespaces.
+            label_selector (str | None): Only cache resources matching this label selector.
+            field_selector (str | None): Only cache resources matching this field selector.
+            indexers (dict[str, Callable] | None): Extra indexers, e.g. {"node": field_indexer(path="spec.nodeName")}.
+            singular_name (str): Resource kind (in lowercase), in use where we have multiple matches for resource.
+            **kwargs: Extra `Informer` arguments (sync_timeout, max_staleness, watch_timeout, resync_period).
+
+        Returns:
+            Informer: Running and synced informer.
+        """
+        if not cls.api_version:
+            cls.api_version = _get_api_version(client=client, api_group=cls.api_group, kind=cls.kind)
+
+        get_kwargs = {"singular_name": singular_name} if singular_name else {}
+        return start_informer(
+            client=client,
+            api=client.resources.get(kind=cls.kind, api_version=cls.api_version, **get_kwargs),
+            kind=cls.kind,
+            api_version=cls.api_version,
+            namespace=namespace,
+            label_selector=label_selector,
+            field_selector=field_selector,
+            indexers=indexers,
+            **kwargs,
+        )
 
     @property
     def labels(self) -> ResourceField:
@@ -1280,6 +1792,8 @@ class Resource(ResourceConstants):
             resource_version=resource_version or self.initial_resource_version,
         )
 
+    @traced()
+    @api_caller(name="wait_for_condition")
     def wait_for_condition(
         self,
         condition: str,
@@ -1290,6 +1804,7 @@ class Resource(ResourceConstants):
         message: str = "",
         stop_condition: str | None = None,
         stop_status: str = "True",
+        use_watch: bool | None = None,
     ) -> None:
         """
         Wait for Resource condition to be in desire status.
@@ -1305,36 +1820,309 @@ class Resource(ResourceConstants):
                 Note: Matching for stop_condition only uses condition type and status.
                 The reason and message fields are ignored when checking for stop_condition.
             stop_status (str): Status of the stop condition which should stop the wait and fail.
+            use_watch (bool | None): Wait using a watch instead of polling.
+                If None, `OPENSHIFT_PYTHON_WRAPPER_WAIT_WITH_WATCH` environment variable is used.
 
         Raises:
             TimeoutExpiredError: If Resource condition is not in desired status within timeout.
             ConditionError: If the desired condition is not met and stop_condition is detected before timeout.
         """
         self.logger.info(f"Wait for {self.kind}/{self.name}'s '{condition}' condition to be '{status}'")
-
-        timeout_watcher = TimeoutWatch(timeout=timeout)
-        self.wait(timeout=timeout, sleep=sleep_time)
-        for sample in TimeoutSampler(
-            wait_timeout=timeout_watcher.remaining_time(),
+        ResourceWaiter(
+            resource=self,
+            timeout=timeout,
             sleep=sleep_time,
-            func=lambda: self.instance,
-        ):
-            if sample:
-                for cond in sample.get("status", {}).get("conditions", []):
-                    actual_condition = {"type": cond["type"], "status": cond["status"]}
+            use_watch=use_watch,
+        ).wait(
+            predicate=self._condition_predicate(
+                condition=condition,
+                status=status,
+                reason=reason,
+                message=message,
+                stop_condition=stop_condition,
+                stop_status=stop_status,
+            )
+        )
 
-                    if stop_condition and actual_condition == {"type": stop_condition, "status": stop_status}:
-                        raise ConditionError(
-                            f"{self.kind} {self.name} reached stop_condition '{stop_condition}' in status '{stop_status}':\n{cond}"
-                        )
+    def _condition_predicate(
+        self,
+        condition: str,
+        status: str,
+        reason: str | None,
+        message: str,
+        stop_condition: str | None,
+        stop_status: str,
+    ) -> Callable[[dict[str, Any] | None], bool]:
+        def _condition_reached(resource_dict: dict[str, Any] | None) -> bool:
+            if not resource_dict:
+                return False
+
+            for cond in (resource_dict.get("status") or {}).get("conditions") or []:
+                actual_condition = {"type": cond["type"], "status": cond["status"]}
+
+                if stop_condition and actual_condition == {"type": stop_condition, "status": stop_status}:
+                    raise ConditionError(
+                        f"{self.kind} {self.name} reached stop_condition '{stop_condition}' in status '{stop_status}':\n{cond}"
+                    )
+
+                expected_condition = {"type": condition, "status": status}
+                if reason is not None:
+                    actual_condition["reason"] = cond.get("reason", "")
+                    expected_condition["reason"] = reason
+
+                if actual_condition == expected_condition and message in (cond.get("message") or ""):
+                    return True
+
+            return False
+
+        return _condition_reached
+
+    async def acreate(
+        self,
+        wait: bool = False,
+        exceptions_dict: dict[type[Exception], list[str]] = DEFAULT_CLUSTER_RETRY_EXCEPTIONS
+        | PROTOCOL_ERROR_EXCEPTION_DICT,
+    ) -> ResourceInstance | None:
+        """
+        Async twin of `create`.
+
+        Args:
+            wait (bool) : True to wait for resource status, see `wait`.
+            exceptions_dict (dict[type[Exception], list[str]]): Dictionary of exceptions to retry on.
 
-                    expected_condition = {"type": condition, "status": status}
-                    if reason is not None:
-                        actual_condition["reason"] = cond.get("reason", "")
-                        expected_condition["reason"] = reason
+        Returns:
+            ResourceInstance | None: Created resource instance or None if create failed.
+        """
+        # Only the base `wait` (resource exists) has an async twin, overrides (e.g. DataVolume) run in a thread
+        if type(self).wait is not Resource.wait:
+            return await run_sync(self.create, wait=wait, exceptions_dict=exceptions_dict)
+
+        resource_ = await run_sync(self.create, wait=False, exceptions_dict=exceptions_dict)
+        if wait and resource_:
+            await self._await_exists()
+
+        return resource_
+
+    async def adeploy(self, wait: bool = False) -> Self:
+        """
+        Async twin of `deploy`.
+
+        Args:
+            wait (bool) : True to wait for resource status, see `wait`.
+
+        Returns:
+            Resource: The deployed resource.
+        """
+        if type(self).wait is not Resource.wait:
+            return await run_sync(self.deploy, wait=wait)
+
+        resource = await run_sync(self.deploy, wait=False)
+        if wait:
+            await self._await_exists()
+
+        return resource
+
+    async def adelete(
+        self, wait: bool = False, timeout: int = TIMEOUT_4MINUTES, body: dict[str, Any] | None = None
+    ) -> bool:
+        """
+        Async twin of `delete`.
+
+        Args:
+            wait (bool): True to wait for the resource to be deleted.
+            timeout (int): Time to wait for the resource to be deleted.
+            body (dict | None): Delete options body.
+
+        Returns:
+            bool: False if the resource was not deleted within timeout, else True.
+        """
+        if type(self).wait_deleted is not Resource.wait_deleted:
+            return await run_sync(self.delete, wait=wait, timeout=timeout, body=body)
+
+        deleted = await run_sync(self.delete, wait=False, body=body)
+        if wait and deleted:
+            return await self.await_deleted(timeout=timeout)
+
+        return deleted
+
+    async def aclean_up(self, wait: bool = True, timeout: int | None = None) -> bool:
+        """
+        Async twin of `clean_up`.
+
+        Args:
+            wait (bool): Wait for resource deletion.
+            timeout (int | None): Timeout in seconds to wait for resource to be deleted.
 
-                    if actual_condition == expected_condition and message in cond.get("message", ""):
-                        return
+        Returns:
+            bool: True if resource was deleted else False.
+        """
+        return await run_sync(self.clean_up, wait=wait, timeout=timeout)
+
+    async def ainstance(self) -> ResourceInstance:
+        """
+        Async twin of `instance`.
+
+        Returns:
+            openshift.dynamic.client.ResourceInstance
+        """
+        return await run_sync(getattr, self, "instance")
+
+    @classmethod
+    async def aget(cls, client: DynamicClient, **kwargs: Any) -> AsyncGenerator[Any, None]:
+        """
+        Async twin of `get`.
+
+        Args:
+            client (DynamicClient): k8s client
+            **kwargs (Any): `get` arguments, e.g. namespace, label_selector, page_size.
+
+        Yields:
+            Resource: Resources of cls.kind.
+        """
+        async for resource in iterate_sync(iterator=iter(await run_sync(cls.get, client=client, **kwargs))):
+            yield resource
+
+    async def await_deleted(self, timeout: int = TIMEOUT_4MINUTES, sleep: int = 1) -> bool:
+        """
+        Async twin of `wait_deleted`.
+
+        Args:
+            timeout (int): Time to wait for the resource.
+            sleep (int): Time to wait between polls.
+
+        Returns:
+            bool: False if the resource still exists after timeout, else True.
+        """
+        self.logger.info(f"Wait until {self.kind} {self.name} is deleted")
+        try:
+            await ResourceWaiter(resource=self, timeout=timeout, sleep=sleep).async_wait(
+                predicate=lambda resource_dict: resource_dict is None
+            )
+            return True
+        except TimeoutExpiredError:
+            self.logger.warning(f"Timeout expired while waiting for {self.kind} {self.name} to be deleted")
+            return False
+
+    async def await_for_status(
+        self,
+        status: str,
+        timeout: int = TIMEOUT_4MINUTES,
+        stop_status: str | None = None,
+        sleep: int = 1,
+        exceptions_dict: dict[type[Exception], list[str]] = PROTOCOL_ERROR_EXCEPTION_DICT
+        | DEFAULT_CLUSTER_RETRY_EXCEPTIONS,
+    ) -> None:
+        """
+        Async twin of `wait_for_status`.
+
+        Args:
+            status (str): Expected status.
+            timeout (int): Time to wait for the resource.
+            stop_status (str): Status which should stop the wait and failed.
+            sleep (int): Time to wait between polls.
+            exceptions_dict (dict[type[Exception], list[str]]): Dictionary of exceptions to retry on.
+
+        Raises:
+            TimeoutExpiredError: If resource in not in desire status.
+        """
+        stop_status = stop_status if stop_status else self.Status.FAILED
+        self.logger.info(f"Wait for {self.kind} {self.name} status to be {status}")
+
+        def _status_reached(resource_dict: dict[str, Any] | None) -> bool:
+            if resource_dict is None:
+                return False
+
+            current_status = (resource_dict.get("status") or {}).get("phase")
+            if current_status == status:
+                return True
+
+            if current_status == stop_status:
+                raise TimeoutExpiredError(f"Status of {self.kind} {self.name} is {current_status}")
+
+            return False
+
+        await ResourceWaiter(resource=self, timeout=timeout, sleep=sleep, exceptions_dict=exceptions_dict).async_wait(
+            predicate=_status_reached
+        )
+
+    async def await_for_condition(
+        self,
+        condition: str,
+        status: str,
+        timeout: int = 300,
+        sleep_time: int = 1,
+        reason: str | None = None,
+        message: str = "",
+        stop_condition: str | None = None,
+        stop_status: str = "True",
+    ) -> None:
+        """
+        Async twin of `wait_for_condition`.
+
+        Args:
+            condition (str): Condition to query.
+            status (str): Expected condition status.
+            timeout (int): Time to wait for the resource.
+            sleep_time(int): Interval between each retry when checking the resource's condition.
+            reason (None): Expected condition reason.
+            message (str): Expected condition text inclusion.
+            stop_condition (str | None): Condition which should stop the wait and fail.
+            stop_status (str): Status of the stop condition which should stop the wait and fail.
+
+        Raises:
+            TimeoutExpiredError: If Resource condition is not in desired status within timeout.
+            ConditionError: If the desired condition is not met and stop_condition is detected before timeout.
+        """
+        self.logger.info(f"Wait for {self.kind}/{self.name}'s '{condition}' condition to be '{status}'")
+        await ResourceWaiter(resource=self, timeout=timeout, sleep=sleep_time).async_wait(
+            predicate=self._condition_predicate(
+                condition=condition,
+                status=status,
+                reason=reason,
+                message=message,
+                stop_condition=stop_condition,
+                stop_status=stop_status,
+            )
+        )
+
+    async def awatcher(self, timeout: int, resource_version: str = "") -> AsyncGenerator[dict[str, Any], None]:
+        """
+        Async twin of `watcher`.
+
+        Args:
+            timeout (int): Time to get conditions.
+            resource_version (str): Only events with a resource_version greater than this value are returned.
+
+        Yields:
+            dict: Watch events, see `watcher`.
+        """
+        async for event in iterate_sync(iterator=self.watcher(timeout=timeout, resource_version=resource_version)):
+            yield event
+
+    async def aevents(self, **kwargs: Any) -> AsyncGenerator[Any, None]:
+        """
+        Async twin of `events`.
+
+        Args:
+            **kwargs (Any): `events` arguments, e.g. field_selector, timeout.
+
+        Yields:
+            Event objects, see `events`.
+        """
+        async for event in iterate_sync(iterator=self.events(**kwargs)):
+            yield event
+
+    async def _await_exists(self, timeout: int = TIMEOUT_4MINUTES) -> None:
+        self.logger.info(f"Wait until {self.kind} {self.name} is created")
+        await ResourceWaiter(
+            resource=self,
+            timeout=timeout,
+            exceptions_dict={
+                **PROTOCOL_ERROR_EXCEPTION_DICT,
+                **NOT_FOUND_ERROR_EXCEPTION_DICT,
+                **DEFAULT_CLUSTER_RETRY_EXCEPTIONS,
+            },
+        ).async_wait(predicate=lambda resource_dict: resource_dict is not None)
 
     def api_request(
         self, method: str, action: str, url: str, retry_params: dict[str, int] | None = None, **params: Any
@@ -1376,6 +2164,8 @@ class Resource(ResourceConstants):
         except json.decoder.JSONDecodeError:
             return response.data
 
+    @traced()
+    @api_caller(name="wait_for_conditions")
     def wait_for_conditions(self) -> None:
         timeout_watcher = TimeoutWatch(timeout=30)
         for sample in TimeoutSampler(
@@ -1445,17 +2235,21 @@ class Resource(ResourceConstants):
         config_file: str = "",
         context: str | None = None,
         config_dict: dict[str, Any] | None = None,
+        page_size: int = DEFAULT_LIST_PAGE_SIZE,
         *args: Any,
         **kwargs: Any,
     ) -> Generator[ResourceField, None, None]:
         """
         Get all cluster resources
 
+        Resources are listed lazily, `page_size` at a time.
+
         Args:
             client (DynamicClient): k8s client
             config_file (str): path to a kubeconfig file.
             config_dict (dict): dict with kubeconfig configuration.
             context (str): name of the context to use.
+            page_size (int): Number of resources to list per request; 0 lists all resources in a single request.
             *args (tuple): args to pass to client.get()
             **kwargs (dict): kwargs to pass to client.get()
 
@@ -1477,8 +2271,9 @@ class Resource(ResourceConstants):
 
         for _resource in client.resources.search():
             try:
-                _resources = client.get(_resource, *args, **kwargs)
-                yield from _resources.items
+                yield from _paginate(
+                    get_page=functools.partial(client.get, _resource, *args, **kwargs), page_size=page_size
+                )
 
             except (NotFoundError, TypeError, MethodNotAllowedError):
                 continue
@@ -1659,12 +2454,17 @@ class NamespacedResource(Resource):
         exceptions_dict: dict[type[Exception], list[str]] = DEFAULT_CLUSTER_RETRY_EXCEPTIONS,
         raw: bool = False,
         context: str | None = None,
+        page_size: int = DEFAULT_LIST_PAGE_SIZE,
+        retry_policy: RetryPolicy | None = None,
         *args: Any,
         **kwargs: Any,
     ) -> Generator[Any, None, None]:
         """
         Get resources
 
+        Resources are listed lazily, `page_size` at a time. Yielded resources carry the listed body, so the first
+        access to `instance` does not issue another GET.
+
         Args:
             client (DynamicClient): k8s client
             dyn_client (DynamicClient): Open connection to remote cluster
@@ -1673,6 +2473,8 @@ class NamespacedResource(Resource):
             singular_name (str): Resource kind (in lowercase), in use where we have multiple matches for resource.
             raw (bool): If True return raw object.
             exceptions_dict (dict): Exceptions dict for TimeoutSampler
+            page_size (int): Number of resources to list per request; 0 lists all resources in a single request.
+            retry_policy (RetryPolicy): Retry policy used when listing.
 
         Returns:
             generator: Generator of Resources of cls.kind
@@ -1689,7 +2491,35 @@ class NamespacedResource(Resource):
             _client = get_client(config_file=config_file, context=context)
 
         def _get() -> Generator["NamespacedResource|ResourceInstance", None, None]:
-            _resources = cls._prepare_resources(*args, client=_client, singular_name=singular_name, **kwargs)  # type: ignore[misc]
+            cached_resources = None if raw else cls._get_cached_resources(_client, *args, **kwargs)
+            if cached_resources is not None:
+                for cached_resource in cached_resources:
+                    yield cls(
+                        client=_client,
+                        name=cached_resource["metadata"]["name"],
+                        namespace=cached_resource["metadata"]["namespace"],
+                    )
+
+                return
+
+            if not (args or kwargs.get("name")):
+                for resource_field in cls._list_resources(
+                    client=_client,
+                    singular_name=singular_name,
+                    page_size=page_size,
+                    exceptions_dict=exceptions_dict,
+                    retry_policy=retry_policy,
+                    **kwargs,
+                ):
+                    if raw:
+                        yield resource_field
+                    else:
+                        yield cls.from_instance(client=_client, instance=resource_field)
+
+                return
+
+            with api_call_context(caller="get"):
+                _resources = cls._prepare_resources(*args, client=_client, singular_name=singular_name, **kwargs)  # type: ignore[misc]
             try:
                 for resource_field in _resources.items:
                     if raw:
@@ -1710,9 +2540,10 @@ class NamespacedResource(Resource):
                         namespace=_resources.metadata.namespace,
                     )
 
-        return Resource.retry_cluster_exceptions(func=_get, exceptions_dict=exceptions_dict)
+        return Resource.retry_cluster_exceptions(func=_get, exceptions_dict=exceptions_dict, retry_policy=retry_policy)
 
     @property
+    @api_caller(name="instance")
     def instance(self) -> ResourceInstance:
         """
         Get resource instance
@@ -1721,10 +2552,18 @@ class NamespacedResource(Resource):
             openshift.dynamic.client.ResourceInstance
         """
 
+        cached_instance = self._cached_instance()
+        if cached_instance is not None:
+            return cached_instance
+
         def _instance() -> ResourceInstance:
             return self.api.get(name=self.name, namespace=self.namespace)
 
-        return self.retry_cluster_exceptions(func=_instance)
+        return self._remember_instance(
+            instance=self.retry_cluster_exceptions(
+                func=_instance, retry_policy=self.retry_policy, operation=f"get {self.kind} {self.name}"
+            )
+        )
 
     def _base_body(self) -> None:
         if self.yaml_file or self.kind_dict:
@@ -1743,13 +2582,30 @@ class NamespacedResource(Resource):
 
 class ResourceEditor:
     def __init__(
-        self, patches: dict[Any, Any], action: str = "update", user_backups: dict[Any, Any] | None = None
+        self,
+        patches: dict[Any, Any],
+        action: str = "update",
+        user_backups: dict[Any, Any] | None = None,
+        field_manager: str | None = None,
+        force_conflicts: bool = False,
+        max_workers: int = 1,
+        retry_policy: RetryPolicy | None = None,
     ) -> None:
         """
         Args:
             patches (dict): {<Resource object>: <yaml patch as dict>}
                 e.g. {<Resource object>:
                         {'metadata': {'labels': {'label1': 'true'}}}
+            action (str): "update" (merge patch) or "replace".
+            user_backups (dict, optional): {<Resource object>: <backup as dict>} to restore instead of computed ones.
+            field_manager (str, optional): Server-side apply the "update" patches as this field manager. No backup
+                is read: restore releases the manager fields. Resources whose patch conflicts with fields owned by
+                other managers (i.e. changes existing values) fall back to a backed up merge patch.
+            force_conflicts (bool): With `field_manager`, take over conflicting fields instead of falling back.
+                Restore then removes those fields instead of resetting their previous values.
+            max_workers (int): Number of resources patched (and restored) concurrently; failures are collected into
+                a single `BulkResourceError`.
+            retry_policy (RetryPolicy, optional): Retry the patches with this policy instead of every 5 seconds.
 
         Allows for temporary edits to cluster resources for tests. During
         __enter__ user-specified patches (see args) are applied and old values
@@ -1771,7 +2627,13 @@ class ResourceEditor:
         self._patches = self._dictify_resourcefield(res=patches)
         self.action = action
         self.user_backups = user_backups
+        self.field_manager = field_manager
+        self.force_conflicts = force_conflicts
+        self.max_workers = max_workers
+        self.retry_policy = retry_policy
         self._backups: dict[Any, Any] = {}
+        # Resources updated by server-side apply, restored by releasing the field manager fields
+        self._applied: list[Any] = []
 
     @property
     def backups(self) -> dict[Any, Any]:
@@ -1784,8 +2646,20 @@ class ResourceEditor:
         """Returns the patches dict provided in the constructor"""
         return self._patches
 
+    @traced()
+    @api_caller(name="ResourceEditor.update")
     def update(self, backup_resources: bool = False) -> None:
         """Prepares backup dicts (where necessary) and applies patches"""
+        if self.field_manager and self.action == "update" and not self.user_backups:
+            self._run_per_resource(
+                operation="Updating",
+                tasks={
+                    resource: functools.partial(self._apply_patch, resource=resource, backup_resources=backup_resources)
+                    for resource in self._patches
+                },
+            )
+            return
+
         # prepare update dicts and backups
         resource_to_patch = []
         if backup_resources:
@@ -1796,33 +2670,11 @@ class ResourceEditor:
 
             else:
                 for resource, update in self._patches.items():
-                    namespace = None
-                    # prepare backup
-                    try:
-                        original_resource_dict = resource.instance.to_dict()
-                    except NotFoundError:
-                        # Some resource cannot be found by name.
-                        # happens in 'ServiceMonitor' resource.
-                        original_resource_dict = list(
-                            resource.get(
-                                client=resource.client,
-                                field_selector=f"metadata.name={resource.name}",
-                            )
-                        )[0].to_dict()
-                        namespace = update.get("metadata", {}).get("namespace")
-
-                    backup = self._create_backup(original=original_resource_dict, patch=update)
-                    if namespace:
-                        # Add namespace to metadata for restore.
-                        backup["metadata"]["namespace"] = namespace
-
                     # no need to back up if no changes have been made
                     # if action is 'replace' we need to update even if no backup (replace update can be empty )
-                    if backup or self.action == "replace":
+                    if self._backup_resource(resource=resource, patch=update):
                         resource_to_patch.append(resource)
-                        self._backups[resource] = backup
-                    else:
-                        LOGGER.warning(f"ResourceEdit: no diff found in patch for {resource.name} -- skipping")
+
                 if not resource_to_patch:
                     return
         else:
@@ -1831,10 +2683,27 @@ class ResourceEditor:
         patches_to_apply = {resource: self._patches[resource] for resource in resource_to_patch}
 
         # apply changes
-        self._apply_patches_sampler(patches=patches_to_apply, action_text="Updating", action=self.action)
+        self._patch_resources(patches=patches_to_apply, action_text="Updating")
 
+    @traced()
+    @api_caller(name="ResourceEditor.restore")
     def restore(self) -> None:
-        self._apply_patches_sampler(patches=self._backups, action_text="Restoring", action=self.action)
+        """Reverts the patches, releasing the field manager fields of server-side applied resources"""
+        if not self._applied and self.max_workers <= 1:
+            self._apply_patches_sampler(patches=self._backups, action_text="Restoring", action=self.action)
+            return
+
+        # Server-side applied and backed up resources are restored in one batch
+        tasks: dict[Any, Callable[[], Any]] = {
+            resource: functools.partial(self._release_field_manager, resource=resource) for resource in self._applied
+        }
+        for resource, backup in self._backups.items():
+            tasks[resource] = functools.partial(
+                self._apply_patches_sampler, patches={resource: backup}, action_text="Restoring", action=self.action
+            )
+
+        self._run_per_resource(operation="Restoring", tasks=tasks)
+        self._applied = []
 
     def __enter__(self) -> Self:
         self.update(backup_resources=True)
@@ -1846,6 +2715,116 @@ class ResourceEditor:
         # restore backups
         self.restore()
 
+    def _backup_resource(self, resource: Any, patch: dict[Any, Any]) -> bool:
+        """
+        Back up the resource fields a patch changes.
+
+        Returns:
+            bool: True if the resource needs to be patched.
+        """
+        namespace = None
+        try:
+            original_resource_dict = resource.instance.to_dict()
+        except NotFoundError:
+            # Some resource cannot be found by name.
+            # happens in 'ServiceMonitor' resource.
+            original_resource_dict = list(
+                resource.get(
+                    client=resource.client,
+                    field_selector=f"metadata.name={resource.name}",
+                )
+            )[0].to_dict()
+            namespace = patch.get("metadata", {}).get("namespace")
+
+        backup = self._create_backup(original=original_resource_dict, patch=patch)
+        if namespace:
+            # Add namespace to metadata for restore.
+            backup["metadata"]["namespace"] = namespace
+
+        if backup or self.action == "replace":
+            self._backups[resource] = backup
+            return True
+
+        LOGGER.warning(f"ResourceEdit: no diff found in patch for {resource.name} -- skipping")
+        return False
+
+    def _apply_patch(self, resource: Any, backup_resources: bool) -> None:
+        patch = self._patches[resource]
+        LOGGER.info(
+            f"ResourceEdits: Applying data for resource {resource.kind} {resource.name} as {self.field_manager}"
+        )
+        try:
+            # Field conflicts are not transient, only retry cluster errors
+            Resource.retry_cluster_exceptions(
+                func=resource.apply,
+                resource_dict=copy.deepcopy(patch),
+                field_manager=self.field_manager,
+                force_conflicts=self.force_conflicts,
+                timeout=TIMEOUT_30SEC,
+                sleep_time=TIMEOUT_5SEC,
+                retry_policy=self.retry_policy,
+                operation=f"apply {resource.kind} {resource.name}",
+            )
+        except ConflictError as exp:
+            LOGGER.info(
+                f"ResourceEdits: {resource.kind} {resource.name} fields are owned by other managers, "
+                f"patching with a backup instead: {exp}"
+            )
+            if backup_resources and not self._backup_resource(resource=resource, patch=patch):
+                return
+
+            self._apply_patches_sampler(patches={resource: patch}, action_text="Updating", action=self.action)
+            return
+
+        self._applied.append(resource)
+
+    def _release_field_manager(self, resource: Any) -> None:
+        LOGGER.info(f"ResourceEdits: Releasing {self.field_manager} fields of resource {resource.kind} {resource.name}")
+        Resource.retry_cluster_exceptions(
+            func=resource.apply,
+            resource_dict={},
+            field_manager=self.field_manager,
+            timeout=TIMEOUT_30SEC,
+            sleep_time=TIMEOUT_5SEC,
+            retry_policy=self.retry_policy,
+            operation=f"release {resource.kind} {resource.name}",
+        )
+
+    def _patch_resources(self, patches: dict[Any, Any], action_text: str) -> None:
+        if self.max_workers <= 1:
+            self._apply_patches_sampler(patches=patches, action_text=action_text, action=self.action)
+            return
+
+        # Each resource is retried on its own, a conflict does not re-apply the patches of the others
+        self._run_per_resource(
+            operation=action_text,
+            tasks={
+                resource: functools.partial(
+                    self._apply_patches_sampler, patches={resource: patch}, action_text=action_text, action=self.action
+                )
+                for resource, patch in patches.items()
+            },
+        )
+
+    def _run_per_resource(self, operation: str, tasks: dict[Any, Callable[[], Any]]) -> None:
+        if self.max_workers <= 1:
+            for task in tasks.values():
+                task()
+
+            return
+
+        errors: list[tuple[Any, Exception]] = []
+        with ThreadPoolExecutor(max_workers=max(min(self.max_workers, len(tasks)), 1)) as executor:
+            futures = {executor.submit(task): resource for resource, task in tasks.items()}
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except Exception as exp:
+                    errors.append((futures[future], exp))
+
+        if errors:
+            raise BulkResourceError(operation=f"ResourceEditor {operation.lower()}", errors=errors)
+
     @staticmethod
     def _dictify_resourcefield(res: Any) -> Any:
         """Recursively turns any ResourceField objects into dicts to avoid issues caused by appending lists, etc."""
@@ -1955,6 +2934,8 @@ class ResourceEditor:
             action=action,
             timeout=TIMEOUT_30SEC,
             sleep_time=TIMEOUT_5SEC,
+            retry_policy=self.retry_policy,
+            operation=f"ResourceEditor {action_text.lower()}",
         )
 
 
@@ -1996,30 +2977,169 @@ class BaseResourceList(ABC):
         """Returns the number of resources in the list."""
         return len(self.resources)
 
-    def deploy(self, wait: bool = False) -> list[Resource | NamespacedResource]:
+    def deploy(
+        self, wait: bool = False, max_workers: int = 1, qps: float | None = None
+    ) -> list[Resource | NamespacedResource]:
         """
         Deploys all resources in the list.
 
+        With `max_workers` > 1 resources are deployed concurrently, dependencies first (see `dependency_tiers`):
+        the resources of a tier are created, then waited for all at once. Resources with their own `wait` (e.g.
+        DataVolume) are waited for by their own `deploy`. All failures of a tier are collected into a single
+        `BulkResourceError`, raised before the dependent tiers are deployed.
+
         Args:
             wait (bool): If True, wait for each resource to be ready.
+            max_workers (int): Number of resources to deploy concurrently; 1 deploys them one by one.
+            qps (float | None): Maximum number of resources to deploy per second.
 
         Returns:
             List[Any]: A list of the results from each resource's deploy() call.
-        """
-        return [resource.deploy(wait=wait) for resource in self.resources]
 
-    def clean_up(self, wait: bool = True) -> bool:
+        Raises:
+            BulkResourceError: If deploying any of the resources failed or timed out (concurrent mode).
+        """
+        if max_workers <= 1 and qps is None:
+            return [resource.deploy(wait=wait) for resource in self.resources]
+
+        return self._run_concurrently(
+            operation="deploy",
+            func=lambda resource: resource.deploy(wait=wait and not self._batch_waited(resource, "wait")),
+            tiers=self.dependency_tiers(),
+            max_workers=max_workers,
+            qps=qps,
+            wait_predicate=(lambda resource_dict: resource_dict is not None) if wait else None,
+            wait_method="wait",
+            wait_timeout=TIMEOUT_4MINUTES,
+            wait_exceptions_dict={
+                **PROTOCOL_ERROR_EXCEPTION_DICT,
+                **NOT_FOUND_ERROR_EXCEPTION_DICT,
+                **DEFAULT_CLUSTER_RETRY_EXCEPTIONS,
+            },
+        )
+
+    def clean_up(self, wait: bool = True, max_workers: int = 1, qps: float | None = None) -> bool:
         """
         Deletes all resources in the list.
 
+        With `max_workers` > 1 resources are deleted concurrently, dependents first (see `dependency_tiers`): the
+        resources of a tier are deleted, then waited for all at once. Resources with their own `wait_deleted` (e.g.
+        DataVolume) are waited for by their own `clean_up`. All failures of a tier are collected into a single
+        `BulkResourceError`, raised before the tiers they depend on are deleted.
+
         Args:
             wait (bool): If True, wait for each resource to be deleted.
+            max_workers (int): Number of resources to delete concurrently; 1 deletes them one by one.
+            qps (float | None): Maximum number of resources to delete per second.
 
         Returns:
             bool: Returns True if all resources are cleaned up correclty.
+
+        Raises:
+            BulkResourceError: If deleting any of the resources failed or timed out (concurrent mode).
+        """
+        if max_workers <= 1 and qps is None:
+            # Deleting in reverse order to resolve dependencies correctly.
+            return all(resource.clean_up(wait=wait) for resource in reversed(self.resources))
+
+        return all(
+            self._run_concurrently(
+                operation="clean_up",
+                func=lambda resource: resource.clean_up(wait=wait and not self._batch_waited(resource, "wait_deleted")),
+                tiers=list(reversed(self.dependency_tiers())),
+                max_workers=max_workers,
+                qps=qps,
+                wait_predicate=(lambda resource_dict: resource_dict is None) if wait else None,
+                wait_method="wait_deleted",
+                wait_timeout=max((resource.delete_timeout for resource in self.resources), default=TIMEOUT_4MINUTES),
+            )
+        )
+
+    def dependency_tiers(self) -> list[list[int]]:
+        """
+        Group the resources by dependency order, e.g. CustomResourceDefinitions, then Namespaces, then the rest.
+
+        Returns:
+            list[list[int]]: Indexes of the resources in each tier, tiers in deploy order.
         """
-        # Deleting in reverse order to resolve dependencies correctly.
-        return all(resource.clean_up(wait=wait) for resource in reversed(self.resources))
+        tiers: dict[int, list[int]] = {}
+        for idx, resource in enumerate(self.resources):
+            order = RESOURCE_LIST_DEPENDENCY_ORDER.get(resource.kind, max(RESOURCE_LIST_DEPENDENCY_ORDER.values()) + 1)
+            tiers.setdefault(order, []).append(idx)
+
+        return [tiers[order] for order in sorted(tiers)]
+
+    @staticmethod
+    def _batch_waited(resource: Resource, wait_method: str) -> bool:
+        # The batched wait only checks existence, classes overriding the wait keep their own semantics and timeouts
+        return getattr(type(resource), wait_method) is getattr(Resource, wait_method)
+
+    def _run_concurrently(
+        self,
+        operation: str,
+        func: Callable[[Any], Any],
+        tiers: list[list[int]],
+        max_workers: int,
+        qps: float | None,
+        wait_predicate: Callable[[dict[str, Any] | None], bool] | None = None,
+        wait_method: str = "wait",
+        wait_timeout: float = TIMEOUT_4MINUTES,
+        wait_exceptions_dict: dict[type[Exception], list[str]] | None = None,
+    ) -> list[Any]:
+        rate_limiter = TokenBucketRateLimiter(qps=qps, burst=max_workers) if qps else None
+        results: list[Any] = [None] * len(self.resources)
+        errors: list[tuple[Any, Exception]] = []
+
+        def _run(resource: Any) -> Any:
+            if rate_limiter:
+                rate_limiter.acquire()
+
+            return func(resource)
+
+        LOGGER.info(f"Run {operation} on {len(self.resources)} resources, {max_workers} at a time")
+        with ThreadPoolExecutor(max_workers=max(max_workers, 1)) as executor:
+            # A tier starts only once the previous one is done, e.g. Namespaces exist before their Pods are created
+            for tier_number, tier in enumerate(tiers):
+                futures = {executor.submit(_run, self.resources[idx]): idx for idx in tier}
+                done: list[Resource] = []
+                for future in as_completed(futures):
+                    idx = futures[future]
+                    try:
+                        results[idx] = future.result()
+                        done.append(self.resources[idx])
+                    except Exception as exp:
+                        errors.append((self.resources[idx], exp))
+
+                # The pool only sends the requests, the resources of the tier are waited for together
+                batched = [resource for resource in done if self._batch_waited(resource, wait_method)]
+                if wait_predicate and batched:
+                    try:
+                        for resource in wait_for_resources(
+                            resources=batched,
+                            predicate=wait_predicate,
+                            timeout=wait_timeout,
+                            exceptions_dict=wait_exceptions_dict,
+                        ):
+                            errors.append((
+                                resource,
+                                TimeoutExpiredError(
+                                    f"Timed out after {wait_timeout} seconds waiting for {resource.kind} "
+                                    f"{resource.name}"
+                                ),
+                            ))
+                    except Exception as exp:
+                        errors.extend((resource, exp) for resource in batched)
+
+                if errors:
+                    skipped = sum(len(next_tier) for next_tier in tiers[tier_number + 1 :])
+                    if skipped:
+                        LOGGER.error(f"{operation} failed, skipping the {skipped} resources of the dependent tiers")
+                    break
+
+        if errors:
+            raise BulkResourceError(operation=operation, errors=errors)
+
+        return results
 
     @abstractmethod
     def _create_resources(self, resource_class: type, **kwargs: Any) -> None:
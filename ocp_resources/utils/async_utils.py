@@ -0,0 +1,86 @@
+"""Helpers for the asyncio API of resources.
+
+The Kubernetes dynamic client is synchronous, so the async API runs each blocking API call on a bounded, shared
+thread pool (the client's urllib3 connection pool is shared by all of them). Waits poll with `asyncio.sleep` in
+between calls, so a pending wait does not hold a thread.
+"""
+
+import asyncio
+import contextlib
+import functools
+import os
+import threading
+from collections.abc import AsyncGenerator, Callable, Iterator
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any
+
+ASYNC_WORKERS_ENV: str = "OPENSHIFT_PYTHON_WRAPPER_ASYNC_WORKERS"
+DEFAULT_ASYNC_WORKERS: int = 32
+
+_EXECUTOR: ThreadPoolExecutor | None = None
+_EXECUTOR_LOCK = threading.Lock()
+
+
+def get_async_executor() -> ThreadPoolExecutor:
+    """
+    Get the shared thread pool for the async API.
+
+    The pool size is taken from `OPENSHIFT_PYTHON_WRAPPER_ASYNC_WORKERS` environment variable (defaults to 32).
+
+    Returns:
+        ThreadPoolExecutor: Shared thread pool.
+    """
+    global _EXECUTOR
+
+    with _EXECUTOR_LOCK:
+        if _EXECUTOR is None:
+            _EXECUTOR = ThreadPoolExecutor(
+                max_workers=int(os.environ.get(ASYNC_WORKERS_ENV, DEFAULT_ASYNC_WORKERS)),
+                thread_name_prefix="ocp-resources-async",
+            )
+
+        return _EXECUTOR
+
+
+async def run_sync(func: Callable[..., Any], *args: Any, **kwargs: Any) -> Any:
+    """
+    Run a blocking function on the shared thread pool.
+
+    Args:
+        func (Callable): Function to run.
+        *args (Any): Positional arguments for `func`.
+        **kwargs (Any): Keyword arguments for `func`.
+
+    Returns:
+        Any: `func` return value.
+    """
+    return await asyncio.get_running_loop().run_in_executor(
+        get_async_executor(), functools.partial(func, *args, **kwargs)
+    )
+
+
+async def iterate_sync(iterator: Iterator[Any]) -> AsyncGenerator[Any, None]:
+    """
+    Iterate a blocking iterator (e.g. a watch stream) without blocking the event loop.
+
+    Args:
+        iterator (Iterator): Blocking iterator, each `next()` runs on the shared thread pool.
+
+    Yields:
+        Any: Items of `iterator`.
+    """
+    sentinel = object()
+    try:
+        while True:
+            item = await run_sync(next, iterator, sentinel)
+            if item is sentinel:
+                return
+
+            yield item
+
+    finally:
+        close = getattr(iterator, "close", None)
+        if close:
+            # The generator may still be running on the thread pool if the consumer was cancelled
+            with contextlib.suppress(ValueError):
+                close()
@@ -12,8 +12,8 @@ LOGGER = get_logger(name=__name__)
 
 
 class DynamicClientWithKubeconfig(DynamicClient):
-    def __init__(self, client: kubernetes.client.ApiClient, kubeconfig: str) -> None:
-        super().__init__(client=client)
+    def __init__(self, client: kubernetes.client.ApiClient, kubeconfig: str, discoverer: Any = None) -> None:
+        super().__init__(client=client, discoverer=discoverer)
         self.kubeconfig = kubeconfig
 
 
@@ -0,0 +1,218 @@
+"""Shared HTTP connection pools for API clients.
+
+Every `kubernetes.client.ApiClient` builds its own urllib3 pool manager, so each `get_client()` call starts without
+open connections, and threaded fan-out beyond the pool size opens (and drops) a new TLS connection per request.
+`get_client()` sizes the pool and enables TCP keep-alive per `ConnectionPoolSettings`, and shares one pool manager
+between the clients of the same cluster and credentials. `connection_pool_metrics` reports how many requests
+reused an open connection.
+"""
+
+import hashlib
+import os
+import socket
+import threading
+from dataclasses import dataclass
+from typing import Any
+
+import kubernetes
+import urllib3
+from simple_logger.logger import get_logger
+
+LOGGER = get_logger(name=__name__)
+
+CONNECTION_POOL_MAXSIZE_ENV: str = "OPENSHIFT_PYTHON_WRAPPER_CONNECTION_POOL_MAXSIZE"
+
+_SHARED_POOL_MANAGERS: dict[tuple[Any, ...], urllib3.PoolManager] = {}
+_SHARED_POOL_MANAGERS_LOCK = threading.Lock()
+
+
+@dataclass(frozen=True)
+class ConnectionPoolSettings:
+    """
+    HTTP connection pool settings of an API client.
+
+    Attributes:
+        maxsize (int | None): Connections kept open per host, i.e. concurrent requests that reuse a connection;
+            None keeps the `kubernetes.client.Configuration.connection_pool_maxsize` default.
+        num_pools (int): Number of hosts (e.g. API server and OAuth server) to keep pools for.
+        block (bool): Wait for a free connection when `maxsize` connections are in use, instead of opening a
+            connection that is closed after the request.
+        tcp_keepalive (bool): Enable TCP keep-alive probes, so idle connections (e.g. long watches) are not
+            silently dropped by load balancers.
+        keepalive_idle (int): Idle seconds before the first keep-alive probe.
+        keepalive_interval (int): Seconds between keep-alive probes.
+        keepalive_count (int): Unanswered probes before the connection is dropped.
+    """
+
+    maxsize: int | None = None
+    num_pools: int = 4
+    block: bool = False
+    tcp_keepalive: bool = True
+    keepalive_idle: int = 60
+    keepalive_interval: int = 10
+    keepalive_count: int = 6
+
+    @classmethod
+    def from_env(cls) -> "ConnectionPoolSettings":
+        """
+        Get the default settings, with `maxsize` from `OPENSHIFT_PYTHON_WRAPPER_CONNECTION_POOL_MAXSIZE`.
+
+        Returns:
+            ConnectionPoolSettings: Settings.
+        """
+        maxsize = os.environ.get(CONNECTION_POOL_MAXSIZE_ENV)
+        return cls(maxsize=int(maxsize) if maxsize else None)
+
+    def socket_options(self) -> list[tuple[int, int, int]]:
+        """
+        Get the socket options of new connections.
+
+        Returns:
+            list[tuple[int, int, int]]: urllib3 socket options.
+        """
+        options = list(urllib3.connection.HTTPConnection.default_socket_options)
+        if not self.tcp_keepalive:
+            return options
+
+        options.append((socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1))
+        # Probe tuning is not available on all platforms
+        for name, value in (
+            ("TCP_KEEPIDLE", self.keepalive_idle),
+            ("TCP_KEEPINTVL", self.keepalive_interval),
+            ("TCP_KEEPCNT", self.keepalive_count),
+        ):
+            if hasattr(socket, name):
+                options.append((socket.IPPROTO_TCP, getattr(socket, name), value))
+
+        return options
+
+
+@dataclass
+class ConnectionPoolMetrics:
+    """
+    Connection usage of a pool manager, over all its clients.
+
+    Attributes:
+        pools (int): Number of host pools.
+        requests (int): Number of requests sent.
+        new_connections (int): Number of connections opened, each one a TCP (and TLS) handshake.
+    """
+
+    pools: int = 0
+    requests: int = 0
+    new_connections: int = 0
+
+    @property
+    def reused_connections(self) -> int:
+        """Requests sent on an already open connection."""
+        return max(self.requests - self.new_connections, 0)
+
+    @property
+    def reuse_ratio(self) -> float:
+        return self.reused_connections / self.requests if self.requests else 0.0
+
+
+def _pool_key(configuration: kubernetes.client.Configuration, settings: ConnectionPoolSettings) -> tuple[Any, ...]:
+    # Credentials are hashed, so they are not kept in clear text
+    credentials = hashlib.sha256(
+        repr((sorted((configuration.api_key or {}).items()), configuration.username, configuration.password)).encode()
+    ).hexdigest()
+    return (
+        configuration.host,
+        configuration.proxy,
+        configuration.no_proxy,
+        configuration.verify_ssl,
+        configuration.ssl_ca_cert,
+        configuration.cert_file,
+        configuration.key_file,
+        configuration.assert_hostname,
+        configuration.tls_server_name,
+        credentials,
+        settings,
+    )
+
+
+def _new_pool_manager(
+    configuration: kubernetes.client.Configuration, settings: ConnectionPoolSettings
+) -> urllib3.PoolManager:
+    # RESTClientObject builds the TLS and proxy setup of the configuration
+    pool_manager = kubernetes.client.rest.RESTClientObject(
+        configuration=configuration, pools_size=settings.num_pools, maxsize=settings.maxsize
+    ).pool_manager
+    pool_manager.connection_pool_kw["block"] = settings.block
+    pool_manager.connection_pool_kw["socket_options"] = settings.socket_options()
+    return pool_manager
+
+
+def install_connection_pool(
+    api_client: kubernetes.client.ApiClient, settings: ConnectionPoolSettings, shared: bool = True
+) -> urllib3.PoolManager:
+    """
+    Replace the pool manager of an API client with one built from `settings`.
+
+    Args:
+        api_client (kubernetes.client.ApiClient): API client, e.g. `DynamicClient.client`.
+        settings (ConnectionPoolSettings): Pool settings.
+        shared (bool): Reuse the pool manager of the clients of the same cluster, credentials and settings.
+
+    Returns:
+        urllib3.PoolManager: The installed pool manager.
+    """
+    configuration = api_client.configuration
+    pool_manager: urllib3.PoolManager | None
+    if not shared:
+        pool_manager = _new_pool_manager(configuration=configuration, settings=settings)
+    else:
+        key = _pool_key(configuration=configuration, settings=settings)
+        with _SHARED_POOL_MANAGERS_LOCK:
+            pool_manager = _SHARED_POOL_MANAGERS.get(key)
+            if pool_manager is None:
+                LOGGER.debug(f"New shared connection pool for {configuration.host}")
+                pool_manager = _new_pool_manager(configuration=configuration, settings=settings)
+                _SHARED_POOL_MANAGERS[key] = pool_manager
+
+    rest_client = api_client.rest_client
+    if rest_client.pool_manager is not pool_manager:
+        rest_client.pool_manager.clear()
+        rest_client.pool_manager = pool_manager
+
+    return pool_manager
+
+
+def connection_pool_metrics(client: Any) -> ConnectionPoolMetrics:
+    """
+    Get the connection usage of a client pool manager.
+
+    Clients sharing a pool manager report the same, combined, metrics. Pools dropped for exceeding
+    `ConnectionPoolSettings.num_pools` are not counted.
+
+    Args:
+        client (DynamicClient | kubernetes.client.ApiClient): Client.
+
+    Returns:
+        ConnectionPoolMetrics: Connection usage.
+    """
+    api_client = getattr(client, "client", client)
+    pools = api_client.rest_client.pool_manager.pools
+    metrics = ConnectionPoolMetrics()
+    for key in pools.keys():
+        pool = pools.get(key)
+        if pool is None:
+            continue
+
+        metrics.pools += 1
+        metrics.requests += pool.num_requests
+        metrics.new_connections += pool.num_connections
+
+    return metrics
+
+
+def clear_connection_pools() -> None:
+    """
+    Close the connections of the shared pool managers and forget them.
+    """
+    with _SHARED_POOL_MANAGERS_LOCK:
+        for pool_manager in _SHARED_POOL_MANAGERS.values():
+            pool_manager.clear()
+
+        _SHARED_POOL_MANAGERS.clear()
@@ -30,3 +30,16 @@ TIMEOUT_1MINUTE: int = 60
 TIMEOUT_2MINUTES: int = 2 * 60
 TIMEOUT_4MINUTES: int = 4 * 60
 TIMEOUT_10MINUTES: int = 10 * 60
+
+DEFAULT_LIST_PAGE_SIZE: int = 500
+
+# Deploy order of resource kinds in resource lists, lower first; other kinds are deployed last
+RESOURCE_LIST_DEPENDENCY_ORDER: dict[str, int] = {
+    "CustomResourceDefinition": 0,
+    "Namespace": 1,
+    "Project": 1,
+    "ProjectRequest": 1,
+}
+
+# libvirt sockets directory in the virt-launcher compute container
+LIBVIRT_RUN_DIR: str = "/var/run/libvirt/"
@@ -0,0 +1,170 @@
+"""Persistent API discovery cache shared by all processes talking to the same cluster.
+
+`DynamicClient` discovers the cluster API groups on creation and caches them in a per-host file under the system
+temp directory, with no expiry and no locking. `PersistentDiscoverer` keeps the cache in a user cache directory,
+expires it after a TTL, serializes reads and writes across processes with a file lock and writes atomically, so
+`get_client` against a warm cache does not hit the discovery endpoints at all.
+
+Kinds missing from the cache still trigger a re-discovery (inherited from `LazyDiscoverer`), so new CRDs are found
+before the TTL expires.
+"""
+
+import contextlib
+import hashlib
+import json
+import os
+import threading
+import time
+from collections.abc import Generator
+from typing import Any
+
+from kubernetes.dynamic.discovery import CacheEncoder, LazyDiscoverer
+from simple_logger.logger import get_logger
+
+from ocp_resources.utils.utils import user_cache_dir
+
+try:
+    import fcntl
+
+    FILE_LOCKING_AVAILABLE = True
+except ImportError:
+    # Windows: the cache is only locked within the process, writes stay atomic
+    FILE_LOCKING_AVAILABLE = False
+
+LOGGER = get_logger(name=__name__)
+
+DISCOVERY_CACHE_DIR_ENV: str = "OPENSHIFT_PYTHON_WRAPPER_DISCOVERY_CACHE_DIR"
+DISCOVERY_CACHE_TTL_ENV: str = "OPENSHIFT_PYTHON_WRAPPER_DISCOVERY_CACHE_TTL"
+DEFAULT_DISCOVERY_CACHE_TTL: int = 600
+CREATED_AT_KEY: str = "ocp_resources_created_at"
+
+
+def discovery_cache_ttl() -> int:
+    """
+    Get the discovery cache TTL from `OPENSHIFT_PYTHON_WRAPPER_DISCOVERY_CACHE_TTL` environment variable.
+
+    Returns:
+        int: TTL in seconds, 0 or less disables the persistent cache.
+    """
+    return int(os.environ.get(DISCOVERY_CACHE_TTL_ENV, DEFAULT_DISCOVERY_CACHE_TTL))
+
+
+def discovery_cache_dir() -> str:
+    """
+    Get the discovery cache directory.
+
+    Taken from `OPENSHIFT_PYTHON_WRAPPER_DISCOVERY_CACHE_DIR` environment variable, defaults to
+    `$XDG_CACHE_HOME/openshift-python-wrapper/discovery` (`~/.cache/...`). Falls back to the system temp directory
+    if the directory cannot be created.
+
+    Returns:
+        str: Path to the cache directory.
+    """
+    return user_cache_dir(name="discovery", env_var=DISCOVERY_CACHE_DIR_ENV)
+
+
+def discovery_cache_file(host: str, cache_dir: str | None = None) -> str:
+    """
+    Get the discovery cache file of a cluster.
+
+    Args:
+        host (str): Cluster API server URL.
+        cache_dir (str, optional): Cache directory, defaults to `discovery_cache_dir()`.
+
+    Returns:
+        str: Path to the cache file.
+    """
+    return os.path.join(
+        cache_dir or discovery_cache_dir(), f"discovery-{hashlib.sha256(host.encode('utf-8')).hexdigest()[:32]}.json"
+    )
+
+
+class PersistentDiscoverer(LazyDiscoverer):
+    """
+    `LazyDiscoverer` with a TTL, a cross-process file lock and atomic writes on its cache file.
+
+    Pass as `DynamicClient(client=..., discoverer=PersistentDiscoverer)`.
+    """
+
+    def __init__(self, client: Any, cache_file: str | None = None) -> None:
+        self.ttl = discovery_cache_ttl()
+        self.cache_path = cache_file or discovery_cache_file(host=client.configuration.host)
+        self._thread_lock = threading.RLock()
+        self._lock_depth = 0
+
+        with self._locked():
+            self._drop_expired_cache()
+            super().__init__(client=client, cache_file=self.cache_path)
+
+    @property
+    def server_version(self) -> str | None:
+        """
+        Server version the cache was discovered from.
+        """
+        return self._cache.get("version", {}).get("kubernetes", {}).get("gitVersion")
+
+    @property
+    def cache_age(self) -> float:
+        """
+        Seconds since the cache was discovered.
+        """
+        return time.time() - self._cache.get(CREATED_AT_KEY, 0)
+
+    @contextlib.contextmanager
+    def _locked(self) -> Generator[None, None, None]:
+        # flock() is per open file, take it once per discoverer and count re-entries
+        with self._thread_lock:
+            if self._lock_depth:
+                self._lock_depth += 1
+                try:
+                    yield
+                finally:
+                    self._lock_depth -= 1
+                return
+
+            with contextlib.ExitStack() as stack:
+                if FILE_LOCKING_AVAILABLE:
+                    lock_file = stack.enter_context(open(f"{self.cache_path}.lock", "a"))
+                    fcntl.flock(lock_file, fcntl.LOCK_EX)
+                    stack.callback(fcntl.flock, lock_file, fcntl.LOCK_UN)
+
+                self._lock_depth = 1
+                try:
+                    yield
+                finally:
+                    self._lock_depth = 0
+
+    def _drop_expired_cache(self) -> None:
+        try:
+            with open(self.cache_path) as fd:
+                created_at = json.load(fd).get(CREATED_AT_KEY, 0)
+        except FileNotFoundError:
+            return
+        except (OSError, ValueError) as exp:
+            LOGGER.warning(f"Dropping unreadable discovery cache {self.cache_path}: {exp}")
+            created_at = 0
+
+        if time.time() - created_at >= self.ttl:
+            LOGGER.debug(f"Discovery cache {self.cache_path} expired, re-discovering")
+            with contextlib.suppress(FileNotFoundError):
+                os.remove(self.cache_path)
+
+    def _write_cache(self) -> None:
+        # A refresh starts from an empty cache, lazy updates keep the original discovery time
+        self._cache.setdefault(CREATED_AT_KEY, time.time())
+        tmp_path = f"{self.cache_path}.{os.getpid()}.{threading.get_ident()}.tmp"
+        with self._locked():
+            try:
+                with open(tmp_path, "w") as fd:
+                    json.dump(self._cache, fd, cls=CacheEncoder)
+
+                os.replace(tmp_path, self.cache_path)
+            except (OSError, TypeError, ValueError) as exp:
+                # Failing to write the cache only costs a discovery on the next client
+                LOGGER.debug(f"Failed to write discovery cache {self.cache_path}: {exp}")
+                with contextlib.suppress(OSError):
+                    os.remove(tmp_path)
+
+    def invalidate_cache(self) -> None:
+        with self._locked():
+            super().invalidate_cache()
@@ -0,0 +1,497 @@
+"""Shared informer cache for resources.
+
+An informer keeps one list+watch per (client, kind, namespace, selectors) in process memory and indexes the watched
+objects by name, namespace, labels and any user defined indexer. While an informer is running and fresh,
+`Resource.instance` and `Resource.get` are served from its cache instead of the API server.
+
+Example:
+    pods = Pod.informer(client=client, namespace="my-ns", indexers={"node": field_indexer(path="spec.nodeName")})
+    pods.by_index(index_name="node", value="worker-0")
+    Pod(client=client, name="my-pod", namespace="my-ns").instance  # served from the cache
+"""
+
+import copy
+import threading
+import time
+from collections import defaultdict
+from collections.abc import Callable
+from typing import Any
+
+from simple_logger.logger import get_logger
+
+from ocp_resources.exceptions import WatchNotPermittedError
+from ocp_resources.utils.constants import TIMEOUT_1MINUTE, TIMEOUT_30SEC
+from ocp_resources.utils.wait_engine import ListWatcher, WaitStats
+
+LOGGER = get_logger(name=__name__)
+
+NAMESPACE_INDEX: str = "namespace"
+LABELS_INDEX: str = "labels"
+OWNER_UID_INDEX: str = "owner_uid"
+
+Indexer = Callable[[dict[str, Any]], list[str]]
+ObjectKey = tuple[str | None, str]
+
+_INFORMERS: dict[tuple[Any, ...], "Informer"] = {}
+_INFORMERS_LOCK = threading.Lock()
+
+
+def namespace_indexer(obj: dict[str, Any]) -> list[str]:
+    namespace = obj.get("metadata", {}).get("namespace")
+    return [namespace] if namespace else []
+
+
+def labels_indexer(obj: dict[str, Any]) -> list[str]:
+    return [f"{key}={value}" for key, value in (obj.get("metadata", {}).get("labels") or {}).items()]
+
+
+def owner_uid_indexer(obj: dict[str, Any]) -> list[str]:
+    return [owner["uid"] for owner in obj.get("metadata", {}).get("ownerReferences") or [] if owner.get("uid")]
+
+
+def field_indexer(path: str) -> Indexer:
+    """
+    Build an indexer for a dotted field path.
+
+    Args:
+        path (str): Dotted path to the field, e.g. "spec.nodeName".
+
+    Returns:
+        Callable: Indexer returning the field value, or no value if the field is not set.
+    """
+    keys = path.split(".")
+
+    def _indexer(obj: dict[str, Any]) -> list[str]:
+        value: Any = obj
+        for key in keys:
+            if not isinstance(value, dict):
+                return []
+
+            value = value.get(key)
+
+        return [str(value)] if value not in (None, "") else []
+
+    return _indexer
+
+
+def parse_equality_label_selector(label_selector: str) -> list[str] | None:
+    """
+    Parse an equality based label selector ("a=b,c==d") to `labels` index values.
+
+    Args:
+        label_selector (str): Label selector.
+
+    Returns:
+        list[str] | None: Index values (["a=b", "c=d"]), or None if the selector is not equality based.
+    """
+    values = []
+    for requirement in label_selector.split(","):
+        requirement = requirement.strip()
+        if "!=" in requirement or " " in requirement or "=" not in requirement:
+            return None
+
+        key, _, value = requirement.replace("==", "=").partition("=")
+        if not key or "=" in value:
+            return None
+
+        values.append(f"{key}={value}")
+
+    return values
+
+
+class Informer:
+    """
+    List and watch a resource kind and keep an indexed in-memory copy of the watched objects.
+
+    Objects are stored as dicts and returned as deep copies. A background thread keeps the cache up to date; the
+    cache is considered fresh while the watch keeps syncing within `max_staleness` seconds.
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        api: Any,
+        kind: str,
+        api_version: str,
+        namespace: str | None = None,
+        label_selector: str | None = None,
+        field_selector: str | None = None,
+        indexers: dict[str, Indexer] | None = None,
+        max_staleness: float = TIMEOUT_1MINUTE,
+        watch_timeout: int = TIMEOUT_30SEC,
+        resync_period: float | None = None,
+    ) -> None:
+        """
+        Args:
+            client (DynamicClient): Client the informer belongs to.
+            api (ResourceInstance): Dynamic client resource API of the kind.
+            kind (str): Resource kind.
+            api_version (str): Resource API version.
+            namespace (str | None): Namespace to watch; None for cluster scoped resources or all namespaces.
+            label_selector (str | None): Only cache objects matching this label selector.
+            field_selector (str | None): Only cache objects matching this field selector.
+            indexers (dict[str, Callable] | None): Extra indexers, {<index name>: <callable returning index values>}.
+            max_staleness (float): Seconds since the last successful sync after which the cache is not used.
+            watch_timeout (int): Maximum duration of a single watch request.
+            resync_period (float | None): Re-list and replace the cache every `resync_period` seconds.
+        """
+        self.client = client
+        self.api = api
+        self.kind = kind
+        self.api_version = api_version
+        self.namespace = namespace
+        self.label_selector = label_selector
+        self.field_selector = field_selector
+        self.max_staleness = max_staleness
+        self.resync_period = resync_period
+        self.stats = WaitStats()
+        self.error: Exception | None = None
+        self._indexers: dict[str, Indexer] = {
+            NAMESPACE_INDEX: namespace_indexer,
+            LABELS_INDEX: labels_indexer,
+            OWNER_UID_INDEX: owner_uid_indexer,
+            **(indexers or {}),
+        }
+        self._store: dict[ObjectKey, dict[str, Any]] = {}
+        self._indices: dict[str, dict[str, set[ObjectKey]]] = {
+            index_name: defaultdict(set) for index_name in self._indexers
+        }
+        self._lock = threading.RLock()
+        self._synced = threading.Event()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._list_watcher = ListWatcher(
+            api=api,
+            namespace=namespace,
+            label_selector=label_selector,
+            field_selector=field_selector,
+            stats=self.stats,
+            watch_timeout=watch_timeout,
+        )
+
+    def __repr__(self) -> str:
+        return f"Informer({self.kind} {self.api_version}, namespace={self.namespace})"
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive() and not self._stop.is_set()
+
+    @property
+    def has_synced(self) -> bool:
+        return self._synced.is_set()
+
+    def is_fresh(self) -> bool:
+        """
+        Check if the cache can be served.
+
+        Returns:
+            bool: True if the informer is running, synced and synced within `max_staleness` seconds.
+        """
+        last_sync_time = self._list_watcher.last_sync_time
+        return (
+            self.is_running
+            and self.has_synced
+            and last_sync_time is not None
+            and time.monotonic() - last_sync_time <= self.max_staleness
+        )
+
+    def covers(self, namespace: str | None) -> bool:
+        return self.namespace is None or self.namespace == namespace
+
+    def start(self) -> "Informer":
+        if not self.is_running:
+            self._stop.clear()
+            self._thread = threading.Thread(target=self._run, name=f"informer-{self.kind}", daemon=True)
+            self._thread.start()
+
+        return self
+
+    def stop(self) -> None:
+        self._stop.set()
+
+    def wait_for_sync(self, timeout: float = TIMEOUT_1MINUTE) -> bool:
+        """
+        Wait for the initial list to be cached.
+
+        Args:
+            timeout (float): Time to wait in seconds.
+
+        Returns:
+            bool: True if the cache is synced.
+        """
+        return self._synced.wait(timeout=timeout) and self.error is None
+
+    def add_indexer(self, name: str, indexer: Indexer) -> None:
+        """
+        Add an indexer and index the already cached objects.
+
+        Args:
+            name (str): Index name.
+            indexer (Callable): Callable returning the index values of an object.
+        """
+        with self._lock:
+            self._indexers[name] = indexer
+            self._indices[name] = defaultdict(set)
+            for key, obj in self._store.items():
+                for value in indexer(obj):
+                    self._indices[name][value].add(key)
+
+    def get(self, name: str, namespace: str | None = None) -> dict[str, Any] | None:
+        """
+        Get a cached object.
+
+        Args:
+            name (str): Object name.
+            namespace (str | None): Object namespace.
+
+        Returns:
+            dict | None: Copy of the cached object, None if it is not in the cache.
+        """
+        with self._lock:
+            obj = self._store.get((namespace, name))
+            return copy.deepcopy(obj) if obj is not None else None
+
+    def list_objects(self, namespace: str | None = None, label_selector: str | None = None) -> list[dict[str, Any]]:
+        """
+        List cached objects.
+
+        Args:
+            namespace (str | None): Only list objects in this namespace.
+            label_selector (str | None): Equality based label selector ("a=b,c=d").
+
+        Returns:
+            list[dict]: Copies of the matching cached objects.
+
+        Raises:
+            ValueError: If `label_selector` is not equality based.
+        """
+        with self._lock:
+            keys = set(self._store)
+            if namespace:
+                keys &= self._indices[NAMESPACE_INDEX].get(namespace, set())
+
+            if label_selector:
+                label_values = parse_equality_label_selector(label_selector=label_selector)
+                if label_values is None:
+                    raise ValueError(f"Only equality based label selectors are supported, got {label_selector}")
+
+                for label_value in label_values:
+                    keys &= self._indices[LABELS_INDEX].get(label_value, set())
+
+            return [copy.deepcopy(self._store[key]) for key in sorted(keys, key=lambda _key: (_key[0] or "", _key[1]))]
+
+    def by_index(self, index_name: str, value: str) -> list[dict[str, Any]]:
+        """
+        List cached objects by index value.
+
+        Args:
+            index_name (str): Index name.
+            value (str): Index value.
+
+        Returns:
+            list[dict]: Copies of the cached objects with this index value.
+        """
+        with self._lock:
+            keys = self._indices[index_name].get(value, set())
+            return [copy.deepcopy(self._store[key]) for key in sorted(keys, key=lambda _key: (_key[0] or "", _key[1]))]
+
+    def index_values(self, index_name: str) -> list[str]:
+        with self._lock:
+            return sorted(value for value, keys in self._indices[index_name].items() if keys)
+
+    def _key(self, obj: dict[str, Any]) -> ObjectKey:
+        metadata = obj.get("metadata", {})
+        return metadata.get("namespace"), metadata["name"]
+
+    def _add(self, obj: dict[str, Any]) -> None:
+        obj.setdefault("apiVersion", self.api_version)
+        obj.setdefault("kind", self.kind)
+        key = self._key(obj=obj)
+        self._delete(key=key)
+        self._store[key] = obj
+        for index_name, indexer in self._indexers.items():
+            for value in indexer(obj):
+                self._indices[index_name][value].add(key)
+
+    def _delete(self, key: ObjectKey) -> None:
+        obj = self._store.pop(key, None)
+        if obj is None:
+            return
+
+        for index_name, indexer in self._indexers.items():
+            for value in indexer(obj):
+                self._indices[index_name][value].discard(key)
+
+    def _replace(self, objs: list[dict[str, Any]]) -> None:
+        self._store = {}
+        self._indices = {index_name: defaultdict(set) for index_name in self._indexers}
+        for obj in objs:
+            self._add(obj=obj)
+
+    def _run(self) -> None:
+        while not self._stop.is_set():
+            try:
+                for event_type, payload in self._list_watcher.stream(timeout=self.resync_period or float("inf")):
+                    with self._lock:
+                        if event_type == "LIST":
+                            self._replace(objs=payload)
+                            self._synced.set()
+                        elif event_type == "DELETED":
+                            self._delete(key=self._key(obj=payload))
+                        else:
+                            self._add(obj=payload)
+
+                    if self._stop.is_set():
+                        return
+
+            except WatchNotPermittedError as exp:
+                LOGGER.warning(f"{self} stopped: {exp}")
+                self.error = exp
+                self._stop.set()
+                self._synced.set()
+
+
+def start_informer(
+    client: Any,
+    api: Any,
+    kind: str,
+    api_version: str,
+    namespace: str | None = None,
+    label_selector: str | None = None,
+    field_selector: str | None = None,
+    indexers: dict[str, Indexer] | None = None,
+    sync_timeout: float = TIMEOUT_1MINUTE,
+    **kwargs: Any,
+) -> Informer:
+    """
+    Get the shared informer for (client, kind, namespace, selectors), starting it if needed.
+
+    Args:
+        client (DynamicClient): k8s client.
+        api (ResourceInstance): Dynamic client resource API of the kind.
+        kind (str): Resource kind.
+        api_version (str): Resource API version.
+        namespace (str | None): Namespace to watch.
+        label_selector (str | None): Label selector.
+        field_selector (str | None): Field selector.
+        indexers (dict[str, Callable] | None): Extra indexers, added to an already running informer as well.
+        sync_timeout (float): Time to wait for the initial sync.
+        **kwargs: Extra `Informer` arguments (max_staleness, watch_timeout, resync_period).
+
+    Returns:
+        Informer: Running and synced informer.
+
+    Raises:
+        TimeoutError: If the informer did not sync within `sync_timeout`.
+        WatchNotPermittedError: If the client is not allowed to list or watch the resource.
+    """
+    key = (id(client), api_version, kind, namespace, label_selector, field_selector)
+    with _INFORMERS_LOCK:
+        informer = _INFORMERS.get(key)
+        if informer is None or not informer.is_running:
+            informer = Informer(
+                client=client,
+                api=api,
+                kind=kind,
+                api_version=api_version,
+                namespace=namespace,
+                label_selector=label_selector,
+                field_selector=field_selector,
+                indexers=indexers,
+                **kwargs,
+            )
+            _INFORMERS[key] = informer.start()
+        else:
+            for name, indexer in (indexers or {}).items():
+                informer.add_indexer(name=name, indexer=indexer)
+
+    if not informer.wait_for_sync(timeout=sync_timeout):
+        if isinstance(informer.error, WatchNotPermittedError):
+            raise informer.error
+
+        raise TimeoutError(f"{informer} did not sync within {sync_timeout} seconds")
+
+    return informer
+
+
+def stop_informers(client: Any = None) -> None:
+    """
+    Stop shared informers.
+
+    Args:
+        client (DynamicClient | None): Only stop the informers of this client; None stops all informers.
+    """
+    with _INFORMERS_LOCK:
+        for key, informer in list(_INFORMERS.items()):
+            if client is None or informer.client is client:
+                informer.stop()
+                del _INFORMERS[key]
+
+
+def informers_running() -> bool:
+    return any(informer.is_running for informer in list(_INFORMERS.values()))
+
+
+def _fresh_informers(client: Any, api_version: str | None, kind: str, namespace: str | None) -> list[Informer]:
+    if not _INFORMERS:
+        return []
+
+    with _INFORMERS_LOCK:
+        informers = list(_INFORMERS.values())
+
+    return [
+        informer
+        for informer in informers
+        if informer.client is client
+        and informer.kind == kind
+        and informer.api_version == api_version
+        and informer.covers(namespace=namespace)
+        and informer.is_fresh()
+    ]
+
+
+def get_cached_object(
+    client: Any, api_version: str | None, kind: str, name: str, namespace: str | None = None
+) -> dict[str, Any] | None:
+    """
+    Get an object from a fresh informer cache.
+
+    A cache miss returns None (the object may have been created after the last event), callers should fall back to
+    the API server.
+
+    Returns:
+        dict | None: Cached object, None if no fresh informer has it.
+    """
+    for informer in _fresh_informers(client=client, api_version=api_version, kind=kind, namespace=namespace):
+        obj = informer.get(name=name, namespace=namespace)
+        if obj is not None:
+            return obj
+
+    return None
+
+
+def list_cached_objects(
+    client: Any, api_version: str | None, kind: str, namespace: str | None = None, label_selector: str | None = None
+) -> list[dict[str, Any]] | None:
+    """
+    List objects from a fresh informer cache that fully covers the request.
+
+    Only informers without selectors, or with exactly the requested label selector, cover a list request.
+
+    Returns:
+        list[dict] | None: Cached objects, None if no fresh informer covers the request.
+    """
+    for informer in _fresh_informers(client=client, api_version=api_version, kind=kind, namespace=namespace):
+        if informer.field_selector:
+            continue
+
+        if informer.label_selector is None:
+            if label_selector and parse_equality_label_selector(label_selector=label_selector) is None:
+                continue
+
+            return informer.list_objects(namespace=namespace, label_selector=label_selector)
+
+        if informer.label_selector == label_selector:
+            return informer.list_objects(namespace=namespace)
+
+    return None
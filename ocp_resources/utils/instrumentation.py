@@ -0,0 +1,368 @@
+"""API call instrumentation.
+
+`get_client()` clients report every API request to the registered hooks as an `ApiCallEvent`: verb, resource,
+namespace, caller, status code and duration. The caller is the outermost wrapper method that issued the request
+(e.g. `wait_for_condition`, `instance`, `get`), set with `api_caller`.
+
+`ApiCallCollector` is an in-memory hook with call counters and latency histograms, which renders them in the
+Prometheus text format. See also the `ocp_resources.utils.pytest_api_calls` pytest plugin.
+
+Example:
+    collector = ApiCallCollector()
+    add_api_call_hook(hook=collector)
+    ...
+    for stats in collector.top(count=10):
+        print(stats)
+"""
+
+import contextlib
+import functools
+import re
+import threading
+import time
+from bisect import bisect_left
+from collections.abc import Callable, Generator
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from typing import Any
+from urllib.parse import urlparse
+
+from kubernetes.client.rest import ApiException
+from simple_logger.logger import get_logger
+
+LOGGER = get_logger(name=__name__)
+
+# Prometheus client default buckets, in seconds
+DEFAULT_LATENCY_BUCKETS: tuple[float, ...] = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+UNKNOWN_CALLER: str = "direct"
+# /api/v1/namespaces/<ns>/pods/<name>/<subresource> or /apis/<group>/<version>/...
+_API_PATH_RE = re.compile(
+    r"^/(?:api/[^/]+|apis/[^/]+/[^/]+)"
+    r"(?:/namespaces/(?P<namespace>[^/]+))?"
+    r"(?:/(?P<resource>[^/]+)(?:/(?P<name>[^/]+)(?:/(?P<subresource>[^/]+))?)?)?/?$"
+)
+
+ApiCallHook = Callable[["ApiCallEvent"], None]
+
+_API_CALL_HOOKS: list[ApiCallHook] = []
+_API_CALLER: ContextVar[str | None] = ContextVar("ocp_resources_api_caller", default=None)
+
+
+@dataclass(frozen=True)
+class ApiCallEvent:
+    """
+    An API request.
+
+    Attributes:
+        verb (str): Kubernetes verb: get, list, watch, create, update, patch, delete, deletecollection (or the HTTP
+            method for non resource URLs).
+        resource (str): Resource plural, with the subresource if any (e.g. "pods", "pods/exec"); "" for non resource
+            URLs such as discovery.
+        namespace (str): Namespace, "" for cluster scoped requests.
+        caller (str): Wrapper method that issued the request, "direct" for requests outside of one.
+        code (int): HTTP status code, 0 if no response was received.
+        duration (float): Request duration in seconds.
+    """
+
+    verb: str
+    resource: str
+    namespace: str
+    caller: str
+    code: int
+    duration: float
+
+
+def add_api_call_hook(hook: ApiCallHook) -> None:
+    """
+    Register a hook called with every `ApiCallEvent`, from the thread that made the request.
+
+    Args:
+        hook (Callable): Hook, must be fast and must not raise.
+    """
+    if hook not in _API_CALL_HOOKS:
+        _API_CALL_HOOKS.append(hook)
+
+
+def remove_api_call_hook(hook: ApiCallHook) -> None:
+    """
+    Unregister a hook.
+
+    Args:
+        hook (Callable): Hook registered with `add_api_call_hook`.
+    """
+    with contextlib.suppress(ValueError):
+        _API_CALL_HOOKS.remove(hook)
+
+
+def _emit(event: ApiCallEvent) -> None:
+    for hook in list(_API_CALL_HOOKS):
+        try:
+            hook(event)
+        except Exception as exp:
+            LOGGER.warning(f"API call hook {hook} failed: {exp}")
+
+
+@contextlib.contextmanager
+def api_call_context(caller: str) -> Generator[None, None, None]:
+    """
+    Attribute the API requests made in the context to a caller, unless an outer context already set one.
+
+    Args:
+        caller (str): Caller name.
+    """
+    if _API_CALLER.get() is not None:
+        yield
+        return
+
+    token = _API_CALLER.set(caller)
+    try:
+        yield
+    finally:
+        _API_CALLER.reset(token)
+
+
+def api_caller(name: str) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Decorator attributing the API requests of a method to `name`, see `api_call_context`.
+
+    Args:
+        name (str): Caller name.
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            with api_call_context(caller=name):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def request_verb_and_resource(method: str, url: str, query_params: Any = None) -> tuple[str, str, str]:
+    """
+    Get the Kubernetes verb, resource and namespace of a request.
+
+    Args:
+        method (str): HTTP method.
+        url (str): Request URL.
+        query_params (list | dict, optional): Request query parameters.
+
+    Returns:
+        tuple[str, str, str]: Verb, resource (with subresource) and namespace.
+    """
+    method = method.upper()
+    match = _API_PATH_RE.match(urlparse(url).path)
+    if not match:
+        return method.lower(), "", ""
+
+    namespace = match.group("namespace") or ""
+    resource, name = match.group("resource"), match.group("name")
+    if not resource:
+        if not namespace:
+            return method.lower(), "", ""
+
+        # /api/v1/namespaces/<name> is the namespace itself
+        resource, name, namespace = "namespaces", namespace, ""
+
+    if match.group("subresource"):
+        resource = f"{resource}/{match.group('subresource')}"
+
+    params = query_params.items() if isinstance(query_params, dict) else query_params or []
+    watch = any(key == "watch" and str(value).lower() == "true" for key, value in params)
+    verbs = {
+        "GET": "watch" if watch else ("get" if name else "list"),
+        "POST": "create",
+        "PUT": "update",
+        "PATCH": "patch",
+        "DELETE": "delete" if name else "deletecollection",
+    }
+    return verbs.get(method, method.lower()), resource, namespace
+
+
+@contextlib.contextmanager
+def observe_api_call(verb: str, resource: str, namespace: str | None = "") -> Generator[None, None, None]:
+    """
+    Report the API request made in the context, for requests that bypass the REST client (e.g. exec websockets).
+
+    Args:
+        verb (str): Kubernetes verb.
+        resource (str): Resource plural, with subresource.
+        namespace (str | None): Namespace.
+    """
+    if not _API_CALL_HOOKS:
+        yield
+        return
+
+    code = 200
+    start = time.monotonic()
+    try:
+        yield
+    except ApiException as exp:
+        code = exp.status or 0
+        raise
+    except Exception:
+        code = 0
+        raise
+    finally:
+        _emit(
+            event=ApiCallEvent(
+                verb=verb,
+                resource=resource,
+                namespace=namespace or "",
+                caller=_API_CALLER.get() or UNKNOWN_CALLER,
+                code=code,
+                duration=time.monotonic() - start,
+            )
+        )
+
+
+def install_instrumentation(api_client: Any) -> None:
+    """
+    Report the requests of an API client to the registered hooks.
+
+    Args:
+        api_client (kubernetes.client.ApiClient): API client, e.g. `DynamicClient.client`.
+    """
+    rest_client = api_client.rest_client
+    request = rest_client.request
+
+    def _instrumented_request(method: str, url: str, query_params: Any = None, *args: Any, **kwargs: Any) -> Any:
+        if not _API_CALL_HOOKS:
+            return request(method, url, query_params, *args, **kwargs)
+
+        verb, resource, namespace = request_verb_and_resource(method=method, url=url, query_params=query_params)
+        with observe_api_call(verb=verb, resource=resource, namespace=namespace):
+            return request(method, url, query_params, *args, **kwargs)
+
+    rest_client.request = _instrumented_request
+
+
+@dataclass
+class ApiCallStats:
+    """
+    Calls of a (verb, resource, namespace, caller) key.
+
+    Attributes:
+        verb (str): Kubernetes verb.
+        resource (str): Resource plural, with subresource.
+        namespace (str): Namespace.
+        caller (str): Wrapper method.
+        count (int): Number of calls.
+        errors (int): Number of calls answered with a status code >= 400 or without a response.
+        total_time (float): Total duration in seconds.
+        bucket_counts (list[int]): Number of calls per latency bucket, the last one is +Inf.
+    """
+
+    verb: str
+    resource: str
+    namespace: str
+    caller: str
+    count: int = 0
+    errors: int = 0
+    total_time: float = 0.0
+    bucket_counts: list[int] = field(default_factory=list)
+
+
+class ApiCallCollector:
+    """
+    In-memory API call hook, with counters and latency histograms per (verb, resource, namespace, caller).
+    """
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_LATENCY_BUCKETS) -> None:
+        """
+        Args:
+            buckets (tuple[float, ...]): Latency histogram upper bounds in seconds, sorted.
+        """
+        self.buckets = buckets
+        self._stats: dict[tuple[str, str, str, str], ApiCallStats] = {}
+        self._lock = threading.Lock()
+
+    def __call__(self, event: ApiCallEvent) -> None:
+        key = (event.verb, event.resource, event.namespace, event.caller)
+        with self._lock:
+            stats = self._stats.get(key)
+            if stats is None:
+                stats = self._stats[key] = ApiCallStats(*key, bucket_counts=[0] * (len(self.buckets) + 1))
+
+            stats.count += 1
+            stats.total_time += event.duration
+            stats.bucket_counts[bisect_left(self.buckets, event.duration)] += 1
+            if not event.code or event.code >= 400:
+                stats.errors += 1
+
+    @property
+    def stats(self) -> list[ApiCallStats]:
+        with self._lock:
+            return list(self._stats.values())
+
+    @property
+    def total_calls(self) -> int:
+        return sum(stats.count for stats in self.stats)
+
+    def top(self, count: int = 10) -> list[ApiCallStats]:
+        """
+        Get the keys that spent the most time in API calls.
+
+        Args:
+            count (int): Number of keys.
+
+        Returns:
+            list[ApiCallStats]: Stats, longest total time first.
+        """
+        return sorted(self.stats, key=lambda stats: stats.total_time, reverse=True)[:count]
+
+    def reset(self) -> None:
+        with self._lock:
+            self._stats.clear()
+
+    def to_prometheus(self, prefix: str = "ocp_resources_api") -> str:
+        """
+        Render the counters and histograms in the Prometheus text exposition format.
+
+        Args:
+            prefix (str): Metric name prefix.
+
+        Returns:
+            str: `<prefix>_requests_total`, `<prefix>_request_errors_total` and `<prefix>_request_duration_seconds`
+                metrics.
+        """
+        all_stats = sorted(self.stats, key=lambda stats: (stats.verb, stats.resource, stats.namespace, stats.caller))
+        requests = [
+            f"# HELP {prefix}_requests_total API requests.",
+            f"# TYPE {prefix}_requests_total counter",
+        ]
+        errors = [
+            f"# HELP {prefix}_request_errors_total API requests that failed.",
+            f"# TYPE {prefix}_request_errors_total counter",
+        ]
+        durations = [
+            f"# HELP {prefix}_request_duration_seconds API request duration.",
+            f"# TYPE {prefix}_request_duration_seconds histogram",
+        ]
+        for stats in all_stats:
+            labels = ",".join(
+                f'{name}="{_escape_label(value=value)}"'
+                for name, value in (
+                    ("verb", stats.verb),
+                    ("resource", stats.resource),
+                    ("namespace", stats.namespace),
+                    ("caller", stats.caller),
+                )
+            )
+            requests.append(f"{prefix}_requests_total{{{labels}}} {stats.count}")
+            errors.append(f"{prefix}_request_errors_total{{{labels}}} {stats.errors}")
+            cumulative = 0
+            for bound, bucket_count in zip((*self.buckets, "+Inf"), stats.bucket_counts, strict=True):
+                cumulative += bucket_count
+                durations.append(f'{prefix}_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+
+            durations.append(f"{prefix}_request_duration_seconds_sum{{{labels}}} {stats.total_time}")
+            durations.append(f"{prefix}_request_duration_seconds_count{{{labels}}} {stats.count}")
+
+        return "\n".join([*requests, *errors, *durations]) + "\n"
+
+
+def _escape_label(value: str) -> str:
+    return value.replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
@@ -0,0 +1,385 @@
+"""Persistent exec sessions on Pod containers and exec fan-out across pods.
+
+`Pod.execute` opens a websocket per command. A `PodExecSession` keeps one shell running in the container and sends
+each command to its stdin, followed by end markers on stdout and stderr carrying the command exit code, so many
+short commands share one stream.
+
+`execute_on_pods` runs one command on many pods with `Pod.execute` on a bounded thread pool.
+"""
+
+import math
+import shlex
+import threading
+import uuid
+from collections.abc import Generator, Iterable
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from concurrent.futures import TimeoutError as FutureTimeoutError
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+import kubernetes
+from kubernetes.stream.ws_client import STDERR_CHANNEL, STDOUT_CHANNEL
+from simple_logger.logger import get_logger
+from timeout_sampler import TimeoutWatch
+
+from ocp_resources.exceptions import ExecOnPodError
+from ocp_resources.utils.constants import TIMEOUT_1MINUTE, TIMEOUT_30SEC
+
+if TYPE_CHECKING:
+    from ocp_resources.pod import Pod
+
+LOGGER = get_logger(name=__name__)
+
+STREAM_CLOSED_ERROR: str = "stream resp is closed"
+DEFAULT_EXEC_SHELL: str = "/bin/sh"
+MARKER_PREFIX: str = "__OCP_EXEC_END_"
+DEFAULT_FAN_OUT_WORKERS: int = 10
+# Private WSClient buffers the session reads the received frames from, see `PodExecSession._read_result`
+WS_CLIENT_BUFFERS: tuple[str, ...] = ("_channels", "_all")
+
+
+@dataclass
+class ExecResult:
+    """
+    Result of a command run in an exec session.
+    """
+
+    command: list[str]
+    rc: int
+    stdout: str
+    stderr: str
+
+
+@dataclass
+class PodExecOutput:
+    """
+    Result of a command run on one pod by `execute_on_pods`.
+    """
+
+    pod: "Pod"
+    stdout: str = ""
+    error: Exception | None = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class _PendingCommand:
+    command: list[str]
+    marker: str
+
+    def script(self) -> str:
+        # Run in a subshell (`exit`, `cd` and friends don't affect the session) without the session stdin
+        return (
+            f"( {shlex.join(self.command)} ) </dev/null; "
+            f"printf '%s %d\\n' '{self.marker}' \"$?\"; printf '%s\\n' '{self.marker}' >&2\n"
+        )
+
+
+class PodExecSession:
+    """
+    A long-lived shell in a Pod container running commands sent over one exec stream.
+
+    Commands run one after the other. A session is thread safe, concurrent callers wait for each other.
+
+    Example:
+        with PodExecSession(pod=pod) as session:
+            session.run(command=["ip", "addr"])
+            results = session.execute_many(commands=[["ping", "-c1", ip] for ip in ips])
+    """
+
+    def __init__(self, pod: "Pod", container: str = "", shell: str = DEFAULT_EXEC_SHELL) -> None:
+        """
+        Args:
+            pod (Pod): Pod to run commands on.
+            container (str): Container name, defaults to the first container.
+            shell (str): Shell binary in the container.
+        """
+        self.pod = pod
+        self.container = container or pod.known_instance.spec.containers[0].name
+        self.shell = shell
+        self._lock = threading.Lock()
+        self._resp: Any = None
+        self._stdout = ""
+        self._stderr = ""
+
+    def __enter__(self) -> "PodExecSession":
+        self.open()
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @property
+    def is_open(self) -> bool:
+        return self._resp is not None and self._resp.is_open()
+
+    def open(self) -> None:
+        """
+        Start the shell, if not already running.
+
+        Raises:
+            ExecOnPodError: If the kubernetes client stream does not have the buffers the session reads.
+        """
+        with self._lock:
+            self._open()
+
+    def _open(self) -> None:
+        if self.is_open:
+            return
+
+        LOGGER.info(f"Open exec session on {self.pod.name}/{self.container}")
+        self._stdout = ""
+        self._stderr = ""
+        self._resp = kubernetes.stream.stream(
+            api_method=self.pod._kube_v1_api.connect_get_namespaced_pod_exec,
+            name=self.pod.name,
+            namespace=self.pod.namespace,
+            command=[self.shell],
+            container=self.container,
+            stderr=True,
+            stdin=True,
+            stdout=True,
+            tty=False,
+            _preload_content=False,
+        )
+        missing_buffers = [buffer for buffer in WS_CLIENT_BUFFERS if not hasattr(self._resp, buffer)]
+        if missing_buffers:
+            self.close()
+            raise ExecOnPodError(
+                command=[self.shell],
+                rc=-1,
+                out="",
+                err=f"Exec sessions are not supported by kubernetes {kubernetes.__version__}: its stream has no "
+                f"{', '.join(missing_buffers)}",
+            )
+
+    def close(self) -> None:
+        """
+        Exit the shell and close the stream.
+        """
+        if self._resp is None:
+            return
+
+        try:
+            if self._resp.is_open():
+                self._resp.write_stdin("exit\n")
+            self._resp.close()
+        except Exception as exp:
+            LOGGER.debug(f"Failed to close exec session on {self.pod.name}/{self.container}: {exp}")
+        finally:
+            self._resp = None
+
+    def run(self, command: list[str], timeout: int = TIMEOUT_1MINUTE, ignore_rc: bool = False) -> str:
+        """
+        Run a command, like `Pod.execute`.
+
+        Args:
+            command (list): Command to run.
+            timeout (int): Time to wait for the command.
+            ignore_rc (bool): If True ignore error rc from the shell and return out.
+
+        Returns:
+            str: Command output.
+
+        Raises:
+            ExecOnPodError: If the command failed.
+        """
+        result = self.execute_many(commands=[command], timeout=timeout)[0]
+        if result.rc and not ignore_rc:
+            raise ExecOnPodError(command=command, rc=result.rc, out=result.stdout, err=result.stderr)
+
+        return result.stdout
+
+    def execute_many(self, commands: list[list[str]], timeout: int = TIMEOUT_1MINUTE) -> list[ExecResult]:
+        """
+        Send all commands at once and collect their results.
+
+        Args:
+            commands (list): Commands to run, in order.
+            timeout (int): Time to wait for all the commands.
+
+        Returns:
+            list[ExecResult]: Result of each command, a failed command does not stop the following ones.
+
+        Raises:
+            ExecOnPodError: If the stream closed or the commands did not finish in time, the session is closed.
+        """
+        pending = [
+            _PendingCommand(command=command, marker=f"{MARKER_PREFIX}{uuid.uuid4().hex}") for command in commands
+        ]
+        with self._lock:
+            self._open()
+            LOGGER.info(f"Execute {len(commands)} command(s) on {self.pod.name}/{self.container}")
+            self._resp.write_stdin("".join(_pending.script() for _pending in pending))
+
+            results: list[ExecResult] = []
+            timeout_watch = TimeoutWatch(timeout=timeout)
+            try:
+                for _pending in pending:
+                    results.append(self._read_result(pending_command=_pending, timeout_watch=timeout_watch))
+            except ExecOnPodError:
+                self.close()
+                raise
+
+            return results
+
+    def _read_result(self, pending_command: _PendingCommand, timeout_watch: TimeoutWatch) -> ExecResult:
+        stdout_marker = f"{pending_command.marker} "
+        stderr_marker = f"{pending_command.marker}\n"
+        while True:
+            stdout_end = self._stdout.find(stdout_marker)
+            rc_end = self._stdout.find("\n", stdout_end) if stdout_end >= 0 else -1
+            stderr_end = self._stderr.find(stderr_marker)
+            if rc_end >= 0 and stderr_end >= 0:
+                result = ExecResult(
+                    command=pending_command.command,
+                    rc=int(self._stdout[stdout_end + len(stdout_marker) : rc_end]),
+                    stdout=self._stdout[:stdout_end],
+                    stderr=self._stderr[:stderr_end],
+                )
+                self._stdout = self._stdout[rc_end + 1 :]
+                self._stderr = self._stderr[stderr_end + len(stderr_marker) :]
+                return result
+
+            if not self._resp.is_open():
+                raise ExecOnPodError(
+                    command=pending_command.command, rc=-1, out=self._stdout, err=self._stderr or STREAM_CLOSED_ERROR
+                )
+
+            remaining_time = timeout_watch.remaining_time()
+            if remaining_time <= 0:
+                raise ExecOnPodError(
+                    command=pending_command.command, rc=-1, out=self._stdout, err=f"Timed out. {self._stderr}"
+                )
+
+            self._resp.update(timeout=min(remaining_time, 1))
+            # read_stdout()/read_stderr() of an empty channel would receive the next frame, and read_all() would
+            # then drop it: take the received data from the channel buffers directly
+            self._stdout += self._resp._channels.pop(STDOUT_CHANNEL, "")
+            self._stderr += self._resp._channels.pop(STDERR_CHANNEL, "")
+            # Drop the copy of everything received the stream keeps for read_all()
+            self._resp._all = type(self._resp._all)()
+
+
+# (client id, namespace, name, container) -> session
+_SESSIONS: dict[tuple[int, str | None, str | None, str], PodExecSession] = {}
+_SESSIONS_LOCK = threading.Lock()
+
+
+def get_exec_session(pod: "Pod", container: str = "", shell: str = DEFAULT_EXEC_SHELL) -> PodExecSession:
+    """
+    Get the shared exec session of a Pod container, opening it if needed.
+
+    Sessions are shared by all `Pod` objects of the same pod and client, and kept until `close_exec_sessions`.
+
+    Args:
+        pod (Pod): Pod to run commands on.
+        container (str): Container name, defaults to the first container.
+        shell (str): Shell binary in the container.
+
+    Returns:
+        PodExecSession: Open exec session.
+    """
+    container = container or pod.known_instance.spec.containers[0].name
+    key = (id(pod.client), pod.namespace, pod.name, container)
+    with _SESSIONS_LOCK:
+        session = _SESSIONS.get(key)
+        if not session or session.shell != shell:
+            if session:
+                session.close()
+
+            session = _SESSIONS[key] = PodExecSession(pod=pod, container=container, shell=shell)
+
+    session.open()
+    return session
+
+
+def close_exec_sessions(pod: "Pod") -> None:
+    """
+    Close the shared exec sessions of a Pod.
+
+    Args:
+        pod (Pod): Pod whose sessions to close.
+    """
+    with _SESSIONS_LOCK:
+        sessions = [
+            _SESSIONS.pop(key) for key in list(_SESSIONS) if key[:3] == (id(pod.client), pod.namespace, pod.name)
+        ]
+
+    for session in sessions:
+        session.close()
+
+
+def _pod_exec_output(pod: "Pod", future: Future) -> PodExecOutput:
+    try:
+        return PodExecOutput(pod=pod, stdout=future.result())
+    except Exception as exp:
+        return PodExecOutput(pod=pod, error=exp)
+
+
+def execute_on_pods(
+    pods: Iterable["Pod"],
+    command: list[str],
+    timeout: int = TIMEOUT_1MINUTE,
+    container: str = "",
+    ignore_rc: bool = False,
+    max_workers: int = DEFAULT_FAN_OUT_WORKERS,
+) -> Generator[PodExecOutput, None, None]:
+    """
+    Run a command on many pods in parallel with `Pod.execute`, yielding results as they finish.
+
+    A failed pod does not stop the others, its error (`ExecOnPodError` or API error) is set on its result.
+    Pods that did not finish once all the others are done and their time is up are yielded with an
+    `ExecOnPodError` (rc -1) without waiting for them.
+
+    Args:
+        pods (Iterable): Pods to run the command on.
+        command (list): Command to run.
+        timeout (int): Time to wait for the command on each pod.
+        container (str): Container name where to exec the command, defaults to each pod's first container.
+        ignore_rc (bool): If True ignore error rc from the shell and return out.
+        max_workers (int): Number of pods to run the command on at a time.
+
+    Yields:
+        PodExecOutput: Result of each pod, in completion order.
+    """
+    pods = list(pods)
+    if not pods:
+        return
+
+    max_workers = max(min(max_workers, len(pods)), 1)
+    # Each pod is bounded by `timeout` in Pod.execute, allow for the pods queued behind slow ones and for connecting
+    batch_timeout = timeout * math.ceil(len(pods) / max_workers) + TIMEOUT_30SEC
+    LOGGER.info(f"Execute {command} on {len(pods)} pods, {max_workers} at a time")
+
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ocp-resources-exec")
+    futures = {
+        executor.submit(pod.execute, command=command, timeout=timeout, container=container, ignore_rc=ignore_rc): pod
+        for pod in pods
+    }
+    yielded: set[Future] = set()
+    try:
+        try:
+            for future in as_completed(futures, timeout=batch_timeout):
+                yielded.add(future)
+                yield _pod_exec_output(pod=futures[future], future=future)
+
+        except FutureTimeoutError:
+            # Pods that finished while the caller was consuming the results have not been handed out yet
+            for future, pod in futures.items():
+                if future in yielded:
+                    continue
+
+                if future.done():
+                    yield _pod_exec_output(pod=pod, future=future)
+                else:
+                    yield PodExecOutput(
+                        pod=pod, error=ExecOnPodError(command=command, rc=-1, out="", err=f"Timed out after {timeout}s")
+                    )
+
+    finally:
+        # Don't wait for stuck pods (or for the rest when the caller stopped iterating)
+        executor.shutdown(wait=False, cancel_futures=True)
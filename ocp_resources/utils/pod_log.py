@@ -0,0 +1,362 @@
+"""Streaming Pod logs.
+
+`Pod.log` downloads the whole log on every call. `PodLogFollower` streams it line by line (following new lines if
+asked to), remembers the timestamp of the last line it saw so a reconnect resumes where it stopped instead of from
+the start, and keeps the last lines in a bounded buffer. `follow_logs` merges the logs of many pods/containers by
+timestamp.
+"""
+
+import contextlib
+import heapq
+import math
+import queue
+import re
+import threading
+import time
+from collections import deque
+from collections.abc import Generator, Iterable
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+from typing import TYPE_CHECKING, Any
+
+import urllib3
+from simple_logger.logger import get_logger
+from timeout_sampler import TimeoutExpiredError, TimeoutWatch
+
+from ocp_resources.utils.constants import TIMEOUT_5SEC
+
+if TYPE_CHECKING:
+    from ocp_resources.pod import Pod
+
+LOGGER = get_logger(name=__name__)
+
+DEFAULT_LOG_BUFFER_SIZE: int = 1000
+# Lines of different sources are held this long to be yielded in timestamp order when following many sources
+DEFAULT_MERGE_WINDOW: float = 1.0
+# Errors of a follow stream closed or idle, resumed from the last seen timestamp
+_STREAM_ERRORS: tuple[type[Exception], ...] = (urllib3.exceptions.ProtocolError, urllib3.exceptions.ReadTimeoutError)
+
+
+@dataclass(order=True)
+class LogLine:
+    """
+    A log line of a Pod container, ordered by timestamp.
+    """
+
+    timestamp: datetime | None
+    pod: str = field(compare=False)
+    container: str = field(compare=False)
+    text: str = field(compare=False)
+
+
+def parse_log_timestamp(value: str) -> datetime | None:
+    """
+    Parse an RFC 3339 log timestamp (as added with `timestamps=True`, nanoseconds are truncated).
+
+    Args:
+        value (str): Timestamp, e.g. `2024-01-01T10:00:00.123456789Z`.
+
+    Returns:
+        datetime | None: UTC timestamp or None if value is not a timestamp.
+    """
+    date_time, _, fraction = value.rstrip("Z").partition(".")
+    try:
+        return datetime.strptime(f"{date_time}.{fraction[:6].ljust(6, '0')}", "%Y-%m-%dT%H:%M:%S.%f").replace(
+            tzinfo=timezone.utc
+        )
+    except ValueError:
+        return None
+
+
+class PodLogFollower:
+    """
+    Stream the log of a Pod container line by line.
+
+    Example:
+        follower = PodLogFollower(pod=pod, since_seconds=60)
+        for line in follower.lines(timeout=30):
+            ...
+        follower.wait_for_log_line(regex=r"Server started", timeout=120)
+    """
+
+    def __init__(
+        self,
+        pod: "Pod",
+        container: str = "",
+        follow: bool = True,
+        since_seconds: int | None = None,
+        since_time: datetime | None = None,
+        tail_lines: int | None = None,
+        buffer_size: int = DEFAULT_LOG_BUFFER_SIZE,
+    ) -> None:
+        """
+        Args:
+            pod (Pod): Pod to stream the log of.
+            container (str): Container name, defaults to the first container.
+            follow (bool): Keep streaming new lines, else stop at the end of the current log.
+            since_seconds (int, optional): Start with lines newer than this many seconds.
+            since_time (datetime, optional): Start with lines newer than this time.
+            tail_lines (int, optional): Start with the last lines of the log (first connection only).
+            buffer_size (int): Number of last lines kept in `buffer`.
+        """
+        self.pod = pod
+        self.container = container or pod.known_instance.spec.containers[0].name
+        self.follow = follow
+        self.since_seconds = since_seconds
+        self.tail_lines = tail_lines
+        self.last_timestamp: datetime | None = since_time
+        self.buffer: deque[LogLine] = deque(maxlen=buffer_size)
+        # Lines seen with `last_timestamp`, skipped when a reconnect returns them again
+        self._seen_at_last_timestamp = 0
+        # Response being read, closed by `close()` from another thread
+        self._response: Any = None
+        self._closed = False
+
+    def _request_kwargs(self, timeout: float | None) -> dict[str, Any]:
+        kwargs: dict[str, Any] = {
+            "name": self.pod.name,
+            "namespace": self.pod.namespace,
+            "container": self.container,
+            "follow": self.follow,
+            "timestamps": True,
+            "_preload_content": False,
+        }
+        if timeout:
+            kwargs["_request_timeout"] = (TIMEOUT_5SEC, timeout)
+
+        if self.last_timestamp:
+            # The client has no sinceTime, ask for a bit more and drop what was already seen
+            elapsed = (datetime.now(tz=timezone.utc) - self.last_timestamp).total_seconds()
+            kwargs["since_seconds"] = max(math.ceil(elapsed) + 1, 1)
+        elif self.since_seconds:
+            kwargs["since_seconds"] = self.since_seconds
+        elif self.tail_lines is not None:
+            kwargs["tail_lines"] = self.tail_lines
+
+        return kwargs
+
+    def _parse(self, raw_line: str) -> LogLine | None:
+        timestamp_str, _, text = raw_line.partition(" ")
+        timestamp = parse_log_timestamp(value=timestamp_str)
+        if timestamp is None:
+            return LogLine(timestamp=None, pod=self.pod.name or "", container=self.container, text=raw_line)
+
+        if self.last_timestamp:
+            if timestamp < self.last_timestamp:
+                return None
+
+            if timestamp == self.last_timestamp:
+                if self._seen_at_last_timestamp:
+                    self._seen_at_last_timestamp -= 1
+                    return None
+            else:
+                self._seen_at_last_timestamp = 0
+
+        return LogLine(timestamp=timestamp, pod=self.pod.name or "", container=self.container, text=text)
+
+    def _read_stream(self, timeout: float | None) -> Generator[LogLine, None, None]:
+        response = self._response = self.pod._kube_v1_api.read_namespaced_pod_log(
+            **self._request_kwargs(timeout=timeout)
+        )
+        # Lines already seen at the last timestamp are about to be returned again
+        seen_at_last_timestamp = self._seen_at_last_timestamp
+
+        def _accept(raw_line: str) -> LogLine | None:
+            nonlocal seen_at_last_timestamp
+            line = self._parse(raw_line=raw_line)
+            if line and line.timestamp:
+                seen_at_last_timestamp = seen_at_last_timestamp + 1 if line.timestamp == self.last_timestamp else 1
+                self.last_timestamp = line.timestamp
+
+            if line:
+                self.buffer.append(line)
+
+            return line
+
+        partial = ""
+        try:
+            # Closed while connecting
+            if self._closed:
+                return
+
+            for chunk in response.stream(decode_content=True):
+                raw_lines = (partial + chunk.decode("utf-8", errors="replace")).split("\n")
+                # An interrupted stream's partial last line is read again by the next stream
+                partial = raw_lines.pop()
+                for raw_line in raw_lines:
+                    if line := _accept(raw_line=raw_line):
+                        yield line
+
+            # The stream ended, a last line without a newline is complete
+            if partial and (line := _accept(raw_line=partial)):
+                yield line
+
+        finally:
+            self._seen_at_last_timestamp = seen_at_last_timestamp
+            self._response = None
+            response.release_conn()
+
+    def lines(self, timeout: float | None = None) -> Generator[LogLine, None, None]:
+        """
+        Stream log lines.
+
+        When following, a stream interrupted by the API server (or idle past `timeout`) is resumed from the last seen
+        line. The stream ends when the container exits.
+
+        Args:
+            timeout (float, optional): Stop after this many seconds, never when following without a timeout.
+
+        Yields:
+            LogLine: Log lines, oldest first.
+        """
+        timeout_watch = TimeoutWatch(timeout=timeout) if timeout else None
+        while not self._closed:
+            remaining_time = timeout_watch.remaining_time() if timeout_watch else None
+            if remaining_time is not None and remaining_time <= 0:
+                return
+
+            stream = self._read_stream(timeout=remaining_time)
+            try:
+                for line in stream:
+                    yield line
+                    if timeout_watch and timeout_watch.remaining_time() <= 0:
+                        return
+
+                # A follow stream ends when the container exits
+                return
+
+            except Exception as exp:
+                # Closed by close(), whatever the read failed with
+                if self._closed:
+                    return
+
+                if not self.follow or not isinstance(exp, _STREAM_ERRORS):
+                    raise
+
+                LOGGER.debug(f"Log stream of {self.pod.name}/{self.container} interrupted: {exp}")
+
+            finally:
+                stream.close()
+
+    def close(self) -> None:
+        """
+        Stop streaming: close the log stream being read (from any thread), `lines()` then returns.
+        """
+        self._closed = True
+        response = self._response
+        if response is not None:
+            with contextlib.suppress(Exception):
+                response.close()
+
+    def wait_for_log_line(self, regex: str | re.Pattern[str], timeout: float) -> LogLine:
+        """
+        Wait for a log line matching a regex, reading the log stream once.
+
+        Args:
+            regex (str | re.Pattern): Regex searched in each line.
+            timeout (float): Time to wait for the line.
+
+        Returns:
+            LogLine: First matching line.
+
+        Raises:
+            TimeoutExpiredError: If no line matched in time.
+        """
+        pattern = re.compile(regex)
+        for line in self.lines(timeout=timeout):
+            if pattern.search(line.text):
+                return line
+
+        raise TimeoutExpiredError(
+            value=f"Log line matching {pattern.pattern!r} in {self.pod.name}/{self.container}", elapsed_time=timeout
+        )
+
+
+def follow_logs(
+    pods: Iterable["Pod"],
+    containers: list[str] | None = None,
+    follow: bool = True,
+    since_seconds: int | None = None,
+    since_time: datetime | None = None,
+    timeout: float | None = None,
+    merge_window: float = DEFAULT_MERGE_WINDOW,
+) -> Generator[LogLine, None, None]:
+    """
+    Stream the logs of many pods and containers merged by timestamp.
+
+    Without follow the logs are merged exactly. When following, each source is read on its own thread and lines are
+    held for `merge_window` seconds to be yielded in timestamp order.
+
+    Args:
+        pods (Iterable): Pods to stream the logs of.
+        containers (list, optional): Container names, defaults to all the containers of each pod.
+        follow (bool): Keep streaming new lines.
+        since_seconds (int, optional): Start with lines newer than this many seconds.
+        since_time (datetime, optional): Start with lines newer than this time.
+        timeout (float, optional): Stop after this many seconds.
+        merge_window (float): Seconds lines are held for ordering when following.
+
+    Yields:
+        LogLine: Log lines of all the sources.
+    """
+    followers = [
+        PodLogFollower(pod=pod, container=container, follow=follow, since_seconds=since_seconds, since_time=since_time)
+        for pod in pods
+        for container in containers or [_container.name for _container in pod.known_instance.spec.containers]
+    ]
+    if not follow:
+        yield from heapq.merge(*[_follower.lines(timeout=timeout) for _follower in followers], key=_merge_key)
+        return
+
+    lines_queue: queue.Queue[LogLine | None] = queue.Queue()
+    stop_event = threading.Event()
+
+    def _read(follower: PodLogFollower) -> None:
+        try:
+            for _line in follower.lines(timeout=timeout):
+                if stop_event.is_set():
+                    return
+                lines_queue.put(_line)
+        except Exception as exp:
+            if not stop_event.is_set():
+                LOGGER.warning(f"Failed to stream log of {follower.pod.name}/{follower.container}: {exp}")
+        finally:
+            lines_queue.put(None)
+
+    threads = [
+        threading.Thread(target=_read, args=(_follower,), daemon=True, name=f"log-{_follower.pod.name}")
+        for _follower in followers
+    ]
+    for thread in threads:
+        thread.start()
+
+    # (timestamp, arrival order, arrival time, line)
+    pending: list[tuple[datetime, int, float, LogLine]] = []
+    running = len(threads)
+    counter = 0
+    try:
+        while running or pending:
+            try:
+                line = lines_queue.get(timeout=merge_window / 2 if pending else None)
+                if line is None:
+                    running -= 1
+                else:
+                    counter += 1
+                    heapq.heappush(pending, (_merge_key(line=line), counter, time.monotonic(), line))
+            except queue.Empty:
+                pass
+
+            # Release lines held long enough, all of them once every source is done
+            release_before = time.monotonic() - merge_window
+            while pending and (not running or pending[0][2] <= release_before):
+                yield heapq.heappop(pending)[3]
+    finally:
+        # Readers may be blocked on a quiet stream, close the streams rather than wait for a line
+        stop_event.set()
+        for _follower in followers:
+            _follower.close()
+
+
+def _merge_key(line: LogLine) -> datetime:
+    # Lines without a timestamp go first
+    return line.timestamp or datetime.min.replace(tzinfo=timezone.utc)
@@ -0,0 +1,102 @@
+"""pytest plugin reporting the API call hotspots of each test.
+
+Enable with `pytest -p ocp_resources.utils.pytest_api_calls`. The terminal summary lists, for the tests that spent
+the most time in API calls, the (verb, resource, caller) keys they spent it on. `--api-calls-metrics-file` also writes
+the metrics of the whole session in the Prometheus text format (e.g. for the node exporter textfile collector).
+"""
+
+from typing import Any
+
+import pytest
+
+from ocp_resources.utils.instrumentation import (
+    ApiCallCollector,
+    ApiCallStats,
+    add_api_call_hook,
+    remove_api_call_hook,
+)
+
+PLUGIN_NAME: str = "ocp-resources-api-calls"
+
+
+def pytest_addoption(parser: pytest.Parser) -> None:
+    group = parser.getgroup("ocp-resources", "openshift-python-wrapper API calls")
+    group.addoption(
+        "--api-calls-top-tests",
+        type=int,
+        default=10,
+        help="Number of tests to report API call hotspots for (default: 10).",
+    )
+    group.addoption(
+        "--api-calls-top-keys",
+        type=int,
+        default=5,
+        help="Number of (verb, resource, caller) hotspots reported per test (default: 5).",
+    )
+    group.addoption(
+        "--api-calls-metrics-file",
+        default=None,
+        help="Write the API call metrics of the session to this file, in the Prometheus text format.",
+    )
+
+
+def pytest_configure(config: pytest.Config) -> None:
+    config.pluginmanager.register(
+        ApiCallsPlugin(
+            top_tests=config.getoption("--api-calls-top-tests"),
+            top_keys=config.getoption("--api-calls-top-keys"),
+            metrics_file=config.getoption("--api-calls-metrics-file"),
+        ),
+        PLUGIN_NAME,
+    )
+
+
+class ApiCallsPlugin:
+    """
+    Collect the API calls of the session and of each test (setup and teardown included).
+    """
+
+    def __init__(self, top_tests: int = 10, top_keys: int = 5, metrics_file: str | None = None) -> None:
+        self.top_tests = top_tests
+        self.top_keys = top_keys
+        self.metrics_file = metrics_file
+        self.session_collector = ApiCallCollector()
+        # Test node id -> its API call stats
+        self.test_stats: dict[str, list[ApiCallStats]] = {}
+        add_api_call_hook(hook=self.session_collector)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item: pytest.Item) -> Any:
+        test_collector = ApiCallCollector()
+        add_api_call_hook(hook=test_collector)
+        try:
+            yield
+        finally:
+            remove_api_call_hook(hook=test_collector)
+            if test_collector.total_calls:
+                self.test_stats[item.nodeid] = test_collector.stats
+
+    def pytest_terminal_summary(self, terminalreporter: Any) -> None:
+        if not self.test_stats:
+            return
+
+        terminalreporter.write_sep("=", "API call hotspots")
+        test_times = {
+            nodeid: sum(stats.total_time for stats in all_stats) for nodeid, all_stats in self.test_stats.items()
+        }
+        for nodeid in sorted(test_times, key=test_times.get, reverse=True)[: self.top_tests]:  # type: ignore[arg-type]
+            all_stats = self.test_stats[nodeid]
+            terminalreporter.write_line(
+                f"{nodeid}: {sum(stats.count for stats in all_stats)} calls, {test_times[nodeid]:.2f}s"
+            )
+            for stats in sorted(all_stats, key=lambda _stats: _stats.total_time, reverse=True)[: self.top_keys]:
+                terminalreporter.write_line(
+                    f"    {stats.count:>6} x {stats.verb} {stats.resource or '-'} ({stats.caller}): "
+                    f"{stats.total_time:.2f}s, {stats.errors} errors"
+                )
+
+    def pytest_unconfigure(self) -> None:
+        remove_api_call_hook(hook=self.session_collector)
+        if self.metrics_file:
+            with open(self.metrics_file, "w") as fd:
+                fd.write(self.session_collector.to_prometheus())
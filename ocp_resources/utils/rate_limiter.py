@@ -0,0 +1,261 @@
+"""Client side rate limiting.
+
+`TokenBucketRateLimiter` spreads calls to a rate. `ClientRateLimiter` is installed on the REST client of each
+`get_client()` client: requests wait for a token of their lane (reads, writes, watches; so a flood of waits does not
+delay creates), and `429`/`503` answers with a `Retry-After` header pause the lane and are retried instead of
+surfacing to the caller.
+"""
+
+import os
+import threading
+import time
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any
+
+from kubernetes.client.rest import ApiException
+from simple_logger.logger import get_logger
+
+from ocp_resources.utils.constants import TIMEOUT_1MINUTE
+
+LOGGER = get_logger(name=__name__)
+
+CLIENT_QPS_ENV: str = "OPENSHIFT_PYTHON_WRAPPER_CLIENT_QPS"
+CLIENT_BURST_ENV: str = "OPENSHIFT_PYTHON_WRAPPER_CLIENT_BURST"
+# client-go default burst
+DEFAULT_CLIENT_BURST: int = 10
+DEFAULT_MAX_THROTTLE_RETRIES: int = 5
+THROTTLE_STATUSES: tuple[int, ...] = (429, 503)
+READ_LANE: str = "read"
+WRITE_LANE: str = "write"
+WATCH_LANE: str = "watch"
+LANES: tuple[str, ...] = (READ_LANE, WRITE_LANE, WATCH_LANE)
+
+
+class TokenBucketRateLimiter:
+    """
+    Thread safe token bucket rate limiter.
+
+    Up to `burst` calls pass immediately, after that calls are spread to `qps` per second.
+    """
+
+    def __init__(self, qps: float, burst: int = 1) -> None:
+        """
+        Args:
+            qps (float): Sustained number of calls per second.
+            burst (int): Number of calls allowed at once.
+
+        Raises:
+            ValueError: If qps is not positive.
+        """
+        if qps <= 0:
+            raise ValueError(f"qps must be positive, got {qps}")
+
+        self.qps = qps
+        self.burst = max(burst, 1)
+        self._tokens = float(self.burst)
+        self._last_refill = time.monotonic()
+        self._lock = threading.Lock()
+
+    def acquire(self) -> float:
+        """
+        Take a token, sleeping until one is available.
+
+        Returns:
+            float: Time in seconds the caller was delayed.
+        """
+        with self._lock:
+            now = time.monotonic()
+            self._tokens = min(self.burst, self._tokens + (now - self._last_refill) * self.qps)
+            self._last_refill = now
+            # Reserve the token now (the bucket may go negative), so concurrent callers queue up in order
+            self._tokens -= 1
+            delay = max(-self._tokens / self.qps, 0.0)
+
+        if delay:
+            time.sleep(delay)
+
+        return delay
+
+
+@dataclass
+class LaneStats:
+    """
+    Requests of a rate limiter lane.
+
+    Attributes:
+        requests (int): Number of requests sent, retries included.
+        queued_time (float): Total time in seconds requests waited for the limiter.
+        max_queued_time (float): Longest time in seconds a request waited for the limiter.
+        throttled (int): Number of `429`/`503` answers with a `Retry-After` header.
+    """
+
+    requests: int = 0
+    queued_time: float = 0.0
+    max_queued_time: float = 0.0
+    throttled: int = 0
+
+
+def client_rate_limits() -> tuple[float, int]:
+    """
+    Get the client rate limits from `OPENSHIFT_PYTHON_WRAPPER_CLIENT_QPS` and `OPENSHIFT_PYTHON_WRAPPER_CLIENT_BURST`
+    environment variables.
+
+    Returns:
+        tuple[float, int]: Requests per second of each lane (0 or less does not limit) and burst.
+    """
+    return float(os.environ.get(CLIENT_QPS_ENV, 0)), int(os.environ.get(CLIENT_BURST_ENV, DEFAULT_CLIENT_BURST))
+
+
+def request_lane(method: str, query_params: Any = None) -> str:
+    """
+    Get the limiter lane of a request.
+
+    Args:
+        method (str): HTTP method.
+        query_params (list | dict, optional): Request query parameters.
+
+    Returns:
+        str: `watch` for watch requests, `read` for other GET/HEAD/OPTIONS requests, else `write`.
+    """
+    if method.upper() in ("GET", "HEAD", "OPTIONS"):
+        params = query_params.items() if isinstance(query_params, dict) else query_params or []
+        if any(key == "watch" and str(value).lower() == "true" for key, value in params):
+            return WATCH_LANE
+
+        return READ_LANE
+
+    return WRITE_LANE
+
+
+def retry_after_seconds(exp: ApiException) -> float | None:
+    """
+    Get the `Retry-After` delay of an API error.
+
+    Args:
+        exp (ApiException): API error.
+
+    Returns:
+        float | None: Delay in seconds (capped at a minute), or None if the error has no `Retry-After` header.
+    """
+    value = (exp.headers or {}).get("Retry-After")
+    if value is None:
+        return None
+
+    try:
+        delay = float(value)
+    except ValueError:
+        try:
+            delay = parsedate_to_datetime(value).timestamp() - time.time()
+        except (TypeError, ValueError):
+            return None
+
+    return min(max(delay, 0.0), TIMEOUT_1MINUTE)
+
+
+class ClientRateLimiter:
+    """
+    Rate limiter of the API requests of one client, with a token bucket per lane (reads, writes, watches).
+
+    Example:
+        limiter = ClientRateLimiter(qps=50, burst=100)
+        limiter.install(api_client=client.client)
+        ...
+        limiter.stats["read"].queued_time
+    """
+
+    def __init__(
+        self,
+        qps: float = 0,
+        burst: int = DEFAULT_CLIENT_BURST,
+        max_throttle_retries: int = DEFAULT_MAX_THROTTLE_RETRIES,
+    ) -> None:
+        """
+        Args:
+            qps (float): Requests per second of each lane, 0 or less only handles `Retry-After` answers.
+            burst (int): Requests of each lane sent at once before spreading them to `qps`.
+            max_throttle_retries (int): Retries of a request answered with `Retry-After`.
+        """
+        self.qps = qps
+        self.burst = burst
+        self.max_throttle_retries = max_throttle_retries
+        self._buckets: dict[str, TokenBucketRateLimiter | None] = {
+            lane: TokenBucketRateLimiter(qps=qps, burst=burst) if qps > 0 else None for lane in LANES
+        }
+        self._paused_until: dict[str, float] = dict.fromkeys(LANES, 0.0)
+        self._lock = threading.Lock()
+        self.stats: dict[str, LaneStats] = {lane: LaneStats() for lane in LANES}
+
+    def acquire(self, lane: str) -> float:
+        """
+        Wait for a lane to accept a request.
+
+        Args:
+            lane (str): Request lane.
+
+        Returns:
+            float: Time in seconds the request was queued.
+        """
+        start = time.monotonic()
+        with self._lock:
+            pause = self._paused_until[lane] - start
+
+        if pause > 0:
+            time.sleep(pause)
+
+        bucket = self._buckets[lane]
+        if bucket:
+            bucket.acquire()
+
+        queued_time = time.monotonic() - start
+        with self._lock:
+            stats = self.stats[lane]
+            stats.requests += 1
+            stats.queued_time += queued_time
+            stats.max_queued_time = max(stats.max_queued_time, queued_time)
+
+        return queued_time
+
+    def throttle(self, lane: str, delay: float) -> None:
+        """
+        Pause a lane, e.g. after a `429` answer.
+
+        Args:
+            lane (str): Request lane.
+            delay (float): Pause in seconds.
+        """
+        with self._lock:
+            self._paused_until[lane] = max(self._paused_until[lane], time.monotonic() + delay)
+            self.stats[lane].throttled += 1
+
+    def install(self, api_client: Any) -> None:
+        """
+        Route the requests of an API client through the limiter.
+
+        Args:
+            api_client (kubernetes.client.ApiClient): API client, e.g. `DynamicClient.client`.
+        """
+        rest_client = api_client.rest_client
+        request = rest_client.request
+
+        def _limited_request(method: str, url: str, query_params: Any = None, *args: Any, **kwargs: Any) -> Any:
+            lane = request_lane(method=method, query_params=query_params)
+            attempt = 0
+            while True:
+                queued_time = self.acquire(lane=lane)
+                if queued_time >= 0.001:
+                    LOGGER.debug(f"{method} {url} queued {queued_time:.3f}s in the {lane} lane")
+
+                try:
+                    return request(method, url, query_params, *args, **kwargs)
+                except ApiException as exp:
+                    delay = retry_after_seconds(exp=exp) if exp.status in THROTTLE_STATUSES else None
+                    if delay is None or attempt >= self.max_throttle_retries:
+                        raise
+
+                    attempt += 1
+                    LOGGER.info(f"{method} {url} throttled ({exp.status}), retry {attempt} in {delay:.1f}s")
+                    self.throttle(lane=lane, delay=delay)
+
+        rest_client.request = _limited_request
+        api_client.rate_limiter = self
@@ -1,4 +1,9 @@
 class ResourceConstants:
+    class Freshness:
+        ALWAYS: str = "always"
+        MAX_AGE: str = "max-age"
+        WATCH: str = "watch"
+
     class Status:
         SUCCEEDED: str = "Succeeded"
         FAILED: str = "Failed"
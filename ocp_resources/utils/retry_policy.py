@@ -0,0 +1,229 @@
+"""Retry policy with exponential backoff and jitter.
+
+`Resource.retry_cluster_exceptions` and the `wait_*` methods retry with a fixed `sleep` by default, so clients that
+failed together retry together (e.g. after an API server restart). A `RetryPolicy` spreads the retries with
+decorrelated jitter (see https://aws.amazon.com/blogs/architecture/exponential-backoff-and-jitter/), caps the
+interval, limits the retries of an operation and, optionally, the retries of all the operations sharing the policy
+(retry budget). Every operation run through the policy is recorded in `RetryPolicy.history`.
+"""
+
+import random
+import threading
+import time
+from collections import deque
+from collections.abc import Callable, Generator
+from dataclasses import dataclass
+from typing import Any
+
+from simple_logger.logger import get_logger
+from timeout_sampler import TimeoutExpiredError, TimeoutWatch
+
+from ocp_resources.utils.wait_engine import ExceptionsDict, is_retryable_exception
+
+LOGGER = get_logger(name=__name__)
+
+DEFAULT_RETRY_HISTORY_SIZE: int = 1000
+
+
+@dataclass
+class RetryRecord:
+    """
+    Outcome of an operation run through a retry policy.
+
+    Attributes:
+        operation (str): Operation name, e.g. "create Pod my-pod".
+        attempts (int): Number of calls, polls of a wait included.
+        retries (int): Number of calls retried after a retryable exception.
+        elapsed (float): Duration of the operation in seconds.
+        succeeded (bool): Whether the operation returned a result.
+    """
+
+    operation: str
+    attempts: int = 0
+    retries: int = 0
+    elapsed: float = 0.0
+    succeeded: bool = False
+
+
+class RetryPolicy:
+    """
+    Retry with exponential backoff, decorrelated jitter, a maximum interval and an optional retry budget.
+
+    The policy is thread safe and meant to be shared, e.g. by all the resources of a test session, so the retry
+    budget limits the retries of all of them.
+
+    Example:
+        retry_policy = RetryPolicy(base=0.5, max_interval=10, max_retries=8, budget_ratio=0.2)
+        pod = Pod(client=client, name="my-pod", namespace="default", retry_policy=retry_policy)
+        pod.create()
+        retry_policy.history[-1].retries
+    """
+
+    def __init__(
+        self,
+        base: float = 1,
+        max_interval: float = 30,
+        max_retries: int | None = None,
+        jitter: bool = True,
+        budget_ratio: float | None = None,
+        budget_min_retries: int = 10,
+        history_size: int = DEFAULT_RETRY_HISTORY_SIZE,
+    ) -> None:
+        """
+        Args:
+            base (float): First interval in seconds, and the shortest one with jitter.
+            max_interval (float): Longest interval in seconds.
+            max_retries (int, optional): Retries of a single operation; None retries until its timeout.
+            jitter (bool): Draw decorrelated jitter intervals; False doubles the interval on every retry.
+            budget_ratio (float, optional): Retries allowed per operation, over all the operations of the policy,
+                e.g. 0.2 allows one retry per five operations. None disables the budget.
+            budget_min_retries (int): Retries always allowed by the budget, so rare failures are retried.
+            history_size (int): Number of operations kept in `history`.
+
+        Raises:
+            ValueError: If base or max_interval is not positive.
+        """
+        if base <= 0 or max_interval <= 0:
+            raise ValueError(f"base and max_interval must be positive, got {base} and {max_interval}")
+
+        self.base = base
+        self.max_interval = max(max_interval, base)
+        self.max_retries = max_retries
+        self.jitter = jitter
+        self.budget_ratio = budget_ratio
+        self.budget_min_retries = budget_min_retries
+        self.history: deque[RetryRecord] = deque(maxlen=history_size)
+        self._operations = 0
+        self._retries = 0
+        self._lock = threading.Lock()
+
+    def intervals(self) -> Generator[float, None, None]:
+        """
+        Generate the intervals to sleep between attempts of an operation.
+
+        Yields:
+            float: Interval in seconds.
+        """
+        interval = self.base
+        while True:
+            if self.jitter:
+                interval = min(self.max_interval, random.uniform(self.base, interval * 3))  # noqa: S311
+                yield interval
+            else:
+                yield interval
+                interval = min(self.max_interval, interval * 2)
+
+    def _can_retry(self, record: RetryRecord) -> bool:
+        if self.max_retries is not None and record.retries >= self.max_retries:
+            LOGGER.warning(f"{record.operation}: giving up after {record.retries} retries")
+            return False
+
+        with self._lock:
+            if self.budget_ratio is not None and self._retries >= (
+                self.budget_min_retries + self.budget_ratio * self._operations
+            ):
+                LOGGER.warning(f"{record.operation}: retry budget exhausted ({self._retries} retries)")
+                return False
+
+            self._retries += 1
+
+        return True
+
+    def sample(
+        self,
+        func: Callable[..., Any],
+        timeout: float,
+        exceptions_dict: ExceptionsDict | None = None,
+        operation: str = "",
+        **kwargs: Any,
+    ) -> Generator[Any, None, None]:
+        """
+        Call a function until the caller stops iterating, like `TimeoutSampler`, sleeping the policy intervals.
+
+        Exceptions matching `exceptions_dict` are retried while the policy allows it, the last one is raised when it
+        does not. Closing the generator after a sample records the operation as succeeded.
+
+        Args:
+            func (Callable): Function to call, with `kwargs`.
+            timeout (float): Time in seconds to keep calling.
+            exceptions_dict (dict, optional): Exceptions to retry on; None retries on any exception.
+            operation (str): Operation name for the history, defaults to the function name.
+
+        Yields:
+            Any: Function results.
+
+        Raises:
+            TimeoutExpiredError: If the timeout expired, with the last retried exception.
+        """
+        record = RetryRecord(operation=operation or getattr(func, "__qualname__", repr(func)))
+        intervals = self.intervals()
+        start = time.monotonic()
+        timeout_watch = TimeoutWatch(timeout=timeout)
+        last_exp: Exception | None = None
+        with self._lock:
+            self._operations += 1
+
+        try:
+            while True:
+                record.attempts += 1
+                try:
+                    value = func(**kwargs)
+                except Exception as exp:
+                    if not is_retryable_exception(exp=exp, exceptions_dict=exceptions_dict) or not self._can_retry(
+                        record=record
+                    ):
+                        raise
+
+                    record.retries += 1
+                    last_exp = exp
+                else:
+                    record.succeeded = True
+                    yield value
+                    record.succeeded = False
+
+                remaining = timeout_watch.remaining_time()
+                if remaining <= 0:
+                    raise TimeoutExpiredError(
+                        f"Timed out after {timeout} seconds running {record.operation}",
+                        last_exp=last_exp,
+                        elapsed_time=timeout,
+                    )
+
+                time.sleep(min(next(intervals), remaining))
+
+        finally:
+            record.elapsed = time.monotonic() - start
+            self.history.append(record)
+            if record.retries:
+                LOGGER.debug(f"{record.operation}: {record.retries} retries in {record.elapsed:.1f}s")
+
+    def call(
+        self,
+        func: Callable[..., Any],
+        timeout: float,
+        exceptions_dict: ExceptionsDict | None = None,
+        operation: str = "",
+        **kwargs: Any,
+    ) -> Any:
+        """
+        Call a function, retrying it per the policy.
+
+        Args:
+            func (Callable): Function to call, with `kwargs`.
+            timeout (float): Time in seconds to keep retrying.
+            exceptions_dict (dict, optional): Exceptions to retry on; None retries on any exception.
+            operation (str): Operation name for the history, defaults to the function name.
+
+        Returns:
+            Any: Function result.
+
+        Raises:
+            TimeoutExpiredError: If the timeout expired, with the last retried exception.
+        """
+        samples = self.sample(
+            func=func, timeout=timeout, exceptions_dict=exceptions_dict, operation=operation, **kwargs
+        )
+        try:
+            return next(samples)
+        finally:
+            samples.close()
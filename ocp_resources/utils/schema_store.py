@@ -0,0 +1,228 @@
+"""Indexed schema store built from the schema archive.
+
+`__resources-mappings.json.gz` (written by `save_json_archive`) and `_definitions.json` stay the interchange format.
+On first use they are parsed once into a sqlite file with one row per kind and per definition, kept in the user cache
+directory and keyed by the size and modification time of both files. Later processes open the sqlite file and read
+only the rows they look up.
+"""
+
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+from collections.abc import Iterator, Mapping
+from pathlib import Path
+from typing import Any
+
+from simple_logger.logger import get_logger
+
+from ocp_resources.utils.archive_utils import load_json_archive
+from ocp_resources.utils.utils import user_cache_dir
+
+LOGGER = get_logger(name=__name__)
+
+SCHEMA_STORE_DIR_ENV: str = "OPENSHIFT_PYTHON_WRAPPER_SCHEMA_STORE_DIR"
+# Bump when the store layout changes
+SCHEMA_STORE_FORMAT: int = 1
+MAPPINGS_TABLE: str = "mappings"
+SUMMARIES_TABLE: str = "summaries"
+DEFINITIONS_TABLE: str = "definitions"
+# Schema keys kept in the summaries table, enough to register a resource without its full schema
+SUMMARY_KEYS: tuple[str, ...] = ("x-kubernetes-group-version-kind", "namespaced")
+_MISSING = object()
+
+
+class SchemaStoreTable(Mapping[str, Any]):
+    """
+    Read-only mapping over one table of a `SchemaStore`.
+
+    Values are decoded on first access and kept, so repeated lookups (e.g. `$ref` resolution) do not hit sqlite.
+    """
+
+    def __init__(self, store: "SchemaStore", table: str) -> None:
+        self.store = store
+        self.table = table
+        self._values: dict[str, Any] = {}
+
+    def __getitem__(self, key: str) -> Any:
+        value = self._values.get(key, _MISSING)
+        if value is _MISSING:
+            value = self.store.fetch(table=self.table, key=key)
+            self._values[key] = value
+
+        if value is None:
+            raise KeyError(key)
+
+        return value
+
+    def __contains__(self, key: object) -> bool:
+        return isinstance(key, str) and self.get(key) is not None
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.store.keys(table=self.table))
+
+    def __len__(self) -> int:
+        return self.store.count(table=self.table)
+
+
+class SchemaStore:
+    """
+    Read-only sqlite index of the resources mappings and definitions.
+    """
+
+    def __init__(self, path: Path) -> None:
+        """
+        Args:
+            path (Path): Path to a store built by `SchemaStore.build`.
+
+        Raises:
+            sqlite3.Error: If the store cannot be opened.
+        """
+        self.path = path
+        self._connection = sqlite3.connect(f"file:{path}?mode=ro", uri=True, check_same_thread=False)
+        self._lock = threading.Lock()
+        self.mappings = SchemaStoreTable(store=self, table=MAPPINGS_TABLE)
+        self.summaries = SchemaStoreTable(store=self, table=SUMMARIES_TABLE)
+        self.definitions = SchemaStoreTable(store=self, table=DEFINITIONS_TABLE)
+
+    @staticmethod
+    def build(path: Path, mappings: dict[str, Any], definitions: dict[str, Any]) -> None:
+        """
+        Write a store, atomically replacing `path`.
+
+        Args:
+            path (Path): Store path.
+            mappings (dict): Resources mappings, lowercase kind to list of schemas.
+            definitions (dict): Definitions, name to schema.
+        """
+        tmp_path = path.with_name(f"{path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        connection = sqlite3.connect(tmp_path)
+        try:
+            for table in (MAPPINGS_TABLE, SUMMARIES_TABLE, DEFINITIONS_TABLE):
+                connection.execute(f"CREATE TABLE {table} (key TEXT PRIMARY KEY, value TEXT NOT NULL)")
+
+            connection.executemany(
+                f"INSERT INTO {MAPPINGS_TABLE} VALUES (?, ?)",
+                ((kind, json.dumps(schemas)) for kind, schemas in mappings.items()),
+            )
+            connection.executemany(
+                f"INSERT INTO {SUMMARIES_TABLE} VALUES (?, ?)",
+                (
+                    (
+                        kind,
+                        json.dumps([
+                            {key: schema[key] for key in SUMMARY_KEYS if key in schema}
+                            for schema in schemas
+                            if isinstance(schema, dict)
+                        ]),
+                    )
+                    for kind, schemas in mappings.items()
+                    if isinstance(schemas, list)
+                ),
+            )
+            connection.executemany(
+                f"INSERT INTO {DEFINITIONS_TABLE} VALUES (?, ?)",
+                ((name, json.dumps(definition)) for name, definition in definitions.items()),
+            )
+            connection.commit()
+        except BaseException:
+            connection.close()
+            tmp_path.unlink(missing_ok=True)
+            raise
+
+        connection.close()
+        os.replace(tmp_path, path)
+
+    def fetch(self, table: str, key: str) -> Any:
+        """
+        Get one decoded value.
+
+        Args:
+            table (str): Table name.
+            key (str): Row key.
+
+        Returns:
+            Any: Decoded value or None if not found.
+        """
+        with self._lock:
+            row = self._connection.execute(f"SELECT value FROM {table} WHERE key = ?", (key,)).fetchone()
+
+        return json.loads(row[0]) if row else None
+
+    def keys(self, table: str) -> list[str]:
+        """
+        Get all keys of a table.
+
+        Args:
+            table (str): Table name.
+
+        Returns:
+            list[str]: Sorted keys.
+        """
+        with self._lock:
+            return [row[0] for row in self._connection.execute(f"SELECT key FROM {table} ORDER BY key")]
+
+    def count(self, table: str) -> int:
+        """
+        Get the number of rows in a table.
+
+        Args:
+            table (str): Table name.
+
+        Returns:
+            int: Number of rows.
+        """
+        with self._lock:
+            return self._connection.execute(f"SELECT COUNT(*) FROM {table}").fetchone()[0]
+
+
+def schema_store_path(mappings_archive: Path, definitions_file: Path) -> Path:
+    """
+    Get the store path of a mappings archive and definitions file.
+
+    Args:
+        mappings_archive (Path): Path to `__resources-mappings.json.gz`.
+        definitions_file (Path): Path to `_definitions.json`.
+
+    Returns:
+        Path: Store path in `OPENSHIFT_PYTHON_WRAPPER_SCHEMA_STORE_DIR` (defaults to
+            `~/.cache/openshift-python-wrapper/schema`), unique per content version of both files.
+    """
+    source_id = [str(SCHEMA_STORE_FORMAT)]
+    for source in (mappings_archive, definitions_file):
+        stat = source.stat()
+        source_id.extend([str(source.resolve()), str(stat.st_size), str(stat.st_mtime_ns)])
+
+    digest = hashlib.sha256(":".join(source_id).encode("utf-8")).hexdigest()[:32]
+    return Path(user_cache_dir(name="schema", env_var=SCHEMA_STORE_DIR_ENV)) / f"schema-{digest}.sqlite"
+
+
+def open_schema_store(mappings_file: Path, definitions_file: Path) -> SchemaStore | None:
+    """
+    Open the store of a mappings archive and definitions file, building it on first use.
+
+    Args:
+        mappings_file (Path): Path to the mappings JSON file (its `.json.gz` archive is read).
+        definitions_file (Path): Path to `_definitions.json`.
+
+    Returns:
+        SchemaStore | None: The store, or None if it could not be built or opened.
+    """
+    mappings_archive = mappings_file.with_suffix(mappings_file.suffix + ".gz")
+    try:
+        store_path = schema_store_path(mappings_archive=mappings_archive, definitions_file=definitions_file)
+        if not store_path.exists():
+            LOGGER.info(f"Building schema store {store_path}")
+            with open(definitions_file) as fd:
+                definitions = json.load(fd).get("definitions", {})
+
+            SchemaStore.build(
+                path=store_path, mappings=load_json_archive(json_file=mappings_file), definitions=definitions
+            )
+
+        return SchemaStore(path=store_path)
+
+    except (OSError, ValueError, sqlite3.Error) as exp:
+        LOGGER.warning(f"Schema store not available, loading the full schema archive: {exp}")
+        return None
@@ -5,6 +5,10 @@ the Resource class and the fake Kubernetes client.
 """
 
 import json
+import os
+import threading
+from collections import OrderedDict
+from collections.abc import Mapping
 from typing import Any
 
 import jsonschema
@@ -13,23 +17,47 @@ from simple_logger.logger import get_logger
 from class_generator.constants import DEFINITIONS_FILE, RESOURCES_MAPPING_ARCHIVE, RESOURCES_MAPPING_FILE
 
 from .archive_utils import load_json_archive
+from .schema_store import SchemaStoreTable, open_schema_store
 
 LOGGER = get_logger(name=__name__)
 
+VALIDATOR_CACHE_SIZE_ENV: str = "OPENSHIFT_PYTHON_WRAPPER_SCHEMA_VALIDATOR_CACHE_SIZE"
+DEFAULT_VALIDATOR_CACHE_SIZE: int = 128
+# Kinds compiled by `SchemaValidator.warm_up()` when no kinds are given
+CORE_KINDS: tuple[str, ...] = (
+    "ConfigMap",
+    "Deployment",
+    "Namespace",
+    "PersistentVolumeClaim",
+    "Pod",
+    "Role",
+    "RoleBinding",
+    "Secret",
+    "Service",
+    "ServiceAccount",
+)
+
 
 class SchemaValidator:
     """Shared schema validator for resource validation."""
 
     # Class-level caches shared across all instances
-    _mappings_data: dict[str, Any] | None = None
-    _definitions_data: dict[str, Any] | None = None
+    # Lazily loaded from the schema store when available, plain dicts when loaded from the archive
+    _mappings_data: Mapping[str, Any] | None = None
+    _definitions_data: Mapping[str, Any] | None = None
     _schema_cache: dict[str, dict[str, Any]] = {}
+    # LRU of compiled validators, key -> (resolved schema the validator was built from, validator)
+    _validator_cache: OrderedDict[str, tuple[dict[str, Any], Any]] = OrderedDict()
+    _validator_cache_lock = threading.Lock()
 
     @classmethod
     def load_mappings_data(cls, skip_cache: bool = False) -> bool:
         """
         Load the resource mappings and definitions data.
 
+        Kinds and definitions are read lazily from the schema store (see `ocp_resources.utils.schema_store`), the
+        whole archive is only parsed if the store is not available.
+
         Returns:
             bool: True if loaded successfully, False otherwise
         """
@@ -37,6 +65,13 @@ class SchemaValidator:
             if not skip_cache:
                 return True
 
+        if RESOURCES_MAPPING_ARCHIVE.exists() and DEFINITIONS_FILE.exists():
+            store = open_schema_store(mappings_file=RESOURCES_MAPPING_FILE, definitions_file=DEFINITIONS_FILE)
+            if store:
+                cls._mappings_data = store.mappings
+                cls._definitions_data = store.definitions
+                return True
+
         # Load mappings from archive
         if RESOURCES_MAPPING_ARCHIVE.exists():
             try:
@@ -65,7 +100,7 @@ class SchemaValidator:
         return True
 
     @classmethod
-    def get_mappings_data(cls, skip_cache: bool = False) -> dict[str, Any] | None:
+    def get_mappings_data(cls, skip_cache: bool = False) -> Mapping[str, Any] | None:
         """
         Get the resource mappings data.
 
@@ -73,7 +108,7 @@ class SchemaValidator:
         encapsulation. It ensures the data is loaded before returning.
 
         Returns:
-            dict[str, Any] | None: The mappings data or None if not loaded
+            Mapping[str, Any] | None: The mappings data (read-only) or None if not loaded
         """
         # Ensure data is loaded
         if cls._mappings_data is None or skip_cache:
@@ -81,7 +116,26 @@ class SchemaValidator:
         return cls._mappings_data
 
     @classmethod
-    def get_definitions_data(cls) -> dict[str, Any] | None:
+    def get_mappings_summary(cls) -> Mapping[str, Any] | None:
+        """
+        Get the resource mappings with only `x-kubernetes-group-version-kind` and `namespaced` of each schema.
+
+        Cheaper than `get_mappings_data` for iterating all kinds, falls back to the full mappings data if the schema
+        store is not available.
+
+        Returns:
+            Mapping[str, Any] | None: The mappings summary or None if not loaded
+        """
+        if cls._mappings_data is None:
+            cls.load_mappings_data()
+
+        if isinstance(cls._mappings_data, SchemaStoreTable):
+            return cls._mappings_data.store.summaries
+
+        return cls._mappings_data
+
+    @classmethod
+    def get_definitions_data(cls) -> Mapping[str, Any] | None:
         """
         Get the resource definitions data.
 
@@ -89,7 +143,7 @@ class SchemaValidator:
         encapsulation. It ensures the data is loaded before returning.
 
         Returns:
-            dict[str, Any] | None: The definitions data or None if not loaded
+            Mapping[str, Any] | None: The definitions data or None if not loaded
         """
         # Ensure data is loaded
         if cls._definitions_data is None:
@@ -254,16 +308,69 @@ class SchemaValidator:
         Raises:
             jsonschema.ValidationError: If validation fails
         """
-        schema = cls.load_schema(kind=kind, api_group=api_group)
-        if not schema:
+        validator = cls.get_validator(kind=kind, api_group=api_group)
+        if validator is None:
             LOGGER.debug(f"No schema found for {kind}, skipping validation")
             return
 
-        try:
-            jsonschema.validate(instance=resource_dict, schema=schema)
-        except jsonschema.ValidationError:
-            # Re-raise as-is so caller can format the error
-            raise
+        # Same error selection as `jsonschema.validate`, without re-checking the schema and re-building the validator
+        error = jsonschema.exceptions.best_match(validator.iter_errors(resource_dict))
+        if error is not None:
+            raise error
+
+    @classmethod
+    def get_validator(cls, kind: str, api_group: str | None = None) -> Any:
+        """
+        Get the compiled validator of a resource kind.
+
+        Validators are built once per (api_group, kind) and kept in an LRU cache, its size is taken from
+        `OPENSHIFT_PYTHON_WRAPPER_SCHEMA_VALIDATOR_CACHE_SIZE` environment variable (defaults to 128).
+
+        Args:
+            kind: The resource kind (e.g., "Pod", "Deployment")
+            api_group: Optional API group to disambiguate resources with same kind
+
+        Returns:
+            jsonschema validator or None if no schema found
+        """
+        schema = cls.load_schema(kind=kind, api_group=api_group)
+        if not schema:
+            return None
+
+        cache_key = f"{api_group}:{kind}" if api_group else kind
+        with cls._validator_cache_lock:
+            cached = cls._validator_cache.get(cache_key)
+            # The schema cache may have been cleared or reloaded since the validator was built
+            if cached and cached[0] is schema:
+                cls._validator_cache.move_to_end(cache_key)
+                return cached[1]
+
+        validator_class = jsonschema.validators.validator_for(schema)
+        validator_class.check_schema(schema)
+        validator = validator_class(schema)
+
+        with cls._validator_cache_lock:
+            cls._validator_cache[cache_key] = (schema, validator)
+            cls._validator_cache.move_to_end(cache_key)
+            max_size = int(os.environ.get(VALIDATOR_CACHE_SIZE_ENV, DEFAULT_VALIDATOR_CACHE_SIZE))
+            while len(cls._validator_cache) > max(max_size, 1):
+                evicted_key, _ = cls._validator_cache.popitem(last=False)
+                cls._schema_cache.pop(evicted_key, None)
+
+        return validator
+
+    @classmethod
+    def warm_up(cls, kinds: list[str] | tuple[str, ...] | None = None) -> list[str]:
+        """
+        Compile validators ahead of the first create/update, e.g. in a session-scoped fixture.
+
+        Args:
+            kinds: Resource kinds to compile, defaults to `CORE_KINDS`
+
+        Returns:
+            list[str]: Kinds that have a compiled validator
+        """
+        return [kind for kind in kinds or CORE_KINDS if cls.get_validator(kind=kind) is not None]
 
     @classmethod
     def format_validation_error(
@@ -320,8 +427,11 @@ class SchemaValidator:
     def clear_cache(cls) -> None:
         """Clear the schema cache (useful for testing).
 
-        This only clears the _schema_cache which contains resolved schemas.
+        This only clears the _schema_cache which contains resolved schemas
+        and the compiled validators built from them.
         It does not clear _mappings_data or _definitions_data which are
         loaded from files.
         """
         cls._schema_cache.clear()
+        with cls._validator_cache_lock:
+            cls._validator_cache.clear()
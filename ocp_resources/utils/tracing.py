@@ -0,0 +1,165 @@
+"""OpenTelemetry tracing of resource operations.
+
+When `opentelemetry-api` is installed, resource operations (create, delete, update, wait_for_*), `Pod.execute`,
+`ResourceEditor` update/restore and the class generator schema stages run in a span, and `get_client()` clients
+trace every API request as a child CLIENT span. Waits set their polling stats (mode, polls, api_calls) on their span.
+Spans are exported by the tracer provider configured by the application, e.g.:
+
+    from opentelemetry import trace
+    from opentelemetry.sdk.trace import TracerProvider
+
+    trace.set_tracer_provider(TracerProvider())
+
+Without `opentelemetry-api`, `traced` returns the decorated function as is and nothing is traced.
+"""
+
+import contextlib
+import functools
+from collections.abc import Callable, Generator, Mapping
+from types import ModuleType
+from typing import Any
+
+from kubernetes.client.rest import ApiException
+
+from ocp_resources.utils.instrumentation import request_verb_and_resource
+
+trace: ModuleType | None
+try:
+    from opentelemetry import trace
+except ImportError:
+    trace = None
+
+TRACER_NAME: str = "ocp_resources"
+
+
+def tracing_available() -> bool:
+    """
+    Check if spans can be created, i.e. `opentelemetry-api` is installed.
+
+    Returns:
+        bool: True if `opentelemetry-api` is installed.
+    """
+    return trace is not None
+
+
+@contextlib.contextmanager
+def start_span(
+    name: str, attributes: Mapping[str, Any] | None = None, client: bool = False
+) -> Generator[Any, None, None]:
+    """
+    Run the context in a new span, child of the current one. Exceptions are recorded on the span.
+
+    Args:
+        name (str): Span name.
+        attributes (Mapping[str, Any], optional): Span attributes, None values are skipped.
+        client (bool): Create a CLIENT span (outgoing request) instead of an INTERNAL one.
+
+    Yields:
+        opentelemetry.trace.Span | None: The span, None if `opentelemetry-api` is not installed.
+    """
+    if trace is None:
+        yield None
+        return
+
+    with trace.get_tracer(TRACER_NAME).start_as_current_span(
+        name=name,
+        kind=trace.SpanKind.CLIENT if client else trace.SpanKind.INTERNAL,
+        attributes=_span_attributes(attributes=attributes),
+    ) as span:
+        yield span
+
+
+def set_span_attributes(attributes: Mapping[str, Any]) -> None:
+    """
+    Set attributes on the current span, if any.
+
+    Args:
+        attributes (Mapping[str, Any]): Span attributes, None values are skipped.
+    """
+    if trace is None:
+        return
+
+    span = trace.get_current_span()
+    if span.is_recording():
+        span.set_attributes(_span_attributes(attributes=attributes))
+
+
+def _span_attributes(attributes: Mapping[str, Any] | None) -> dict[str, Any]:
+    return {key: value for key, value in (attributes or {}).items() if value is not None}
+
+
+def _resource_attributes(obj: Any) -> dict[str, Any]:
+    return {
+        "k8s.resource.kind": getattr(obj, "kind", None),
+        "k8s.resource.name": getattr(obj, "name", None),
+        "k8s.namespace.name": getattr(obj, "namespace", None),
+    }
+
+
+def traced(name: str | None = None) -> Callable[[Callable[..., Any]], Callable[..., Any]]:
+    """
+    Decorator running a method in a span.
+
+    Without `name`, the span of a resource method is named `<kind>.<method>` and carries the resource kind, name and
+    namespace.
+
+    Args:
+        name (str, optional): Span name.
+    """
+
+    def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
+        if trace is None:
+            return func
+
+        @functools.wraps(func)
+        def wrapper(*args: Any, **kwargs: Any) -> Any:
+            obj = args[0] if args else None
+            span_name = name or f"{getattr(obj, 'kind', None) or type(obj).__name__}.{func.__name__}"
+            with start_span(name=span_name, attributes=_resource_attributes(obj=obj) if name is None else None):
+                return func(*args, **kwargs)
+
+        return wrapper
+
+    return decorator
+
+
+def install_tracing(api_client: Any) -> None:
+    """
+    Trace the requests of an API client as CLIENT spans. No-op if `opentelemetry-api` is not installed.
+
+    Args:
+        api_client (kubernetes.client.ApiClient): API client, e.g. `DynamicClient.client`.
+    """
+    if trace is None:
+        return
+
+    rest_client = api_client.rest_client
+    request = rest_client.request
+
+    def _traced_request(method: str, url: str, query_params: Any = None, *args: Any, **kwargs: Any) -> Any:
+        verb, resource, namespace = request_verb_and_resource(method=method, url=url, query_params=query_params)
+        with start_span(
+            name=f"{verb} {resource}" if resource else method.upper(),
+            attributes={
+                "http.request.method": method.upper(),
+                "url.full": url,
+                "k8s.verb": verb,
+                "k8s.resource": resource or None,
+                "k8s.namespace.name": namespace or None,
+            },
+            client=True,
+        ) as span:
+            try:
+                response = request(method, url, query_params, *args, **kwargs)
+            except ApiException as exp:
+                if exp.status:
+                    span.set_attribute("http.response.status_code", exp.status)
+                raise
+
+            status = getattr(response, "status", None)
+            if status is not None:
+                span.set_attribute("http.response.status_code", status)
+
+            return response
+
+    rest_client.request = _traced_request
@@ -1,4 +1,6 @@
+import os
 import re
+import tempfile
 
 import yaml
 from simple_logger.logger import get_logger
@@ -161,3 +163,27 @@ def convert_camel_case_to_snake_case(name: str) -> str:
                 last_capital_char = True
 
     return formatted_str
+
+
+def user_cache_dir(name: str, env_var: str | None = None) -> str:
+    """
+    Get (and create) a cache directory of openshift-python-wrapper.
+
+    Args:
+        name (str): Cache subdirectory name.
+        env_var (str, optional): Environment variable overriding the directory.
+
+    Returns:
+        str: `$<env_var>` if set, else `$XDG_CACHE_HOME/openshift-python-wrapper/<name>` (`~/.cache/...`).
+            Falls back to the system temp directory if the directory cannot be created.
+    """
+    cache_dir = (env_var and os.environ.get(env_var)) or os.path.join(
+        os.environ.get("XDG_CACHE_HOME") or os.path.expanduser("~/.cache"), "openshift-python-wrapper", name
+    )
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+    except OSError as exp:
+        LOGGER.warning(f"Cannot create cache directory {cache_dir}, using temp directory: {exp}")
+        return tempfile.gettempdir()
+
+    return cache_dir
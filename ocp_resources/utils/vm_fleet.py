@@ -0,0 +1,370 @@
+"""Fleet level VirtualMachine lifecycle.
+
+`VirtualMachine.start/stop/restart(wait=True)` poll each VM on its own. `VirtualMachineFleet` sends the lifecycle
+requests of many VMs on a bounded thread pool, then waits on all of them through one watch on VMs and one on VMIs per
+namespace (see `ListWatcher`), reporting a phase histogram while waiting and the time to ready of each VM.
+"""
+
+import queue
+import threading
+import time
+from collections import Counter
+from collections.abc import Callable, Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+from simple_logger.logger import get_logger
+from timeout_sampler import TimeoutExpiredError, TimeoutWatch
+
+from ocp_resources.utils.constants import (
+    DEFAULT_CLUSTER_RETRY_EXCEPTIONS,
+    PROTOCOL_ERROR_EXCEPTION_DICT,
+    TIMEOUT_4MINUTES,
+    TIMEOUT_10SEC,
+)
+from ocp_resources.utils.pod_exec import DEFAULT_FAN_OUT_WORKERS
+from ocp_resources.utils.wait_engine import ListWatcher, WaitStats
+
+if TYPE_CHECKING:
+    from ocp_resources.virtual_machine import VirtualMachine
+
+LOGGER = get_logger(name=__name__)
+
+VM_KIND: str = "VirtualMachine"
+VMI_KIND: str = "VirtualMachineInstance"
+VMI_RUNNING_PHASE: str = "Running"
+UNKNOWN_PHASE: str = "Unknown"
+ERROR_PHASE: str = "Error"
+_WATCH_FAILED: str = "FAILED"
+# Longest single watch request, a finished wait stops its watch threads within it
+FLEET_WATCH_TIMEOUT: int = TIMEOUT_10SEC
+
+
+@dataclass
+class VMFleetMember:
+    """
+    Lifecycle state of one VM of a fleet, as last seen by the fleet watches.
+    """
+
+    vm: "VirtualMachine"
+    requested_at: float = field(default_factory=time.monotonic)
+    ready_at: float | None = None
+    vm_ready: bool | None = None
+    printable_status: str | None = None
+    vmi_phase: str | None = None
+    vmi_uid: str | None = None
+    # VMI replaced by a restart, not ready until a new VMI runs
+    replaced_vmi_uid: str | None = None
+    error: Exception | None = None
+
+    @property
+    def phase(self) -> str:
+        """
+        VMI phase (e.g. Scheduling, Scheduled, Running), else the VM printable status (e.g. Stopped).
+        """
+        if self.error:
+            return ERROR_PHASE
+
+        return self.vmi_phase or self.printable_status or UNKNOWN_PHASE
+
+    @property
+    def time_to_ready(self) -> float | None:
+        """
+        Seconds from the last lifecycle request (or the fleet creation) to the VM reaching the awaited status.
+        """
+        return None if self.ready_at is None else self.ready_at - self.requested_at
+
+    def is_ready(self, status: bool | None) -> bool:
+        if status is True:
+            return (
+                bool(self.vm_ready)
+                and self.vmi_phase == VMI_RUNNING_PHASE
+                and (self.replaced_vmi_uid is None or self.vmi_uid != self.replaced_vmi_uid)
+            )
+
+        return not self.vm_ready and self.vmi_uid is None
+
+
+@dataclass
+class VMFleetStatus:
+    """
+    Status of a fleet wait.
+    """
+
+    members: list[VMFleetMember]
+    stats: WaitStats = field(default_factory=WaitStats)
+
+    @property
+    def histogram(self) -> dict[str, int]:
+        """
+        Number of VMs per phase, e.g. {"Scheduling": 120, "Scheduled": 80, "Running": 300}.
+        """
+        return dict(Counter(member.phase for member in self.members))
+
+    @property
+    def ready(self) -> list[VMFleetMember]:
+        return [member for member in self.members if member.ready_at is not None]
+
+    @property
+    def pending(self) -> list[VMFleetMember]:
+        return [member for member in self.members if member.ready_at is None and member.error is None]
+
+    @property
+    def failed(self) -> list[VMFleetMember]:
+        return [member for member in self.members if member.error is not None]
+
+    @property
+    def times_to_ready(self) -> dict[str, float]:
+        """
+        Time to ready in seconds of each ready VM, keyed by `<namespace>/<name>`.
+        """
+        return {
+            f"{member.vm.namespace}/{member.vm.name}": member.time_to_ready
+            for member in self.members
+            if member.time_to_ready is not None
+        }
+
+
+class VirtualMachineFleet:
+    """
+    Start, stop and restart many VMs and wait for all of them with one watch per kind and namespace.
+
+    Example:
+        fleet = VirtualMachineFleet(vms=vms)
+        status = fleet.start(wait=True, timeout=TIMEOUT_10MINUTES)
+        status.times_to_ready
+    """
+
+    def __init__(
+        self,
+        vms: Iterable["VirtualMachine"],
+        max_workers: int = DEFAULT_FAN_OUT_WORKERS,
+        sleep: float = 1,
+    ) -> None:
+        """
+        Args:
+            vms (Iterable): VMs of the fleet.
+            max_workers (int): Number of lifecycle requests sent at a time.
+            sleep (float): Back-off after a transient watch error or an early closed watch.
+        """
+        self.members: dict[tuple[str | None, str | None], VMFleetMember] = {
+            (vm.namespace, vm.name): VMFleetMember(vm=vm) for vm in vms
+        }
+        self.max_workers = max_workers
+        self.sleep = sleep
+        self.status: VMFleetStatus | None = None
+
+    def start(self, wait: bool = False, timeout: int = TIMEOUT_4MINUTES) -> VMFleetStatus | None:
+        """
+        Start all the VMs.
+
+        Args:
+            wait (bool): Wait for all the VMs to be ready.
+            timeout (int): Time to wait for the fleet.
+
+        Returns:
+            VMFleetStatus | None: Fleet status if waited.
+        """
+        self._request(action="start")
+        return self.wait_for_ready_status(status=True, timeout=timeout) if wait else None
+
+    def stop(self, wait: bool = False, timeout: int = TIMEOUT_4MINUTES) -> VMFleetStatus | None:
+        """
+        Stop all the VMs.
+
+        Args:
+            wait (bool): Wait for all the VMs to be stopped and their VMIs deleted.
+            timeout (int): Time to wait for the fleet.
+
+        Returns:
+            VMFleetStatus | None: Fleet status if waited.
+        """
+        self._request(action="stop")
+        return self.wait_for_ready_status(status=None, timeout=timeout) if wait else None
+
+    def restart(self, wait: bool = False, timeout: int = TIMEOUT_4MINUTES) -> VMFleetStatus | None:
+        """
+        Restart all the VMs.
+
+        Args:
+            wait (bool): Wait for all the VMs to run a new VMI.
+            timeout (int): Time to wait for the fleet.
+
+        Returns:
+            VMFleetStatus | None: Fleet status if waited.
+        """
+        # Remember the running VMIs, one list per namespace, to wait for their replacements
+        for namespace, vm in self._vm_by_namespace().items():
+            vmi_uids = {
+                vmi["metadata"]["name"]: vmi["metadata"]["uid"]
+                for vmi in ListWatcher(api=vm.vmi.api, namespace=namespace).list()
+            }
+            for (member_namespace, name), member in self.members.items():
+                if member_namespace == namespace:
+                    member.replaced_vmi_uid = vmi_uids.get(name)
+
+        self._request(action="restart")
+        return self.wait_for_ready_status(status=True, timeout=timeout) if wait else None
+
+    def wait_for_ready_status(
+        self,
+        status: bool | None,
+        timeout: int = TIMEOUT_4MINUTES,
+        progress_callback: Callable[[VMFleetStatus], None] | None = None,
+    ) -> VMFleetStatus:
+        """
+        Wait for all the VMs to reach a ready status, see `VirtualMachine.wait_for_ready_status`.
+
+        VMs whose lifecycle request failed are not waited for.
+
+        Args:
+            status (bool | None): True for running VMs (VM ready and its VMI running), None for stopped VMs (VM not
+                ready and no VMI).
+            timeout (int): Time to wait for the fleet.
+            progress_callback (Callable, optional): Called with the fleet status whenever the phase histogram changes.
+
+        Returns:
+            VMFleetStatus: Fleet status, also kept in `status`.
+
+        Raises:
+            TimeoutExpiredError: If not all the VMs reached the status in time.
+        """
+        for member in self.members.values():
+            member.ready_at = None
+
+        watchers = {
+            (kind, namespace): ListWatcher(
+                api=api,
+                namespace=namespace,
+                exceptions_dict={**PROTOCOL_ERROR_EXCEPTION_DICT, **DEFAULT_CLUSTER_RETRY_EXCEPTIONS},
+                sleep=self.sleep,
+                watch_timeout=FLEET_WATCH_TIMEOUT,
+            )
+            for namespace, vm in self._vm_by_namespace().items()
+            for kind, api in ((VM_KIND, vm.api), (VMI_KIND, vm.vmi.api))
+        }
+        self.status = VMFleetStatus(members=list(self.members.values()))
+        LOGGER.info(
+            f"Wait for {len(self.members)} VMs to be {'ready' if status is True else status}, "
+            f"watching {len(watchers)} VM and VMI lists"
+        )
+
+        events: queue.Queue[tuple[str, str | None, str, Any]] = queue.Queue()
+        stop_event = threading.Event()
+        # (kind, namespace) of the lists received so far
+        listed: set[tuple[str, str | None]] = set()
+
+        def _watch(kind: str, namespace: str | None, list_watcher: ListWatcher) -> None:
+            try:
+                for event_type, payload in list_watcher.stream(timeout=timeout, stop_event=stop_event):
+                    if stop_event.is_set():
+                        return
+
+                    events.put((kind, namespace, event_type, payload))
+            except Exception as exp:
+                events.put((kind, namespace, _WATCH_FAILED, exp))
+
+        for (kind, namespace), list_watcher in watchers.items():
+            threading.Thread(
+                target=_watch, args=(kind, namespace, list_watcher), daemon=True, name=f"vm-fleet-{kind}-{namespace}"
+            ).start()
+
+        timeout_watch = TimeoutWatch(timeout=timeout)
+        histogram = self.status.histogram
+        try:
+            while self.status.pending:
+                remaining_time = timeout_watch.remaining_time()
+                if remaining_time <= 0:
+                    raise TimeoutExpiredError(
+                        value=f"{len(self.status.pending)} of {len(self.members)} VMs not "
+                        f"{'ready' if status is True else status}: {self.status.histogram}",
+                        elapsed_time=timeout,
+                    )
+
+                try:
+                    kind, namespace, event_type, payload = events.get(timeout=min(remaining_time, TIMEOUT_10SEC))
+                except queue.Empty:
+                    continue
+
+                if event_type == _WATCH_FAILED:
+                    raise payload
+
+                self._apply_event(kind=kind, namespace=namespace, event_type=event_type, payload=payload)
+                if event_type == "LIST":
+                    listed.add((kind, namespace))
+
+                for member in self.status.pending:
+                    # Until both lists of its namespace arrived, a member without a VMI may just not be listed yet
+                    if {(VM_KIND, member.vm.namespace), (VMI_KIND, member.vm.namespace)} <= listed and member.is_ready(
+                        status=status
+                    ):
+                        member.ready_at = time.monotonic()
+
+                if self.status.histogram != histogram:
+                    histogram = self.status.histogram
+                    LOGGER.info(f"VM fleet: {histogram}")
+                    if progress_callback:
+                        progress_callback(self.status)
+
+            return self.status
+
+        finally:
+            stop_event.set()
+            self.status.stats = _sum_stats(stats=[list_watcher.stats for list_watcher in watchers.values()])
+            LOGGER.debug(f"VM fleet wait stats: {self.status.stats}")
+
+    def _vm_by_namespace(self) -> dict[str | None, "VirtualMachine"]:
+        return {namespace: member.vm for (namespace, _), member in self.members.items()}
+
+    def _request(self, action: str) -> None:
+        LOGGER.info(f"{action.capitalize()} {len(self.members)} VMs, {self.max_workers} at a time")
+        with ThreadPoolExecutor(
+            max_workers=max(min(self.max_workers, len(self.members)), 1), thread_name_prefix="ocp-resources-vm-fleet"
+        ) as executor:
+            futures = {}
+            for member in self.members.values():
+                member.requested_at = time.monotonic()
+                member.error = None
+                futures[executor.submit(member.vm.api_request, method="PUT", action=action)] = member
+
+            for future in as_completed(futures):
+                member = futures[future]
+                try:
+                    future.result()
+                except Exception as exp:
+                    LOGGER.error(f"Failed to {action} {member.vm.kind} {member.vm.namespace}/{member.vm.name}: {exp}")
+                    member.error = exp
+
+    def _apply_event(self, kind: str, namespace: str | None, event_type: str, payload: Any) -> None:
+        if event_type == "LIST":
+            # Objects missing from a (re-)list are gone
+            listed = {_object["metadata"]["name"]: _object for _object in payload}
+            for (member_namespace, name), listed_member in self.members.items():
+                if member_namespace == namespace:
+                    _update_member(member=listed_member, kind=kind, resource_dict=listed.get(name))
+
+            return
+
+        member = self.members.get((namespace, payload.get("metadata", {}).get("name")))
+        if member:
+            _update_member(member=member, kind=kind, resource_dict=None if event_type == "DELETED" else payload)
+
+
+def _update_member(member: VMFleetMember, kind: str, resource_dict: dict[str, Any] | None) -> None:
+    resource_status = (resource_dict or {}).get("status") or {}
+    if kind == VM_KIND:
+        member.vm_ready = resource_status.get("ready")
+        member.printable_status = resource_status.get("printableStatus")
+    else:
+        member.vmi_uid = resource_dict["metadata"].get("uid") if resource_dict else None
+        member.vmi_phase = resource_status.get("phase")
+
+
+def _sum_stats(stats: list[WaitStats]) -> WaitStats:
+    total = WaitStats()
+    for _stats in stats:
+        for name in ("api_calls", "list_calls", "watch_calls", "relists", "events", "polls"):
+            setattr(total, name, getattr(total, name) + getattr(_stats, name))
+
+    return total
@@ -0,0 +1,270 @@
+"""Batched VirtualMachineInstance diagnostics.
+
+The `VirtualMachineInstance` virsh helpers look up the virt-launcher pod and detect the hypervisor connection URI on
+every call, then open one exec per command. A `VMIDiagnosticsSession` resolves the launcher pod, its user uid and the
+connection URI once and runs the virsh commands over one exec session (see `PodExecSession`).
+`collect_vmi_diagnostics` takes snapshots of many VMIs in parallel, listing the launcher pods once per namespace.
+"""
+
+from collections import defaultdict
+from collections.abc import Generator, Iterable
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any
+
+import xmltodict
+from kubernetes.dynamic import DynamicClient
+from simple_logger.logger import get_logger
+
+from ocp_resources.pod import Pod
+from ocp_resources.utils.constants import LIBVIRT_RUN_DIR, TIMEOUT_1MINUTE
+from ocp_resources.utils.pod_exec import DEFAULT_FAN_OUT_WORKERS, PodExecSession
+
+if TYPE_CHECKING:
+    from ocp_resources.virtual_machine_instance import VirtualMachineInstance
+
+LOGGER = get_logger(name=__name__)
+
+DEFAULT_VIRSH_ACTIONS: tuple[str, ...] = ("domstate", "dommemstat", "dumpxml")
+VIRT_LAUNCHER_CONTAINER: str = "compute"
+VIRT_LAUNCHER_LABEL_SELECTOR: str = "kubevirt.io=virt-launcher"
+VIRT_LAUNCHER_CREATED_BY_LABEL: str = "kubevirt.io/created-by"
+
+
+@dataclass
+class VMIDiagnostics:
+    """
+    Diagnostics snapshot of a VMI.
+
+    `outputs` holds the output of each virsh action that succeeded and `errors` the stderr of each one that failed.
+    `error` is set if the snapshot could not be taken at all (e.g. no launcher pod or the exec failed).
+    """
+
+    vmi: "VirtualMachineInstance"
+    pod: str = ""
+    node: str = ""
+    user_uid: int | None = None
+    hypervisor_uri: str = ""
+    outputs: dict[str, str] = field(default_factory=dict)
+    errors: dict[str, str] = field(default_factory=dict)
+    error: Exception | None = None
+
+    @property
+    def succeeded(self) -> bool:
+        return self.error is None and not self.errors
+
+    @property
+    def domstate(self) -> str:
+        return self.outputs.get("domstate", "").strip()
+
+    @property
+    def dommemstat(self) -> dict[str, int]:
+        """
+        Domain memory stats, e.g. {"actual": 2097152, "rss": 482716}.
+        """
+        stats: dict[str, int] = {}
+        for line in self.outputs.get("dommemstat", "").splitlines():
+            name, _, value = line.strip().partition(" ")
+            if value.strip().isdigit():
+                stats[name] = int(value)
+
+        return stats
+
+    @property
+    def xml_dict(self) -> dict[str, Any]:
+        xml = self.outputs.get("dumpxml")
+        return xmltodict.parse(xml_input=xml, process_namespaces=True) if xml else {}
+
+
+class VMIDiagnosticsSession:
+    """
+    Run virsh commands for a VMI, resolving its virt-launcher pod and hypervisor connection URI once.
+
+    Example:
+        with VMIDiagnosticsSession(vmi=vmi) as session:
+            snapshot = session.snapshot()
+            session.virsh(action="domblklist")
+    """
+
+    def __init__(
+        self,
+        vmi: "VirtualMachineInstance",
+        privileged_client: DynamicClient | None = None,
+        pod: Pod | None = None,
+    ) -> None:
+        """
+        Args:
+            vmi (VirtualMachineInstance): VMI to inspect.
+            privileged_client (DynamicClient, optional): Client with elevated privileges for the launcher pod.
+            pod (Pod, optional): The virt-launcher pod, looked up on first use if not given.
+        """
+        self.vmi = vmi
+        self.client = privileged_client or vmi.client
+        self._pod = pod
+        self._hypervisor_uri: str | None = None
+        self._exec_session: PodExecSession | None = None
+
+    def __enter__(self) -> "VMIDiagnosticsSession":
+        return self
+
+    def __exit__(self, *args: Any) -> None:
+        self.close()
+
+    @property
+    def pod(self) -> Pod:
+        if self._pod is None:
+            self._pod = self.vmi.get_virt_launcher_pod(privileged_client=self.client)
+
+        return self._pod
+
+    @property
+    def exec_session(self) -> PodExecSession:
+        if self._exec_session is None:
+            self._exec_session = PodExecSession(pod=self.pod, container=VIRT_LAUNCHER_CONTAINER)
+
+        return self._exec_session
+
+    @property
+    def user_uid(self) -> int | None:
+        return self.vmi.get_pod_user_uid(pod=self.pod)
+
+    @property
+    def hypervisor_uri(self) -> str:
+        if self._hypervisor_uri is None:
+            if self.vmi.is_pod_root(pod=self.pod):
+                self._hypervisor_uri = ""
+            else:
+                self._hypervisor_uri = self.vmi.hypervisor_connection_uri_from_libvirt_dir(
+                    libvirt_dir_listing=self.exec_session.run(command=["ls", LIBVIRT_RUN_DIR])
+                )
+
+        return self._hypervisor_uri
+
+    def virsh(self, action: str, timeout: int = TIMEOUT_1MINUTE) -> str:
+        """
+        Run a virsh action on the VMI domain.
+
+        Args:
+            action (str): The virsh action to perform (e.g., 'dumpxml', 'domstate').
+            timeout (int): Time to wait for the command.
+
+        Returns:
+            str: Command output.
+
+        Raises:
+            ExecOnPodError: If the command failed.
+        """
+        return self.exec_session.run(
+            command=self.vmi.virsh_cmd(action=action, hypervisor_uri=self.hypervisor_uri), timeout=timeout
+        )
+
+    def snapshot(
+        self, actions: Iterable[str] = DEFAULT_VIRSH_ACTIONS, timeout: int = TIMEOUT_1MINUTE
+    ) -> VMIDiagnostics:
+        """
+        Run virsh actions in one exec and collect their outputs.
+
+        Args:
+            actions (Iterable): The virsh actions to perform.
+            timeout (int): Time to wait for all the commands.
+
+        Returns:
+            VMIDiagnostics: Snapshot, failures are set on it instead of raised.
+        """
+        actions = list(actions)
+        diagnostics = VMIDiagnostics(vmi=self.vmi)
+        try:
+            diagnostics.pod = self.pod.name or ""
+            diagnostics.node = self.pod.known_instance.spec.nodeName or ""
+            diagnostics.user_uid = self.user_uid
+            diagnostics.hypervisor_uri = self.hypervisor_uri
+            results = self.exec_session.execute_many(
+                commands=[
+                    self.vmi.virsh_cmd(action=action, hypervisor_uri=diagnostics.hypervisor_uri) for action in actions
+                ],
+                timeout=timeout,
+            )
+        except Exception as exp:
+            LOGGER.warning(
+                f"Failed to collect diagnostics of {self.vmi.kind} {self.vmi.namespace}/{self.vmi.name}: {exp}"
+            )
+            diagnostics.error = exp
+            return diagnostics
+
+        for action, result in zip(actions, results, strict=True):
+            if result.rc:
+                diagnostics.errors[action] = result.stderr or f"rc {result.rc}"
+            else:
+                diagnostics.outputs[action] = result.stdout
+
+        return diagnostics
+
+    def close(self) -> None:
+        """
+        Close the exec session.
+        """
+        if self._exec_session is not None:
+            self._exec_session.close()
+
+
+def collect_vmi_diagnostics(
+    vmis: Iterable["VirtualMachineInstance"],
+    actions: Iterable[str] = DEFAULT_VIRSH_ACTIONS,
+    privileged_client: DynamicClient | None = None,
+    timeout: int = TIMEOUT_1MINUTE,
+    max_workers: int = DEFAULT_FAN_OUT_WORKERS,
+) -> Generator[VMIDiagnostics, None, None]:
+    """
+    Take a diagnostics snapshot of many VMIs in parallel, yielding snapshots as they finish.
+
+    The virt-launcher pods are listed once per namespace, then each VMI costs one GET and one exec.
+
+    Args:
+        vmis (Iterable): VMIs to inspect.
+        actions (Iterable): The virsh actions to perform on each VMI.
+        privileged_client (DynamicClient, optional): Client with elevated privileges for the launcher pods.
+        timeout (int): Time to wait for the commands of each VMI.
+        max_workers (int): Number of VMIs to inspect at a time.
+
+    Yields:
+        VMIDiagnostics: Snapshot of each VMI, in completion order.
+    """
+    vmis = list(vmis)
+    if not vmis:
+        return
+
+    actions = list(actions)
+    # VMI uid -> its launcher pods
+    launcher_pods: dict[str, list[Pod]] = defaultdict(list)
+    vmi_by_namespace = {vmi.namespace: vmi for vmi in vmis}
+    for namespace, vmi in vmi_by_namespace.items():
+        for pod in Pod.get(
+            client=privileged_client or vmi.client, namespace=namespace, label_selector=VIRT_LAUNCHER_LABEL_SELECTOR
+        ):
+            vmi_uid: str | None = (pod.known_instance.metadata.labels or {}).get(VIRT_LAUNCHER_CREATED_BY_LABEL)
+            # Not created for a VMI
+            if vmi_uid:
+                launcher_pods[vmi_uid].append(pod)
+
+    def _snapshot(vmi: "VirtualMachineInstance") -> VMIDiagnostics:
+        try:
+            vmi_instance = vmi.instance
+            pod = vmi._select_virt_launcher_pod(
+                pods=launcher_pods.get(vmi_instance.metadata.uid, []), vmi_instance=vmi_instance
+            )
+        except Exception as exp:
+            return VMIDiagnostics(vmi=vmi, error=exp)
+
+        with VMIDiagnosticsSession(vmi=vmi, privileged_client=privileged_client, pod=pod) as session:
+            return session.snapshot(actions=actions, timeout=timeout)
+
+    max_workers = max(min(max_workers, len(vmis)), 1)
+    LOGGER.info(f"Collect diagnostics of {len(vmis)} VMIs, {max_workers} at a time")
+    executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="ocp-resources-vmi-diagnostics")
+    futures = [executor.submit(_snapshot, vmi) for vmi in vmis]
+    try:
+        for future in as_completed(futures):
+            yield future.result()
+
+    finally:
+        executor.shutdown(wait=False, cancel_futures=True)
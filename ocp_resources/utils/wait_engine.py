@@ -0,0 +1,527 @@
+"""Watch based wait engine for resources.
+
+Waits are driven by a `resourceVersion` resumed watch instead of polling the API server with a full GET every
+`sleep` seconds. The engine lists the watched objects once, watches from the list `resourceVersion` and returns as
+soon as a matching event arrives. The watch is re-listed when the server answers with `410 Gone` and the wait falls
+back to polling only when the client is not allowed to watch the resource.
+"""
+
+import asyncio
+import os
+import threading
+import time
+from collections.abc import Callable, Generator
+from dataclasses import dataclass
+from typing import TYPE_CHECKING, Any
+
+from kubernetes.client.rest import ApiException
+from kubernetes.dynamic.exceptions import ForbiddenError, MethodNotAllowedError, NotFoundError
+from simple_logger.logger import get_logger
+from timeout_sampler import TimeoutExpiredError, TimeoutSampler, TimeoutWatch
+
+from ocp_resources.exceptions import WatchNotPermittedError
+from ocp_resources.utils.async_utils import run_sync
+from ocp_resources.utils.tracing import set_span_attributes
+
+if TYPE_CHECKING:
+    from ocp_resources.utils.retry_policy import RetryPolicy
+
+LOGGER = get_logger(name=__name__)
+
+HTTP_STATUS_GONE: int = 410
+WAIT_WITH_WATCH_ENV: str = "OPENSHIFT_PYTHON_WRAPPER_WAIT_WITH_WATCH"
+
+ExceptionsDict = dict[type[Exception], list[str]]
+
+
+@dataclass
+class WaitStats:
+    """
+    API usage of a single wait.
+
+    Attributes:
+        mode (str): "watch" or "poll"; "poll" is also reported when a watch wait fell back to polling.
+        api_calls (int): Total number of API requests issued by the wait.
+        list_calls (int): Number of LIST/GET requests (initial list, re-lists and polls).
+        watch_calls (int): Number of watch requests opened.
+        relists (int): Number of re-lists caused by `410 Gone` responses.
+        events (int): Number of watch events received.
+        polls (int): Number of polling requests.
+    """
+
+    mode: str = "watch"
+    api_calls: int = 0
+    list_calls: int = 0
+    watch_calls: int = 0
+    relists: int = 0
+    events: int = 0
+    polls: int = 0
+
+
+def wait_with_watch_enabled(use_watch: bool | None = None) -> bool:
+    """
+    Resolve whether a wait should use the watch engine.
+
+    Args:
+        use_watch (bool | None): Explicit per-call choice; if None, `OPENSHIFT_PYTHON_WRAPPER_WAIT_WITH_WATCH`
+            environment variable is used (defaults to "false").
+
+    Returns:
+        bool: True if waits should be watch driven.
+    """
+    if use_watch is not None:
+        return use_watch
+
+    return os.environ.get(WAIT_WITH_WATCH_ENV, "false").lower() == "true"
+
+
+def is_retryable_exception(exp: Exception, exceptions_dict: ExceptionsDict | None) -> bool:
+    """
+    Check if an exception matches an exceptions dict (same semantics as `TimeoutSampler`).
+
+    Args:
+        exp (Exception): Raised exception.
+        exceptions_dict (dict | None): {<exception class>: [<message substrings>]}; None matches any exception.
+
+    Returns:
+        bool: True if the exception should be retried.
+    """
+    if exceptions_dict is None:
+        return True
+
+    for exception_type, messages in exceptions_dict.items():
+        if isinstance(exp, exception_type):
+            if not messages or any(message in str(exp) for message in messages):
+                return True
+
+    return False
+
+
+class ListWatcher:
+    """
+    List and watch a set of objects, resuming the watch from the last seen `resourceVersion`.
+
+    `stream` yields `("LIST", [<object dict>, ...])` after every (re-)list and `(<event type>, <object dict>)` for
+    every ADDED/MODIFIED/DELETED watch event. BOOKMARK events only advance the `resourceVersion`.
+    """
+
+    def __init__(
+        self,
+        api: Any,
+        namespace: str | None = None,
+        field_selector: str | None = None,
+        label_selector: str | None = None,
+        stats: WaitStats | None = None,
+        exceptions_dict: ExceptionsDict | None = None,
+        sleep: float = 1,
+        watch_timeout: int | None = None,
+        retry_policy: "RetryPolicy | None" = None,
+    ) -> None:
+        """
+        Args:
+            api (ResourceInstance): Dynamic client resource API (e.g. `Resource.api`).
+            namespace (str | None): Namespace to list/watch; None for cluster scoped or all namespaces.
+            field_selector (str | None): Field selector for list and watch.
+            label_selector (str | None): Label selector for list and watch.
+            stats (WaitStats | None): Stats object to update.
+            exceptions_dict (dict | None): Transient exceptions to retry on.
+            sleep (float): Time to wait before retrying after a transient error or an early closed watch.
+            watch_timeout (int | None): Maximum duration of a single watch request; None to watch until `timeout`.
+            retry_policy (RetryPolicy | None): Back off with the policy intervals instead of `sleep`, reset on
+                every list and event.
+        """
+        self.api = api
+        self.namespace = namespace
+        self.field_selector = field_selector
+        self.label_selector = label_selector
+        self.stats = stats or WaitStats()
+        self.exceptions_dict = exceptions_dict
+        self.sleep = sleep
+        self.watch_timeout = watch_timeout
+        self.retry_policy = retry_policy
+        self._backoff_intervals: Generator[float, None, None] | None = None
+        self.resource_version: str | None = None
+        self.last_sync_time: float | None = None
+
+    def _selector_kwargs(self) -> dict[str, Any]:
+        kwargs: dict[str, Any] = {}
+        if self.namespace:
+            kwargs["namespace"] = self.namespace
+
+        if self.field_selector:
+            kwargs["field_selector"] = self.field_selector
+
+        if self.label_selector:
+            kwargs["label_selector"] = self.label_selector
+
+        return kwargs
+
+    def list(self) -> list[dict[str, Any]]:
+        """
+        List the watched objects and remember the list `resourceVersion`.
+
+        Returns:
+            list[dict]: Listed objects.
+        """
+        self.stats.api_calls += 1
+        self.stats.list_calls += 1
+        response = self.api.get(**self._selector_kwargs())
+        response_dict = response.to_dict()
+        self.resource_version = response_dict.get("metadata", {}).get("resourceVersion") or None
+        self.last_sync_time = time.monotonic()
+        self._backoff_intervals = None
+        return response_dict.get("items") or []
+
+    def _backoff(self, timeout_watch: TimeoutWatch) -> None:
+        delay = self.sleep
+        if self.retry_policy:
+            if self._backoff_intervals is None:
+                self._backoff_intervals = self.retry_policy.intervals()
+
+            delay = next(self._backoff_intervals)
+
+        time.sleep(min(delay, max(timeout_watch.remaining_time(), 0)))
+
+    def stream(
+        self, timeout: float, stop_event: threading.Event | None = None
+    ) -> Generator[tuple[str, Any], None, None]:
+        """
+        List and watch until `timeout` expires.
+
+        Args:
+            timeout (float): Time in seconds to stream events for; `float("inf")` streams until the generator is
+                closed (requires `watch_timeout`).
+            stop_event (threading.Event | None): Stop streaming once set, checked between watch requests, so a
+                consumer in another thread can end an idle stream within `watch_timeout`.
+
+        Yields:
+            tuple[str, Any]: Event type and payload, see class docstring.
+
+        Raises:
+            WatchNotPermittedError: If the client is not allowed to list or watch the resource.
+        """
+        timeout_watch = TimeoutWatch(timeout=timeout)
+        need_list = True
+
+        while timeout_watch.remaining_time() > 0 and not (stop_event and stop_event.is_set()):
+            try:
+                if need_list:
+                    yield "LIST", self.list()
+                    need_list = False
+
+                remaining = timeout_watch.remaining_time()
+                if remaining <= 0:
+                    return
+
+                watch_timeout = max(int(min(remaining, self.watch_timeout or remaining)), 1)
+                watch_started = TimeoutWatch(timeout=watch_timeout)
+                self.stats.api_calls += 1
+                self.stats.watch_calls += 1
+                for event in self.api.watch(
+                    resource_version=self.resource_version,
+                    timeout=watch_timeout,
+                    allow_watch_bookmarks=True,
+                    **self._selector_kwargs(),
+                ):
+                    event_type = event["type"]
+                    raw_object = event.get("raw_object") or {}
+                    if event_type == "ERROR":
+                        raise ApiException(status=raw_object.get("code"), reason=raw_object.get("message"))
+
+                    self.resource_version = raw_object.get("metadata", {}).get("resourceVersion", self.resource_version)
+                    self.last_sync_time = time.monotonic()
+                    if event_type == "BOOKMARK":
+                        continue
+
+                    self.stats.events += 1
+                    self._backoff_intervals = None
+                    yield event_type, raw_object
+
+                self.last_sync_time = time.monotonic()
+
+                # The watch closed before its timeout (e.g. server side close), back off before resuming it.
+                if watch_started.remaining_time() > 0 and timeout_watch.remaining_time() > 0:
+                    self._backoff(timeout_watch=timeout_watch)
+
+            except (ForbiddenError, MethodNotAllowedError) as exp:
+                if _is_permission_error(exp=exp) or not is_retryable_exception(
+                    exp=exp, exceptions_dict=self.exceptions_dict
+                ):
+                    raise WatchNotPermittedError(reason=str(exp)) from exp
+
+                self._backoff(timeout_watch=timeout_watch)
+
+            except ApiException as exp:
+                if exp.status == HTTP_STATUS_GONE:
+                    LOGGER.debug(f"Watch resourceVersion {self.resource_version} expired, re-listing")
+                    self.stats.relists += 1
+                    self.resource_version = None
+                    need_list = True
+                    continue
+
+                if not is_retryable_exception(exp=exp, exceptions_dict=self.exceptions_dict):
+                    raise
+
+                self._backoff(timeout_watch=timeout_watch)
+
+            except Exception as exp:
+                if not is_retryable_exception(exp=exp, exceptions_dict=self.exceptions_dict):
+                    raise
+
+                self._backoff(timeout_watch=timeout_watch)
+
+
+def _is_permission_error(exp: Exception) -> bool:
+    return isinstance(exp, MethodNotAllowedError) or (
+        isinstance(exp, ForbiddenError) and "context deadline exceeded" not in str(exp)
+    )
+
+
+class ResourceWaiter:
+    """
+    Wait for a single resource to satisfy a predicate.
+
+    The predicate gets the resource dict, or None when the resource does not exist, and returns True when the wait
+    is done. It may raise to stop the wait early (e.g. when a stop status is reached).
+    """
+
+    def __init__(
+        self,
+        resource: Any,
+        timeout: float,
+        sleep: float = 1,
+        exceptions_dict: ExceptionsDict | None = None,
+        use_watch: bool | None = None,
+        retry_policy: "RetryPolicy | None" = None,
+    ) -> None:
+        """
+        Args:
+            resource (Resource): Resource to wait for.
+            timeout (float): Time to wait in seconds.
+            sleep (float): Polling interval, also used as back-off after transient errors in watch mode.
+            exceptions_dict (dict | None): Exceptions to retry on; None retries on any exception.
+            use_watch (bool | None): Use the watch engine; None defers to `OPENSHIFT_PYTHON_WRAPPER_WAIT_WITH_WATCH`.
+            retry_policy (RetryPolicy | None): Poll and back off with the policy intervals instead of `sleep`.
+        """
+        self.resource = resource
+        self.timeout = timeout
+        self.sleep = sleep
+        self.exceptions_dict = exceptions_dict
+        self.use_watch = wait_with_watch_enabled(use_watch=use_watch)
+        self.retry_policy = retry_policy
+        self.stats = WaitStats(mode="watch" if self.use_watch else "poll")
+
+    def wait(self, predicate: Callable[[dict[str, Any] | None], bool]) -> dict[str, Any] | None:
+        """
+        Wait until `predicate` returns True.
+
+        Args:
+            predicate (Callable): Called with the resource dict (or None if the resource does not exist).
+
+        Returns:
+            dict | None: The resource dict that satisfied the predicate.
+
+        Raises:
+            TimeoutExpiredError: If the predicate was not satisfied within the timeout.
+        """
+        self.resource.last_wait_stats = self.stats
+        timeout_watch = TimeoutWatch(timeout=self.timeout)
+        try:
+            if self.use_watch:
+                try:
+                    return self._wait_with_watch(predicate=predicate, timeout_watch=timeout_watch)
+                except WatchNotPermittedError as exp:
+                    LOGGER.warning(
+                        f"Cannot watch {self.resource.kind} {self.resource.name}, falling back to polling: {exp}"
+                    )
+                    self.stats.mode = "poll"
+
+            return self._wait_with_polling(predicate=predicate, timeout=timeout_watch.remaining_time())
+
+        finally:
+            LOGGER.debug(f"{self.resource.kind} {self.resource.name} wait stats: {self.stats}")
+            set_span_attributes(
+                attributes={
+                    "ocp_resources.wait.mode": self.stats.mode,
+                    "ocp_resources.wait.polls": self.stats.polls,
+                    "ocp_resources.wait.api_calls": self.stats.api_calls,
+                    "ocp_resources.wait.events": self.stats.events,
+                    "ocp_resources.wait.relists": self.stats.relists,
+                }
+            )
+
+    async def async_wait(self, predicate: Callable[[dict[str, Any] | None], bool]) -> dict[str, Any] | None:
+        """
+        Wait until `predicate` returns True, without blocking a thread between polls.
+
+        Each poll runs on the shared async thread pool, the wait in between is an `asyncio.sleep`.
+
+        Args:
+            predicate (Callable): Called with the resource dict (or None if the resource does not exist).
+
+        Returns:
+            dict | None: The resource dict that satisfied the predicate.
+
+        Raises:
+            TimeoutExpiredError: If the predicate was not satisfied within the timeout.
+        """
+        self.resource.last_wait_stats = self.stats
+        self.stats.mode = "poll"
+        timeout_watch = TimeoutWatch(timeout=self.timeout)
+        last_exp: Exception | None = None
+        while True:
+            try:
+                sample = await run_sync(self._get)
+            except Exception as exp:
+                if not is_retryable_exception(exp=exp, exceptions_dict=self.exceptions_dict):
+                    raise
+
+                last_exp = exp
+            else:
+                if predicate(sample):
+                    return sample
+
+            remaining = timeout_watch.remaining_time()
+            if remaining <= 0:
+                raise TimeoutExpiredError(
+                    f"Timed out after {self.timeout} seconds waiting for {self.resource.kind} {self.resource.name}",
+                    last_exp=last_exp,
+                    elapsed_time=self.timeout,
+                )
+
+            await asyncio.sleep(min(self.sleep, remaining))
+
+    def _get(self) -> dict[str, Any] | None:
+        self.stats.api_calls += 1
+        self.stats.list_calls += 1
+        self.stats.polls += 1
+        try:
+            return self.resource.instance.to_dict()
+        except NotFoundError:
+            return None
+
+    def _wait_with_polling(
+        self, predicate: Callable[[dict[str, Any] | None], bool], timeout: float
+    ) -> dict[str, Any] | None:
+        samples = (
+            self.retry_policy.sample(
+                func=self._get,
+                timeout=timeout,
+                exceptions_dict=self.exceptions_dict,
+                operation=f"wait for {self.resource.kind} {self.resource.name}",
+            )
+            if self.retry_policy
+            else TimeoutSampler(
+                wait_timeout=timeout, sleep=self.sleep, exceptions_dict=self.exceptions_dict, func=self._get
+            )
+        )
+        for sample in samples:
+            if predicate(sample):
+                return sample
+
+        return None
+
+    def _wait_with_watch(
+        self, predicate: Callable[[dict[str, Any] | None], bool], timeout_watch: TimeoutWatch
+    ) -> dict[str, Any] | None:
+        LOGGER.info(f"Watching {self.resource.kind} {self.resource.name} for up to {self.timeout} seconds")
+        list_watcher = ListWatcher(
+            api=self.resource.api,
+            namespace=self.resource.namespace,
+            field_selector=f"metadata.name={self.resource.name}",
+            stats=self.stats,
+            exceptions_dict=self.exceptions_dict,
+            sleep=self.sleep,
+            retry_policy=self.retry_policy,
+        )
+        current: dict[str, Any] | None = None
+        for event_type, payload in list_watcher.stream(timeout=timeout_watch.remaining_time()):
+            if event_type == "LIST":
+                current = payload[0] if payload else None
+            elif event_type == "DELETED":
+                current = None
+            else:
+                current = payload
+
+            if predicate(current):
+                return current
+
+        raise TimeoutExpiredError(
+            f"Timed out after {self.timeout} seconds waiting for {self.resource.kind} {self.resource.name}",
+            elapsed_time=self.timeout - timeout_watch.remaining_time(),
+        )
+
+
+def wait_for_resources(
+    resources: list[Any],
+    predicate: Callable[[dict[str, Any] | None], bool],
+    timeout: float,
+    sleep: float = 1,
+    exceptions_dict: ExceptionsDict | None = None,
+) -> list[Any]:
+    """
+    Wait for many resources at once, with one list and watch per kind and namespace instead of one per resource.
+
+    Falls back to polling each resource when the client is not allowed to watch its kind.
+
+    Args:
+        resources (list[Resource]): Resources to wait for.
+        predicate (Callable): Called with the dict of a resource (or None if it does not exist), True when the wait
+            of this resource is done.
+        timeout (float): Time to wait for all the resources, in seconds.
+        sleep (float): Back-off after transient errors and polling interval.
+        exceptions_dict (dict | None): Exceptions to retry on; None retries on any exception.
+
+    Returns:
+        list[Resource]: The resources that did not satisfy the predicate within the timeout.
+    """
+    groups: dict[tuple[str, str | None, str | None], dict[str, Any]] = {}
+    for resource in resources:
+        groups.setdefault((resource.kind, resource.api_version, resource.namespace), {})[resource.name] = resource
+
+    timeout_watch = TimeoutWatch(timeout=timeout)
+    not_ready: list[Any] = []
+    for (kind, _api_version, namespace), pending in groups.items():
+        LOGGER.info(f"Watching {len(pending)} {kind} resources in {namespace or 'the cluster'} for up to {timeout}s")
+        list_watcher = ListWatcher(
+            api=next(iter(pending.values())).api,
+            namespace=namespace,
+            exceptions_dict=exceptions_dict,
+            sleep=sleep,
+        )
+        stream = list_watcher.stream(timeout=max(timeout_watch.remaining_time(), 0))
+        try:
+            for event_type, payload in stream:
+                if event_type == "LIST":
+                    current = {item.get("metadata", {}).get("name"): item for item in payload}
+                    for name in [name for name in pending if predicate(current.get(name))]:
+                        del pending[name]
+                else:
+                    name = payload.get("metadata", {}).get("name")
+                    if name in pending and predicate(None if event_type == "DELETED" else payload):
+                        del pending[name]
+
+                if not pending:
+                    break
+
+        except WatchNotPermittedError as exp:
+            LOGGER.warning(f"Cannot watch {kind} in {namespace or 'the cluster'}, falling back to polling: {exp}")
+            for name, resource in list(pending.items()):
+                try:
+                    ResourceWaiter(
+                        resource=resource,
+                        timeout=max(timeout_watch.remaining_time(), 0),
+                        sleep=sleep,
+                        exceptions_dict=exceptions_dict,
+                        use_watch=False,
+                    ).wait(predicate=predicate)
+                    del pending[name]
+                except TimeoutExpiredError:
+                    continue
+
+        finally:
+            stream.close()
+
+        not_ready.extend(pending.values())
+
+    return not_ready
@@ -2,6 +2,7 @@
 
 
 import shlex
+from collections.abc import Iterable
 from typing import Any
 from warnings import warn
 
@@ -15,11 +16,14 @@ from ocp_resources.node import Node
 from ocp_resources.pod import Pod
 from ocp_resources.resource import NamespacedResource
 from ocp_resources.utils.constants import (
+    LIBVIRT_RUN_DIR,
     PROTOCOL_ERROR_EXCEPTION_DICT,
+    TIMEOUT_1MINUTE,
     TIMEOUT_4MINUTES,
     TIMEOUT_5SEC,
     TIMEOUT_30SEC,
 )
+from ocp_resources.utils.vmi_diagnostics import DEFAULT_VIRSH_ACTIONS, VMIDiagnostics, VMIDiagnosticsSession
 
 
 class VirtualMachineInstance(NamespacedResource):
@@ -300,17 +304,33 @@ class VirtualMachineInstance(NamespacedResource):
         Raises:
             ResourceNotFoundError: If no virt-launcher pod is found.
         """
+        vmi_instance = self.instance
         pods = list(
             Pod.get(
                 client=privileged_client or self.client,
                 namespace=self.namespace,
-                label_selector=f"kubevirt.io=virt-launcher,kubevirt.io/created-by={self.instance.metadata.uid}",
+                label_selector=f"kubevirt.io=virt-launcher,kubevirt.io/created-by={vmi_instance.metadata.uid}",
             )
         )
+        return self._select_virt_launcher_pod(pods=pods, vmi_instance=vmi_instance)
+
+    def _select_virt_launcher_pod(self, pods: list[Pod], vmi_instance: Any) -> Pod:
+        """Select the virt-launcher pod of this VMI out of its launcher pods.
+
+        Args:
+            pods: The virt-launcher pods created by this VMI.
+            vmi_instance: The VMI instance.
+
+        Returns:
+            Pod: The virt-launcher pod.
+
+        Raises:
+            ResourceNotFoundError: If no virt-launcher pod is found.
+        """
         if not pods:
             raise ResourceNotFoundError(f"VIRT launcher POD not found for {self.kind}:{self.name}")
 
-        migration_state = self.instance.status.migrationState
+        migration_state = vmi_instance.status.migrationState
         if migration_state:
             #  After VM migration there are two pods, one in Completed status and one in Running status.
             #  We need to return the Pod that is not in Completed status.
@@ -347,11 +367,12 @@ class VirtualMachineInstance(NamespacedResource):
                 label_selector="kubevirt.io=virt-handler",
             )
         )
+        node_name = self.instance.status.nodeName
         for pod in pods:
-            if pod.instance["spec"]["nodeName"] == self.instance.status.nodeName:
+            if pod.instance["spec"]["nodeName"] == node_name:
                 return pod
 
-        raise ResourceNotFoundError(f"virt-handler pod not found on node {self.instance.status.nodeName}")
+        raise ResourceNotFoundError(f"virt-handler pod not found on node {node_name}")
 
     @property
     def virt_handler_pod(self) -> Pod:
@@ -490,7 +511,8 @@ class VirtualMachineInstance(NamespacedResource):
         Returns:
             int | None: The runAsUser UID value, or None if not set.
         """
-        security_context = pod.instance.spec.get("securityContext", {})
+        # The pod security context is immutable, use the listed pod body when there is one
+        security_context = pod.known_instance.spec.get("securityContext", {})
         if security_context:
             return security_context.get("runAsUser")
         return None
@@ -524,16 +546,30 @@ class VirtualMachineInstance(NamespacedResource):
         if VirtualMachineInstance.is_pod_root(pod=pod):
             return ""
 
-        virtqemud_socket = "virtqemud"
-        socket = (
-            virtqemud_socket
-            if virtqemud_socket in pod.execute(command=["ls", "/var/run/libvirt/"], container="compute")
-            else "libvirt"
+        return VirtualMachineInstance.hypervisor_connection_uri_from_libvirt_dir(
+            libvirt_dir_listing=pod.execute(command=["ls", LIBVIRT_RUN_DIR], container="compute")
         )
-        return f"-c qemu+unix:///session?socket=/var/run/libvirt/{socket}-sock"
+
+    @staticmethod
+    def hypervisor_connection_uri_from_libvirt_dir(libvirt_dir_listing: str) -> str:
+        """Get the hypervisor connection URI of a non-root virt-launcher pod from its libvirt run directory.
+
+        Args:
+            libvirt_dir_listing: Output of `ls` of the libvirt run directory in the compute container.
+
+        Returns:
+            str: The hypervisor connection URI string.
+        """
+        virtqemud_socket = "virtqemud"
+        socket = virtqemud_socket if virtqemud_socket in libvirt_dir_listing else "libvirt"
+        return f"-c qemu+unix:///session?socket={LIBVIRT_RUN_DIR}{socket}-sock"
 
     def virsh_cmd(
-        self, action: str, privileged_client: DynamicClient | None = None, pod: Pod | None = None
+        self,
+        action: str,
+        privileged_client: DynamicClient | None = None,
+        pod: Pod | None = None,
+        hypervisor_uri: str | None = None,
     ) -> list[str]:
         """Build a virsh command list for the given action.
 
@@ -541,15 +577,18 @@ class VirtualMachineInstance(NamespacedResource):
             action: The virsh action to perform (e.g., 'dumpxml', 'domstate').
             privileged_client: Client with elevated privileges.
             pod: Optional virt-launcher pod (avoids re-fetching if already available).
+            hypervisor_uri: Optional hypervisor connection URI (avoids detecting it again on the pod).
 
         Returns:
             list[str]: The command as a list of strings.
         """
-        # For backward compatibility
-        if pod is None:
-            pod = self.get_virt_launcher_pod(privileged_client=privileged_client or self.client)
+        if hypervisor_uri is None:
+            # For backward compatibility
+            if pod is None:
+                pod = self.get_virt_launcher_pod(privileged_client=privileged_client or self.client)
+
+            hypervisor_uri = self.get_hypervisor_connection_uri(pod=pod)
 
-        hypervisor_uri = self.get_hypervisor_connection_uri(pod=pod)
         return shlex.split(f"virsh {hypervisor_uri} {action} {self.namespace}_{self.name}")
 
     def get_xml(self, privileged_client: DynamicClient | None = None) -> str:
@@ -694,3 +733,33 @@ class VirtualMachineInstance(NamespacedResource):
             command=self.virsh_cmd(action=command, pod=pod),
             container="compute",
         )
+
+    def diagnostics_session(self, privileged_client: DynamicClient | None = None) -> VMIDiagnosticsSession:
+        """Get a diagnostics session, resolving the virt-launcher pod and hypervisor URI once for many virsh commands.
+
+        Args:
+            privileged_client: Client with elevated privileges.
+
+        Returns:
+            VMIDiagnosticsSession: The session, close it (or use it as a context manager) when done.
+        """
+        return VMIDiagnosticsSession(vmi=self, privileged_client=privileged_client)
+
+    def get_diagnostics(
+        self,
+        actions: Iterable[str] = DEFAULT_VIRSH_ACTIONS,
+        privileged_client: DynamicClient | None = None,
+        timeout: int = TIMEOUT_1MINUTE,
+    ) -> VMIDiagnostics:
+        """Run virsh actions in one exec in the virt-launcher pod and collect their outputs.
+
+        Args:
+            actions: The virsh actions to perform.
+            privileged_client: Client with elevated privileges.
+            timeout: Time to wait for all the commands.
+
+        Returns:
+            VMIDiagnostics: Snapshot, failures are set on it instead of raised.
+        """
+        with self.diagnostics_session(privileged_client=privileged_client) as session:
+            return session.snapshot(actions=actions, timeout=timeout)
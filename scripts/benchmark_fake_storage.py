@@ -0,0 +1,101 @@
+import copy
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+from fake_kubernetes_client.resource_storage import FakeResourceStorage
+
+NAMESPACES: int = 100
+NODES: int = 50
+PHASES: tuple[str, ...] = ("Pending", "Running", "Succeeded", "Failed")
+QUERIES: dict[str, dict[str, str | None]] = {
+    "label": {"namespace": None, "label_selector": "app=app-7", "field_selector": None},
+    "namespace + label": {"namespace": "namespace-3", "label_selector": "app=app-7", "field_selector": None},
+    "node": {"namespace": None, "label_selector": None, "field_selector": "spec.nodeName=node-11"},
+    "name": {"namespace": None, "label_selector": None, "field_selector": "metadata.name=pod-4242"},
+    "phase + label": {"namespace": None, "label_selector": "app=app-7", "field_selector": "status.phase=Running"},
+}
+
+
+def pod(index: int) -> dict[str, Any]:
+    return {
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "metadata": {
+            "name": f"pod-{index}",
+            "namespace": f"namespace-{index % NAMESPACES}",
+            "labels": {"app": f"app-{index % 1000}", "tier": "backend"},
+        },
+        "spec": {
+            "nodeName": f"node-{index % NODES}",
+            "containers": [{"name": "benchmark", "image": "quay.io/benchmark/image:latest"}],
+        },
+        "status": {"phase": PHASES[index % len(PHASES)]},
+    }
+
+
+def scan_list_resources(storage: FakeResourceStorage, namespace: str | None, **selectors: str | None) -> list[Any]:
+    # Listing before the indexes: scan every object of the kind and deep copy the matches
+    kind_resources = storage.resources["v1"]["Pod"]
+    resources = [
+        resource
+        for resource_namespace, namespace_resources in kind_resources.items()
+        if namespace is None or resource_namespace == namespace
+        for resource in namespace_resources.values()
+    ]
+    if selectors["label_selector"]:
+        resources = storage._filter_by_labels(resources, selectors["label_selector"])
+    if selectors["field_selector"]:
+        resources = storage._filter_by_fields(resources, selectors["field_selector"])
+    return [copy.deepcopy(resource) for resource in resources]
+
+
+def seconds_per_query(list_resources: Callable[..., list[Any]], query: dict[str, str | None], repeat: int) -> float:
+    start = time.perf_counter()
+    for _ in range(repeat):
+        list_resources(**query)
+    return (time.perf_counter() - start) / repeat
+
+
+def main(objects: int, repeat: int) -> str:
+    storage = FakeResourceStorage()
+    start = time.perf_counter()
+    for index in range(objects):
+        resource = pod(index=index)
+        storage.store_resource(
+            kind="Pod",
+            api_version="v1",
+            name=resource["metadata"]["name"],
+            namespace=resource["metadata"]["namespace"],
+            resource=resource,
+        )
+    store_time = time.perf_counter() - start
+
+    lines = [f"Store {objects} pods: {store_time:.2f}s", f"{'query':<20} {'scan':>10} {'indexed':>10} {'speedup':>8}"]
+    for name, query in QUERIES.items():
+        indexed = seconds_per_query(
+            list_resources=lambda **kwargs: storage.list_resources(kind="Pod", api_version="v1", **kwargs),
+            query=query,
+            repeat=repeat,
+        )
+        scan = seconds_per_query(
+            list_resources=lambda **kwargs: scan_list_resources(storage=storage, **kwargs), query=query, repeat=repeat
+        )
+        lines.append(f"{name:<20} {scan * 1000:8.2f}ms {indexed * 1000:8.2f}ms {scan / indexed:7.1f}x")
+
+    return "\n".join(lines)
+
+
+if __name__ == "__main__":
+    """
+    Compare `FakeResourceStorage.list_resources` with indexes against scanning and deep copying every object.
+
+    Usage: python scripts/benchmark_fake_storage.py [objects] [repeat]
+    """
+    print(
+        main(
+            objects=int(sys.argv[1]) if len(sys.argv) > 1 else 100_000,
+            repeat=int(sys.argv[2]) if len(sys.argv) > 2 else 5,
+        )
+    )
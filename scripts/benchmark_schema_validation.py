@@ -0,0 +1,79 @@
+import sys
+import time
+from collections.abc import Callable
+from typing import Any
+
+import jsonschema
+
+from ocp_resources.utils.schema_validator import SchemaValidator
+
+RESOURCES: dict[str, dict[str, Any]] = {
+    "Pod": {
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "metadata": {"name": "benchmark-pod", "namespace": "default", "labels": {"app": "benchmark"}},
+        "spec": {
+            "containers": [
+                {
+                    "name": "benchmark",
+                    "image": "quay.io/benchmark/image:latest",
+                    "ports": [{"containerPort": 8080, "protocol": "TCP"}],
+                    "resources": {"limits": {"cpu": "100m", "memory": "128Mi"}},
+                }
+            ],
+        },
+    },
+    "ConfigMap": {
+        "apiVersion": "v1",
+        "kind": "ConfigMap",
+        "metadata": {"name": "benchmark-config-map", "namespace": "default"},
+        "data": {"key": "value"},
+    },
+    "Namespace": {"apiVersion": "v1", "kind": "Namespace", "metadata": {"name": "benchmark-namespace"}},
+}
+
+
+def validations_per_second(validate: Callable[[dict[str, Any], str], None], iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        for kind, resource_dict in RESOURCES.items():
+            validate(resource_dict, kind)
+
+    return iterations * len(RESOURCES) / (time.perf_counter() - start)
+
+
+def uncached_validate(resource_dict: dict[str, Any], kind: str) -> None:
+    # Validation before compiled validators: a new validator (and schema check) on every call
+    jsonschema.validate(instance=resource_dict, schema=SchemaValidator.load_schema(kind=kind))
+
+
+def cached_validate(resource_dict: dict[str, Any], kind: str) -> None:
+    SchemaValidator.validate(resource_dict=resource_dict, kind=kind)
+
+
+def main(iterations: int) -> str:
+    if not SchemaValidator.load_mappings_data():
+        return "Schema mappings not found, run the class generator schema update first"
+
+    start = time.perf_counter()
+    SchemaValidator.warm_up(kinds=list(RESOURCES))
+    warm_up_time = time.perf_counter() - start
+
+    uncached = validations_per_second(validate=uncached_validate, iterations=iterations)
+    cached = validations_per_second(validate=cached_validate, iterations=iterations)
+
+    return (
+        f"Warm up ({', '.join(RESOURCES)}): {warm_up_time:.3f}s\n"
+        f"jsonschema.validate:      {uncached:10.1f} validations/s\n"
+        f"SchemaValidator.validate: {cached:10.1f} validations/s\n"
+        f"Speedup: {cached / uncached:.1f}x"
+    )
+
+
+if __name__ == "__main__":
+    """
+    Compare schema validation throughput of `jsonschema.validate` with the cached validators of `SchemaValidator`.
+
+    Usage: python scripts/benchmark_schema_validation.py [iterations]
+    """
+    print(main(iterations=int(sys.argv[1]) if len(sys.argv) > 1 else 200))
@@ -0,0 +1,106 @@
+import asyncio
+
+import pytest
+from timeout_sampler import TimeoutExpiredError
+
+from ocp_resources.exceptions import ConditionError
+from ocp_resources.namespace import Namespace
+from ocp_resources.pod import Pod
+from ocp_resources.utils.async_utils import iterate_sync, run_sync
+
+POD_CONTAINERS: list[dict[str, str]] = [{"name": "test-container", "image": "nginx:latest"}]
+
+
+class WaitedPod(Pod):
+    def wait(self, *_args, **_kwargs):
+        self.waited = True
+
+
+@pytest.fixture(scope="class")
+def async_pod(fake_client):
+    fake_client.register_resources([{"kind": "Pod", "api_version": "v1", "namespaced": True}])
+    return Pod(client=fake_client, name="test-async-pod", namespace="default", containers=POD_CONTAINERS)
+
+
+class TestAsyncUtils:
+    def test_run_sync(self):
+        assert asyncio.run(run_sync(sum, [1, 2, 3])) == 6
+
+    def test_iterate_sync(self):
+        async def _collect():
+            return [item async for item in iterate_sync(iterator=iter(range(3)))]
+
+        assert asyncio.run(_collect()) == [0, 1, 2]
+
+
+@pytest.mark.incremental
+class TestAsyncResource:
+    def test_acreate(self, async_pod):
+        assert asyncio.run(async_pod.acreate(wait=True))
+        assert async_pod.exists
+
+    def test_ainstance(self, async_pod):
+        assert asyncio.run(async_pod.ainstance()).metadata.name == async_pod.name
+
+    def test_aget(self, fake_client, async_pod):
+        async def _names():
+            return [pod.name async for pod in Pod.aget(client=fake_client, namespace=async_pod.namespace)]
+
+        assert async_pod.name in asyncio.run(_names())
+
+    def test_await_for_status(self, async_pod):
+        asyncio.run(async_pod.await_for_status(status=Pod.Status.RUNNING, timeout=5))
+        assert async_pod.last_wait_stats.polls
+
+    def test_await_for_stop_status(self, async_pod):
+        asyncio.run(async_pod.await_for_status(status=Pod.Status.RUNNING, stop_status=Pod.Status.RUNNING, timeout=5))
+
+    def test_await_for_condition(self, async_pod):
+        asyncio.run(
+            async_pod.await_for_condition(condition=Pod.Condition.READY, status=Pod.Condition.Status.TRUE, timeout=5)
+        )
+
+    def test_await_for_condition_stop_condition(self, async_pod):
+        with pytest.raises(ConditionError):
+            asyncio.run(
+                async_pod.await_for_condition(
+                    condition="NotACondition",
+                    status=Pod.Condition.Status.TRUE,
+                    stop_condition=Pod.Condition.READY,
+                    timeout=5,
+                )
+            )
+
+    def test_await_for_status_timeout(self, async_pod):
+        with pytest.raises(TimeoutExpiredError):
+            asyncio.run(async_pod.await_for_status(status="NotAPhase", timeout=1, sleep=0.1))
+
+    def test_concurrent_waits(self, fake_client, async_pod):
+        namespaces = [Namespace(client=fake_client, name=f"test-async-namespace-{idx}") for idx in range(5)]
+
+        async def _deploy_all():
+            await asyncio.gather(*[namespace.adeploy(wait=True) for namespace in namespaces])
+            await asyncio.gather(*[
+                namespace.await_for_status(status=Namespace.Status.ACTIVE, timeout=5) for namespace in namespaces
+            ])
+            return await asyncio.gather(*[namespace.adelete(wait=True, timeout=5) for namespace in namespaces])
+
+        assert all(asyncio.run(_deploy_all()))
+
+    def test_awatcher(self, async_pod):
+        async def _events():
+            return [event async for event in async_pod.awatcher(timeout=1)]
+
+        # The watch resumes from the creation resourceVersion, so only later changes are sent
+        async_pod.update(resource_dict={"metadata": {"name": async_pod.name, "labels": {"watched": "true"}}})
+        assert [event["type"] for event in asyncio.run(_events())] == ["MODIFIED"]
+
+    def test_adelete(self, async_pod):
+        assert asyncio.run(async_pod.adelete(wait=True, timeout=5))
+        assert not async_pod.exists
+
+    def test_adeploy_own_wait(self, fake_client):
+        pod = WaitedPod(client=fake_client, name="test-async-own-wait", namespace="default", containers=POD_CONTAINERS)
+        asyncio.run(pod.adeploy(wait=True))
+        assert pod.waited
+        asyncio.run(pod.adelete(wait=True, timeout=5))
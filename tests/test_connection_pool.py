@@ -0,0 +1,90 @@
+import socket
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import kubernetes
+import pytest
+
+from ocp_resources.utils.connection_pool import (
+    ConnectionPoolSettings,
+    clear_connection_pools,
+    connection_pool_metrics,
+    install_connection_pool,
+)
+
+
+class KeepAliveHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self):  # noqa: N802
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", "2")
+        self.end_headers()
+        self.wfile.write(b"{}")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture(scope="module")
+def api_server():
+    server = ThreadingHTTPServer(("127.0.0.1", 0), KeepAliveHandler)
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{server.server_address[1]}"
+    server.shutdown()
+    clear_connection_pools()
+
+
+def _api_client(host, token="sha256~token"):  # noqa: S107
+    configuration = kubernetes.client.Configuration()
+    configuration.host = host
+    configuration.api_key = {"authorization": f"Bearer {token}"}
+    return kubernetes.client.ApiClient(configuration=configuration)
+
+
+class TestConnectionPool:
+    def test_socket_options(self):
+        options = ConnectionPoolSettings(keepalive_idle=30).socket_options()
+
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) in options
+        if hasattr(socket, "TCP_KEEPIDLE"):
+            assert (socket.IPPROTO_TCP, socket.TCP_KEEPIDLE, 30) in options
+
+        assert (socket.SOL_SOCKET, socket.SO_KEEPALIVE, 1) not in ConnectionPoolSettings(
+            tcp_keepalive=False
+        ).socket_options()
+
+    def test_from_env(self, monkeypatch):
+        monkeypatch.setenv("OPENSHIFT_PYTHON_WRAPPER_CONNECTION_POOL_MAXSIZE", "16")
+        assert ConnectionPoolSettings.from_env().maxsize == 16
+
+    def test_shared_between_clients(self, api_server):
+        settings = ConnectionPoolSettings(maxsize=8)
+        first_client, second_client = _api_client(host=api_server), _api_client(host=api_server)
+        other_credentials_client = _api_client(host=api_server, token="sha256~other")  # noqa: S106
+
+        pool_manager = install_connection_pool(api_client=first_client, settings=settings)
+
+        assert install_connection_pool(api_client=second_client, settings=settings) is pool_manager
+        assert install_connection_pool(api_client=other_credentials_client, settings=settings) is not pool_manager
+        unshared_client = _api_client(host=api_server)
+        assert install_connection_pool(api_client=unshared_client, settings=settings, shared=False) is not pool_manager
+
+    def test_connection_reuse_metrics(self, api_server):
+        api_client = _api_client(host=api_server)
+        install_connection_pool(
+            api_client=api_client, settings=ConnectionPoolSettings(maxsize=4, block=True), shared=False
+        )
+
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            list(executor.map(lambda _: api_client.rest_client.request("GET", f"{api_server}/version"), range(40)))
+
+        metrics = connection_pool_metrics(client=api_client)
+        assert metrics.pools == 1
+        assert metrics.requests == 40
+        assert 1 <= metrics.new_connections <= 4
+        assert metrics.reused_connections == 40 - metrics.new_connections
+        assert metrics.reuse_ratio >= 0.9
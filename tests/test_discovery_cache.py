@@ -0,0 +1,95 @@
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from ocp_resources.utils.discovery_cache import CREATED_AT_KEY, PersistentDiscoverer, discovery_cache_file
+
+HOST: str = "https://api.test-discovery-cache.example.com:6443"
+POD_RESOURCE: dict[str, object] = {"name": "pods", "kind": "Pod", "namespaced": True, "verbs": ["get", "list"]}
+
+
+def _request(method, path, **kwargs):
+    if path == "/version":
+        return {"gitVersion": "v1.30.0"}
+
+    if path == "/apis":
+        return SimpleNamespace(groups=[])
+
+    return SimpleNamespace(resources=[dict(POD_RESOURCE)])
+
+
+@pytest.fixture()
+def api_client():
+    client = MagicMock()
+    client.configuration.host = HOST
+    client.request.side_effect = _request
+    return client
+
+
+@pytest.fixture()
+def cache_dir(tmp_path, monkeypatch):
+    monkeypatch.setenv("OPENSHIFT_PYTHON_WRAPPER_DISCOVERY_CACHE_DIR", str(tmp_path))
+    monkeypatch.setenv("OPENSHIFT_PYTHON_WRAPPER_DISCOVERY_CACHE_TTL", "600")
+    return tmp_path
+
+
+def _requested_paths(client):
+    return [_call.args[1] for _call in client.request.call_args_list]
+
+
+class TestPersistentDiscoverer:
+    def test_cache_file_keyed_by_host(self, cache_dir):
+        assert discovery_cache_file(host=HOST) != discovery_cache_file(host=f"{HOST}/other")
+        assert discovery_cache_file(host=HOST).startswith(str(cache_dir))
+
+    def test_cold_cache_discovers(self, cache_dir, api_client):
+        discoverer = PersistentDiscoverer(client=api_client)
+        assert discoverer.search(kind="Pod", api_version="v1")
+        assert _requested_paths(client=api_client) == ["/version", "/apis", "api/v1"]
+        assert discoverer.server_version == "v1.30.0"
+
+    def test_warm_cache_skips_discovery(self, cache_dir, api_client):
+        PersistentDiscoverer(client=api_client).search(kind="Pod", api_version="v1")
+        api_client.request.reset_mock()
+
+        discoverer = PersistentDiscoverer(client=api_client)
+        assert discoverer.search(kind="Pod", api_version="v1")[0].kind == "Pod"
+        assert not api_client.request.called
+
+    def test_lazy_update_keeps_discovery_time(self, cache_dir, api_client):
+        discoverer = PersistentDiscoverer(client=api_client)
+        created_at = discoverer._cache[CREATED_AT_KEY]
+        discoverer.search(kind="Pod", api_version="v1")
+        assert PersistentDiscoverer(client=api_client)._cache[CREATED_AT_KEY] == created_at
+
+    def test_expired_cache_rediscovers(self, cache_dir, api_client, monkeypatch):
+        PersistentDiscoverer(client=api_client)
+        api_client.request.reset_mock()
+
+        monkeypatch.setenv("OPENSHIFT_PYTHON_WRAPPER_DISCOVERY_CACHE_TTL", "-1")
+        PersistentDiscoverer(client=api_client)
+        assert "/apis" in _requested_paths(client=api_client)
+
+    def test_missing_kind_invalidates_cache(self, cache_dir, api_client):
+        discoverer = PersistentDiscoverer(client=api_client)
+        api_client.request.reset_mock()
+
+        assert not discoverer.search(kind="NoSuchKind")
+        assert "/apis" in _requested_paths(client=api_client)
+
+    def test_corrupted_cache_rediscovers(self, cache_dir, api_client):
+        with open(discovery_cache_file(host=HOST), "w") as fd:
+            fd.write("{not json")
+
+        assert PersistentDiscoverer(client=api_client).search(kind="Pod", api_version="v1")
+        assert "/apis" in _requested_paths(client=api_client)
+
+    def test_without_file_locking(self, cache_dir, api_client, monkeypatch):
+        monkeypatch.setattr("ocp_resources.utils.discovery_cache.FILE_LOCKING_AVAILABLE", False)
+        PersistentDiscoverer(client=api_client).search(kind="Pod", api_version="v1")
+        api_client.request.reset_mock()
+
+        assert PersistentDiscoverer(client=api_client).search(kind="Pod", api_version="v1")[0].kind == "Pod"
+        assert not api_client.request.called
+        assert not list(cache_dir.glob("*.lock"))
@@ -0,0 +1,81 @@
+import datetime
+import threading
+import time
+
+import pytest
+import timeout_sampler
+from timeout_sampler import TimeoutExpiredError
+
+from fake_kubernetes_client import FakeClock
+from ocp_resources.config_map import ConfigMap
+from ocp_resources.pod import Pod
+
+NAMESPACE: str = "test-fake-clock"
+POD_CONTAINERS: list[dict[str, str]] = [{"name": "test-container", "image": "nginx:latest"}]
+
+
+@pytest.fixture()
+def clock(fake_client):
+    with fake_client.clock.virtual_time() as clock:
+        yield clock
+
+
+@pytest.fixture()
+def clock_pod(fake_client, clock):
+    with Pod(client=fake_client, name="clock-pod", namespace=NAMESPACE, containers=POD_CONTAINERS) as pod:
+        yield pod
+
+
+def _set_phase(pod, phase):
+    pod.api.patch(name=pod.name, namespace=pod.namespace, body={"status": {"phase": phase}})
+
+
+class TestFakeClock:
+    @pytest.mark.parametrize("use_watch", [False, True])
+    def test_timeout(self, clock, clock_pod, use_watch):
+        start, real_start = clock.monotonic(), time.perf_counter()
+        with pytest.raises(TimeoutExpiredError):
+            clock_pod.wait_for_status(status="NotAPhase", timeout=240, use_watch=use_watch)
+
+        assert clock.monotonic() - start >= 240
+        assert time.perf_counter() - real_start < 5
+
+    @pytest.mark.parametrize("use_watch", [False, True])
+    def test_scheduled_transition(self, clock, clock_pod, use_watch):
+        clock.call_later(30, lambda: _set_phase(pod=clock_pod, phase=Pod.Status.SUCCEEDED))
+        start = clock.monotonic()
+        clock_pod.wait_for_status(status=Pod.Status.SUCCEEDED, timeout=240, use_watch=use_watch)
+
+        assert 30 <= clock.monotonic() - start <= 32
+        _set_phase(pod=clock_pod, phase=Pod.Status.RUNNING)
+
+    def test_timestamps(self, fake_client, clock):
+        clock.advance(seconds=3600)
+        config_map = ConfigMap(client=fake_client, name="clock-config-map", namespace=NAMESPACE, data={"key": "value"})
+        config_map.deploy()
+        created = datetime.datetime.fromisoformat(config_map.instance.metadata.creationTimestamp)
+
+        assert abs((created - clock.now()).total_seconds()) < 1
+        assert (created - datetime.datetime.now(tz=datetime.timezone.utc)).total_seconds() > 3500
+        config_map.clean_up()
+
+    def test_restore(self, fake_client):
+        with fake_client.clock.virtual_time():
+            with fake_client.clock.virtual_time():
+                assert timeout_sampler.time is not time
+
+            with pytest.raises(RuntimeError):
+                with FakeClock().virtual_time():
+                    pass
+
+        assert timeout_sampler.time is time
+        assert not fake_client.clock.virtual
+
+    def test_real_time_timers(self):
+        clock, calls, done = FakeClock(), [], threading.Event()
+        clock.call_later(0.2, lambda: (calls.append((2, threading.current_thread())), done.set()))
+        clock.call_later(0.1, lambda: calls.append((1, threading.current_thread())))
+
+        assert done.wait(timeout=5)
+        assert [order for order, _ in calls] == [1, 2]
+        assert len({thread for _, thread in calls}) == 1
@@ -0,0 +1,146 @@
+import os
+import stat
+import subprocess
+import sys
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import AuthenticationError
+from unittest.mock import patch
+
+import pytest
+
+from fake_kubernetes_client import (
+    ConflictError,
+    FakeClusterServer,
+    FakeDynamicClient,
+    FakeRemoteStorage,
+    RemoteOperationNotSupportedError,
+)
+from fake_kubernetes_client.server import FAKE_CLUSTER_ADDRESS_ENV
+from ocp_resources.resource import get_client
+
+NAMESPACE: str = "test-fake-cluster-server"
+THREADS: int = 8
+WRITES_PER_THREAD: int = 25
+
+WORKER_SCRIPT: str = """
+import sys
+from concurrent.futures import ThreadPoolExecutor
+
+from ocp_resources.resource import get_client
+
+api = get_client(fake=True).resources.get(api_version="v1", kind="ConfigMap")
+
+
+def create(index):
+    api.create(body={"metadata": {"name": f"worker-{sys.argv[1]}-{index}", "namespace": sys.argv[2]}, "data": {"index": str(index)}})
+
+
+with ThreadPoolExecutor(max_workers=4) as executor:
+    list(executor.map(create, range(10)))
+"""
+
+
+def _config_maps(client):
+    return client.resources.get(api_version="v1", kind="ConfigMap")
+
+
+def _remote_client(server):
+    return FakeDynamicClient(storage=FakeRemoteStorage(address=server.address, authkey=server.authkey))
+
+
+def _concurrent_writes(client):
+    api = _config_maps(client=client)
+    api.create(body={"metadata": {"name": "counter", "namespace": NAMESPACE}, "data": {}})
+    start = threading.Barrier(THREADS)
+
+    def write(thread):
+        start.wait()
+        for index in range(WRITES_PER_THREAD):
+            api.patch(name="counter", namespace=NAMESPACE, body={"data": {f"{thread}-{index}": "1"}})
+
+    with ThreadPoolExecutor(max_workers=THREADS) as executor:
+        list(executor.map(write, range(THREADS)))
+
+    return api.get(name="counter", namespace=NAMESPACE)
+
+
+@pytest.fixture()
+def server():
+    with FakeClusterServer() as server:
+        yield server
+
+
+class TestFakeClusterConcurrency:
+    def test_concurrent_patches(self):
+        client = get_client(fake=True)
+        events = client.storage.event_bus.history
+        counter = _concurrent_writes(client=client)
+
+        assert len(counter.data) == THREADS * WRITES_PER_THREAD
+        assert counter.metadata.generation == THREADS * WRITES_PER_THREAD + 1
+        assert [event.resource_version for event in events] == sorted({event.resource_version for event in events})
+
+        stats = client.storage.lock_stats()
+        assert stats["v1/ConfigMap"].acquisitions >= THREADS * WRITES_PER_THREAD
+        assert stats["commit"].acquisitions >= THREADS * WRITES_PER_THREAD
+
+    def test_concurrent_creates(self):
+        api = _config_maps(client=get_client(fake=True))
+
+        def create(_thread):
+            try:
+                api.create(body={"metadata": {"name": "once", "namespace": NAMESPACE}})
+                return True
+            except ConflictError:
+                return False
+
+        with ThreadPoolExecutor(max_workers=THREADS) as executor:
+            assert sorted(executor.map(create, range(THREADS))) == [False] * (THREADS - 1) + [True]
+
+
+class TestFakeClusterServer:
+    def test_shared_cluster(self, server):
+        client = _remote_client(server=server)
+        counter = _concurrent_writes(client=client)
+
+        assert len(counter.data) == THREADS * WRITES_PER_THREAD
+        stored = server.storage.get_resource(kind="ConfigMap", api_version="v1", name="counter", namespace=NAMESPACE)
+        assert stored["metadata"]["resourceVersion"] == counter.metadata.resourceVersion
+        assert client.storage.lock_stats()["v1/ConfigMap"].acquisitions >= THREADS * WRITES_PER_THREAD
+
+    def test_remote_watch(self, server):
+        watcher, writer = (_remote_client(server=server) for _ in range(2))
+        resource_version = watcher.storage.event_bus.resource_version
+        _config_maps(client=writer).create(body={"metadata": {"name": "watched", "namespace": NAMESPACE}})
+
+        events = list(
+            _config_maps(client=watcher).watch(namespace=NAMESPACE, resource_version=resource_version, timeout=1)
+        )
+        assert [(event["type"], event["object"].metadata.name) for event in events] == [("ADDED", "watched")]
+
+    def test_worker_processes(self, server):
+        env = {**os.environ, **server.environment()}
+        workers = [
+            subprocess.Popen([sys.executable, "-c", WORKER_SCRIPT, str(worker), NAMESPACE], env=env)
+            for worker in range(2)
+        ]
+        assert [worker.wait(timeout=120) for worker in workers] == [0, 0]
+
+        config_maps = server.storage.list_resources(kind="ConfigMap", api_version="v1", namespace=NAMESPACE)
+        assert sorted(config_map["metadata"]["name"] for config_map in config_maps) == sorted(
+            f"worker-{worker}-{index}" for worker in range(2) for index in range(10)
+        )
+
+    def test_authentication(self, server):
+        assert stat.S_IMODE(os.stat(server.address).st_mode) == 0o600
+        with pytest.raises(AuthenticationError):
+            FakeRemoteStorage(address=server.address, authkey=b"wrong").call("resource_version")
+
+        with patch.dict(os.environ, {FAKE_CLUSTER_ADDRESS_ENV: server.address}):
+            with pytest.raises(ValueError, match="AUTHKEY"):
+                get_client(fake=True)
+
+    def test_remote_subscribe(self, server):
+        with pytest.raises(RemoteOperationNotSupportedError):
+            _remote_client(server=server).storage.event_bus.subscribe(callback=print)
@@ -0,0 +1,123 @@
+import time
+
+import pytest
+from timeout_sampler import TimeoutExpiredError
+
+from fake_kubernetes_client.controllers import log_normal
+from ocp_resources.datavolume import DataVolume
+from ocp_resources.deployment import Deployment
+from ocp_resources.pod import Pod
+from ocp_resources.replica_set import ReplicaSet
+from ocp_resources.resource import get_client
+from ocp_resources.virtual_machine import VirtualMachine
+
+NAMESPACE: str = "test-fake-controllers"
+VM_COUNT: int = 1000
+
+
+@pytest.fixture()
+def client():
+    client = get_client(fake=True)
+    client.controllers.start(seed=42)
+    with client.clock.virtual_time():
+        yield client
+    client.controllers.stop()
+
+
+@pytest.fixture()
+def deployment(client):
+    client.controllers.configure(kind="Pod", latency=(5, 10))
+    with Deployment(
+        client=client,
+        name="web",
+        namespace=NAMESPACE,
+        selector={"matchLabels": {"app": "web"}},
+        template={
+            "metadata": {"labels": {"app": "web"}},
+            "spec": {"containers": [{"name": "web", "image": "nginx:latest"}]},
+        },
+        replicas=3,
+    ) as deployment:
+        yield deployment
+
+
+def _virtual_machine(client, name):
+    return VirtualMachine(
+        client=client,
+        name=name,
+        namespace=NAMESPACE,
+        body={"spec": {"running": True, "template": {"spec": {"domain": {"devices": {}}}}}},
+    )
+
+
+class TestFakeControllers:
+    def test_deployment(self, client, deployment):
+        start = client.clock.monotonic()
+        assert deployment.instance.status.readyReplicas == 0
+
+        deployment.wait_for_replicas(timeout=60)
+        assert 5 <= client.clock.monotonic() - start <= 12
+        replica_sets = list(ReplicaSet.get(client=client, namespace=NAMESPACE))
+        assert len(replica_sets) == 1
+        pods = list(Pod.get(client=client, namespace=NAMESPACE, label_selector="app=web"))
+        assert len(pods) == 3
+        assert all(pod.instance.metadata.ownerReferences[0].name == replica_sets[0].name for pod in pods)
+        assert {pod.status for pod in pods} == {Pod.Status.RUNNING}
+
+        deployment.scale_replicas(replica_count=1)
+        deployment.wait_for_replicas(timeout=60)
+        assert len(list(Pod.get(client=client, namespace=NAMESPACE, label_selector="app=web"))) == 1
+
+        deployment.clean_up()
+        client.clock.advance(seconds=1)
+        assert not list(ReplicaSet.get(client=client, namespace=NAMESPACE))
+        assert not list(Pod.get(client=client, namespace=NAMESPACE, label_selector="app=web"))
+
+    def test_virtual_machines_boot(self, client):
+        client.controllers.configure(kind="VirtualMachineInstance", latency=log_normal(median=10))
+        virtual_machines = [_virtual_machine(client=client, name=f"vm-{index}") for index in range(VM_COUNT)]
+        start, real_start = client.clock.monotonic(), time.perf_counter()
+        for virtual_machine in virtual_machines:
+            virtual_machine.deploy()
+        assert virtual_machines[0].printable_status == VirtualMachine.Status.STOPPED
+
+        for virtual_machine in virtual_machines:
+            virtual_machine.wait_for_ready_status(status=True, timeout=600)
+
+        assert 30 <= client.clock.monotonic() - start <= 600
+        assert time.perf_counter() - real_start < 120
+        vmi = virtual_machines[0].vmi
+        assert vmi.status == vmi.Status.RUNNING
+        assert virtual_machines[0].printable_status == VirtualMachine.Status.RUNNING
+
+        virtual_machines[0].api.patch(name="vm-0", namespace=NAMESPACE, body={"spec": {"running": False}})
+        virtual_machines[0].wait_for_ready_status(status=None, timeout=60)
+        client.clock.advance(seconds=1)
+        assert not vmi.exists
+        assert virtual_machines[0].printable_status == VirtualMachine.Status.STOPPED
+
+    def test_failure_injection(self, client):
+        client.controllers.configure(kind="VirtualMachineInstance", latency=5, failure_rate=1.0)
+        with _virtual_machine(client=client, name="failing-vm") as virtual_machine:
+            with pytest.raises(TimeoutExpiredError):
+                virtual_machine.vmi.wait_until_running(timeout=60, logs=False)
+
+            assert virtual_machine.vmi.status == virtual_machine.vmi.Status.FAILED
+            assert virtual_machine.printable_status == VirtualMachine.Status.CRASH_LOOPBACK_OFF
+
+    def test_data_volume(self, client):
+        client.controllers.configure(kind="DataVolume", latency=30)
+        with DataVolume(
+            client=client,
+            name="data-volume",
+            namespace=NAMESPACE,
+            api_name="storage",
+            size="1Gi",
+            source_dict={"blank": {}},
+        ) as data_volume:
+            assert data_volume.instance.status.phase == DataVolume.Status.PENDING
+            start = client.clock.monotonic()
+            data_volume.wait_for_dv_success(timeout=600)
+
+            assert client.clock.monotonic() - start >= 120
+            assert data_volume.pvc.instance.status.capacity.storage == "1Gi"
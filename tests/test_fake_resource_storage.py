@@ -0,0 +1,98 @@
+import pytest
+
+from fake_kubernetes_client import FakeDynamicClient
+from fake_kubernetes_client.resource_storage import FakeResourceStorage
+
+
+def _pod(name, namespace="default", app="web", node="node-1", phase="Running"):
+    return {
+        "apiVersion": "v1",
+        "kind": "Pod",
+        "metadata": {"name": name, "namespace": namespace, "labels": {"app": app}},
+        "spec": {"nodeName": node},
+        "status": {"phase": phase},
+    }
+
+
+def _store(storage, resource):
+    storage.store_resource(
+        kind="Pod",
+        api_version="v1",
+        name=resource["metadata"]["name"],
+        namespace=resource["metadata"]["namespace"],
+        resource=resource,
+    )
+
+
+def _names(storage, **kwargs):
+    return sorted(
+        resource["metadata"]["name"] for resource in storage.list_resources(kind="Pod", api_version="v1", **kwargs)
+    )
+
+
+@pytest.fixture()
+def storage():
+    storage = FakeResourceStorage()
+    for resource in (
+        _pod(name="web-1"),
+        _pod(name="web-2", namespace="other", node="node-2"),
+        _pod(name="db-1", app="db", phase="Pending"),
+    ):
+        _store(storage=storage, resource=resource)
+    return storage
+
+
+class TestFakeResourceStorageIndexes:
+    @pytest.mark.parametrize(
+        "kwargs, expected",
+        [
+            pytest.param({"label_selector": "app=web"}, ["web-1", "web-2"], id="label"),
+            pytest.param({"label_selector": "app=web", "namespace": "other"}, ["web-2"], id="namespace-label"),
+            pytest.param({"field_selector": "spec.nodeName=node-1"}, ["db-1", "web-1"], id="field"),
+            pytest.param({"field_selector": "metadata.name==web-2"}, ["web-2"], id="double-equals"),
+            pytest.param(
+                {"label_selector": "app=web", "field_selector": "status.phase=Running,spec.nodeName=node-2"},
+                ["web-2"],
+                id="label-and-fields",
+            ),
+            pytest.param({"label_selector": "app=missing"}, [], id="no-match"),
+            pytest.param({"label_selector": "app"}, ["db-1", "web-1", "web-2"], id="not-indexed"),
+        ],
+    )
+    def test_list_resources(self, storage, kwargs, expected):
+        assert _names(storage=storage, **kwargs) == expected
+
+    def test_indexes_follow_updates_and_deletes(self, storage):
+        _store(storage=storage, resource=_pod(name="web-1", app="db"))
+        assert _names(storage=storage, label_selector="app=web") == ["web-2"]
+        assert _names(storage=storage, label_selector="app=db") == ["db-1", "web-1"]
+
+        storage.delete_resource(kind="Pod", api_version="v1", name="db-1", namespace="default")
+        assert _names(storage=storage, label_selector="app=db") == ["web-1"]
+        storage.delete_resource(kind="Pod", api_version="v1", name="web-1", namespace="default")
+        assert ("app", "db") not in storage.indexes["v1", "Pod"].labels
+
+    def test_non_string_field_value(self, storage):
+        resource = _pod(name="no-phase")
+        resource["status"]["phase"] = None
+        _store(storage=storage, resource=resource)
+
+        assert _names(storage=storage, field_selector="status.phase=null") == ["no-phase"]
+
+    def test_snapshots(self, storage):
+        resource = _pod(name="snapshot")
+        _store(storage=storage, resource=resource)
+        resource["metadata"]["labels"]["app"] = "changed"
+
+        stored = storage.get_resource(kind="Pod", api_version="v1", name="snapshot", namespace="default")
+        assert stored["metadata"]["labels"]["app"] == "web"
+        assert stored is storage.get_resource(kind="Pod", api_version="v1", name="snapshot", namespace="default")
+
+    def test_returned_lists_are_copies(self):
+        api = FakeDynamicClient().resources.get(api_version="v1", kind="ConfigMap")
+        api.create(body={"metadata": {"name": "lists", "namespace": "default"}, "data": {"spec_list": [1]}})
+
+        api.get(name="lists", namespace="default").data.get("spec_list").append(2)
+        api.get(name="lists", namespace="default").data["spec_list"].append(3)
+
+        assert api.get(name="lists", namespace="default").data.get("spec_list") == [1]
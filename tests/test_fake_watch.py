@@ -0,0 +1,115 @@
+import threading
+
+import pytest
+
+from ocp_resources.config_map import ConfigMap
+from ocp_resources.pod import Pod
+
+NAMESPACE: str = "test-fake-watch"
+POD_CONTAINERS: list[dict[str, str]] = [{"name": "test-container", "image": "nginx:latest"}]
+
+
+@pytest.fixture()
+def config_map_api(fake_client):
+    return fake_client.resources.get(api_version="v1", kind="ConfigMap")
+
+
+def _collect(api, events, **kwargs):
+    for event in api.watch(namespace=NAMESPACE, **kwargs):
+        events.append((event["type"], event["raw_object"]))
+
+
+def _config_map(name):
+    return {"apiVersion": "v1", "kind": "ConfigMap", "metadata": {"name": name, "namespace": NAMESPACE}}
+
+
+class TestFakeWatch:
+    def test_fan_out(self, fake_client, config_map_api):
+        resource_version = config_map_api.get(namespace=NAMESPACE).metadata.resourceVersion
+        first_events, second_events = [], []
+        watchers = [
+            threading.Thread(
+                target=_collect,
+                args=(config_map_api, events),
+                kwargs={"timeout": 1, "resource_version": resource_version},
+            )
+            for events in (first_events, second_events)
+        ]
+        for watcher in watchers:
+            watcher.start()
+
+        config_map_api.create(namespace=NAMESPACE, body=_config_map(name="fan-out"))
+        config_map_api.patch(name="fan-out", namespace=NAMESPACE, body={"data": {"key": "value"}})
+        config_map_api.delete(name="fan-out", namespace=NAMESPACE)
+        for watcher in watchers:
+            watcher.join()
+
+        assert [event_type for event_type, _ in first_events] == ["ADDED", "MODIFIED", "DELETED"]
+        assert first_events == second_events
+        resource_versions = [int(obj["metadata"]["resourceVersion"]) for _, obj in first_events]
+        assert resource_versions == sorted(resource_versions)
+        assert resource_versions[0] > int(resource_version)
+
+    def test_resume_and_selectors(self, config_map_api):
+        config_map_api.create(namespace=NAMESPACE, body=_config_map(name="resume-a"))
+        resource_version = config_map_api.get(namespace=NAMESPACE).metadata.resourceVersion
+        config_map_api.patch(name="resume-a", namespace=NAMESPACE, body={"data": {"key": "value"}})
+        config_map_api.create(namespace=NAMESPACE, body=_config_map(name="resume-b"))
+
+        events = []
+        _collect(api=config_map_api, events=events, resource_version=resource_version, timeout=0)
+        assert [(event_type, obj["metadata"]["name"]) for event_type, obj in events] == [
+            ("MODIFIED", "resume-a"),
+            ("ADDED", "resume-b"),
+        ]
+
+        events = []
+        _collect(api=config_map_api, events=events, resource_version=resource_version, timeout=0, name="resume-b")
+        assert [obj["metadata"]["name"] for _, obj in events] == ["resume-b"]
+
+    def test_gone(self, fake_client, config_map_api):
+        resource_version = config_map_api.get(namespace=NAMESPACE).metadata.resourceVersion
+        config_map_api.create(namespace=NAMESPACE, body=_config_map(name="gone"))
+        fake_client.storage.event_bus.compact()
+
+        events = []
+        _collect(api=config_map_api, events=events, resource_version=resource_version, timeout=1)
+        assert [(event_type, obj["code"]) for event_type, obj in events] == [("ERROR", 410)]
+
+    def test_bookmarks(self, fake_client, config_map_api, monkeypatch):
+        monkeypatch.setattr(fake_client.storage.event_bus, "bookmark_interval", 0.05)
+        resource_version = config_map_api.get(namespace=NAMESPACE).metadata.resourceVersion
+
+        events = []
+        _collect(
+            api=config_map_api,
+            events=events,
+            resource_version=resource_version,
+            timeout=0.3,
+            allow_watch_bookmarks=True,
+        )
+        assert events
+        assert {event_type for event_type, _ in events} == {"BOOKMARK"}
+
+    def test_wait_with_watch(self, fake_client):
+        with Pod(client=fake_client, name="watched-pod", namespace=NAMESPACE, containers=POD_CONTAINERS) as pod:
+            timer = threading.Timer(
+                0.2,
+                pod.api.patch,
+                kwargs={"name": pod.name, "namespace": NAMESPACE, "body": {"status": {"phase": Pod.Status.SUCCEEDED}}},
+            )
+            timer.start()
+            pod.wait_for_status(status=Pod.Status.SUCCEEDED, timeout=5, use_watch=True)
+            timer.join()
+
+            assert pod.last_wait_stats.mode == "watch"
+            assert pod.last_wait_stats.polls == 0
+            assert pod.last_wait_stats.events == 1
+
+    def test_watcher(self, fake_client):
+        config_map = ConfigMap(client=fake_client, name="watcher", namespace=NAMESPACE, data={"key": "value"})
+        config_map.deploy()
+        config_map.update(resource_dict={"metadata": {"name": config_map.name}, "data": {"key": "new"}})
+        config_map.clean_up()
+
+        assert [event["type"] for event in config_map.watcher(timeout=0)] == ["MODIFIED", "DELETED"]
@@ -0,0 +1,117 @@
+from unittest.mock import patch
+
+import pytest
+
+from ocp_resources.pod import Pod
+from ocp_resources.utils.informer import (
+    OWNER_UID_INDEX,
+    field_indexer,
+    parse_equality_label_selector,
+    stop_informers,
+)
+
+NAMESPACE: str = "test-informer"
+POD_CONTAINERS: list[dict[str, str]] = [{"name": "test-container", "image": "nginx:latest"}]
+
+
+@pytest.fixture(scope="class")
+def informer_pods(fake_client):
+    fake_client.register_resources([{"kind": "Pod", "api_version": "v1", "namespaced": True}])
+    pods = [
+        Pod(
+            client=fake_client,
+            name=f"informer-pod-{idx}",
+            namespace=NAMESPACE,
+            containers=POD_CONTAINERS,
+            node_name=f"worker-{idx % 2}",
+            label={"app": "informer", "idx": str(idx)},
+        ).deploy()
+        for idx in range(3)
+    ]
+    yield pods
+    stop_informers(client=fake_client)
+    for pod in pods:
+        pod.clean_up()
+
+
+@pytest.fixture(scope="class")
+def pod_informer(fake_client, informer_pods):
+    return Pod.informer(
+        client=fake_client,
+        namespace=NAMESPACE,
+        indexers={"node": field_indexer(path="spec.nodeName")},
+        watch_timeout=1,
+    )
+
+
+class TestParseEqualityLabelSelector:
+    def test_equality(self):
+        assert parse_equality_label_selector(label_selector="a=b,c==d") == ["a=b", "c=d"]
+
+    @pytest.mark.parametrize("label_selector", ["a!=b", "a in (b)", "a", "!a"])
+    def test_not_equality(self, label_selector):
+        assert parse_equality_label_selector(label_selector=label_selector) is None
+
+
+@pytest.mark.incremental
+class TestInformer:
+    def test_synced(self, pod_informer):
+        assert pod_informer.has_synced
+        assert pod_informer.is_fresh()
+
+    def test_shared(self, fake_client, pod_informer):
+        assert Pod.informer(client=fake_client, namespace=NAMESPACE) is pod_informer
+
+    def test_lister_get(self, pod_informer):
+        assert pod_informer.get(name="informer-pod-0", namespace=NAMESPACE)["metadata"]["name"] == "informer-pod-0"
+        assert pod_informer.get(name="no-such-pod", namespace=NAMESPACE) is None
+
+    def test_lister_list(self, pod_informer):
+        assert len(pod_informer.list_objects(namespace=NAMESPACE)) == 3
+        assert [pod["metadata"]["name"] for pod in pod_informer.list_objects(label_selector="app=informer,idx=1")] == [
+            "informer-pod-1"
+        ]
+
+    def test_custom_indexer(self, pod_informer):
+        assert [pod["metadata"]["name"] for pod in pod_informer.by_index(index_name="node", value="worker-0")] == [
+            "informer-pod-0",
+            "informer-pod-2",
+        ]
+        assert pod_informer.index_values(index_name="node") == ["worker-0", "worker-1"]
+
+    def test_add_indexer(self, pod_informer):
+        pod_informer.add_indexer(name="idx", indexer=field_indexer(path="metadata.labels.idx"))
+        assert len(pod_informer.by_index(index_name="idx", value="2")) == 1
+        assert pod_informer.by_index(index_name=OWNER_UID_INDEX, value="no-such-uid") == []
+
+    def test_instance_served_from_cache(self, fake_client, pod_informer):
+        pod = Pod(client=fake_client, name="informer-pod-0", namespace=NAMESPACE)
+        pod._set_api_version()
+        with patch.object(Pod, "api", new_callable=lambda: property(lambda _self: pytest.fail("API was called"))):
+            assert pod.instance.metadata.name == "informer-pod-0"
+            assert pod.exists
+
+    def test_get_served_from_cache(self, fake_client, pod_informer):
+        with patch.object(Pod, "_list_resources", side_effect=AssertionError("API was called")):
+            assert [pod.name for pod in Pod.get(client=fake_client, namespace=NAMESPACE, label_selector="idx=2")] == [
+                "informer-pod-2"
+            ]
+
+    def test_get_with_positional_args_not_served_from_cache(self, fake_client, pod_informer):
+        assert Pod._get_cached_resources(fake_client, "extra-arg", namespace=NAMESPACE) is None
+
+    def test_cache_miss_falls_back_to_api(self, fake_client, pod_informer):
+        assert not Pod(client=fake_client, name="no-such-pod", namespace=NAMESPACE).exists
+
+    def test_stale_cache_not_served(self, fake_client, pod_informer):
+        pod_informer.max_staleness = -1
+        try:
+            with patch.object(Pod, "_list_resources", wraps=Pod._list_resources) as list_resources:
+                list(Pod.get(client=fake_client, namespace=NAMESPACE))
+                assert list_resources.called
+        finally:
+            pod_informer.max_staleness = 60
+
+    def test_stop(self, fake_client, pod_informer):
+        stop_informers(client=fake_client)
+        assert not pod_informer.is_running
@@ -0,0 +1,139 @@
+from unittest.mock import MagicMock
+
+import pytest
+from kubernetes.client.rest import ApiException
+
+from ocp_resources.utils.instrumentation import (
+    ApiCallCollector,
+    ApiCallEvent,
+    add_api_call_hook,
+    api_call_context,
+    api_caller,
+    install_instrumentation,
+    remove_api_call_hook,
+    request_verb_and_resource,
+)
+from ocp_resources.utils.pytest_api_calls import ApiCallsPlugin
+
+API_URL: str = "https://api.cluster.example.com:6443"
+
+
+class FakeRestClient:
+    def request(self, method, url, query_params=None, **kwargs):
+        if url.endswith("/missing"):
+            raise ApiException(status=404, reason="Not Found")
+
+        return "ok"
+
+
+@pytest.fixture()
+def api_client():
+    api_client = MagicMock(rest_client=FakeRestClient())
+    install_instrumentation(api_client=api_client)
+    return api_client
+
+
+@pytest.fixture()
+def collector():
+    collector = ApiCallCollector()
+    add_api_call_hook(hook=collector)
+    yield collector
+    remove_api_call_hook(hook=collector)
+
+
+@api_caller(name="wait_for_condition")
+def _wait_for_condition(api_client):
+    # The outer caller is kept
+    with api_call_context(caller="instance"):
+        api_client.rest_client.request("GET", f"{API_URL}/api/v1/namespaces/test/pods/test-pod")
+
+
+class TestRequestVerbAndResource:
+    @pytest.mark.parametrize(
+        "method, path, query_params, expected",
+        [
+            pytest.param("GET", "/api/v1/namespaces/test/pods", None, ("list", "pods", "test"), id="list"),
+            pytest.param("GET", "/api/v1/namespaces/test/pods/p", None, ("get", "pods", "test"), id="get"),
+            pytest.param(
+                "GET",
+                "/apis/kubevirt.io/v1/namespaces/test/virtualmachines",
+                [("watch", True)],
+                ("watch", "virtualmachines", "test"),
+                id="watch",
+            ),
+            pytest.param("GET", "/api/v1/namespaces/test/pods/p/log", None, ("get", "pods/log", "test"), id="log"),
+            pytest.param(
+                "PATCH", "/apis/apps/v1/namespaces/t/deployments/d", None, ("patch", "deployments", "t"), id="patch"
+            ),
+            pytest.param("DELETE", "/api/v1/namespaces/test", None, ("delete", "namespaces", ""), id="namespace"),
+            pytest.param("POST", "/api/v1/nodes", None, ("create", "nodes", ""), id="cluster-scoped"),
+            pytest.param("GET", "/apis", None, ("get", "", ""), id="discovery"),
+        ],
+    )
+    def test_request_verb_and_resource(self, method, path, query_params, expected):
+        assert request_verb_and_resource(method=method, url=f"{API_URL}{path}", query_params=query_params) == expected
+
+
+class TestApiCallCollector:
+    def test_collect(self, api_client, collector):
+        _wait_for_condition(api_client=api_client)
+        _wait_for_condition(api_client=api_client)
+        api_client.rest_client.request("POST", f"{API_URL}/api/v1/namespaces/test/configmaps")
+        with pytest.raises(ApiException):
+            api_client.rest_client.request("GET", f"{API_URL}/api/v1/namespaces/test/configmaps/missing")
+
+        stats = {(stats.verb, stats.resource, stats.caller): stats for stats in collector.stats}
+        assert stats["get", "pods", "wait_for_condition"].count == 2
+        assert stats["create", "configmaps", "direct"].errors == 0
+        assert stats["get", "configmaps", "direct"].errors == 1
+        assert collector.total_calls == 4
+        assert len(collector.top(count=2)) == 2
+
+    def test_no_hooks(self, api_client):
+        hook = MagicMock()
+        add_api_call_hook(hook=hook)
+        remove_api_call_hook(hook=hook)
+
+        assert api_client.rest_client.request("GET", f"{API_URL}/api/v1/pods") == "ok"
+        assert not hook.called
+
+    def test_to_prometheus(self):
+        collector = ApiCallCollector(buckets=(0.1, 1))
+        for duration in (0.05, 0.5, 2):
+            collector(
+                ApiCallEvent(verb="list", resource="pods", namespace="test", caller="get", code=200, duration=duration)
+            )
+
+        text = collector.to_prometheus()
+        labels = 'verb="list",resource="pods",namespace="test",caller="get"'
+        assert f"ocp_resources_api_requests_total{{{labels}}} 3" in text
+        assert f"ocp_resources_api_request_errors_total{{{labels}}} 0" in text
+        assert f'ocp_resources_api_request_duration_seconds_bucket{{{labels},le="0.1"}} 1' in text
+        assert f'ocp_resources_api_request_duration_seconds_bucket{{{labels},le="1"}} 2' in text
+        assert f'ocp_resources_api_request_duration_seconds_bucket{{{labels},le="+Inf"}} 3' in text
+        assert f"ocp_resources_api_request_duration_seconds_count{{{labels}}} 3" in text
+
+
+class TestApiCallsPlugin:
+    def test_hotspots(self, api_client, tmp_path):
+        metrics_file = tmp_path / "metrics.prom"
+        plugin = ApiCallsPlugin(top_keys=1, metrics_file=str(metrics_file))
+        for nodeid in ("test_a", "test_b"):
+            protocol = plugin.pytest_runtest_protocol(item=MagicMock(nodeid=nodeid))
+            next(protocol)
+            if nodeid == "test_a":
+                _wait_for_condition(api_client=api_client)
+                api_client.rest_client.request("GET", f"{API_URL}/api/v1/nodes")
+
+            with pytest.raises(StopIteration):
+                next(protocol)
+
+        terminal_reporter = MagicMock()
+        plugin.pytest_terminal_summary(terminalreporter=terminal_reporter)
+        plugin.pytest_unconfigure()
+
+        lines = [call.args[0] for call in terminal_reporter.write_line.call_args_list]
+        assert list(plugin.test_stats) == ["test_a"]
+        assert lines[0].startswith("test_a: 2 calls")
+        assert len(lines) == 2
+        assert "ocp_resources_api_requests_total" in metrics_file.read_text()
@@ -0,0 +1,322 @@
+import io
+import os
+import queue
+import re
+import select
+import socket
+import subprocess
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import patch
+
+import pytest
+from kubernetes.stream.ws_client import STDERR_CHANNEL, STDOUT_CHANNEL, WSClient
+from websocket import ABNF
+
+from ocp_resources.exceptions import ExecOnPodError, MissingRequiredArgumentError
+from ocp_resources.pod import Pod
+from ocp_resources.utils.pod_exec import MARKER_PREFIX, PodExecSession, execute_on_pods
+
+POD_CONTAINERS: list[dict[str, str]] = [{"name": "test-container", "image": "nginx:latest"}]
+
+
+class LocalShellStream(WSClient):
+    """WSClient over a local shell process, receiving one frame (pipe read) per update like the real stream."""
+
+    def __init__(self, command):
+        self.command = command
+        self.process = subprocess.Popen(
+            command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE, text=False
+        )
+        self._pipes = {self.process.stdout.fileno(): STDOUT_CHANNEL, self.process.stderr.fileno(): STDERR_CHANNEL}
+        self._channels = {}
+        self._all = io.StringIO()
+
+    def is_open(self):
+        return self.process.poll() is None
+
+    def update(self, timeout=0):
+        readable, _, _ = select.select(list(self._pipes), [], [], timeout)
+        if readable:
+            self._receive(channel=self._pipes[readable[0]], data=os.read(readable[0], 65536).decode())
+
+    def _receive(self, channel, data):
+        if data:
+            self._all.write(data)
+            self._channels[channel] = self._channels.get(channel, "") + data
+
+    def write_stdin(self, data):
+        self.process.stdin.write(data.encode())
+        self.process.stdin.flush()
+
+    def close(self):
+        if self.is_open():
+            self.process.kill()
+        self.process.wait()
+
+
+class FrameStream(LocalShellStream):
+    """WSClient answering each command with the given frames, the end markers taken from the written script."""
+
+    def __init__(self, command, frames):
+        super().__init__(command=["cat"])
+        self.frames = frames
+        self._queued = []
+
+    def update(self, timeout=0):
+        if self._queued:
+            self._receive(*self._queued.pop(0))
+
+    def write_stdin(self, data):
+        for marker in re.findall(rf"'({MARKER_PREFIX}\w+)' \"", data):
+            self._queued.extend((channel, frame.format(marker=marker)) for channel, frame in self.frames)
+
+
+class LocalShellWebSocket:
+    """Websocket of a real WSClient, carrying the channels of a local shell process as frames."""
+
+    def __init__(self, command):
+        self.process = subprocess.Popen(command, stdin=subprocess.PIPE, stdout=subprocess.PIPE, stderr=subprocess.PIPE)
+        # WSClient polls `sock`, one byte is written to it per queued frame
+        self.sock, self._notify = socket.socketpair()
+        self._frames = queue.Queue()
+        self.connected = True
+        for channel, pipe in ((STDOUT_CHANNEL, self.process.stdout), (STDERR_CHANNEL, self.process.stderr)):
+            threading.Thread(target=self._pump, args=(channel, pipe), daemon=True).start()
+
+    def _pump(self, channel, pipe):
+        while data := os.read(pipe.fileno(), 65536):
+            self._frames.put(bytes([channel]) + data)
+            self._notify.send(b"x")
+
+    def recv_data_frame(self, control_frame):
+        self.sock.recv(1)
+        return ABNF.OPCODE_BINARY, SimpleNamespace(data=self._frames.get())
+
+    def send(self, payload, opcode):
+        self.process.stdin.write(payload[1:].encode())
+        self.process.stdin.flush()
+
+    def close(self, **kwargs):
+        self.connected = False
+        self.process.kill()
+        self.process.wait()
+        self.sock.close()
+        self._notify.close()
+
+
+@pytest.fixture(scope="class")
+def exec_pod(fake_client):
+    fake_client.register_resources([{"kind": "Pod", "api_version": "v1", "namespaced": True}])
+    with Pod(client=fake_client, name="test-exec-pod", namespace="default", containers=POD_CONTAINERS) as pod:
+        yield pod
+
+
+@pytest.fixture()
+def local_exec():
+    with patch(
+        "ocp_resources.utils.pod_exec.kubernetes.stream.stream",
+        side_effect=lambda **kwargs: LocalShellStream(command=kwargs["command"]),
+    ) as stream:
+        yield stream
+
+
+class TestPodExecSession:
+    def test_run(self, exec_pod, local_exec):
+        with PodExecSession(pod=exec_pod) as session:
+            assert session.container == "test-container"
+            assert session.run(command=["echo", "hello world"]) == "hello world\n"
+            assert session.run(command=["printf", "no-newline"]) == "no-newline"
+
+    def test_run_failure(self, exec_pod, local_exec):
+        with PodExecSession(pod=exec_pod) as session:
+            with pytest.raises(ExecOnPodError) as exc_info:
+                session.run(command=["sh", "-c", "echo out; echo err >&2; exit 3"])
+
+            assert (exc_info.value.rc, exc_info.value.out, exc_info.value.err) == (3, "out\n", "err\n")
+            assert session.run(command=["sh", "-c", "exit 3"], ignore_rc=True) == ""
+            # The session survives failed commands and `exit`
+            assert session.run(command=["echo", "alive"]) == "alive\n"
+
+    def test_execute_many(self, exec_pod, local_exec):
+        with PodExecSession(pod=exec_pod) as session:
+            results = session.execute_many(
+                commands=[["echo", "1"], ["sh", "-c", "echo 2 >&2; exit 1"], ["cat"], ["echo", "$HOME; exit"]]
+            )
+
+        assert [(result.rc, result.stdout, result.stderr) for result in results] == [
+            (0, "1\n", ""),
+            (1, "", "2\n"),
+            (0, "", ""),
+            (0, "$HOME; exit\n", ""),
+        ]
+        assert local_exec.call_count == 1
+
+    def test_frames_received_while_reading_are_kept(self, exec_pod):
+        frames = [(STDOUT_CHANNEL, "hello\n"), (STDOUT_CHANNEL, "{marker} 0\n"), (STDERR_CHANNEL, "{marker}\n")]
+        with patch(
+            "ocp_resources.utils.pod_exec.kubernetes.stream.stream",
+            side_effect=lambda **kwargs: FrameStream(command=kwargs["command"], frames=frames),
+        ):
+            with PodExecSession(pod=exec_pod) as session:
+                assert session.run(command=["echo", "hello"], timeout=5) == "hello\n"
+
+    def test_real_ws_client(self, exec_pod):
+        # Runs on the kubernetes WSClient itself, fails if a client upgrade changes the buffers the session reads
+        with patch(
+            "kubernetes.stream.ws_client.create_websocket",
+            side_effect=lambda configuration, url, headers=None: LocalShellWebSocket(command=["sh"]),
+        ):
+            with patch(
+                "ocp_resources.utils.pod_exec.kubernetes.stream.stream",
+                side_effect=lambda **kwargs: WSClient(configuration=None, url="", headers=None, capture_all=True),
+            ):
+                with PodExecSession(pod=exec_pod) as session:
+                    results = session.execute_many(commands=[["echo", "out"], ["sh", "-c", "echo err >&2; exit 2"]])
+
+        assert [(result.rc, result.stdout, result.stderr) for result in results] == [(0, "out\n", ""), (2, "", "err\n")]
+
+    def test_unsupported_stream(self, exec_pod):
+        with patch("ocp_resources.utils.pod_exec.kubernetes.stream.stream", return_value=SimpleNamespace(close=list)):
+            with pytest.raises(ExecOnPodError, match="_channels, _all"):
+                PodExecSession(pod=exec_pod).open()
+
+    def test_timeout_closes_session(self, exec_pod, local_exec):
+        session = PodExecSession(pod=exec_pod)
+        with pytest.raises(ExecOnPodError):
+            session.run(command=["sleep", "5"], timeout=1)
+
+        assert not session.is_open
+
+
+class TestPodExecSessions:
+    def test_session_reused(self, exec_pod, local_exec):
+        try:
+            assert exec_pod.exec_session() is exec_pod.exec_session(container="test-container")
+            results = exec_pod.execute_many(commands=[["echo", "a"], ["echo", "b"]])
+            assert [result.stdout for result in results] == ["a\n", "b\n"]
+            assert local_exec.call_count == 1
+        finally:
+            exec_pod.close_exec_sessions()
+
+        assert not exec_pod.exec_session().run(command=["true"])
+        exec_pod.close_exec_sessions()
+        assert local_exec.call_count == 2
+
+    def test_concurrent_open(self, exec_pod):
+        def _slow_stream(**kwargs):
+            time.sleep(0.2)
+            return LocalShellStream(command=kwargs["command"])
+
+        with patch("ocp_resources.utils.pod_exec.kubernetes.stream.stream", side_effect=_slow_stream) as stream:
+            try:
+                threads = [threading.Thread(target=exec_pod.exec_session) for _ in range(2)]
+                for thread in threads:
+                    thread.start()
+                for thread in threads:
+                    thread.join()
+
+                assert stream.call_count == 1
+            finally:
+                exec_pod.close_exec_sessions()
+
+
+def _fake_execute(self, command, timeout=60, container="", ignore_rc=False):
+    if self.name.endswith("slow"):
+        time.sleep(timeout + 1)
+    if self.name.endswith("failing"):
+        raise ExecOnPodError(command=command, rc=1, out="", err="failed")
+    return f"{self.name}: {' '.join(command)}"
+
+
+@pytest.fixture(scope="class")
+def fan_out_pods(fake_client):
+    fake_client.register_resources([{"kind": "Pod", "api_version": "v1", "namespaced": True}])
+    pods = [
+        Pod(
+            client=fake_client,
+            name=f"test-fan-out-{suffix}",
+            namespace="fan-out",
+            containers=POD_CONTAINERS,
+            label={"app": "fan-out"},
+        ).deploy()
+        for suffix in ("0", "1", "failing")
+    ]
+    yield pods
+    for pod in pods:
+        pod.clean_up()
+
+
+class TestExecuteOnPods:
+    def test_results_streamed(self, fan_out_pods):
+        with patch.object(Pod, "execute", _fake_execute):
+            outputs = {output.pod.name: output for output in execute_on_pods(pods=fan_out_pods, command=["ip", "a"])}
+
+        assert outputs["test-fan-out-0"].stdout == "test-fan-out-0: ip a"
+        assert outputs["test-fan-out-1"].succeeded
+        assert not outputs["test-fan-out-failing"].succeeded
+        assert outputs["test-fan-out-failing"].error.rc == 1
+
+    def test_bounded_workers(self, fan_out_pods):
+        running = []
+        max_running = []
+        lock = threading.Lock()
+
+        def _execute(self, **kwargs):
+            with lock:
+                running.append(self)
+                max_running.append(len(running))
+            time.sleep(0.1)
+            with lock:
+                running.remove(self)
+            return ""
+
+        with patch.object(Pod, "execute", _execute):
+            assert len(list(execute_on_pods(pods=fan_out_pods, command=["true"], max_workers=2))) == 3
+
+        assert max(max_running) == 2
+
+    def test_slow_pod_does_not_block(self, fan_out_pods, fake_client):
+        slow_pod = Pod(client=fake_client, name="test-fan-out-slow", namespace="fan-out")
+        with (
+            patch.object(Pod, "execute", _fake_execute),
+            patch("ocp_resources.utils.pod_exec.TIMEOUT_30SEC", 0),
+        ):
+            start = time.monotonic()
+            outputs = list(execute_on_pods(pods=[slow_pod, *fan_out_pods], command=["true"], timeout=1, max_workers=4))
+
+        assert time.monotonic() - start < 2
+        assert [output.pod.name for output in outputs][-1] == "test-fan-out-slow"
+        assert "Timed out" in outputs[-1].error.err
+
+    def test_slow_consumer_gets_finished_pods(self, fan_out_pods):
+        def _execute(self, command, **kwargs):
+            if self.name == "test-fan-out-1":
+                time.sleep(0.3)
+            return self.name
+
+        with (
+            patch.object(Pod, "execute", _execute),
+            patch("ocp_resources.utils.pod_exec.TIMEOUT_30SEC", 0),
+        ):
+            outputs = []
+            for output in execute_on_pods(pods=fan_out_pods[:2], command=["true"], timeout=1):
+                outputs.append(output)
+                time.sleep(1.5)
+
+        assert sorted((output.pod.name, output.stdout) for output in outputs) == [
+            ("test-fan-out-0", "test-fan-out-0"),
+            ("test-fan-out-1", "test-fan-out-1"),
+        ]
+
+    def test_label_selector(self, fake_client, fan_out_pods):
+        with patch.object(Pod, "execute", _fake_execute):
+            outputs = Pod.execute_on_pods(
+                command=["true"], client=fake_client, namespace="fan-out", label_selector="app=fan-out"
+            )
+            assert sorted(output.pod.name for output in outputs) == sorted(pod.name for pod in fan_out_pods)
+
+    def test_missing_pods(self):
+        with pytest.raises(MissingRequiredArgumentError):
+            Pod.execute_on_pods(command=["true"])
@@ -0,0 +1,192 @@
+import threading
+import time
+from datetime import datetime, timedelta, timezone
+from unittest.mock import MagicMock, PropertyMock, patch
+
+import pytest
+import urllib3
+from timeout_sampler import TimeoutExpiredError
+
+from ocp_resources.pod import Pod
+from ocp_resources.utils.pod_log import PodLogFollower, follow_logs, parse_log_timestamp
+
+POD_CONTAINERS: list[dict[str, str]] = [
+    {"name": "app", "image": "nginx:latest"},
+    {"name": "sidecar", "image": "nginx:latest"},
+]
+BASE_TIME: datetime = datetime(2024, 1, 1, 10, 0, 0, tzinfo=timezone.utc)
+
+
+def log_line(second, text):
+    return f"{(BASE_TIME + timedelta(seconds=second)).strftime('%Y-%m-%dT%H:%M:%S.%f')}123Z {text}\n"
+
+
+class FakeLogResponse:
+    """`read_namespaced_pod_log(_preload_content=False)`-like response."""
+
+    def __init__(self, chunks, error=None):
+        self.chunks = chunks
+        self.error = error
+        self.released = False
+
+    def stream(self, decode_content=True):
+        yield from (chunk.encode() for chunk in self.chunks)
+        if self.error:
+            raise self.error
+
+    def release_conn(self):
+        self.released = True
+
+
+class QuietLogResponse(FakeLogResponse):
+    """Follow response that stays open, without new lines, until closed."""
+
+    def __init__(self, chunks):
+        super().__init__(chunks=chunks)
+        self.closed = threading.Event()
+
+    def stream(self, decode_content=True):
+        yield from super().stream(decode_content=decode_content)
+        self.closed.wait()
+        raise urllib3.exceptions.ProtocolError("Connection closed")
+
+    def close(self):
+        self.closed.set()
+
+
+@pytest.fixture(scope="class")
+def log_pod(fake_client):
+    fake_client.register_resources([{"kind": "Pod", "api_version": "v1", "namespaced": True}])
+    with Pod(client=fake_client, name="test-log-pod", namespace="default", containers=POD_CONTAINERS) as pod:
+        yield pod
+
+
+@pytest.fixture()
+def log_api():
+    api = MagicMock()
+    with patch.object(Pod, "_kube_v1_api", new_callable=PropertyMock, return_value=api):
+        yield api
+
+
+class TestParseLogTimestamp:
+    def test_nanoseconds(self):
+        assert parse_log_timestamp(value="2024-01-01T10:00:00.123456789Z") == BASE_TIME.replace(microsecond=123456)
+
+    def test_no_fraction(self):
+        assert parse_log_timestamp(value="2024-01-01T10:00:00Z") == BASE_TIME
+
+    def test_not_a_timestamp(self):
+        assert parse_log_timestamp(value="hello") is None
+
+
+class TestPodLogFollower:
+    def test_lines_split_across_chunks(self, log_pod, log_api):
+        first, second = log_line(0, "first"), log_line(1, "second")
+        # The last line has no newline
+        response = FakeLogResponse(chunks=[first[:10], first[10:] + second[:-4], second[-4:-1]])
+        log_api.read_namespaced_pod_log.return_value = response
+
+        lines = list(PodLogFollower(pod=log_pod, follow=False).lines())
+
+        assert [(line.container, line.text) for line in lines] == [("app", "first"), ("app", "second")]
+        assert lines[0].timestamp == BASE_TIME
+        assert response.released
+        kwargs = log_api.read_namespaced_pod_log.call_args.kwargs
+        assert (kwargs["container"], kwargs["timestamps"], kwargs["_preload_content"]) == ("app", True, False)
+
+    def test_resume_after_interrupted_stream(self, log_pod, log_api):
+        log_api.read_namespaced_pod_log.side_effect = [
+            FakeLogResponse(
+                chunks=[log_line(0, "a"), log_line(1, "b"), log_line(1, "c")[:15]],
+                error=urllib3.exceptions.ProtocolError("closed"),
+            ),
+            # The resumed stream returns the lines seen at the last timestamp again
+            FakeLogResponse(chunks=[log_line(0, "a"), log_line(1, "b"), log_line(1, "c"), log_line(2, "d")]),
+            FakeLogResponse(chunks=[]),
+        ]
+        follower = PodLogFollower(pod=log_pod, container="sidecar", since_seconds=60)
+
+        lines = []
+        for line in follower.lines(timeout=10):
+            lines.append(line.text)
+            if line.text == "d":
+                break
+
+        assert lines == ["a", "b", "c", "d"]
+        first_call, second_call = log_api.read_namespaced_pod_log.call_args_list
+        assert first_call.kwargs["since_seconds"] == 60
+        assert second_call.kwargs["since_seconds"] > 60
+
+    def test_buffer_bounded(self, log_pod, log_api):
+        log_api.read_namespaced_pod_log.return_value = FakeLogResponse(
+            chunks=[log_line(second, f"line-{second}") for second in range(10)]
+        )
+        follower = PodLogFollower(pod=log_pod, follow=False, buffer_size=3)
+
+        assert len(list(follower.lines())) == 10
+        assert [line.text for line in follower.buffer] == ["line-7", "line-8", "line-9"]
+        assert follower.last_timestamp == BASE_TIME + timedelta(seconds=9)
+
+    def test_since_time(self, log_pod, log_api):
+        log_api.read_namespaced_pod_log.return_value = FakeLogResponse(chunks=[log_line(0, "old"), log_line(5, "new")])
+        follower = PodLogFollower(pod=log_pod, follow=False, since_time=BASE_TIME + timedelta(seconds=1))
+
+        assert [line.text for line in follower.lines()] == ["new"]
+
+
+class TestWaitForLogLine:
+    def test_match(self, log_pod, log_api):
+        log_api.read_namespaced_pod_log.return_value = FakeLogResponse(
+            chunks=[log_line(0, "starting"), log_line(1, "Server started on port 8080"), log_line(2, "ignored")]
+        )
+
+        line = log_pod.wait_for_log_line(regex=r"started on port \d+", timeout=5)
+
+        assert line.timestamp == BASE_TIME + timedelta(seconds=1)
+        assert log_api.read_namespaced_pod_log.call_count == 1
+
+    def test_timeout(self, log_pod, log_api):
+        log_api.read_namespaced_pod_log.side_effect = lambda **kwargs: FakeLogResponse(chunks=[log_line(0, "noise")])
+
+        with pytest.raises(TimeoutExpiredError):
+            log_pod.wait_for_log_line(regex="never", timeout=1)
+
+
+class TestFollowLogs:
+    @staticmethod
+    def _logs_by_container(**kwargs):
+        logs = {
+            "app": [log_line(0, "app-0"), log_line(2, "app-2")],
+            "sidecar": [log_line(1, "sidecar-1"), log_line(3, "sidecar-3")],
+        }
+        return FakeLogResponse(chunks=logs[kwargs["container"]])
+
+    def test_merged_by_timestamp(self, log_pod, log_api):
+        log_api.read_namespaced_pod_log.side_effect = self._logs_by_container
+
+        lines = follow_logs(pods=[log_pod], follow=False)
+
+        assert [line.text for line in lines] == ["app-0", "sidecar-1", "app-2", "sidecar-3"]
+
+    def test_follow_merged_by_timestamp(self, log_pod, log_api):
+        log_api.read_namespaced_pod_log.side_effect = self._logs_by_container
+
+        lines = follow_logs(pods=[log_pod], timeout=1, merge_window=0.5)
+
+        assert [line.text for line in lines] == ["app-0", "sidecar-1", "app-2", "sidecar-3"]
+
+    def test_follow_closes_streams_when_stopped(self, log_pod, log_api):
+        response = QuietLogResponse(chunks=[log_line(0, "app-0")])
+        log_api.read_namespaced_pod_log.return_value = response
+
+        lines = follow_logs(pods=[log_pod], containers=["app"], merge_window=0.1)
+        assert next(lines).text == "app-0"
+        lines.close()
+
+        assert response.closed.is_set()
+        for _ in range(50):
+            if response.released:
+                break
+            time.sleep(0.1)
+        assert response.released
+        assert log_api.read_namespaced_pod_log.call_count == 1
@@ -1,16 +1,22 @@
 import os
-from unittest.mock import patch
+from unittest.mock import MagicMock, patch
 
 import kubernetes
 import pytest
 import yaml
+from kubernetes.client.rest import ApiException
+from kubernetes.dynamic.exceptions import GoneError
 
-from ocp_resources.exceptions import ResourceTeardownError
+from ocp_resources.config_map import ConfigMap
+from ocp_resources.exceptions import BulkResourceError, ListExpiredError, ResourceTeardownError
 from ocp_resources.namespace import Namespace
 from ocp_resources.pod import Pod
-from ocp_resources.resource import NamespacedResourceList, Resource, ResourceList
+from ocp_resources.resource import NamespacedResourceList, Resource, ResourceEditor, ResourceList, _paginate
 from ocp_resources.secret import Secret
 from ocp_resources.utils.client_config import resolve_bearer_token, save_kubeconfig
+from ocp_resources.utils.informer import stop_informers
+from ocp_resources.utils.rate_limiter import ClientRateLimiter, TokenBucketRateLimiter, request_lane
+from ocp_resources.utils.wait_engine import ListWatcher
 
 BASE_NAMESPACE_NAME: str = "test-namespace"
 BASE_POD_NAME: str = "test-pod"
@@ -134,6 +140,106 @@ class TestResource:
                 pass
 
 
+class TestResourcePagination:
+    def test_get_paginated(self, fake_client, namespaces):
+        namespaces.deploy()
+        with patch.object(
+            Resource, "retry_cluster_exceptions", wraps=Resource.retry_cluster_exceptions
+        ) as retry_cluster_exceptions:
+            names = [ns.name for ns in Namespace.get(client=fake_client, page_size=1)]
+
+        assert {ns.name for ns in namespaces}.issubset(names)
+        assert len(names) == len(set(names))
+        assert retry_cluster_exceptions.call_count >= len(names)
+        namespaces.clean_up()
+
+    def test_expired_continue_token(self):
+        def _get_page(limit, _continue):
+            if _continue:
+                raise GoneError(ApiException(status=410, reason="Expired"))
+            return MagicMock(items=["first"], metadata={"continue": "next-page"})
+
+        pages = _paginate(get_page=_get_page, page_size=1)
+        assert next(pages) == "first"
+        with pytest.raises(ListExpiredError):
+            next(pages)
+
+    def test_get_carries_listed_body(self, fake_client, pod):
+        pod_from_list = next(
+            Pod.get(client=fake_client, namespace="default", field_selector=f"metadata.name={pod.name}")
+        )
+        with patch.object(Pod, "api", new_callable=lambda: property(lambda _self: pytest.fail("API was called"))):
+            assert pod_from_list.instance.metadata.name == pod.name
+
+        assert pod_from_list.instance.metadata.name == pod.name
+
+    def test_get_all_cluster_resources_paginated(self, fake_client, namespace):
+        namespace.deploy()
+        names = [
+            _resource.metadata.name
+            for _resource in Resource.get_all_cluster_resources(client=fake_client, page_size=1)
+            if _resource.kind == "Namespace"
+        ]
+        assert namespace.name in names
+        namespace.clean_up()
+
+
+class TestResourceFreshness:
+    def test_from_dict(self, fake_client, pod):
+        pod_dict = pod.instance.to_dict()
+        pod_from_dict = Pod.from_dict(client=fake_client, resource_dict=pod_dict)
+        assert pod_from_dict.namespace == pod.namespace
+        assert pod_from_dict.resource_version == pod_dict["metadata"]["resourceVersion"]
+        with patch.object(Pod, "api", new_callable=lambda: property(lambda _self: pytest.fail("API was called"))):
+            assert pod_from_dict.instance.metadata.uid == pod_dict["metadata"]["uid"]
+
+    def test_from_instance(self, fake_client, pod):
+        pod_from_instance = Pod.from_instance(client=fake_client, instance=pod.instance)
+        assert pod_from_instance.name == pod.name
+
+    def test_always_fetches(self, fake_client, pod):
+        pod_always = Pod(client=fake_client, name=pod.name, namespace=pod.namespace)
+        with patch.object(Pod, "api", wraps=pod_always.api) as api:
+            assert pod_always.instance
+            assert pod_always.instance
+
+        assert api.get.call_count == 2
+
+    def test_max_age(self, fake_client, pod):
+        pod_max_age = Pod(
+            client=fake_client,
+            name=pod.name,
+            namespace=pod.namespace,
+            freshness=Pod.Freshness.MAX_AGE,
+            max_age=60,
+        )
+        with patch.object(Pod, "api", wraps=pod_max_age.api) as api:
+            assert pod_max_age.instance
+            assert pod_max_age.instance
+            assert api.get.call_count == 1
+            pod_max_age.max_age = -1
+            assert pod_max_age.instance
+
+        assert api.get.call_count == 2
+
+    def test_known_instance(self, fake_client, pod):
+        pod_known = Pod(client=fake_client, name=pod.name, namespace=pod.namespace)
+        with patch.object(Pod, "api", wraps=pod_known.api) as api:
+            assert pod_known.known_instance.metadata.uid
+            assert pod_known.known_instance.spec.containers[0].name
+
+        assert api.get.call_count == 1
+
+    def test_watch(self, fake_client, pod):
+        fake_client.register_resources([{"kind": "Pod", "api_version": "v1", "namespaced": True}])
+        pod_watch = Pod(client=fake_client, name=pod.name, namespace=pod.namespace, freshness=Pod.Freshness.WATCH)
+        try:
+            assert pod_watch.instance.metadata.name == pod.name
+            assert pod_watch.resource_version
+        finally:
+            stop_informers(client=fake_client)
+
+
 @pytest.mark.incremental
 class TestResourceList:
     def test_resource_list_deploy(self, namespaces):
@@ -188,6 +294,253 @@ class TestNamespacedResourceList:
             assert pods
 
 
+class TestResourceListConcurrent:
+    def test_concurrent_deploy_and_clean_up(self, fake_client):
+        namespaces = ResourceList(
+            client=fake_client, resource_class=Namespace, name="test-concurrent-namespace", num_resources=5
+        )
+        assert [ns.name for ns in namespaces.deploy(wait=True, max_workers=3, qps=100)] == [
+            ns.name for ns in namespaces
+        ]
+        assert all(ns.exists for ns in namespaces)
+        assert namespaces.clean_up(wait=True, max_workers=3)
+        assert not any(ns.exists for ns in namespaces)
+
+    def test_dependency_tiers(self, fake_client, namespaces):
+        pods = NamespacedResourceList(
+            client=fake_client,
+            resource_class=Pod,
+            namespaces=namespaces,
+            name=BASE_POD_NAME,
+            containers=POD_CONTAINERS,
+        )
+        pods.resources.append(namespaces[0])
+        assert pods.dependency_tiers() == [[3], [0, 1, 2]]
+
+    def test_concurrent_errors_are_aggregated(self, fake_client):
+        namespaces = ResourceList(
+            client=fake_client, resource_class=Namespace, name="test-concurrent-errors", num_resources=3
+        )
+        with patch.object(namespaces[1], "deploy", side_effect=ValueError("deploy failed")):
+            with pytest.raises(BulkResourceError) as exc_info:
+                namespaces.deploy(max_workers=3)
+
+        assert [resource for resource, _ in exc_info.value.errors] == [namespaces[1]]
+        assert namespaces[0].exists
+        assert namespaces[2].exists
+        namespaces.clean_up(wait=False, max_workers=3)
+
+    def test_concurrent_waits_are_batched(self, fake_client):
+        namespaces = ResourceList(
+            client=fake_client, resource_class=Namespace, name="test-concurrent-batched", num_resources=5
+        )
+        with (
+            patch.object(Resource, "wait", side_effect=AssertionError("waited for a single resource")),
+            patch.object(Resource, "wait_deleted", side_effect=AssertionError("waited for a single resource")),
+            patch.object(ListWatcher, "list", autospec=True, side_effect=ListWatcher.list) as list_calls,
+        ):
+            namespaces.deploy(wait=True, max_workers=2)
+            namespaces.clean_up(wait=True, max_workers=2)
+
+        assert list_calls.call_count == 2
+        assert not any(ns.exists for ns in namespaces)
+
+    def test_own_waits_are_kept(self, fake_client):
+        class WaitedNamespace(Namespace):
+            def wait(self, *_args, **_kwargs):
+                self.waited = True
+
+        namespaces = ResourceList(
+            client=fake_client, resource_class=WaitedNamespace, name="test-concurrent-own-wait", num_resources=3
+        )
+        with patch("ocp_resources.resource.wait_for_resources", side_effect=AssertionError("batched wait")):
+            namespaces.deploy(wait=True, max_workers=3)
+
+        assert all(ns.waited for ns in namespaces)
+        namespaces.clean_up(wait=False, max_workers=3)
+
+    def test_failed_batched_wait_is_aggregated(self, fake_client):
+        namespaces = ResourceList(
+            client=fake_client, resource_class=Namespace, name="test-concurrent-wait-error", num_resources=3
+        )
+        with (
+            patch.object(namespaces[0], "deploy", side_effect=ValueError("deploy failed")),
+            patch("ocp_resources.resource.wait_for_resources", side_effect=ApiException(status=500)),
+        ):
+            with pytest.raises(BulkResourceError) as exc_info:
+                namespaces.deploy(wait=True, max_workers=3)
+
+        assert sorted(type(exp).__name__ for _, exp in exc_info.value.errors) == [
+            "ApiException",
+            "ApiException",
+            "ValueError",
+        ]
+        namespaces.clean_up(wait=False, max_workers=3)
+
+    def test_failed_tier_stops_dependent_tiers(self, fake_client):
+        namespace = Namespace(client=fake_client, name="test-concurrent-failed-tier")
+        pods = NamespacedResourceList(
+            client=fake_client,
+            resource_class=Pod,
+            namespaces=ResourceList(client=fake_client, resource_class=Namespace, name=namespace.name, num_resources=1),
+            name=BASE_POD_NAME,
+            containers=POD_CONTAINERS,
+        )
+        pods.resources.append(namespace)
+        with (
+            patch.object(namespace, "deploy", side_effect=ValueError("deploy failed")),
+            patch.object(Pod, "deploy", side_effect=AssertionError("dependent tier deployed")),
+        ):
+            with pytest.raises(BulkResourceError) as exc_info:
+                pods.deploy(wait=True, max_workers=3)
+
+        assert [resource for resource, _ in exc_info.value.errors] == [namespace]
+
+
+@pytest.fixture()
+def config_maps(fake_client):
+    config_maps = [
+        ConfigMap(
+            client=fake_client,
+            name=f"test-editor-{index}",
+            namespace="default",
+            data={"key": "value"},
+            label={"env": "prod"},
+        ).deploy()
+        for index in range(3)
+    ]
+    yield config_maps
+    for config_map in config_maps:
+        config_map.clean_up(wait=False)
+
+
+class TestResourceEditor:
+    def test_apply_and_release(self, config_maps):
+        patches = {
+            config_map: {"metadata": {"labels": {"edited": "true", "env": "prod"}}, "data": {"new": "1"}}
+            for config_map in config_maps
+        }
+        with patch.object(ResourceEditor, "_backup_resource") as backup_resource:
+            with ResourceEditor(patches=patches, field_manager="ocp-tests", max_workers=3) as editor:
+                assert all(config_map.instance.metadata.labels.edited == "true" for config_map in config_maps)
+                assert not editor.backups
+
+        assert not backup_resource.called
+        for config_map in config_maps:
+            instance = config_map.instance
+            assert dict(instance.metadata.labels) == {"env": "prod"}
+            assert dict(instance.data) == {"key": "value"}
+            assert "ocp-tests" not in [entry.manager for entry in instance.metadata.managedFields]
+
+    def test_conflict_falls_back_to_backup(self, config_maps):
+        config_map = config_maps[0]
+        with ResourceEditor(
+            patches={config_map: {"metadata": {"labels": {"env": "test"}}}}, field_manager="ocp-tests"
+        ) as editor:
+            assert config_map.instance.metadata.labels.env == "test"
+            assert editor.backups == {config_map: {"metadata": {"labels": {"env": "prod"}}}}
+
+        assert config_map.instance.metadata.labels.env == "prod"
+
+    def test_force_conflicts(self, config_maps):
+        config_map = config_maps[0]
+        with ResourceEditor(
+            patches={config_map: {"metadata": {"labels": {"env": "test"}}}},
+            field_manager="ocp-tests",
+            force_conflicts=True,
+        ) as editor:
+            assert config_map.instance.metadata.labels.env == "test"
+            assert not editor.backups
+
+        # The forced field is released, not reset
+        assert "env" not in (config_map.instance.metadata.labels or {})
+
+    def test_concurrent_errors_are_aggregated(self, config_maps):
+        patches = {config_map: {"metadata": {"labels": {"env": "test"}}} for config_map in config_maps}
+        with patch.object(config_maps[1], "update", side_effect=ValueError("patch failed")):
+            with pytest.raises(BulkResourceError) as exc_info:
+                ResourceEditor(patches=patches, max_workers=3).update(backup_resources=True)
+
+        assert [resource for resource, _ in exc_info.value.errors] == [config_maps[1]]
+        assert config_maps[0].instance.metadata.labels.env == "test"
+        assert config_maps[2].instance.metadata.labels.env == "test"
+
+
+class TestTokenBucketRateLimiter:
+    def test_burst(self):
+        rate_limiter = TokenBucketRateLimiter(qps=1, burst=3)
+        assert [rate_limiter.acquire() for _ in range(3)] == [0, 0, 0]
+
+    def test_rate(self):
+        rate_limiter = TokenBucketRateLimiter(qps=50, burst=1)
+        rate_limiter.acquire()
+        assert rate_limiter.acquire() > 0
+
+    def test_invalid_qps(self):
+        with pytest.raises(ValueError):
+            TokenBucketRateLimiter(qps=0)
+
+
+class FakeRestClient:
+    def __init__(self, throttled_requests=0, retry_after="0.1"):
+        self.calls = []
+        self.throttled_requests = throttled_requests
+        self.retry_after = retry_after
+
+    def request(self, method, url, query_params=None, **kwargs):
+        self.calls.append((method, url))
+        if len(self.calls) <= self.throttled_requests:
+            exp = ApiException(status=429, reason="Too Many Requests")
+            exp.headers = {"Retry-After": self.retry_after}
+            raise exp
+
+        return "ok"
+
+
+class FakeApiClient:
+    def __init__(self, rest_client):
+        self.rest_client = rest_client
+
+
+class TestClientRateLimiter:
+    def test_request_lane(self):
+        assert request_lane(method="GET", query_params=[("labelSelector", "app=test")]) == "read"
+        assert request_lane(method="GET", query_params=[("watch", True)]) == "watch"
+        assert request_lane(method="GET", query_params={"watch": "true"}) == "watch"
+        assert request_lane(method="PATCH") == "write"
+
+    def test_lanes_are_independent(self):
+        rate_limiter = ClientRateLimiter(qps=20, burst=1)
+        rate_limiter.acquire(lane="read")
+        assert rate_limiter.acquire(lane="write") == pytest.approx(0, abs=0.01)
+        assert rate_limiter.acquire(lane="read") > 0.01
+
+        assert rate_limiter.stats["read"].requests == 2
+        assert rate_limiter.stats["read"].max_queued_time > 0.01
+
+    def test_retry_after(self):
+        rest_client = FakeRestClient(throttled_requests=2)
+        api_client = FakeApiClient(rest_client=rest_client)
+        ClientRateLimiter().install(api_client=api_client)
+
+        assert api_client.rest_client.request("POST", "/api/v1/namespaces/test/configmaps") == "ok"
+        assert len(rest_client.calls) == 3
+        stats = api_client.rate_limiter.stats["write"]
+        assert (stats.requests, stats.throttled) == (3, 2)
+        assert stats.queued_time >= 0.2
+        assert api_client.rate_limiter.stats["read"].requests == 0
+
+    def test_retry_after_exhausted(self):
+        rest_client = FakeRestClient(throttled_requests=10, retry_after="0")
+        api_client = FakeApiClient(rest_client=rest_client)
+        ClientRateLimiter(max_throttle_retries=2).install(api_client=api_client)
+
+        with pytest.raises(ApiException):
+            api_client.rest_client.request("GET", "/api/v1/namespaces")
+
+        assert len(rest_client.calls) == 3
+
+
 @pytest.mark.xfail(reason="Need debug")
 class TestClientProxy:
     @patch.dict(os.environ, {"HTTP_PROXY": "http://env-http-proxy.com"})
@@ -0,0 +1,115 @@
+from unittest.mock import MagicMock
+
+import pytest
+from kubernetes.dynamic.exceptions import ConflictError, ServerTimeoutError
+from timeout_sampler import TimeoutExpiredError
+
+from ocp_resources.config_map import ConfigMap
+from ocp_resources.resource import Resource
+from ocp_resources.utils.constants import DEFAULT_CLUSTER_RETRY_EXCEPTIONS
+from ocp_resources.utils.retry_policy import RetryPolicy
+
+
+def _flaky(failures, exception=ServerTimeoutError):
+    """Return a function that raises `failures` times before returning "ok"."""
+    func = MagicMock(side_effect=[exception(MagicMock())] * failures + ["ok"])
+    func.__qualname__ = "flaky"
+    return func
+
+
+class TestRetryPolicy:
+    def test_exponential_intervals(self):
+        intervals = RetryPolicy(base=1, max_interval=8, jitter=False).intervals()
+        assert [next(intervals) for _ in range(6)] == [1, 2, 4, 8, 8, 8]
+
+    def test_jitter_intervals(self):
+        intervals = RetryPolicy(base=1, max_interval=5).intervals()
+        samples = [next(intervals) for _ in range(100)]
+
+        assert all(1 <= interval <= 5 for interval in samples)
+        assert len(set(samples)) > 1
+
+    def test_invalid_interval(self):
+        with pytest.raises(ValueError):
+            RetryPolicy(base=0)
+
+    def test_call_records_retries(self):
+        retry_policy = RetryPolicy(base=0.01, max_interval=0.02)
+
+        assert (
+            retry_policy.call(func=_flaky(failures=2), timeout=5, exceptions_dict=DEFAULT_CLUSTER_RETRY_EXCEPTIONS)
+            == "ok"
+        )
+        record = retry_policy.history[-1]
+        assert (record.operation, record.attempts, record.retries, record.succeeded) == ("flaky", 3, 2, True)
+
+    def test_not_retryable(self):
+        retry_policy = RetryPolicy(base=0.01)
+        func = _flaky(failures=1, exception=ConflictError)
+
+        with pytest.raises(ConflictError):
+            retry_policy.call(func=func, timeout=5, exceptions_dict=DEFAULT_CLUSTER_RETRY_EXCEPTIONS)
+
+        assert func.call_count == 1
+        assert not retry_policy.history[-1].succeeded
+
+    def test_max_retries(self):
+        retry_policy = RetryPolicy(base=0.01, max_retries=2)
+        func = _flaky(failures=5)
+
+        with pytest.raises(ServerTimeoutError):
+            retry_policy.call(func=func, timeout=5)
+
+        assert func.call_count == 3
+
+    def test_retry_budget(self):
+        retry_policy = RetryPolicy(base=0.01, budget_ratio=0, budget_min_retries=1)
+        assert retry_policy.call(func=_flaky(failures=1), timeout=5) == "ok"
+
+        # The budget is shared: the single retry it allows is spent
+        with pytest.raises(ServerTimeoutError):
+            retry_policy.call(func=_flaky(failures=1), timeout=5)
+
+    def test_timeout(self):
+        retry_policy = RetryPolicy(base=0.05)
+
+        with pytest.raises(TimeoutExpiredError) as exp:
+            retry_policy.call(func=_flaky(failures=100), timeout=0.2)
+
+        assert isinstance(exp.value.last_exp, ServerTimeoutError)
+
+    def test_retry_cluster_exceptions(self):
+        retry_policy = RetryPolicy(base=0.01)
+
+        assert (
+            Resource.retry_cluster_exceptions(func=_flaky(failures=1), retry_policy=retry_policy, operation="list")
+            == "ok"
+        )
+        assert retry_policy.history[-1].operation == "list"
+        assert retry_policy.history[-1].retries == 1
+
+
+class TestResourceRetryPolicy:
+    def test_resource_operations(self, fake_client):
+        retry_policy = RetryPolicy(base=0.01)
+        config_map = ConfigMap(
+            client=fake_client,
+            name="test-retry-policy",
+            namespace="default",
+            data={"key": "value"},
+            retry_policy=retry_policy,
+        )
+        config_map.deploy()
+        assert config_map.instance.data.key == "value"
+        config_map.clean_up()
+
+        operations = [record.operation for record in retry_policy.history]
+        assert operations[0] == "create ConfigMap test-retry-policy"
+        assert "get ConfigMap test-retry-policy" in operations
+        assert "delete ConfigMap test-retry-policy" in operations
+        assert operations[-1] == "wait for ConfigMap test-retry-policy"
+        records = {record.operation: record for record in retry_policy.history}
+        assert records["create ConfigMap test-retry-policy"].succeeded
+        assert records["wait for ConfigMap test-retry-policy"].succeeded
+        # The last get of the wait found the ConfigMap deleted
+        assert not records["get ConfigMap test-retry-policy"].succeeded
@@ -2,6 +2,7 @@
 
 from unittest.mock import mock_open, patch
 
+import jsonschema
 import pytest
 
 from ocp_resources.utils.schema_validator import SchemaValidator
@@ -15,6 +16,7 @@ def reset_schema_validator():
     SchemaValidator._mappings_data = None
     SchemaValidator._definitions_data = None
     SchemaValidator._schema_cache.clear()
+    SchemaValidator._validator_cache.clear()
 
     yield
 
@@ -22,6 +24,7 @@ def reset_schema_validator():
     SchemaValidator._mappings_data = None
     SchemaValidator._definitions_data = None
     SchemaValidator._schema_cache.clear()
+    SchemaValidator._validator_cache.clear()
 
 
 class TestSchemaLoading:
@@ -70,8 +73,11 @@ class TestSchemaLoading:
         """Test successful loading of mappings data."""
         mock_mappings_data = {"pod": [{"type": "object"}]}
 
-        # Mock the archive loading function and file operations
-        with patch("ocp_resources.utils.schema_validator.load_json_archive") as mock_load_archive:
+        # Mock the archive loading function and file operations, without the schema store
+        with (
+            patch("ocp_resources.utils.schema_validator.open_schema_store", return_value=None),
+            patch("ocp_resources.utils.schema_validator.load_json_archive") as mock_load_archive,
+        ):
             mock_load_archive.return_value = mock_mappings_data
 
             with patch("builtins.open", mock_open(read_data='{"definitions": {"SomeDefinition": {"type": "string"}}}')):
@@ -312,3 +318,52 @@ class TestSchemaLoadingWithApiGroup:
             # If validation fails, it should be because of schema requirements,
             # not because we picked the wrong schema
             assert "ValidationError" in str(type(e))
+
+
+class TestValidatorCache:
+    """Test compiled validator caching."""
+
+    @pytest.fixture(autouse=True)
+    def setup_pod_schema(self, monkeypatch):
+        monkeypatch.setattr(SchemaValidator, "_mappings_data", {"pod": [POD_SCHEMA]})
+        monkeypatch.setattr(SchemaValidator, "_definitions_data", {})
+
+    def test_validator_built_once(self):
+        """Test the validator is compiled once and reused."""
+        validator = SchemaValidator.get_validator(kind="Pod")
+        assert SchemaValidator.get_validator(kind="Pod") is validator
+
+    def test_validate_raises_validation_error(self):
+        """Test validation with the cached validator raises like jsonschema.validate."""
+        SchemaValidator.validate(
+            resource_dict={
+                "apiVersion": "v1",
+                "kind": "Pod",
+                "metadata": {"name": "pod"},
+                "spec": {"containers": [{"name": "container", "image": "image"}]},
+            },
+            kind="Pod",
+        )
+        with pytest.raises(jsonschema.ValidationError):
+            SchemaValidator.validate(resource_dict={"apiVersion": 1, "kind": "Pod"}, kind="Pod")
+
+    def test_validator_rebuilt_after_schema_reload(self):
+        """Test a stale validator is not served after the schema cache is cleared."""
+        validator = SchemaValidator.get_validator(kind="Pod")
+        SchemaValidator._schema_cache.clear()
+        assert SchemaValidator.get_validator(kind="Pod") is not validator
+
+    def test_lru_eviction(self, monkeypatch):
+        """Test least recently used validators are evicted with their schemas."""
+        monkeypatch.setenv("OPENSHIFT_PYTHON_WRAPPER_SCHEMA_VALIDATOR_CACHE_SIZE", "1")
+        monkeypatch.setattr(SchemaValidator, "_mappings_data", {"pod": [POD_SCHEMA], "service": [POD_SCHEMA]})
+        SchemaValidator.get_validator(kind="Pod")
+        SchemaValidator.get_validator(kind="Service")
+
+        assert list(SchemaValidator._validator_cache) == ["Service"]
+        assert "Pod" not in SchemaValidator._schema_cache
+
+    def test_warm_up(self):
+        """Test warm up compiles the kinds that have a schema."""
+        assert SchemaValidator.warm_up(kinds=["Pod", "NoSuchKind"]) == ["Pod"]
+        assert "Pod" in SchemaValidator._validator_cache
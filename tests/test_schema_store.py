@@ -0,0 +1,83 @@
+import json
+import os
+from unittest.mock import patch
+
+import pytest
+
+from ocp_resources.utils.archive_utils import save_json_archive
+from ocp_resources.utils.schema_store import SchemaStore, open_schema_store
+from tests.fixtures.validation_schemas import POD_SCHEMA
+
+POD_MAPPING: dict[str, object] = {
+    **POD_SCHEMA,
+    "namespaced": True,
+    "x-kubernetes-group-version-kind": [{"group": "", "kind": "Pod", "version": "v1"}],
+}
+MAPPINGS: dict[str, list[dict[str, object]]] = {"pod": [POD_MAPPING], "service": [{"type": "object"}]}
+DEFINITIONS: dict[str, dict[str, str]] = {"io.k8s.api.core.v1.PodSpec": {"type": "object"}}
+
+
+@pytest.fixture()
+def schema_files(tmp_path, monkeypatch):
+    monkeypatch.setenv("OPENSHIFT_PYTHON_WRAPPER_SCHEMA_STORE_DIR", str(tmp_path / "store"))
+    mappings_file = tmp_path / "__resources-mappings.json"
+    definitions_file = tmp_path / "_definitions.json"
+    save_json_archive(data=MAPPINGS, json_file=mappings_file)
+    definitions_file.write_text(json.dumps({"definitions": DEFINITIONS}))
+    return mappings_file, definitions_file
+
+
+@pytest.fixture()
+def schema_store(tmp_path):
+    SchemaStore.build(path=tmp_path / "store.sqlite", mappings=MAPPINGS, definitions=DEFINITIONS)
+    return SchemaStore(path=tmp_path / "store.sqlite")
+
+
+class TestSchemaStore:
+    def test_mappings(self, schema_store):
+        assert schema_store.mappings["pod"] == [POD_MAPPING]
+        assert schema_store.mappings.get("no-such-kind") is None
+        assert "service" in schema_store.mappings
+        assert list(schema_store.mappings) == ["pod", "service"]
+        assert len(schema_store.mappings) == 2
+
+    def test_value_decoded_once(self, schema_store):
+        with patch.object(schema_store, "fetch", wraps=schema_store.fetch) as fetch:
+            assert schema_store.mappings["pod"] is schema_store.mappings["pod"]
+            assert fetch.call_count == 1
+
+    def test_summaries(self, schema_store):
+        assert schema_store.summaries["pod"] == [
+            {"x-kubernetes-group-version-kind": POD_MAPPING["x-kubernetes-group-version-kind"], "namespaced": True}
+        ]
+
+    def test_definitions(self, schema_store):
+        assert schema_store.definitions["io.k8s.api.core.v1.PodSpec"] == {"type": "object"}
+        with pytest.raises(KeyError):
+            schema_store.definitions["PodSpec"]
+
+
+class TestOpenSchemaStore:
+    def test_built_once(self, schema_files):
+        mappings_file, definitions_file = schema_files
+        assert open_schema_store(mappings_file=mappings_file, definitions_file=definitions_file).mappings["pod"]
+
+        with patch("ocp_resources.utils.schema_store.load_json_archive") as load_json_archive:
+            store = open_schema_store(mappings_file=mappings_file, definitions_file=definitions_file)
+            assert store.mappings["pod"] == [POD_MAPPING]
+            assert not load_json_archive.called
+
+    def test_rebuilt_on_archive_change(self, schema_files):
+        mappings_file, definitions_file = schema_files
+        store = open_schema_store(mappings_file=mappings_file, definitions_file=definitions_file)
+
+        save_json_archive(data={"namespace": [{"type": "object"}]}, json_file=mappings_file)
+        archive = mappings_file.with_suffix(".json.gz")
+        os.utime(archive, ns=(archive.stat().st_atime_ns, archive.stat().st_mtime_ns + 1))
+
+        updated_store = open_schema_store(mappings_file=mappings_file, definitions_file=definitions_file)
+        assert updated_store.path != store.path
+        assert list(updated_store.mappings) == ["namespace"]
+
+    def test_missing_files(self, tmp_path):
+        assert open_schema_store(mappings_file=tmp_path / "missing.json", definitions_file=tmp_path / "missing") is None
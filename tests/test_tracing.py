@@ -0,0 +1,99 @@
+import subprocess
+import sys
+import textwrap
+from unittest.mock import MagicMock
+
+import pytest
+from kubernetes.client.rest import ApiException
+
+from ocp_resources.config_map import ConfigMap
+from ocp_resources.utils.tracing import install_tracing, start_span
+
+API_URL: str = "https://api.cluster.example.com:6443"
+
+
+class FakeRestClient:
+    def request(self, method, url, query_params=None, **kwargs):
+        if url.endswith("/missing"):
+            raise ApiException(status=404, reason="Not Found")
+
+        return MagicMock(status=200)
+
+
+@pytest.fixture(scope="module")
+def span_exporter():
+    trace = pytest.importorskip("opentelemetry.trace")
+    sdk_trace = pytest.importorskip("opentelemetry.sdk.trace")
+    export = pytest.importorskip("opentelemetry.sdk.trace.export")
+    in_memory = pytest.importorskip("opentelemetry.sdk.trace.export.in_memory_span_exporter")
+
+    exporter = in_memory.InMemorySpanExporter()
+    provider = sdk_trace.TracerProvider()
+    provider.add_span_processor(export.SimpleSpanProcessor(exporter))
+    trace.set_tracer_provider(provider)
+    return exporter
+
+
+@pytest.fixture()
+def spans(span_exporter):
+    span_exporter.clear()
+    yield span_exporter
+    span_exporter.clear()
+
+
+class TestTracingNotInstalled:
+    def test_no_op(self):
+        # Block the opentelemetry import in a fresh interpreter
+        code = textwrap.dedent(
+            """
+            import sys
+            from unittest.mock import MagicMock
+
+            sys.modules["opentelemetry"] = None
+            from ocp_resources.utils.tracing import install_tracing, start_span, traced, tracing_available
+
+            def func():
+                pass
+
+            api_client = MagicMock()
+            request = api_client.rest_client.request
+            install_tracing(api_client=api_client)
+            with start_span(name="test") as span:
+                assert span is None
+            assert not tracing_available()
+            assert traced(name="test")(func) is func
+            assert api_client.rest_client.request is request
+            """
+        )
+        subprocess.run([sys.executable, "-c", code], check=True)
+
+
+class TestTracing:
+    def test_resource_spans(self, fake_client, spans):
+        config_map = ConfigMap(client=fake_client, name="test-tracing-cm", namespace="default", data={"key": "value"})
+        config_map.deploy()
+        config_map.wait(timeout=5, use_watch=False)
+        config_map.clean_up()
+
+        finished = {span.name: span for span in spans.get_finished_spans()}
+        assert {"ConfigMap.create", "ConfigMap.wait", "ConfigMap.delete"} <= set(finished)
+        assert finished["ConfigMap.create"].attributes["k8s.resource.name"] == "test-tracing-cm"
+        assert finished["ConfigMap.create"].attributes["k8s.namespace.name"] == "default"
+        assert finished["ConfigMap.wait"].attributes["ocp_resources.wait.mode"] == "poll"
+        assert finished["ConfigMap.wait"].attributes["ocp_resources.wait.polls"] == 1
+
+    def test_http_child_spans(self, spans):
+        api_client = MagicMock(rest_client=FakeRestClient())
+        install_tracing(api_client=api_client)
+        with start_span(name="parent"):
+            api_client.rest_client.request("GET", f"{API_URL}/api/v1/namespaces/test/pods/test-pod")
+            with pytest.raises(ApiException):
+                api_client.rest_client.request("GET", f"{API_URL}/api/v1/namespaces/test/configmaps/missing")
+
+        get_pod, get_missing, parent = spans.get_finished_spans()
+        assert get_pod.name == "get pods"
+        assert get_pod.parent.span_id == parent.context.span_id
+        assert get_pod.attributes["http.response.status_code"] == 200
+        assert get_pod.attributes["k8s.namespace.name"] == "test"
+        assert get_missing.attributes["http.response.status_code"] == 404
+        assert not get_missing.status.is_ok
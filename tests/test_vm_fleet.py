@@ -0,0 +1,138 @@
+import threading
+import time
+from unittest.mock import patch
+
+import pytest
+from timeout_sampler import TimeoutExpiredError
+
+from ocp_resources.utils.vm_fleet import VMI_KIND, VirtualMachineFleet
+from ocp_resources.utils.wait_engine import ListWatcher
+from ocp_resources.virtual_machine import VirtualMachine
+from ocp_resources.virtual_machine_instance import VirtualMachineInstance
+
+NAMESPACE: str = "vm-fleet"
+
+
+def _patch_status(resource, status):
+    resource.api.patch(
+        body={"metadata": {"name": resource.name, "namespace": resource.namespace}, "status": status},
+        namespace=resource.namespace,
+        content_type="application/merge-patch+json",
+    )
+
+
+def _fake_api_request(self, method, action, **kwargs):
+    """Act like virt-controller: create a VMI that is scheduled then running, or delete it."""
+    if self.name.endswith("broken"):
+        raise RuntimeError("admission webhook denied the request")
+
+    vmi = VirtualMachineInstance(client=self.client, name=self.name, namespace=self.namespace, domain={})
+    if action in ("stop", "restart"):
+        vmi.clean_up(wait=False)
+        _patch_status(resource=self, status={"ready": None, "printableStatus": "Stopped"})
+
+    if action in ("start", "restart"):
+        vmi.deploy()
+        _patch_status(resource=vmi, status={"phase": "Scheduling"})
+        _patch_status(resource=self, status={"printableStatus": "Starting"})
+
+        def _run():
+            _patch_status(resource=vmi, status={"phase": "Running"})
+            _patch_status(resource=self, status={"ready": True, "printableStatus": "Running"})
+
+        threading.Timer(interval=0.3, function=_run).start()
+
+    return {}
+
+
+@pytest.fixture()
+def fleet_vms(fake_client):
+    fake_client.register_resources([
+        {"kind": "VirtualMachine", "api_version": "v1", "group": "kubevirt.io", "namespaced": True},
+        {"kind": "VirtualMachineInstance", "api_version": "v1", "group": "kubevirt.io", "namespaced": True},
+    ])
+    vms = [VirtualMachine(client=fake_client, name=f"test-fleet-vm-{index}", namespace=NAMESPACE) for index in range(3)]
+    for vm in vms:
+        vm.deploy()
+        _patch_status(resource=vm, status={"printableStatus": "Stopped"})
+
+    with patch.object(VirtualMachine, "api_request", _fake_api_request):
+        yield vms
+
+    for vm in vms:
+        vm.vmi.clean_up(wait=False)
+        vm.clean_up(wait=False)
+
+
+class TestVirtualMachineFleet:
+    def test_start_stop(self, fleet_vms):
+        histograms = []
+        fleet = VirtualMachineFleet(vms=fleet_vms, sleep=0.1)
+        fleet._request(action="start")
+        status = fleet.wait_for_ready_status(
+            status=True, timeout=10, progress_callback=lambda _status: histograms.append(_status.histogram)
+        )
+
+        assert status.histogram == {"Running": 3}
+        assert {"Scheduling": 3} in histograms
+        assert len(status.times_to_ready) == 3
+        assert all(time_to_ready > 0 for time_to_ready in status.times_to_ready.values())
+        # One list per kind for the whole fleet
+        assert status.stats.list_calls == 2
+
+        status = fleet.stop(wait=True, timeout=10)
+        assert status.histogram == {"Stopped": 3}
+        assert not status.pending
+
+    def test_restart_waits_for_new_vmi(self, fleet_vms):
+        fleet = VirtualMachineFleet(vms=fleet_vms, sleep=0.1)
+        fleet.start(wait=True, timeout=10)
+
+        status = fleet.restart(wait=True, timeout=10)
+
+        assert status.histogram == {"Running": 3}
+        assert all(time_to_ready >= 0.3 for time_to_ready in status.times_to_ready.values())
+
+    def test_failed_request(self, fake_client, fleet_vms):
+        broken_vm = VirtualMachine(client=fake_client, name="test-fleet-vm-broken", namespace=NAMESPACE)
+        fleet = VirtualMachineFleet(vms=[*fleet_vms, broken_vm], sleep=0.1)
+
+        status = fleet.start(wait=True, timeout=10)
+
+        assert [member.vm.name for member in status.failed] == ["test-fleet-vm-broken"]
+        assert status.histogram == {"Running": 3, "Error": 1}
+
+    def test_timeout(self, fleet_vms):
+        fleet = VirtualMachineFleet(vms=fleet_vms, sleep=0.1)
+
+        with pytest.raises(TimeoutExpiredError, match="3 of 3 VMs not ready"):
+            fleet.wait_for_ready_status(status=True, timeout=1)
+
+        assert fleet.status.histogram == {"Stopped": 3}
+
+    def test_stop_waits_for_vmi_list(self, fleet_vms):
+        # The VMs report stopped while their VMIs still exist, listed after the VMs
+        for vm in fleet_vms:
+            VirtualMachineInstance(client=vm.client, name=vm.name, namespace=vm.namespace, domain={}).deploy()
+
+        list_vmis = ListWatcher.list
+
+        def _slow_list(self):
+            if self.api.resource_def["kind"] == VMI_KIND:
+                time.sleep(0.3)
+            return list_vmis(self)
+
+        fleet = VirtualMachineFleet(vms=fleet_vms, sleep=0.1)
+        with patch.object(ListWatcher, "list", _slow_list):
+            with pytest.raises(TimeoutExpiredError, match="3 of 3 VMs not None"):
+                fleet.wait_for_ready_status(status=None, timeout=1)
+
+    def test_watches_stop_with_wait(self, fleet_vms):
+        fleet = VirtualMachineFleet(vms=fleet_vms, sleep=0.1)
+        with patch("ocp_resources.utils.vm_fleet.FLEET_WATCH_TIMEOUT", 1):
+            fleet.start(wait=True, timeout=30)
+
+        deadline = time.monotonic() + 5
+        while any(thread.name.startswith("vm-fleet-") for thread in threading.enumerate()):
+            assert time.monotonic() < deadline, "fleet watches still running after the wait"
+            time.sleep(0.1)
@@ -0,0 +1,117 @@
+from unittest.mock import patch
+
+import pytest
+from kubernetes.dynamic.exceptions import ResourceNotFoundError
+
+from ocp_resources.pod import Pod
+from ocp_resources.utils.pod_exec import ExecResult, PodExecSession
+from ocp_resources.utils.vmi_diagnostics import collect_vmi_diagnostics
+from ocp_resources.virtual_machine_instance import VirtualMachineInstance
+
+NAMESPACE: str = "diagnostics"
+DOMMEMSTAT: str = "actual 2097152\nswap_in 0\nrss 482716\n"
+DUMPXML: str = "<domain type='kvm'><name>diagnostics</name></domain>"
+
+
+def _virsh_output(command):
+    if command[0] == "ls":
+        return ExecResult(command=command, rc=0, stdout="virtqemud-sock\nvirtqemud-sock-ro\n", stderr="")
+
+    action = command[-2]
+    if action == "domstats":
+        return ExecResult(command=command, rc=1, stdout="", stderr="error: unknown command\n")
+
+    return ExecResult(
+        command=command,
+        rc=0,
+        stdout={"domstate": "running\n", "dommemstat": DOMMEMSTAT, "dumpxml": DUMPXML}[action],
+        stderr="",
+    )
+
+
+@pytest.fixture()
+def fake_exec():
+    with patch.object(
+        PodExecSession,
+        "execute_many",
+        autospec=True,
+        side_effect=lambda self, commands, timeout=60: [_virsh_output(command=command) for command in commands],
+    ) as execute_many:
+        yield execute_many
+
+
+@pytest.fixture(scope="class")
+def diagnostics_vmis(fake_client):
+    fake_client.register_resources([
+        {"kind": "Pod", "api_version": "v1", "namespaced": True},
+        {"kind": "VirtualMachineInstance", "api_version": "v1", "group": "kubevirt.io", "namespaced": True},
+    ])
+    vmis = [
+        VirtualMachineInstance(client=fake_client, name=f"test-vmi-{index}", namespace=NAMESPACE, domain={}).deploy()
+        for index in range(3)
+    ]
+    pods = []
+    # The last VMI has no launcher pod
+    for index, vmi in enumerate(vmis[:2]):
+        pods.append(
+            Pod(
+                client=fake_client,
+                name=f"virt-launcher-test-vmi-{index}",
+                namespace=NAMESPACE,
+                containers=[{"name": "compute", "image": "virt-launcher"}],
+                node_name=f"node-{index}",
+                security_context={"runAsUser": 107} if index else {},
+                label={"kubevirt.io": "virt-launcher", "kubevirt.io/created-by": vmi.instance.metadata.uid},
+            ).deploy()
+        )
+
+    yield vmis
+    for resource in [*pods, *vmis]:
+        resource.clean_up()
+
+
+class TestVMIDiagnosticsSession:
+    def test_snapshot_root_pod(self, diagnostics_vmis, fake_exec):
+        diagnostics = diagnostics_vmis[0].get_diagnostics()
+
+        assert diagnostics.succeeded
+        assert (diagnostics.pod, diagnostics.node, diagnostics.user_uid) == ("virt-launcher-test-vmi-0", "node-0", None)
+        assert diagnostics.hypervisor_uri == ""
+        assert diagnostics.domstate == "running"
+        assert diagnostics.dommemstat == {"actual": 2097152, "swap_in": 0, "rss": 482716}
+        assert diagnostics.xml_dict["domain"]["name"] == "diagnostics"
+        # All the virsh commands run in one exec
+        assert fake_exec.call_count == 1
+        assert [command[-1] for command in fake_exec.call_args.kwargs["commands"]] == [f"{NAMESPACE}_test-vmi-0"] * 3
+
+    def test_snapshot_non_root_pod(self, diagnostics_vmis, fake_exec):
+        with diagnostics_vmis[1].diagnostics_session() as session:
+            diagnostics = session.snapshot(actions=["domstate", "domstats"])
+            assert session.virsh(action="domstate") == "running\n"
+
+        assert diagnostics.user_uid == 107
+        assert "virtqemud-sock" in diagnostics.hypervisor_uri
+        assert diagnostics.outputs == {"domstate": "running\n"}
+        assert diagnostics.errors == {"domstats": "error: unknown command\n"}
+        assert not diagnostics.succeeded
+        # The connection URI is detected once for the session
+        assert fake_exec.call_count == 3
+
+    def test_no_launcher_pod(self, diagnostics_vmis, fake_exec):
+        diagnostics = diagnostics_vmis[2].get_diagnostics()
+
+        assert isinstance(diagnostics.error, ResourceNotFoundError)
+        assert not fake_exec.called
+
+
+class TestCollectVMIDiagnostics:
+    def test_collect(self, diagnostics_vmis, fake_exec):
+        with patch.object(Pod, "get", wraps=Pod.get) as pod_get:
+            snapshots = {
+                diagnostics.vmi.name: diagnostics for diagnostics in collect_vmi_diagnostics(vmis=diagnostics_vmis)
+            }
+
+        assert pod_get.call_count == 1
+        assert snapshots["test-vmi-0"].domstate == snapshots["test-vmi-1"].domstate == "running"
+        assert snapshots["test-vmi-1"].pod == "virt-launcher-test-vmi-1"
+        assert isinstance(snapshots["test-vmi-2"].error, ResourceNotFoundError)
@@ -0,0 +1,128 @@
+from unittest.mock import MagicMock, patch
+
+import pytest
+from kubernetes.client.rest import ApiException
+from kubernetes.dynamic.exceptions import ForbiddenError
+from timeout_sampler import TimeoutExpiredError
+
+from ocp_resources.exceptions import WatchNotPermittedError
+from ocp_resources.namespace import Namespace
+from ocp_resources.pod import Pod
+from ocp_resources.utils.wait_engine import ListWatcher, WaitStats, wait_with_watch_enabled
+
+POD_CONTAINERS: list[dict[str, str]] = [{"name": "test-container", "image": "nginx:latest"}]
+
+
+def _list_response(items, resource_version="1"):
+    response = MagicMock()
+    response.to_dict.return_value = {"metadata": {"resourceVersion": resource_version}, "items": items}
+    return response
+
+
+@pytest.fixture(scope="class")
+def watched_pod(fake_client):
+    fake_client.register_resources([{"kind": "Pod", "api_version": "v1", "namespaced": True}])
+    with Pod(
+        client=fake_client,
+        name="test-wait-engine-pod",
+        namespace="default",
+        containers=POD_CONTAINERS,
+    ) as pod:
+        yield pod
+
+
+class TestWaitWithWatchEnabled:
+    def test_default_is_polling(self, monkeypatch):
+        monkeypatch.delenv("OPENSHIFT_PYTHON_WRAPPER_WAIT_WITH_WATCH", raising=False)
+        assert not wait_with_watch_enabled()
+
+    def test_env_var(self, monkeypatch):
+        monkeypatch.setenv("OPENSHIFT_PYTHON_WRAPPER_WAIT_WITH_WATCH", "true")
+        assert wait_with_watch_enabled()
+
+    def test_explicit_value_overrides_env_var(self, monkeypatch):
+        monkeypatch.setenv("OPENSHIFT_PYTHON_WRAPPER_WAIT_WITH_WATCH", "true")
+        assert not wait_with_watch_enabled(use_watch=False)
+
+
+class TestResourceWaitWithWatch:
+    def test_wait(self, watched_pod):
+        watched_pod.wait(timeout=5, use_watch=True)
+        assert watched_pod.last_wait_stats.mode == "watch"
+        assert watched_pod.last_wait_stats.list_calls == 1
+        assert watched_pod.last_wait_stats.polls == 0
+
+    def test_wait_for_status(self, watched_pod):
+        watched_pod.wait_for_status(status=Pod.Status.RUNNING, timeout=5, use_watch=True)
+        assert watched_pod.last_wait_stats.mode == "watch"
+
+    def test_wait_for_stop_status(self, watched_pod):
+        watched_pod.wait_for_status(
+            status=Pod.Status.RUNNING, stop_status=Pod.Status.RUNNING, timeout=5, use_watch=True
+        )
+
+    def test_wait_for_condition(self, watched_pod):
+        watched_pod.wait_for_condition(
+            condition=Pod.Condition.READY, status=Pod.Condition.Status.TRUE, timeout=5, use_watch=True
+        )
+        assert watched_pod.last_wait_stats.mode == "watch"
+
+    def test_wait_for_status_timeout(self, watched_pod):
+        with pytest.raises(TimeoutExpiredError):
+            watched_pod.wait_for_status(status="NotAPhase", timeout=1, sleep=0.1, use_watch=True)
+
+    def test_wait_deleted(self, fake_client):
+        namespace = Namespace(client=fake_client, name="test-wait-engine-deleted")
+        assert namespace.wait_deleted(timeout=5, use_watch=True)
+        assert namespace.last_wait_stats.api_calls == 1
+
+    def test_wait_polling(self, watched_pod):
+        watched_pod.wait(timeout=5, use_watch=False)
+        assert watched_pod.last_wait_stats.mode == "poll"
+        assert watched_pod.last_wait_stats.polls == 1
+
+    def test_forbidden_watch_falls_back_to_polling(self, watched_pod):
+        forbidden = ForbiddenError(ApiException(status=403, reason="Forbidden"))
+        with patch.object(ListWatcher, "list", side_effect=forbidden):
+            watched_pod.wait(timeout=5, use_watch=True)
+
+        assert watched_pod.last_wait_stats.mode == "poll"
+        assert watched_pod.last_wait_stats.polls == 1
+
+
+class TestListWatcher:
+    def test_relist_on_gone(self):
+        pod_dict = {"metadata": {"name": "pod", "resourceVersion": "3"}}
+        api = MagicMock()
+        api.get.side_effect = [_list_response(items=[], resource_version="1"), _list_response(items=[pod_dict])]
+        api.watch.side_effect = [
+            iter([{"type": "ERROR", "raw_object": {"code": 410, "message": "too old resource version"}}]),
+            iter([{"type": "MODIFIED", "raw_object": pod_dict}]),
+        ]
+        stats = WaitStats()
+        events = list(ListWatcher(api=api, stats=stats, sleep=0).stream(timeout=2))
+
+        assert events[:3] == [("LIST", []), ("LIST", [pod_dict]), ("MODIFIED", pod_dict)]
+        assert stats.relists == 1
+        assert stats.list_calls == 2
+        assert api.watch.call_args_list[0].kwargs["resource_version"] == "1"
+
+    def test_bookmark_advances_resource_version(self):
+        api = MagicMock()
+        api.get.return_value = _list_response(items=[])
+        api.watch.side_effect = [
+            iter([{"type": "BOOKMARK", "raw_object": {"metadata": {"resourceVersion": "7"}}}]),
+            iter([]),
+        ]
+        stats = WaitStats()
+        stream = ListWatcher(api=api, stats=stats, sleep=0).stream(timeout=2)
+        assert next(stream) == ("LIST", [])
+        assert list(stream) == []
+        assert stats.events == 0
+        assert api.watch.call_args_list[1].kwargs["resource_version"] == "7"
+
+    def test_forbidden_raises_watch_not_permitted(self):
+        api = MagicMock()
+        api.get.side_effect = ForbiddenError(ApiException(status=403, reason="Forbidden"))
+        with pytest.raises(WatchNotPermittedError):
+            list(ListWatcher(api=api).stream(timeout=2))